@@ -0,0 +1,4 @@
+"""
+Benchmarks for ZLECAf backend hot paths
+Run from the backend directory: python -m benchmarks.<name>
+"""
@@ -0,0 +1,139 @@
+"""
+Benchmark: /calculate-tariff/batch engine vs N single-line calculations
+
+The single-line path replays what /api/calculate-tariff does per request
+(linear country lookup, three-level rate priority, amounts and both
+calculation journals) without the network enrichment and MongoDB insert,
+so the comparison only measures local computation.
+
+Usage (from backend/):
+    python -m benchmarks.batch_tariff --lines 100 500 2000
+"""
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from constants import AFRICAN_COUNTRIES
+from data_loader import get_tariff_corrections
+from etl.country_tariffs_complete import (
+    get_tariff_rate_for_country,
+    get_vat_rate_for_country,
+    get_other_taxes_for_country,
+    get_product_category,
+    get_zlecaf_reduction_factor
+)
+from etl.country_hs6_tariffs import get_country_hs6_tariff
+from etl.country_hs6_detailed import get_sub_position_rate, COUNTRY_HS6_DETAILED
+from services.tariff_batch_service import batch_tariff_engine
+
+
+def single_line(line: Dict) -> Dict:
+    """Per-request computation of /api/calculate-tariff (local part only)"""
+    origin = next((c for c in AFRICAN_COUNTRIES if c['iso3'] == line["origin_country"].upper()), None)
+    if not origin:
+        origin = next((c for c in AFRICAN_COUNTRIES if c['code'] == line["origin_country"].upper()), None)
+    dest = next((c for c in AFRICAN_COUNTRIES if c['iso3'] == line["destination_country"].upper()), None)
+    if not dest:
+        dest = next((c for c in AFRICAN_COUNTRIES if c['code'] == line["destination_country"].upper()), None)
+    dest_iso3 = dest['iso3']
+
+    hs_code_clean = line["hs_code"].replace(".", "").replace(" ", "")
+    hs6_code = hs_code_clean[:6].zfill(6)
+    precision = "chapter"
+    if len(hs_code_clean) > 6:
+        rate, _, _ = get_sub_position_rate(dest_iso3, hs_code_clean)
+        if rate is not None:
+            normal_rate, precision = rate, "sub_position"
+    if precision == "chapter":
+        hs6_tariff = get_country_hs6_tariff(dest_iso3, hs6_code)
+        if hs6_tariff:
+            normal_rate = hs6_tariff["dd"]
+        else:
+            normal_rate, _ = get_tariff_rate_for_country(dest_iso3, hs6_code)
+
+    category = get_product_category(hs6_code)
+    zlecaf_rate = normal_rate * get_zlecaf_reduction_factor(dest_iso3, category)
+    vat_rate, _ = get_vat_rate_for_country(dest_iso3)
+    other_rate, _ = get_other_taxes_for_country(dest_iso3)
+    get_tariff_corrections().get('transition_periods', {}).get(hs6_code[:2], 'immediate')
+
+    value = line["value"]
+    normal_customs = value * normal_rate
+    zlecaf_customs = value * zlecaf_rate
+    other_amount = value * other_rate
+    normal_vat = (value + normal_customs + other_amount) * vat_rate
+    zlecaf_vat = (value + zlecaf_customs + other_amount) * vat_rate
+    normal_total = value + normal_customs + other_amount + normal_vat
+    zlecaf_total = value + zlecaf_customs + other_amount + zlecaf_vat
+
+    journal = []
+    for step, (component, amount) in enumerate([
+        ("Valeur CIF", value), ("DD", normal_customs), ("Autres taxes", other_amount), ("TVA", normal_vat)
+    ], start=1):
+        journal.append({"step": step, "component": component, "amount": round(amount, 2)})
+
+    return {
+        "normal_total_cost": round(normal_total, 2),
+        "zlecaf_total_cost": round(zlecaf_total, 2),
+        "journal": journal
+    }
+
+
+def make_invoice(n: int, seed: int = 42) -> List[Dict]:
+    """Facture synthétique: mélange de codes SH6, sous-positions et chapitres"""
+    rng = random.Random(seed)
+    countries = [c["iso3"] for c in AFRICAN_COUNTRIES]
+    sub_positions = [
+        (iso3, sp)
+        for iso3, tariffs in COUNTRY_HS6_DETAILED.items()
+        for data in tariffs.values()
+        for sp in data.get("sub_positions", {})
+    ]
+    lines = []
+    for _ in range(n):
+        if sub_positions and rng.random() < 0.3:
+            dest, hs_code = rng.choice(sub_positions)
+        else:
+            dest = rng.choice(countries)
+            hs_code = f"{rng.randint(1, 97):02d}{rng.randint(1, 99):02d}{rng.randint(0, 90):02d}"
+        lines.append({
+            "origin_country": rng.choice(countries),
+            "destination_country": dest,
+            "hs_code": hs_code,
+            "value": round(rng.uniform(100, 250000), 2)
+        })
+    return lines
+
+
+def run(sizes: List[int], repeat: int = 3) -> None:
+    print(f"{'lines':>8} {'single (ms)':>14} {'batch (ms)':>12} {'speedup':>9}")
+    for n in sizes:
+        lines = make_invoice(n)
+
+        best_single = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            singles = [single_line(line) for line in lines]
+            best_single = min(best_single, time.perf_counter() - start)
+
+        best_batch = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results, _ = batch_tariff_engine.calculate(lines)
+            best_batch = min(best_batch, time.perf_counter() - start)
+
+        mismatches = sum(
+            1 for s, b in zip(singles, results)
+            if s["normal_total_cost"] != b["normal_total_cost"] or s["zlecaf_total_cost"] != b["zlecaf_total_cost"]
+        )
+        print(f"{n:>8} {best_single * 1000:>14.1f} {best_batch * 1000:>12.1f} "
+              f"{best_single / best_batch:>8.1f}x" + (f"  MISMATCHES={mismatches}" if mismatches else ""))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.lines, args.repeat)
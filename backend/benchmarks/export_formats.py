@@ -0,0 +1,99 @@
+"""
+Benchmark: export formats of /api/export/tariffs/* (CSV, Excel, Parquet, Arrow)
+
+Runs the router's serializers on synthetic customs_data documents (the
+latest import of each of the 54 countries, no MongoDB) and reports output
+size, write time and the time for pandas to read the file back.
+
+Usage (from backend/):
+    python -m benchmarks.export_formats --lines 5000
+"""
+import argparse
+import asyncio
+import io
+import random
+import time
+
+import pandas as pd
+import pyarrow.ipc as ipc
+
+from constants import AFRICAN_COUNTRIES
+from routers.export_router import _arrow_chunks, _csv_chunks, _excel_file, _parquet_file
+
+UNITS = ["kg", "u", "l", "m2", "Number"]
+DUTIES = ["0%", "5%", "10%", "20%", "35%", "Exempt", "10% + 100 FCFA/kg"]
+
+
+def documents(lines: int, seed: int = 0):
+    rng = random.Random(seed)
+    docs = []
+    for country in AFRICAN_COUNTRIES:
+        docs.append({
+            "country_code": country["iso3"],
+            "imported_at": "2025-01-15T08:00:00Z",
+            "tariffs": {"tariff_lines": [
+                {
+                    "hs_code": f"{rng.randint(10000000, 99999999)}",
+                    "description": f"Produit {n} - {rng.choice(['animaux', 'machines', 'textiles', 'chimie'])}",
+                    "unit": rng.choice(UNITS),
+                    "customs_duty": rng.choice(DUTIES),
+                    "vat": rng.choice(["16%", "18%", "19.25%"]),
+                    "source": "Tarif douanier national",
+                }
+                for n in range(lines)
+            ]},
+        })
+    return docs
+
+
+async def _iterate(docs):
+    for doc in docs:
+        yield doc
+
+
+async def write_csv(docs) -> bytes:
+    return "".join([chunk async for chunk in _csv_chunks(_iterate(docs))]).encode("utf-8")
+
+
+async def write_file(build, docs) -> bytes:
+    output = await build(_iterate(docs))
+    output.seek(0)
+    data = output.read()
+    output.close()
+    return data
+
+
+async def write_arrow(docs) -> bytes:
+    return b"".join([chunk async for chunk in _arrow_chunks(_iterate(docs))])
+
+
+FORMATS = {
+    "csv": (write_csv, lambda data: pd.read_csv(io.BytesIO(data))),
+    "excel": (lambda docs: write_file(_excel_file, docs),
+              lambda data: pd.read_excel(io.BytesIO(data), sheet_name=None, engine="openpyxl")),
+    "parquet": (lambda docs: write_file(_parquet_file, docs), lambda data: pd.read_parquet(io.BytesIO(data))),
+    "arrow": (write_arrow, lambda data: ipc.open_stream(data).read_pandas()),
+}
+
+
+def run(lines: int, formats):
+    docs = documents(lines)
+    print(f"{len(docs)} countries x {lines} lines = {len(docs) * lines} tariff lines")
+    print(f"{'format':>8} {'size (MB)':>10} {'write (s)':>10} {'read (s)':>9}")
+    for name in formats:
+        write, read = FORMATS[name]
+        start = time.perf_counter()
+        data = asyncio.run(write(docs))
+        written = time.perf_counter() - start
+        start = time.perf_counter()
+        read(data)
+        read_s = time.perf_counter() - start
+        print(f"{name:>8} {len(data) / 1e6:>10.2f} {written:>10.2f} {read_s:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=5000, help="tariff lines per country")
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS), choices=list(FORMATS))
+    args = parser.parse_args()
+    run(args.lines, args.formats)
@@ -0,0 +1,64 @@
+"""
+Benchmark: import time and memory of the HS6 database
+
+Each measurement runs in a fresh interpreter:
+- cold: empty bytecode cache (first boot of a new image / worker)
+- warm: __pycache__ already populated
+and reports wall time and RSS growth for importing etl.hs6_database and
+answering a first get_hs6_info() lookup.
+
+Usage (from backend/):
+    python -m benchmarks.hs6_startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, ".")
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import etl.hs6_database as db
+imported = time.perf_counter()
+db.get_hs6_info("870323")
+first_lookup = time.perf_counter()
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_lookup_ms": (first_lookup - start) * 1000,
+    "rss_mb": (rss_after - rss_before) / 1024,
+}))
+"""
+
+
+def probe(cold: bool) -> dict:
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if cold:
+            env["PYTHONPYCACHEPREFIX"] = cache_dir
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(runs: int) -> None:
+    probe(cold=False)  # populate __pycache__
+    print(f"{'mode':<6} {'import (ms)':>12} {'+1st lookup (ms)':>17} {'RSS (MB)':>9}")
+    for mode in ("cold", "warm"):
+        samples = [probe(cold=mode == "cold") for _ in range(runs)]
+        print(f"{mode:<6} {statistics.median(s['import_ms'] for s in samples):>12.1f} "
+              f"{statistics.median(s['first_lookup_ms'] for s in samples):>17.1f} "
+              f"{statistics.median(s['rss_mb'] for s in samples):>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    run(args.runs)
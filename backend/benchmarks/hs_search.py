@@ -0,0 +1,78 @@
+"""
+Benchmark: HS6 keyword search, linear scan vs shared inverted index
+
+The linear path replays the former search_hs6_codes: accent folding of
+every description of every HS6_DATABASE entry on each query, then
+substring matching. The index path is etl.hs_search_index.HSSearchIndex
+as used by /api/hs6/search and /api/hs6/smart-search.
+
+Usage (from backend/):
+    python -m benchmarks.hs_search --repeat 20
+"""
+import argparse
+import statistics
+import time
+import unicodedata
+from typing import List
+
+from etl.hs6_database import HS6_DATABASE, get_hs6_search_index
+
+QUERIES = [
+    "8703", "870323", "café", "cafe", "riz", "voiture", "huile de palme",
+    "coffee", "motor cars", "bovins", "ciment", "textiles", "lait", "or",
+]
+
+
+def linear_search(query: str, language: str = "fr", limit: int = 20) -> List[str]:
+    """Former search_hs6_codes (code list only)"""
+    def normalize(text: str) -> str:
+        return ''.join(
+            c for c in unicodedata.normalize('NFD', text.lower())
+            if unicodedata.category(c) != 'Mn'
+        )
+
+    query_normalized = normalize(query)
+    results = []
+    for code, info in HS6_DATABASE.items():
+        desc_fr = normalize(info.get("description_fr", ""))
+        desc_en = normalize(info.get("description_en", ""))
+        category = normalize(info.get("category", ""))
+        if query_normalized in code or query_normalized in desc_fr or query_normalized in desc_en or query_normalized in category:
+            results.append(code)
+        if len(results) >= limit:
+            break
+    return results
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def run(repeat: int) -> None:
+    start = time.perf_counter()
+    index = get_hs6_search_index()
+    build = time.perf_counter() - start
+    print(f"HS6_DATABASE: {len(HS6_DATABASE)} codes")
+    print(f"Index build: {build * 1000:.0f} ms\n")
+
+    print(f"{'query':<18} {'linear (ms)':>12} {'index (ms)':>11} {'speedup':>9} {'hits':>6}")
+    for query in QUERIES:
+        linear = timed(lambda: linear_search(query), repeat)
+        indexed = timed(lambda: index.search(query, "fr", 20), repeat)
+        # Ensemble complet: l'index doit couvrir tous les résultats de l'ancienne recherche
+        missing = set(linear_search(query, limit=len(HS6_DATABASE))) - set(index.search(query, "fr", None))
+        hits = len(index.search(query, "fr", None))
+        print(f"{query:<18} {linear * 1000:>12.2f} {indexed * 1000:>11.3f} "
+              f"{linear / indexed:>8.0f}x {hits:>6}" + (f"  MISSING={len(missing)}" if missing else ""))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    run(args.repeat)
@@ -0,0 +1,95 @@
+"""
+Benchmark: delta_engine sur un tarif national synthétique
+
+Génère deux versions d'un tarif (par défaut 200 000 lignes: ~1 % de lignes
+supprimées, ~1 % de nouvelles, ~5 % de lignes modifiées) puis mesure:
+- loop: l'ancienne comparaison ligne à ligne (old.loc[c, f]), sur un
+  échantillon (--loop-lines) extrapolé au volume complet
+- vectorized: compare() en mémoire
+- chunked: compare_chunked() par blocs vers un fichier Parquet
+
+Usage (depuis backend/):
+    python -m benchmarks.tariff_deltas --lines 200000 --loop-lines 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# delta_engine.py est à la racine du dépôt
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from delta_engine import FIELDS, compare, compare_chunked
+
+RATES = ['[{"code":"DD","rate":%d},{"code":"TVA","rate":18}]' % r for r in (0, 5, 10, 20, 35)]
+
+
+def schedule(lines: int, seed: int = 0):
+    """Ancienne et nouvelle version d'un tarif synthétique"""
+    rng = np.random.default_rng(seed)
+    codes = np.arange(lines, dtype=np.int64) * 7 + 101_000_000
+    old = pd.DataFrame({"national_code": codes, "hs6": codes // 10_000})
+    for f in FIELDS:
+        old[f] = np.asarray(RATES, dtype=object)[rng.integers(0, len(RATES), lines)]
+
+    new = old[rng.random(lines) > 0.01].copy()
+    changed = rng.random(len(new)) < 0.05
+    new.loc[changed, "advalorem_json"] = RATES[-1]
+    added = pd.DataFrame({"national_code": codes[-1] + 7 * np.arange(1, lines // 100 + 1)})
+    added["hs6"] = added["national_code"] // 10_000
+    for f in FIELDS:
+        added[f] = RATES[0]
+    return old, pd.concat([new, added], ignore_index=True)
+
+
+def loop_compare(old: pd.DataFrame, new: pd.DataFrame) -> int:
+    """Ancienne implémentation (boucle sur chaque code commun et chaque champ)"""
+    old, new = old.set_index("national_code"), new.set_index("national_code")
+    count = len(new.index.difference(old.index)) + len(old.index.difference(new.index))
+    for c in old.index.intersection(new.index):
+        for f in FIELDS:
+            if str(old.loc[c, f]) != str(new.loc[c, f]):
+                count += 1
+    return count
+
+
+def run(lines: int, loop_lines: int, chunksize: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        old, new = schedule(lines)
+        old_csv, new_csv = Path(tmp) / "old.csv", Path(tmp) / "new.csv"
+        old.to_csv(old_csv, index=False)
+        new.to_csv(new_csv, index=False)
+
+        sample_old, sample_new = schedule(loop_lines)
+        start = time.perf_counter()
+        loop_compare(sample_old, sample_new)
+        loop_s = (time.perf_counter() - start) * lines / loop_lines
+
+        start = time.perf_counter()
+        deltas = compare(str(old_csv), str(new_csv))
+        vectorized_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        chunked = compare_chunked(str(old_csv), str(new_csv), str(Path(tmp) / "deltas.parquet"), chunksize)
+        chunked_s = time.perf_counter() - start
+
+    print(f"{lines} lines, {len(deltas)} deltas")
+    print(f"{'mode':>12} {'time (s)':>10} {'speedup':>9}")
+    print(f"{'loop*':>12} {loop_s:>10.1f} {1:>8.1f}x   (* extrapolated from {loop_lines} lines)")
+    print(f"{'vectorized':>12} {vectorized_s:>10.2f} {loop_s / vectorized_s:>8.1f}x")
+    print(f"{'chunked':>12} {chunked_s:>10.2f} {loop_s / chunked_s:>8.1f}x"
+          + ("" if chunked == len(deltas) else "  MISMATCH"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--loop-lines", type=int, default=5_000)
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    args = parser.parse_args()
+    run(args.lines, args.loop_lines, args.chunksize)
@@ -1,47 +1,136 @@
 """
 Data loader for ZLECAf 2024 enhanced commerce and economic data
+
+Les fichiers (CSV/JSON) sont lus une seule fois puis servis depuis
+DATA_FILE_CACHE, invalidé automatiquement quand le fichier change sur
+disque (mtime / taille). Le CSV de commerce est indexé par code ISO3.
+
+Les valeurs du cache sont partagées: les fonctions publiques ci-dessous
+renvoient des copies, que l'appelant peut modifier librement.
 """
 import pandas as pd
+import copy
 import json
+import logging
+import threading
+import time
+import unicodedata
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+CORRECTIONS_PATH = ROOT_DIR / "zlecaf_corrections_2024.json"
+COMMERCE_PATH = ROOT_DIR / "ZLECAf_ENRICHI_2024_COMMERCE.csv"
+ECONOMIC_PATH = ROOT_DIR / "ZLECAF_54_PAYS_DONNEES_COMPLETES.csv"
+CUSTOMS_PATH = ROOT_DIR / "douanes_africaines.json"
+INFRASTRUCTURE_PATH = ROOT_DIR / "classement_infrastructure_afrique.json"
+
+
+class DataFileCache:
+    """
+    Parsed data files keyed by path, reloaded when the file changes on disk
+    """
+
+    def __init__(self):
+        # (chemin, analyseur) -> ((mtime_ns, taille), valeur)
+        self._entries: Dict[Tuple[Path, Callable], Tuple[Tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+        # compteurs protégés séparément: un succès n'attend pas un rechargement en cours
+        self._stats_lock = threading.Lock()
+        self.stats = {"hits": 0, "reloads": 0, "files": {}}
+
+    def get(self, path: Path, parse: Callable[[Path], Any], name: Optional[str] = None) -> Any:
+        """
+        Valeur analysée du fichier (relu seulement si son mtime ou sa taille a changé)
+
+        Args:
+            path: fichier de données
+            parse: fonction de lecture, une entrée par couple (fichier, fonction)
+            name: nom de l'entrée dans les statistiques (par défaut le nom du fichier)
+
+        La valeur renvoyée est partagée par tous les appelants: ne pas la modifier.
+        """
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = (path, parse)
+        name = name or path.name
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._count_hit(name)
+            return entry[1]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._count_hit(name)
+                return entry[1]
+            start = time.perf_counter()
+            value = parse(path)
+            elapsed = time.perf_counter() - start
+            self._entries[key] = (version, value)
+            with self._stats_lock:
+                file_stats = self.stats["files"].setdefault(name, {"hits": 0, "reloads": 0})
+                file_stats["reloads"] += 1
+                file_stats["reload_ms"] = round(elapsed * 1000, 2)
+                file_stats["loaded_at"] = time.time()
+                self.stats["reloads"] += 1
+            logger.info(f"Data file {name} loaded in {elapsed * 1000:.1f} ms")
+        return value
+
+    def _count_hit(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats["hits"] += 1
+            self.stats["files"].setdefault(name, {"hits": 0, "reloads": 0})["hits"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "hits": self.stats["hits"],
+                "reloads": self.stats["reloads"],
+                "files": copy.deepcopy(self.stats["files"])
+            }
+
+
+DATA_FILE_CACHE = DataFileCache()
+
+
+def _read_json(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _normalize_name(s: str) -> str:
+    # Enlever les accents et convertir en minuscules
+    return unicodedata.normalize('NFD', s.lower()).encode('ascii', 'ignore').decode('ascii')
 
-ROOT_DIR = Path(__file__).parent.parent
 
 # Load the corrections and enhanced statistics
 def load_corrections_data():
     """Load the 2024 corrections JSON with tariffs and enhanced statistics"""
-    corrections_path = ROOT_DIR / "zlecaf_corrections_2024.json"
-    with open(corrections_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return copy.deepcopy(_corrections_data())
+
+
+def _corrections_data() -> Dict:
+    return DATA_FILE_CACHE.get(CORRECTIONS_PATH, _read_json)
 
 # Load the complete commerce data
 def load_commerce_data():
     """Load the enriched 2024 commerce data for all 54 countries"""
-    commerce_path = ROOT_DIR / "ZLECAf_ENRICHI_2024_COMMERCE.csv"
-    df = pd.read_csv(commerce_path)
-    return df
+    return _commerce_data()["frame"].copy()
 
 # Load the complete country economic data
 def load_country_economic_data():
     """Load the complete economic data for 54 countries"""
-    economic_path = ROOT_DIR / "ZLECAF_54_PAYS_DONNEES_COMPLETES.csv"
-    df = pd.read_csv(economic_path)
-    return df
+    return DATA_FILE_CACHE.get(ECONOMIC_PATH, pd.read_csv).copy()
 
-# Get country profile from commerce data
-def get_country_commerce_profile(country_code: str) -> Optional[Dict]:
-    """Get detailed commerce profile for a specific country"""
-    df = load_commerce_data()
-    
-    # Match by Code_ISO
-    country_row = df[df['Code_ISO'] == country_code.upper()]
-    
-    if country_row.empty:
-        return None
-    
-    row = country_row.iloc[0]
-    
+def _build_commerce_profile(row: pd.Series) -> Dict:
+    """Typed commerce profile of one CSV row"""
     # Extract export products
     export_products = []
     for i in range(1, 6):
@@ -130,88 +219,111 @@ def get_country_commerce_profile(country_code: str) -> Optional[Dict]:
         'validation_status': row.get('STATUT_VALIDATION', '')
     }
 
+def _build_trade_performance(row: pd.Series) -> Dict:
+    """Typed trade performance of one CSV row"""
+    return {
+        'country': row['Pays'],
+        'code': row['Code_ISO'],
+        'gdp_2024': float(row['PIB_2024_Mds_USD']) if pd.notna(row['PIB_2024_Mds_USD']) else 0,
+        'exports_2024': float(row['Exportations_2024_Mds_USD']) if pd.notna(row['Exportations_2024_Mds_USD']) else 0,
+        'imports_2024': float(row['Importations_2024_Mds_USD']) if pd.notna(row['Importations_2024_Mds_USD']) else 0,
+        'trade_balance_2024': float(row['Balance_Commerciale_2024_Mds_USD']) if pd.notna(row['Balance_Commerciale_2024_Mds_USD']) else 0,
+        'hdi_2024': float(row['IDH_2024']) if pd.notna(row['IDH_2024']) else 0,
+        'growth_rate_2024': float(row['Croissance_PIB_2024_Pct']) if pd.notna(row['Croissance_PIB_2024_Pct']) else 0
+    }
+
+
+def _parse_commerce(path: Path) -> Dict:
+    """CSV de commerce: DataFrame, profils indexés par ISO3 et performances commerciales"""
+    df = pd.read_csv(path)
+    profiles = {}
+    trade_performance = []
+    for _, row in df.iterrows():
+        # Premier enregistrement retenu en cas de doublon
+        profiles.setdefault(row['Code_ISO'], _build_commerce_profile(row))
+        trade_performance.append(_build_trade_performance(row))
+    return {"frame": df, "profiles": profiles, "trade_performance": trade_performance}
+
+
+def _commerce_data() -> Dict:
+    return DATA_FILE_CACHE.get(COMMERCE_PATH, _parse_commerce)
+
+# Get country profile from commerce data
+def get_country_commerce_profile(country_code: str) -> Optional[Dict]:
+    """Get detailed commerce profile for a specific country"""
+    profile = _commerce_data()["profiles"].get(country_code.upper())
+    return copy.deepcopy(profile) if profile is not None else None
+
 # Get all countries trade performance data
 def get_all_countries_trade_performance() -> List[Dict]:
     """Get trade performance data for all countries"""
-    df = load_commerce_data()
-    
-    countries_data = []
-    for _, row in df.iterrows():
-        countries_data.append({
-            'country': row['Pays'],
-            'code': row['Code_ISO'],
-            'gdp_2024': float(row['PIB_2024_Mds_USD']) if pd.notna(row['PIB_2024_Mds_USD']) else 0,
-            'exports_2024': float(row['Exportations_2024_Mds_USD']) if pd.notna(row['Exportations_2024_Mds_USD']) else 0,
-            'imports_2024': float(row['Importations_2024_Mds_USD']) if pd.notna(row['Importations_2024_Mds_USD']) else 0,
-            'trade_balance_2024': float(row['Balance_Commerciale_2024_Mds_USD']) if pd.notna(row['Balance_Commerciale_2024_Mds_USD']) else 0,
-            'hdi_2024': float(row['IDH_2024']) if pd.notna(row['IDH_2024']) else 0,
-            'growth_rate_2024': float(row['Croissance_PIB_2024_Pct']) if pd.notna(row['Croissance_PIB_2024_Pct']) else 0
-        })
-    
-    return countries_data
+    return [dict(country) for country in _commerce_data()["trade_performance"]]
 
 # Get enhanced statistics from corrections JSON
 def get_enhanced_statistics() -> Dict:
     """Get enhanced statistics including projections and trade evolution"""
-    corrections = load_corrections_data()
-    return corrections.get('enhanced_statistics', {})
+    return copy.deepcopy(_corrections_data().get('enhanced_statistics', {}))
 
 # Get tariff corrections
 def get_tariff_corrections() -> Dict:
     """Get updated tariff rates for normal and zlecaf"""
-    corrections = load_corrections_data()
-    return corrections.get('tariff_corrections', {})
+    return copy.deepcopy(_corrections_data().get('tariff_corrections', {}))
 
 # Load customs data
 def load_customs_data():
     """Load African customs administrations data"""
-    customs_path = ROOT_DIR / "douanes_africaines.json"
-    with open(customs_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return copy.deepcopy(DATA_FILE_CACHE.get(CUSTOMS_PATH, _read_json))
 
 # Load infrastructure ranking data
 def load_infrastructure_ranking():
     """Load African infrastructure ranking (IPL & AIDI)"""
-    ranking_path = ROOT_DIR / "classement_infrastructure_afrique.json"
-    with open(ranking_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return copy.deepcopy(DATA_FILE_CACHE.get(INFRASTRUCTURE_PATH, _read_json))
+
+
+def _parse_customs(path: Path) -> Dict[str, Dict]:
+    customs = {}
+    for entry in _read_json(path):
+        customs.setdefault(entry['pays'].lower(), {
+            'administration': entry['administration_douaniere'],
+            'website': entry['site_web'],
+            'offices': entry['bureaux_importants']
+        })
+    return customs
+
+
+def _parse_infrastructure_ranking(path: Path) -> List[Tuple[str, Dict]]:
+    return [
+        (_normalize_name(entry['pays']), {
+            'africa_rank': entry['rang_afrique'],
+            'lpi_infrastructure_score': entry['score_infrastructure_ipl'],
+            'lpi_world_rank': entry['rang_mondial_ipl'],
+            'aidi_transport_score': entry.get('score_aidi_2024', entry.get('score_transport_aidi', 0))
+        })
+        for entry in _read_json(path)
+    ]
 
 # Get customs info for a country
 def get_country_customs_info(country_name: str) -> Optional[Dict]:
     """Get customs administration info for a specific country"""
-    customs_data = load_customs_data()
-    
     # Match by country name (case-insensitive)
-    for entry in customs_data:
-        if entry['pays'].lower() == country_name.lower():
-            return {
-                'administration': entry['administration_douaniere'],
-                'website': entry['site_web'],
-                'offices': entry['bureaux_importants']
-            }
-    return None
+    customs = DATA_FILE_CACHE.get(CUSTOMS_PATH, _parse_customs, "douanes_africaines.json (index)")
+    info = customs.get(country_name.lower())
+    return copy.deepcopy(info) if info is not None else None
 
 # Get infrastructure ranking for a country
 def get_country_infrastructure_ranking(country_name: str) -> Optional[Dict]:
     """Get infrastructure ranking for a specific country"""
-    ranking_data = load_infrastructure_ranking()
-    
-    # Normaliser le nom pour la comparaison
-    import unicodedata
-    def normalize(s):
-        # Enlever les accents et convertir en minuscules
-        return unicodedata.normalize('NFD', s.lower()).encode('ascii', 'ignore').decode('ascii')
-    
-    search_name = normalize(country_name)
-    
+    ranking = DATA_FILE_CACHE.get(INFRASTRUCTURE_PATH, _parse_infrastructure_ranking,
+                                  "classement_infrastructure_afrique.json (index)")
+    search_name = _normalize_name(country_name)
+
     # Match by country name (case-insensitive, accent-insensitive)
-    for entry in ranking_data:
-        entry_name = normalize(entry['pays'])
+    for entry_name, info in ranking:
         if entry_name == search_name or search_name in entry_name or entry_name in search_name:
-            return {
-                'africa_rank': entry['rang_afrique'],
-                'lpi_infrastructure_score': entry['score_infrastructure_ipl'],
-                'lpi_world_rank': entry['rang_mondial_ipl'],
-                'aidi_transport_score': entry.get('score_aidi_2024', entry.get('score_transport_aidi', 0))
-            }
+            return dict(info)
     return None
+
+
+def get_data_cache_stats() -> Dict[str, Any]:
+    """Succès du cache et durées de rechargement par fichier"""
+    return DATA_FILE_CACHE.get_stats()
@@ -0,0 +1,199 @@
+"""
+Registre des jeux de données statiques de l'API
+Les modules de données (pays, tarifs, bases HS6, FAOSTAT, UNIDO, règles
+d'origine, logistique...) ne sont plus importés au démarrage du serveur:
+server.py et les routes obtiennent des proxys qui importent le module au
+premier appel.
+
+- DATASETS.function(name, attr) / functions(name, *attrs): fonctions
+  chargées au premier appel
+- DATASETS.module(name): accès paresseux aux constantes du module
+  (ex. country_data.REAL_COUNTRY_DATA)
+- DATASETS.warm_up(names): préchargement optionnel (DATASET_WARMUP) lancé
+  en arrière-plan au démarrage
+- python -m backend.startup_profile: temps d'import par jeu de données
+"""
+import importlib
+import logging
+import os
+import threading
+import time
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Jeux de données préchargés au démarrage ("all", "none" ou liste séparée par des virgules)
+DATASET_WARMUP = os.getenv("DATASET_WARMUP", "hs6_database")
+
+
+class Dataset:
+    """
+    A data module imported on first use
+    """
+
+    def __init__(self, name: str, module: str, description: str = "",
+                 warm: Optional[Callable[[ModuleType], object]] = None):
+        self.name = name
+        self.module_name = module
+        self.description = description
+        self.warm = warm
+        self.load_time: Optional[float] = None
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """Importer le module (une seule fois) et mesurer la durée d'import"""
+        module = self._module
+        if module is not None:
+            return module
+        with self._lock:
+            if self._module is None:
+                start = time.perf_counter()
+                module = importlib.import_module(self.module_name)
+                self.load_time = time.perf_counter() - start
+                self._module = module
+                logger.info(f"Dataset {self.name} loaded in {self.load_time * 1000:.0f} ms")
+        return self._module
+
+
+class LazyModule:
+    """Attribute access proxy for a dataset module"""
+
+    def __init__(self, dataset: Dataset):
+        self._dataset = dataset
+
+    def __getattr__(self, attr: str):
+        return getattr(self._dataset.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._dataset.loaded else "not loaded"
+        return f"<LazyModule {self._dataset.module_name} ({state})>"
+
+
+class DatasetRegistry:
+    """
+    Registry of lazily imported dataset modules
+    """
+
+    def __init__(self):
+        self._datasets: Dict[str, Dataset] = {}
+
+    def register(self, name: str, module: str, description: str = "",
+                 warm: Optional[Callable[[ModuleType], object]] = None) -> Dataset:
+        dataset = self._datasets[name] = Dataset(name, module, description, warm)
+        return dataset
+
+    def __getitem__(self, name: str) -> Dataset:
+        return self._datasets[name]
+
+    def __iter__(self):
+        return iter(self._datasets.values())
+
+    def __len__(self) -> int:
+        return len(self._datasets)
+
+    def names(self) -> List[str]:
+        return list(self._datasets)
+
+    def load(self, name: str) -> ModuleType:
+        return self._datasets[name].load()
+
+    def module(self, name: str) -> LazyModule:
+        return LazyModule(self._datasets[name])
+
+    def function(self, name: str, attr: str) -> Callable:
+        """Proxy d'une fonction du jeu de données, résolue au premier appel"""
+        dataset = self._datasets[name]
+        target = None
+
+        def proxy(*args, **kwargs):
+            nonlocal target
+            if target is None:
+                target = getattr(dataset.load(), attr)
+            return target(*args, **kwargs)
+
+        proxy.__name__ = proxy.__qualname__ = attr
+        proxy.__doc__ = f"Lazy proxy for {dataset.module_name}.{attr}"
+        return proxy
+
+    def functions(self, name: str, *attrs: str) -> Tuple[Callable, ...]:
+        return tuple(self.function(name, attr) for attr in attrs)
+
+    def resolve(self, names: Optional[str]) -> List[str]:
+        """Noms de jeux de données pour une valeur de DATASET_WARMUP"""
+        if not names or names.strip().lower() == "none":
+            return []
+        if names.strip().lower() == "all":
+            return self.names()
+        selected = [n.strip() for n in names.split(",") if n.strip()]
+        unknown = [n for n in selected if n not in self._datasets]
+        if unknown:
+            raise ValueError(f"Unknown datasets: {', '.join(unknown)}")
+        return selected
+
+    def warm_up(self, names: Iterable[str]) -> Dict[str, float]:
+        """
+        Charger les jeux de données (et leurs index) avant les premières requêtes
+
+        Returns:
+            {nom: durée en secondes}
+        """
+        timings = {}
+        for name in names:
+            dataset = self._datasets[name]
+            start = time.perf_counter()
+            try:
+                module = dataset.load()
+                if dataset.warm is not None:
+                    dataset.warm(module)
+            except Exception as e:
+                logger.error(f"Dataset {name} warm-up error: {e}")
+                continue
+            timings[name] = time.perf_counter() - start
+        return timings
+
+    def status(self) -> List[Dict]:
+        return [
+            {
+                "name": dataset.name,
+                "module": dataset.module_name,
+                "loaded": dataset.loaded,
+                "load_ms": round(dataset.load_time * 1000, 1) if dataset.load_time is not None else None
+            }
+            for dataset in self
+        ]
+
+
+DATASETS = DatasetRegistry()
+
+DATASETS.register("country_data", "country_data", "Profils économiques des 54 pays")
+DATASETS.register("gold_reserves", "gold_reserves_data", "Réserves d'or et indice GAI 2025")
+DATASETS.register("projects", "projects_data", "Projets structurants par pays")
+DATASETS.register("ports", "logistics_data", "Ports africains")
+DATASETS.register("airports", "logistics_air_data", "Aéroports et fret aérien")
+DATASETS.register("corridors", "logistics_land_data", "Corridors terrestres et OSBP")
+DATASETS.register("free_zones", "free_zones_data", "Zones franches")
+DATASETS.register("logistics_graph", "logistics_graph", "Graphe multimodal et itinéraires",
+                  warm=lambda module: module.get_graph().warm_countries())
+DATASETS.register("production", "production_data", "Production et valeur ajoutée")
+DATASETS.register("faostat", "etl.faostat_data", "FAOSTAT agriculture et pêche")
+DATASETS.register("unido", "etl.unido_data", "UNIDO production manufacturière")
+DATASETS.register("trade_products", "etl.trade_products_data", "Top 20 produits échangés")
+DATASETS.register("unctad", "etl.unctad_data", "CNUCED ports, flux, LSCI")
+DATASETS.register("news", "etl.news_aggregator", "Actualités économiques (flux RSS)")
+DATASETS.register("rules_of_origin", "etl.afcfta_rules_of_origin", "Règles d'origine ZLECAf",
+                  warm=lambda module: module.get_rule_table())
+DATASETS.register("hs_codes", "etl.hs_codes_data", "Nomenclature SH2022",
+                  warm=lambda module: module._get_search_index())
+DATASETS.register("hs6_database", "etl.hs6_database", "Base HS6 complète",
+                  warm=lambda module: module.get_hs6_search_index())
+DATASETS.register("hs6_tariffs", "etl.hs6_tariffs", "Tarifs SH6 par secteur")
+DATASETS.register("country_tariffs", "etl.country_tariffs", "Tarifs par chapitre (TEC)")
+DATASETS.register("country_tariffs_complete", "etl.country_tariffs_complete", "Taux NPF, TVA et taxes par pays")
+DATASETS.register("country_hs6_tariffs", "etl.country_hs6_tariffs", "Tarifs SH6 par pays")
+DATASETS.register("country_hs6_detailed", "etl.country_hs6_detailed", "Sous-positions nationales")
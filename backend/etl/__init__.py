@@ -7,30 +7,47 @@ Données enrichies pour l'analyse de production:
 - Production industrielle UNIDO
 """
 
-from .ports_etl import PortsETL, run_etl
-from .trs_official_data import TRS_OFFICIAL_DATA, LPI_2023_DATA, GLOBAL_BENCHMARKS
-from .faostat_data import (
-    FAOSTAT_AGRICULTURE_DATA,
-    AFRICA_TOP_PRODUCERS,
-    FISHERIES_TOP_PRODUCERS,
-    get_faostat_country_data,
-    get_africa_top_producers,
-    get_all_commodities,
-    get_countries_with_data,
-    get_all_faostat_data,
-    get_fisheries_rankings,
-    get_faostat_statistics
-)
-from .unido_data import (
-    UNIDO_INDUSTRY_DATA,
-    ISIC_SECTORS,
-    get_unido_country_data,
-    get_all_unido_data,
-    get_isic_sectors,
-    get_countries_by_mva,
-    get_sector_analysis,
-    get_unido_statistics
-)
+import importlib
+
+# Les sous-modules ne sont importés qu'au premier accès à l'un de leurs
+# noms: `from etl.hs6_database import ...` ne charge plus FAOSTAT/UNIDO.
+_SUBMODULE_EXPORTS = {
+    "ports_etl": ["PortsETL", "run_etl"],
+    "trs_official_data": ["TRS_OFFICIAL_DATA", "LPI_2023_DATA", "GLOBAL_BENCHMARKS"],
+    "faostat_data": [
+        "FAOSTAT_AGRICULTURE_DATA",
+        "AFRICA_TOP_PRODUCERS",
+        "FISHERIES_TOP_PRODUCERS",
+        "get_faostat_country_data",
+        "get_africa_top_producers",
+        "get_all_commodities",
+        "get_countries_with_data",
+        "get_all_faostat_data",
+        "get_fisheries_rankings",
+        "get_faostat_statistics",
+    ],
+    "unido_data": [
+        "UNIDO_INDUSTRY_DATA",
+        "ISIC_SECTORS",
+        "get_unido_country_data",
+        "get_all_unido_data",
+        "get_isic_sectors",
+        "get_countries_by_mva",
+        "get_sector_analysis",
+        "get_unido_statistics",
+    ],
+}
+_EXPORTS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Ports
@@ -22,6 +22,9 @@ which is the most recent official data published by the AU Secretariat as of
 the implementation date (January 2026).
 """
 
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
 # Rule type translations
 ORIGIN_TYPES = {
     "WO": {"en": "Wholly Obtained", "fr": "Entièrement Obtenu"},
@@ -1334,118 +1337,119 @@ def get_heading_rule(heading: str, lang: str = "fr") -> dict:
 def is_ytb(hs_code: str) -> bool:
     """Check if a heading is yet to be agreed"""
     heading = hs_code.replace(".", "")[:4]
-    return heading in YTB_HEADINGS
+    return heading in _YTB_HEADINGS_SET
 
 
-def get_rule_of_origin(hs_code: str, lang: str = "fr") -> dict:
-    """
-    Get rules of origin for an HS code.
-    
-    Priority order:
-    1. Heading-specific rule (4-digit)
-    2. Chapter-level rule (2-digit)
-    
-    Returns a complete rule structure with all metadata.
-    """
-    hs_clean = hs_code.replace(".", "").replace(" ", "")
-    hs6 = hs_clean[:6].ljust(6, '0') if len(hs_clean) >= 6 else hs_clean.ljust(6, '0')
-    heading = hs_clean[:4]
-    chapter = hs_clean[:2].zfill(2)
-    
-    # Check if heading is yet to be agreed
-    if is_ytb(hs_code):
-        return {
-            "hs6_code": hs6,
-            "heading": heading,
-            "chapter": chapter,
-            "status": "YTB",
-            "primary_rule": {
-                "code": "YTB",
-                "type": "YTB",
-                "name": "En cours de négociation" if lang == "fr" else "Yet to be agreed",
-                "description": "Les règles pour ce produit sont encore en négociation" if lang == "fr" else "Rules for this product are still under negotiation"
-            },
-            "alternative_rule": None,
-            "regional_content": 40,  # Default minimum
-            "notes": "Les négociations sont en cours pour établir les règles d'origine spécifiques à ce produit. Les règles génériques du chapitre peuvent s'appliquer en attendant." if lang == "fr" else "Negotiations are ongoing to establish product-specific rules of origin. Chapter-level generic rules may apply in the interim.",
-            "source": "CHAPTER_FALLBACK",
-            "source_detail": "AfCFTA Annex II Appendix IV - Heading under negotiation"
-        }
-    
-    # Try heading-specific rule first
+# ============================================================================
+# PRECOMPUTED RESOLUTION TABLE
+# ============================================================================
+# Le résultat de get_rule_of_origin ne dépend que de la position (4 chiffres)
+# et de la langue: une réponse par position YTB ou HEADING_RULES, une par
+# chapitre (repli), une pour les codes sans règle. Ces réponses sont
+# calculées une seule fois par langue; seuls hs6_code / heading / chapter
+# sont renseignés à chaque appel.
+RULE_LANGUAGES = ("fr", "en")
+
+_YTB_HEADINGS_SET = frozenset(YTB_HEADINGS)
+
+# {langue: (réponses par position, réponses par chapitre, réponse inconnue)}
+_rule_table: Optional[Dict[str, Tuple[Mapping, Mapping, dict]]] = None
+
+
+def _ytb_rule(heading: str, chapter: str, lang: str) -> dict:
+    return {
+        "hs6_code": None,
+        "heading": heading,
+        "chapter": chapter,
+        "status": "YTB",
+        "primary_rule": {
+            "code": "YTB",
+            "type": "YTB",
+            "name": "En cours de négociation" if lang == "fr" else "Yet to be agreed",
+            "description": "Les règles pour ce produit sont encore en négociation" if lang == "fr" else "Rules for this product are still under negotiation"
+        },
+        "alternative_rule": None,
+        "regional_content": 40,  # Default minimum
+        "notes": "Les négociations sont en cours pour établir les règles d'origine spécifiques à ce produit. Les règles génériques du chapitre peuvent s'appliquer en attendant." if lang == "fr" else "Negotiations are ongoing to establish product-specific rules of origin. Chapter-level generic rules may apply in the interim.",
+        "source": "CHAPTER_FALLBACK",
+        "source_detail": "AfCFTA Annex II Appendix IV - Heading under negotiation"
+    }
+
+
+def _heading_rule(heading: str, chapter: str, lang: str) -> dict:
     heading_rule = get_heading_rule(heading, lang)
-    if heading_rule:
-        primary_code = heading_rule["primary_code"]
-        alt_code = heading_rule.get("alt_code")
-        max_non_orig = heading_rule.get("max_non_originating", 0)
-        
-        # Calculate regional content (inverse of max non-originating)
-        # For Wholly Obtained (max_non_orig = 0), regional content is 100%
-        regional_content = 100 - max_non_orig
-        
-        return {
-            "hs6_code": hs6,
-            "heading": heading,
-            "chapter": chapter,
-            "chapter_description": CHAPTER_RULES.get(chapter, {}).get(f"description_{lang}", ""),
-            "status": heading_rule.get("status", "AGREED"),
-            "primary_rule": {
-                "code": primary_code,
-                "type": primary_code,
-                "name": heading_rule["primary_name"],
-                "description": heading_rule.get("rule_text", heading_rule["primary_name"])
-            },
-            "alternative_rule": {
-                "code": alt_code,
-                "type": alt_code,
-                "name": heading_rule["alt_name"],
-                "description": ORIGIN_TYPES.get(alt_code, {}).get(lang, alt_code) if alt_code else None
-            } if alt_code else None,
-            "regional_content": regional_content,
-            "notes": heading_rule.get("description", ""),
-            "source": "HEADING",
-            "source_detail": f"AfCFTA Annex II Appendix IV - Heading {heading}"
-        }
-    
-    # Fall back to chapter rule
-    chapter_rule = get_chapter_rule(chapter, lang)
-    if chapter_rule:
-        primary_code = chapter_rule["primary_code"]
-        alt_code = chapter_rule.get("alt_code")
-        max_non_orig = chapter_rule.get("max_non_originating", 0)
-        
-        # For Wholly Obtained (max_non_orig = 0), regional content is 100%
-        regional_content = 100 - max_non_orig
-        
-        return {
-            "hs6_code": hs6,
-            "heading": heading,
-            "chapter": chapter,
-            "chapter_description": chapter_rule.get("description", ""),
-            "status": chapter_rule.get("status", "AGREED"),
-            "primary_rule": {
-                "code": primary_code,
-                "type": primary_code,
-                "name": chapter_rule["primary_name"],
-                "description": chapter_rule.get("rule_text", chapter_rule["primary_name"])
-            },
-            "alternative_rule": {
-                "code": alt_code,
-                "type": alt_code,
-                "name": chapter_rule["alt_name"],
-                "description": ORIGIN_TYPES.get(alt_code, {}).get(lang, alt_code) if alt_code else None
-            } if alt_code else None,
-            "regional_content": regional_content,
-            "notes": "",
-            "source": "CHAPTER",
-            "source_detail": f"AfCFTA Annex II Appendix IV - Chapter {chapter}"
-        }
-    
-    # No rule found
+    primary_code = heading_rule["primary_code"]
+    alt_code = heading_rule.get("alt_code")
+    max_non_orig = heading_rule.get("max_non_originating", 0)
+
+    # Calculate regional content (inverse of max non-originating)
+    # For Wholly Obtained (max_non_orig = 0), regional content is 100%
+    regional_content = 100 - max_non_orig
+
     return {
-        "hs6_code": hs6,
+        "hs6_code": None,
         "heading": heading,
         "chapter": chapter,
+        "chapter_description": CHAPTER_RULES.get(chapter, {}).get(f"description_{lang}", ""),
+        "status": heading_rule.get("status", "AGREED"),
+        "primary_rule": {
+            "code": primary_code,
+            "type": primary_code,
+            "name": heading_rule["primary_name"],
+            "description": heading_rule.get("rule_text", heading_rule["primary_name"])
+        },
+        "alternative_rule": {
+            "code": alt_code,
+            "type": alt_code,
+            "name": heading_rule["alt_name"],
+            "description": ORIGIN_TYPES.get(alt_code, {}).get(lang, alt_code) if alt_code else None
+        } if alt_code else None,
+        "regional_content": regional_content,
+        "notes": heading_rule.get("description", ""),
+        "source": "HEADING",
+        "source_detail": f"AfCFTA Annex II Appendix IV - Heading {heading}"
+    }
+
+
+def _chapter_rule(chapter: str, lang: str) -> dict:
+    chapter_rule = get_chapter_rule(chapter, lang)
+    primary_code = chapter_rule["primary_code"]
+    alt_code = chapter_rule.get("alt_code")
+    max_non_orig = chapter_rule.get("max_non_originating", 0)
+
+    # For Wholly Obtained (max_non_orig = 0), regional content is 100%
+    regional_content = 100 - max_non_orig
+
+    return {
+        "hs6_code": None,
+        "heading": None,
+        "chapter": chapter,
+        "chapter_description": chapter_rule.get("description", ""),
+        "status": chapter_rule.get("status", "AGREED"),
+        "primary_rule": {
+            "code": primary_code,
+            "type": primary_code,
+            "name": chapter_rule["primary_name"],
+            "description": chapter_rule.get("rule_text", chapter_rule["primary_name"])
+        },
+        "alternative_rule": {
+            "code": alt_code,
+            "type": alt_code,
+            "name": chapter_rule["alt_name"],
+            "description": ORIGIN_TYPES.get(alt_code, {}).get(lang, alt_code) if alt_code else None
+        } if alt_code else None,
+        "regional_content": regional_content,
+        "notes": "",
+        "source": "CHAPTER",
+        "source_detail": f"AfCFTA Annex II Appendix IV - Chapter {chapter}"
+    }
+
+
+def _unknown_rule(lang: str) -> dict:
+    return {
+        "hs6_code": None,
+        "heading": None,
+        "chapter": None,
         "status": "UNKNOWN",
         "primary_rule": None,
         "alternative_rule": None,
@@ -1456,6 +1460,79 @@ def get_rule_of_origin(hs_code: str, lang: str = "fr") -> dict:
     }
 
 
+def _build_language_table(lang: str) -> Tuple[Mapping, Mapping, dict]:
+    headings = {heading: _heading_rule(heading, heading[:2], lang) for heading in HEADING_RULES}
+    # Priorité aux positions en négociation
+    headings.update((heading, _ytb_rule(heading, heading[:2], lang)) for heading in YTB_HEADINGS)
+    chapters = {chapter: _chapter_rule(chapter, lang) for chapter in CHAPTER_RULES}
+    return MappingProxyType(headings), MappingProxyType(chapters), _unknown_rule(lang)
+
+
+def get_rule_table() -> Dict[str, Tuple[Mapping, Mapping, dict]]:
+    """Table des réponses précalculées par langue (construite au premier appel)"""
+    global _rule_table
+    if _rule_table is None:
+        _rule_table = {lang: _build_language_table(lang) for lang in RULE_LANGUAGES}
+    return _rule_table
+
+
+def _lookup(table: Optional[Tuple[Mapping, Mapping, dict]], hs_code: str, lang: str) -> dict:
+    hs_clean = hs_code.replace(".", "").replace(" ", "")
+    hs6 = hs_clean[:6].ljust(6, '0') if len(hs_clean) >= 6 else hs_clean.ljust(6, '0')
+    heading = hs_clean[:4]
+    chapter = hs_clean[:2].zfill(2)
+
+    if table is None:
+        # Langue hors table: réponse calculée à la demande
+        if heading in _YTB_HEADINGS_SET:
+            template = _ytb_rule(heading, chapter, lang)
+        elif heading in HEADING_RULES:
+            template = _heading_rule(heading, chapter, lang)
+        elif chapter in CHAPTER_RULES:
+            template = _chapter_rule(chapter, lang)
+        else:
+            template = _unknown_rule(lang)
+    else:
+        headings, chapters, unknown = table
+        template = headings.get(heading) or chapters.get(chapter) or unknown
+
+    # Copie: les appelants peuvent modifier la réponse sans altérer la table
+    rule = template.copy()
+    rule["hs6_code"] = hs6
+    rule["heading"] = heading
+    rule["chapter"] = chapter
+    primary, alternative = rule["primary_rule"], rule["alternative_rule"]
+    if primary is not None:
+        rule["primary_rule"] = primary.copy()
+    if alternative is not None:
+        rule["alternative_rule"] = alternative.copy()
+    return rule
+
+
+def get_rule_of_origin(hs_code: str, lang: str = "fr") -> dict:
+    """
+    Get rules of origin for an HS code.
+    
+    Priority order:
+    1. Heading under negotiation (YTB)
+    2. Heading-specific rule (4-digit)
+    3. Chapter-level rule (2-digit)
+    
+    Returns a complete rule structure with all metadata, read from the
+    precomputed table (see get_rule_table).
+    """
+    return _lookup(get_rule_table().get(lang), hs_code, lang)
+
+
+def resolve_many(hs_codes: Iterable[str], lang: str = "fr") -> List[dict]:
+    """
+    Règles d'origine d'une liste de codes SH, dans l'ordre des codes
+    (calculs par lot, exports)
+    """
+    table = get_rule_table().get(lang)
+    return [_lookup(table, hs_code, lang) for hs_code in hs_codes]
+
+
 def get_rule_summary(hs_code: str, lang: str = "fr") -> str:
     """Get a human-readable summary of the rule of origin for an HS code"""
     rule = get_rule_of_origin(hs_code, lang)
@@ -15,6 +15,8 @@ Pour les codes non listés, le système utilise les taux par chapitre du pays.
 
 from typing import Dict, Optional, Tuple
 
+from etl.hs_search_index import HSSearchIndex
+
 # Import des tarifs par région
 from etl.country_hs6_tariffs_cedeao_cemac import (
     SEN_HS6_TARIFFS, MLI_HS6_TARIFFS, BFA_HS6_TARIFFS, BEN_HS6_TARIFFS,
@@ -568,9 +570,24 @@ def get_country_hs6_dd_rate(country_code: str, hs6_code: str) -> Tuple[Optional[
     return (None, "Non disponible - utiliser taux chapitre")
 
 
+_search_indexes: Dict[str, HSSearchIndex] = {}
+
+
+def _get_search_index(country_iso3: str) -> HSSearchIndex:
+    """Index de recherche des tarifs SH6 d'un pays (construit au premier appel)"""
+    index = _search_indexes.get(country_iso3)
+    if index is None:
+        index = HSSearchIndex(
+            (code, {"fr": data.get("description_fr", ""), "en": data.get("description_en", "")})
+            for code, data in COUNTRY_HS6_TARIFFS.get(country_iso3, {}).items()
+        )
+        _search_indexes[country_iso3] = index
+    return index
+
+
 def search_country_hs6_tariffs(country_code: str, query: str, language: str = 'fr', limit: int = 20) -> list:
     """
-    Rechercher des codes SH6 avec tarifs dans un pays
+    Rechercher des codes SH6 avec tarifs dans un pays (code ou mot-clé, accents ignorés)
     """
     # Normaliser le code pays
     if len(country_code) == 2:
@@ -578,23 +595,21 @@ def search_country_hs6_tariffs(country_code: str, query: str, language: str = 'f
     else:
         country_iso3 = country_code.upper()
     
-    country_tariffs = COUNTRY_HS6_TARIFFS.get(country_iso3, {})
-    query_lower = query.lower()
-    results = []
+    if country_iso3 not in COUNTRY_HS6_TARIFFS:
+        return []
     
+    country_tariffs = COUNTRY_HS6_TARIFFS[country_iso3]
     desc_key = f"description_{language}"
+    results = []
     
-    for code, data in country_tariffs.items():
-        description = data.get(desc_key, data.get("description_fr", ""))
-        if query_lower in description.lower() or query_lower in code:
-            results.append({
-                "hs6_code": code,
-                "description": description,
-                "dd_rate": data["dd"],
-                "dd_rate_pct": f"{data['dd'] * 100:.1f}%"
-            })
-            if len(results) >= limit:
-                break
+    for code in _get_search_index(country_iso3).search(query, language, limit):
+        data = country_tariffs[code]
+        results.append({
+            "hs6_code": code,
+            "description": data.get(desc_key, data.get("description_fr", "")),
+            "dd_rate": data["dd"],
+            "dd_rate_pct": f"{data['dd'] * 100:.1f}%"
+        })
     
     return results
 
@@ -273,46 +273,37 @@ COUNTRY_OTHER_TAXES = {
 # TAUX ZLECAf PAR CATÉGORIE DE PRODUIT
 # =============================================================================
 
+# Produits sensibles (10% des lignes, réduction sur 10-13 ans)
+SENSITIVE_CHAPTERS = frozenset(["01", "02", "04", "10", "11", "17", "22", "24", "52", "61", "62", "64", "87"])
+
+# Produits exclus (certains produits stratégiques nationaux)
+EXCLUDED_CHAPTERS = frozenset()  # Varie par pays
+
+# Liste des PMA africains
+LDC_COUNTRIES = frozenset([
+    "BEN", "BFA", "BDI", "CAF", "TCD", "COM", "COD", "DJI", "ERI", "ETH",
+    "GMB", "GIN", "GNB", "LSO", "LBR", "MDG", "MWI", "MLI", "MRT", "MOZ",
+    "NER", "RWA", "STP", "SEN", "SLE", "SOM", "SSD", "SDN", "TZA", "TGO",
+    "UGA", "ZMB"
+])
+
+ZLECAF_CURRENT_YEAR = 5  # 2025 = année 5 du calendrier ZLECAf
+
+
 # Catégorie de produit selon chapitre HS
 def get_product_category(hs_chapter: str) -> str:
     """Déterminer la catégorie de produit pour le calendrier ZLECAf"""
     chapter = hs_chapter[:2].zfill(2)
     
-    # Produits sensibles (10% des lignes, réduction sur 10-13 ans)
-    sensitive_chapters = ["01", "02", "04", "10", "11", "17", "22", "24", "52", "61", "62", "64", "87"]
-    
-    # Produits exclus (certains produits stratégiques nationaux)
-    excluded_chapters = []  # Varie par pays
-    
-    if chapter in sensitive_chapters:
+    if chapter in SENSITIVE_CHAPTERS:
         return "sensitive"
-    elif chapter in excluded_chapters:
+    elif chapter in EXCLUDED_CHAPTERS:
         return "excluded"
     else:
         return "normal"
 
-# Facteur de réduction ZLECAf selon le calendrier
-def get_zlecaf_reduction_factor(country_iso3: str, product_category: str) -> float:
-    """
-    Calculer le facteur de réduction ZLECAf basé sur:
-    - Le statut du pays (PMA ou non-PMA)
-    - La catégorie du produit
-    - L'année actuelle (2025)
-    
-    Année 1 = 2021 (entrée en vigueur)
-    Année 5 = 2025 (année actuelle)
-    """
-    # Liste des PMA africains
-    LDC_COUNTRIES = [
-        "BEN", "BFA", "BDI", "CAF", "TCD", "COM", "COD", "DJI", "ERI", "ETH",
-        "GMB", "GIN", "GNB", "LSO", "LBR", "MDG", "MWI", "MLI", "MRT", "MOZ",
-        "NER", "RWA", "STP", "SEN", "SLE", "SOM", "SSD", "SDN", "TZA", "TGO",
-        "UGA", "ZMB"
-    ]
-    
-    is_ldc = country_iso3 in LDC_COUNTRIES
-    current_year = 5  # 2025 = année 5 du calendrier ZLECAf
-    
+
+def _compute_reduction_factor(is_ldc: bool, product_category: str, current_year: int) -> float:
     if product_category == "excluded":
         return 1.0  # Pas de réduction
     
@@ -342,36 +333,67 @@ def get_zlecaf_reduction_factor(country_iso3: str, product_category: str) -> flo
             progress = min(1.0, current_year / 5)
             return max(0.0, 1.0 - progress * 0.9)  # 90% de réduction sur 5 ans
 
-# =============================================================================
-# FONCTIONS PRINCIPALES
-# =============================================================================
 
-def get_tariff_rate_for_country(country_code: str, hs_code: str) -> Tuple[float, str]:
+# Facteurs de réduction par (statut PMA, catégorie) pour l'année en cours
+REDUCTION_FACTORS = {
+    (is_ldc, category): _compute_reduction_factor(is_ldc, category, ZLECAF_CURRENT_YEAR)
+    for is_ldc in (True, False)
+    for category in ("normal", "sensitive", "excluded")
+}
+
+
+# Facteur de réduction ZLECAf selon le calendrier
+def get_zlecaf_reduction_factor(country_iso3: str, product_category: str) -> float:
     """
-    Obtenir le taux de droit de douane pour un pays et un code HS
+    Calculer le facteur de réduction ZLECAf basé sur:
+    - Le statut du pays (PMA ou non-PMA)
+    - La catégorie du produit
+    - L'année actuelle (2025)
     
-    Args:
-        country_code: Code ISO3 ou ISO2 du pays
-        hs_code: Code HS (2 à 6 chiffres)
-        
-    Returns:
-        Tuple (taux en décimal, source)
+    Année 1 = 2021 (entrée en vigueur)
+    Année 5 = 2025 (année actuelle)
     """
-    # Normaliser le code pays en ISO3
-    if len(country_code) == 2:
-        country_iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
-    else:
-        country_iso3 = country_code.upper()
-    
-    # Obtenir les tarifs du pays
-    country_tariffs = COUNTRY_TARIFFS_MAP.get(country_iso3)
-    if not country_tariffs:
-        return (0.15, "Taux par défaut")  # 15% par défaut
-    
-    # Extraire le chapitre (2 premiers chiffres)
-    chapter = hs_code[:2].zfill(2)
-    
-    # Chercher le taux correspondant
+    is_ldc = country_iso3 in LDC_COUNTRIES
+    factor = REDUCTION_FACTORS.get((is_ldc, product_category))
+    if factor is None:
+        # Catégorie inconnue: calendrier des produits normaux
+        factor = REDUCTION_FACTORS[(is_ldc, "normal")]
+    return factor
+
+# =============================================================================
+# TABLES DE RÉSOLUTION COMPILÉES PAR PAYS
+# =============================================================================
+# Construites une fois au premier appel: taux NPF et ZLECAf par chapitre
+# (tableaux de 100 cases indexés par le chapitre), taux SH6 nationaux, TVA
+# et autres taxes. Les fonctions ci-dessous n'y font plus que des accès
+# directs.
+
+DEFAULT_NPF = (0.15, "Taux par défaut")  # Pays sans tarif national
+DEFAULT_VAT = {"vat": 18.0, "source": "Taux par défaut"}
+DEFAULT_OTHER_TAXES = {"other": 0.0}
+
+CATEGORY_NAMES = {
+    "normal": "produit normal",
+    "sensitive": "produit sensible",
+    "excluded": "produit exclu"
+}
+
+
+def _normalize_country(country_code: str) -> str:
+    code = country_code.upper()
+    if len(code) == 2:
+        return ISO2_TO_ISO3.get(code, code)
+    return code
+
+
+# Indice 0-99 du tableau par chapitre pour hs_code[:2] ("8" = "08", "" = "00")
+CHAPTER_SLOTS = {f"{i:02d}": i for i in range(100)}
+CHAPTER_SLOTS.update({str(i): i for i in range(10)})
+CHAPTER_SLOTS[""] = 0
+
+
+def _scan_tariff_buckets(country_iso3: str, country_tariffs: Dict, chapter: str) -> Tuple[float, str]:
+    """Parcours des tranches {taux: [chapitres]} d'un pays (compilation et chapitres non numériques)"""
     for rate_str, chapters in country_tariffs.items():
         if rate_str == "00":
             rate = 0.0
@@ -388,6 +410,135 @@ def get_tariff_rate_for_country(country_code: str, hs_code: str) -> Tuple[float,
     return (0.10, f"Taux générique {country_iso3}")
 
 
+class CountryTariffTable:
+    """
+    Precompiled tariff resolution table of a destination country
+    """
+
+    __slots__ = (
+        "iso3", "tariffs", "npf_by_chapter", "zlecaf_by_chapter", "hs6_rates",
+        "vat_rate", "vat_source", "other_taxes_rate", "other_taxes"
+    )
+
+    def __init__(self, iso3: str, hs6_tariffs: Dict[str, Dict]):
+        self.iso3 = iso3
+        self.tariffs = COUNTRY_TARIFFS_MAP.get(iso3)
+        if self.tariffs:
+            self.npf_by_chapter = tuple(
+                _scan_tariff_buckets(iso3, self.tariffs, f"{i:02d}") for i in range(100)
+            )
+        else:
+            self.npf_by_chapter = (DEFAULT_NPF,) * 100
+        self.zlecaf_by_chapter = tuple(
+            self._zlecaf_rate(rate, f"{i:02d}") for i, (rate, _) in enumerate(self.npf_by_chapter)
+        )
+        self.hs6_rates = {code: info["dd"] for code, info in hs6_tariffs.items() if info}
+
+        vat_info = COUNTRY_VAT_RATES.get(iso3, DEFAULT_VAT)
+        self.vat_rate = vat_info["vat"] / 100
+        self.vat_source = vat_info["source"]
+
+        # Total des autres taxes (hors clé "other")
+        self.other_taxes = COUNTRY_OTHER_TAXES.get(iso3, DEFAULT_OTHER_TAXES)
+        self.other_taxes_rate = sum(
+            v for k, v in self.other_taxes.items() if k != "other" and isinstance(v, (int, float))
+        ) / 100
+
+    def npf_rate(self, hs_code: str) -> Tuple[float, str]:
+        """Taux NPF par chapitre (taux, source)"""
+        index = CHAPTER_SLOTS.get(hs_code[:2])
+        if index is not None:
+            return self.npf_by_chapter[index]
+        if not self.tariffs:
+            return DEFAULT_NPF
+        return _scan_tariff_buckets(self.iso3, self.tariffs, hs_code[:2].zfill(2))
+
+    def zlecaf_rate(self, hs_code: str) -> Tuple[float, str]:
+        """Taux ZLECAf par chapitre (taux, source)"""
+        index = CHAPTER_SLOTS.get(hs_code[:2])
+        if index is not None:
+            return self.zlecaf_by_chapter[index]
+        return self._zlecaf_rate(self.npf_rate(hs_code)[0], hs_code)
+
+    def _zlecaf_rate(self, npf_rate: float, hs_code: str) -> Tuple[float, str]:
+        product_category = get_product_category(hs_code)
+        reduction_factor = get_zlecaf_reduction_factor(self.iso3, product_category)
+        return (npf_rate * reduction_factor, f"ZLECAf ({CATEGORY_NAMES.get(product_category, '')})")
+
+
+_tariff_tables: Optional[Dict[str, CountryTariffTable]] = None
+_tables_by_code: Dict[str, CountryTariffTable] = {}
+
+
+def get_tariff_tables() -> Dict[str, CountryTariffTable]:
+    """Tables compilées de tous les pays (construites au premier appel)"""
+    global _tariff_tables
+    if _tariff_tables is None:
+        from etl.country_hs6_tariffs import COUNTRY_HS6_TARIFFS
+        countries = list(COUNTRY_TARIFFS_MAP)
+        countries += [iso3 for iso3 in list(COUNTRY_VAT_RATES) + list(COUNTRY_OTHER_TAXES) if iso3 not in countries]
+        tables = {
+            iso3: CountryTariffTable(iso3, COUNTRY_HS6_TARIFFS.get(iso3, {}))
+            for iso3 in countries
+        }
+        # Accès direct par code ISO3 ou ISO2
+        _tables_by_code.update(tables)
+        _tables_by_code.update({iso2: tables[iso3] for iso2, iso3 in ISO2_TO_ISO3.items() if iso3 in tables})
+        _tariff_tables = tables
+    return _tariff_tables
+
+
+def get_tariff_table(country_code: str) -> Optional[CountryTariffTable]:
+    """Table compilée d'un pays (code ISO2 ou ISO3), None si pays inconnu"""
+    if _tariff_tables is None:
+        get_tariff_tables()
+    table = _tables_by_code.get(country_code)
+    if table is None:
+        table = _tables_by_code.get(country_code.upper())
+    return table
+
+
+# =============================================================================
+# FONCTIONS PRINCIPALES
+# =============================================================================
+
+def get_tariff_rate_for_country(country_code: str, hs_code: str) -> Tuple[float, str]:
+    """
+    Obtenir le taux de droit de douane pour un pays et un code HS
+    
+    Args:
+        country_code: Code ISO3 ou ISO2 du pays
+        hs_code: Code HS (2 à 6 chiffres)
+        
+    Returns:
+        Tuple (taux en décimal, source)
+    """
+    table = get_tariff_table(country_code)
+    if table is None:
+        return DEFAULT_NPF
+    return table.npf_rate(hs_code)
+
+
+def resolve_npf_rate(country_code: str, hs6_code: str) -> Tuple[float, str, str]:
+    """
+    Taux NPF d'un code SH6: tarif SH6 national, sinon taux par chapitre
+    
+    Args:
+        country_code: Code ISO3 ou ISO2 du pays
+        hs6_code: Code SH à 6 chiffres
+        
+    Returns:
+        Tuple (taux en décimal, source, précision "hs6_country" ou "chapter")
+    """
+    table = get_tariff_table(country_code)
+    if table is None:
+        return DEFAULT_NPF + ("chapter",)
+    rate = table.hs6_rates.get(hs6_code)
+    if rate is not None:
+        return (rate, f"Tarif SH6 {table.iso3} ({hs6_code})", "hs6_country")
+    return table.npf_rate(hs6_code) + ("chapter",)
+
+
 def get_zlecaf_tariff_rate(country_code: str, hs_code: str) -> Tuple[float, str]:
     """
     Obtenir le taux ZLECAf réduit pour un pays et un code HS
@@ -399,29 +550,13 @@ def get_zlecaf_tariff_rate(country_code: str, hs_code: str) -> Tuple[float, str]
     Returns:
         Tuple (taux ZLECAf en décimal, source)
     """
-    # Normaliser le code pays
-    if len(country_code) == 2:
-        country_iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
-    else:
-        country_iso3 = country_code.upper()
-    
-    # Obtenir le taux NPF
-    npf_rate, _ = get_tariff_rate_for_country(country_iso3, hs_code)
-    
-    # Déterminer la catégorie et le facteur de réduction
-    product_category = get_product_category(hs_code)
-    reduction_factor = get_zlecaf_reduction_factor(country_iso3, product_category)
-    
-    # Calculer le taux ZLECAf
-    zlecaf_rate = npf_rate * reduction_factor
-    
-    category_name = {
-        "normal": "produit normal",
-        "sensitive": "produit sensible",
-        "excluded": "produit exclu"
-    }.get(product_category, "")
-    
-    return (zlecaf_rate, f"ZLECAf ({category_name})")
+    table = get_tariff_table(country_code)
+    if table is None:
+        # Pays inconnu: taux NPF par défaut, calendrier non-PMA
+        product_category = get_product_category(hs_code)
+        reduction_factor = get_zlecaf_reduction_factor(_normalize_country(country_code), product_category)
+        return (DEFAULT_NPF[0] * reduction_factor, f"ZLECAf ({CATEGORY_NAMES.get(product_category, '')})")
+    return table.zlecaf_rate(hs_code)
 
 
 def get_vat_rate_for_country(country_code: str) -> Tuple[float, str]:
@@ -434,13 +569,10 @@ def get_vat_rate_for_country(country_code: str) -> Tuple[float, str]:
     Returns:
         Tuple (taux TVA en décimal, source)
     """
-    if len(country_code) == 2:
-        country_iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
-    else:
-        country_iso3 = country_code.upper()
-    
-    vat_info = COUNTRY_VAT_RATES.get(country_iso3, {"vat": 18.0, "source": "Taux par défaut"})
-    return (vat_info["vat"] / 100, vat_info["source"])
+    table = get_tariff_table(country_code)
+    if table is None:
+        return (DEFAULT_VAT["vat"] / 100, DEFAULT_VAT["source"])
+    return (table.vat_rate, table.vat_source)
 
 
 def get_other_taxes_for_country(country_code: str) -> Tuple[float, Dict]:
@@ -453,17 +585,10 @@ def get_other_taxes_for_country(country_code: str) -> Tuple[float, Dict]:
     Returns:
         Tuple (total autres taxes en décimal, détail des taxes)
     """
-    if len(country_code) == 2:
-        country_iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
-    else:
-        country_iso3 = country_code.upper()
-    
-    taxes = COUNTRY_OTHER_TAXES.get(country_iso3, {"other": 0.0})
-    
-    # Calculer le total (exclure la clé "other" du total)
-    total = sum(v for k, v in taxes.items() if k != "other" and isinstance(v, (int, float)))
-    
-    return (total / 100, taxes)
+    table = get_tariff_table(country_code)
+    if table is None:
+        return (0.0, DEFAULT_OTHER_TAXES)
+    return (table.other_taxes_rate, table.other_taxes)
 
 
 def get_complete_taxes_for_country(country_code: str, hs_code: str, value_cif: float) -> Dict:
@@ -553,14 +678,14 @@ def get_all_country_rates() -> Dict:
     # Chapitres test
     test_chapters = ["01", "18", "27", "61", "84", "87"]
     
+    tables = get_tariff_tables()
     for iso3 in COUNTRY_TARIFFS_MAP.keys():
+        table = tables[iso3]
         result[iso3] = {
             "vat": COUNTRY_VAT_RATES.get(iso3, {}).get("vat", 18.0),
-            "tariffs_by_chapter": {}
+            "tariffs_by_chapter": {
+                ch: f"{table.npf_by_chapter[int(ch)][0]*100:.1f}%" for ch in test_chapters
+            }
         }
-        
-        for ch in test_chapters:
-            rate, _ = get_tariff_rate_for_country(iso3, ch)
-            result[iso3]["tariffs_by_chapter"][ch] = f"{rate*100:.1f}%"
     
     return result
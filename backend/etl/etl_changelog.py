@@ -0,0 +1,291 @@
+"""
+JOURNAL DES MODIFICATIONS ETL (append-only)
+===========================================
+Remplace l'ancien etl_log.json, relu et réécrit en entier à chaque
+exécution du pipeline.
+
+Structure du répertoire (etl/etl_log/):
+- segment-000001.jsonl, segment-000002.jsonl... : une entrée JSON par
+  ligne, ajoutée en fin de fichier; un nouveau segment est ouvert au-delà
+  de SEGMENT_MAX_BYTES
+- index.json: petit index de queue, réécrit atomiquement après chaque
+  exécution: segments (nombre d'entrées, taille), dernières exécutions et,
+  pour chaque port, la position (segment, offset) de ses dernières entrées
+
+Les questions courantes (dernière exécution, N dernières modifications,
+modifications d'un port) ne lisent que l'index et quelques lignes, jamais
+l'historique complet. compact() supprime les entrées les plus anciennes au-delà
+d'une rétention et réécrit les segments restants.
+
+L'ancien etl_log.json est importé (sans être modifié) à la création du journal.
+"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ETL_DIR = Path(__file__).resolve().parent
+ETL_LOG_DIR = ETL_DIR / "etl_log"
+LEGACY_LOG_FILE = ETL_DIR / "etl_log.json"
+
+SEGMENT_MAX_BYTES = 1024 * 1024
+# Exécutions et entrées par port conservées dans l'index
+INDEX_RUNS = 50
+INDEX_PORT_ENTRIES = 20
+# Écart maximal entre deux entrées d'une même exécution (import de l'ancien log)
+LEGACY_RUN_GAP_SECONDS = 60
+
+
+def _segment_name(number: int) -> str:
+    return f"segment-{number:06d}.jsonl"
+
+
+def _empty_index() -> Dict:
+    return {"total_entries": 0, "segments": [], "runs": [], "ports": {}}
+
+
+class EtlChangeLog:
+    """
+    Segmented append-only change log with a small tail index
+    """
+
+    def __init__(self, root: Path = ETL_LOG_DIR, legacy_file: Optional[Path] = LEGACY_LOG_FILE,
+                 segment_max_bytes: int = SEGMENT_MAX_BYTES):
+        self.root = Path(root)
+        self.legacy_file = legacy_file
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.json"
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _read_index(self) -> Dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return _empty_index()
+
+    def _write_index(self, index: Dict) -> None:
+        tmp = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp, self.index_path)
+
+    def index(self) -> Dict:
+        """Index courant (crée le journal et importe l'ancien log si besoin)"""
+        with self._lock:
+            return self._ensure()
+
+    def _ensure(self) -> Dict:
+        if self.index_path.exists():
+            return self._read_index()
+        self.root.mkdir(parents=True, exist_ok=True)
+        index = _empty_index()
+        if self.legacy_file is not None and Path(self.legacy_file).exists():
+            with open(self.legacy_file, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+            for run in _legacy_runs(legacy):
+                self._append(index, run, run_id=f"legacy-{run[0].get('timestamp', '')}")
+            logger.info(f"📋 Log ETL importé: {len(legacy)} entrées depuis {self.legacy_file}")
+        self._write_index(index)
+        return index
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+
+    def _append(self, index: Dict, entries: List[Dict], run_id: str) -> Dict:
+        segments = index["segments"]
+        if not segments or segments[-1]["bytes"] >= self.segment_max_bytes:
+            number = int(segments[-1]["name"][8:14]) + 1 if segments else 1
+            segments.append({"name": _segment_name(number), "entries": 0, "bytes": 0})
+        segment = segments[-1]
+
+        path = self.root / segment["name"]
+        ports = index["ports"]
+        with open(path, "ab") as f:
+            f.seek(0, os.SEEK_END)
+            start = offset = f.tell()
+            for entry in entries:
+                line = json.dumps(dict(entry, run_id=run_id), ensure_ascii=False).encode("utf-8") + b"\n"
+                f.write(line)
+                port_id = entry.get("port_id")
+                if port_id is not None:
+                    positions = ports.setdefault(str(port_id), [])
+                    positions.append([segment["name"], offset])
+                    del positions[:-INDEX_PORT_ENTRIES]
+                offset += len(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+        run = {
+            "run_id": run_id,
+            "timestamp": entries[-1].get("timestamp") if entries else datetime.now(timezone.utc).isoformat(),
+            "entries": len(entries),
+            "segment": segment["name"],
+            "offset": start,
+        }
+        segment["entries"] += len(entries)
+        segment["bytes"] = offset
+        index["total_entries"] += len(entries)
+        index["runs"].append(run)
+        del index["runs"][:-INDEX_RUNS]
+        return run
+
+    def append_run(self, entries: Iterable[Dict], run_id: Optional[str] = None) -> Dict:
+        """
+        Ajouter les entrées d'une exécution (un seul ajout en fin de segment)
+
+        Returns:
+            résumé de l'exécution (run_id, timestamp, entries, segment, offset)
+        """
+        entries = list(entries)
+        with self._lock:
+            index = self._ensure()
+            run = self._append(index, entries, run_id or uuid.uuid4().hex)
+            self._write_index(index)
+        return run
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    def _read_at(self, positions: Iterable[Tuple[str, int]]) -> List[Dict]:
+        out = []
+        handles = {}
+        try:
+            for name, offset in positions:
+                f = handles.get(name)
+                if f is None:
+                    f = handles[name] = open(self.root / name, "rb")
+                f.seek(offset)
+                out.append(json.loads(f.readline()))
+        finally:
+            for f in handles.values():
+                f.close()
+        return out
+
+    def _iter_segment_reversed(self, name: str) -> Iterator[Dict]:
+        with open(self.root / name, "rb") as f:
+            lines = f.read().splitlines()
+        for line in reversed(lines):
+            if line:
+                yield json.loads(line)
+
+    def last_run(self) -> Optional[Dict]:
+        runs = self.index()["runs"]
+        return runs[-1] if runs else None
+
+    def runs(self, limit: int = 10) -> List[Dict]:
+        """Dernières exécutions, de la plus récente à la plus ancienne"""
+        return list(reversed(self.index()["runs"][-limit:]))
+
+    def tail(self, limit: int = 50) -> List[Dict]:
+        """Dernières entrées (ordre chronologique), lues depuis la fin des segments"""
+        index = self.index()
+        out = deque(maxlen=limit)
+        for segment in reversed(index["segments"]):
+            if len(out) >= limit:
+                break
+            for entry in self._iter_segment_reversed(segment["name"]):
+                if len(out) >= limit:
+                    break
+                out.appendleft(entry)
+        return list(out)
+
+    def run_entries(self, run: Dict) -> List[Dict]:
+        """Entrées d'une exécution (depuis sa position dans le segment)"""
+        out = []
+        with open(self.root / run["segment"], "rb") as f:
+            f.seek(run["offset"])
+            for _ in range(run["entries"]):
+                out.append(json.loads(f.readline()))
+        return out
+
+    def port_changes(self, port_id: str, limit: int = INDEX_PORT_ENTRIES) -> List[Dict]:
+        """Dernières entrées d'un port (au plus INDEX_PORT_ENTRIES, via l'index)"""
+        positions = self.index()["ports"].get(str(port_id), [])
+        return self._read_at(positions[-limit:]) if limit > 0 else []
+
+    def total_entries(self) -> int:
+        return self.index()["total_entries"]
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def compact(self, keep_entries: int) -> Dict:
+        """
+        Ne garder que les keep_entries entrées les plus récentes
+
+        Les entrées conservées sont réécrites dans de nouveaux segments et
+        l'index est reconstruit; les anciens segments sont ensuite supprimés.
+        """
+        with self._lock:
+            index = self._ensure()
+            kept = deque(maxlen=max(keep_entries, 0))
+            for segment in index["segments"]:
+                with open(self.root / segment["name"], "rb") as f:
+                    for line in f:
+                        if line.strip():
+                            kept.append(json.loads(line))
+
+            old_segments = [s["name"] for s in index["segments"]]
+            next_number = int(old_segments[-1][8:14]) + 1 if old_segments else 1
+            new_index = _empty_index()
+            new_index["segments"].append({"name": _segment_name(next_number), "entries": 0, "bytes": 0})
+            for run_id, run_entries in _group_by_run(kept):
+                self._append(new_index, [{k: v for k, v in e.items() if k != "run_id"} for e in run_entries], run_id)
+            if not new_index["segments"][0]["entries"]:
+                new_index["segments"] = []
+            self._write_index(new_index)
+            for name in old_segments:
+                (self.root / name).unlink(missing_ok=True)
+            logger.info(f"📋 Log ETL compacté: {index['total_entries']} -> {new_index['total_entries']} entrées")
+            return new_index
+
+
+def _group_by_run(entries: Iterable[Dict]) -> Iterator[Tuple[str, List[Dict]]]:
+    run_id, group = None, []
+    for entry in entries:
+        if group and entry.get("run_id") != run_id:
+            yield run_id, group
+            group = []
+        run_id = entry.get("run_id")
+        group.append(entry)
+    if group:
+        yield run_id, group
+
+
+def _legacy_runs(entries: List[Dict]) -> Iterator[List[Dict]]:
+    """Regrouper les entrées de l'ancien log en exécutions (entrées rapprochées)"""
+    run, previous = [], None
+    for entry in entries:
+        try:
+            ts = datetime.fromisoformat(entry.get("timestamp", ""))
+        except (TypeError, ValueError):
+            ts = None
+        if run and (ts is None or previous is None or (ts - previous).total_seconds() > LEGACY_RUN_GAP_SECONDS):
+            yield run
+            run = []
+        run.append(entry)
+        previous = ts
+    if run:
+        yield run
+
+
+ETL_CHANGELOG = EtlChangeLog()
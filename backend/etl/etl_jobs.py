@@ -0,0 +1,191 @@
+"""
+EXÉCUTION DES PIPELINES ETL EN ARRIÈRE-PLAN
+===========================================
+POST /api/etl/run exécutait run_etl() directement dans le handler async:
+la boucle d'événements restait bloquée pendant tout le pipeline et deux
+appels simultanés pouvaient réécrire ports_africains.json en même temps.
+
+Les pipelines sont désormais soumis à ETL_JOBS:
+- exécution sur un pool de threads dédié (la boucle reste libre)
+- un seul job actif par jeu de données (single-flight): une nouvelle
+  demande pendant l'exécution renvoie le job en cours
+- chaque job a un identifiant, un état (queued, running, succeeded,
+  failed) et une liste d'événements de progression, consultables par
+  polling ou en flux SSE
+"""
+
+import logging
+import threading
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Nombre de jobs terminés conservés en mémoire
+JOB_HISTORY = 50
+MAX_WORKERS = 2
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Callback de progression: progress(step, percent, message=None)
+Progress = Callable[..., None]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class EtlJob:
+    """
+    État d'un job ETL et journal de ses événements
+    """
+
+    def __init__(self, dataset: str):
+        self.job_id = uuid.uuid4().hex
+        self.dataset = dataset
+        self.status = QUEUED
+        self.step: Optional[str] = None
+        self.progress = 0
+        self.created_at = _now()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.events: List[Dict] = []
+        self._cond = threading.Condition()
+        self._emit("status", message="Job en attente")
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def _emit(self, event: str, message: Optional[str] = None) -> None:
+        with self._cond:
+            self.events.append({
+                "seq": len(self.events),
+                "event": event,
+                "status": self.status,
+                "step": self.step,
+                "progress": self.progress,
+                "message": message,
+                "timestamp": _now(),
+            })
+            self._cond.notify_all()
+
+    def report(self, step: str, percent: int, message: Optional[str] = None) -> None:
+        """Callback de progression passé au pipeline"""
+        self.step = step
+        self.progress = max(0, min(100, int(percent)))
+        self._emit("progress", message)
+
+    def _set_status(self, status: str, message: Optional[str] = None) -> None:
+        # Sous le verrou: un lecteur ne voit jamais done sans l'événement final
+        with self._cond:
+            self.status = status
+            if status == RUNNING:
+                self.started_at = _now()
+            elif status in (SUCCEEDED, FAILED):
+                self.finished_at = _now()
+                if status == SUCCEEDED:
+                    self.progress = 100
+            self._emit("status", message)
+
+    def events_since(self, seq: int, timeout: Optional[float] = None) -> List[Dict]:
+        """Événements à partir de seq; attend au plus timeout s'il n'y en a pas"""
+        with self._cond:
+            self._cond.wait_for(lambda: len(self.events) > seq or self.done, timeout)
+            return self.events[seq:]
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self.done, timeout)
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "dataset": self.dataset,
+            "status": self.status,
+            "step": self.step,
+            "progress": self.progress,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class EtlJobRunner:
+    """
+    File de jobs ETL exécutés sur un pool de threads, un job actif par jeu de données
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, history: int = JOB_HISTORY):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="etl-job")
+        self._history = history
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, EtlJob]" = OrderedDict()
+        self._active: Dict[str, EtlJob] = {}
+
+    def submit(self, dataset: str, task: Callable[[Progress], Any]) -> Tuple[EtlJob, bool]:
+        """
+        Soumettre task(progress) pour un jeu de données
+
+        Returns:
+            (job, created): created=False si un job était déjà actif pour
+            ce jeu de données (le job en cours est renvoyé)
+        """
+        with self._lock:
+            active = self._active.get(dataset)
+            if active is not None and not active.done:
+                return active, False
+            job = EtlJob(dataset)
+            self._active[dataset] = job
+            self._jobs[job.job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job, task)
+        return job, True
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(self._jobs) - self._history)]:
+            del self._jobs[job_id]
+
+    def _run(self, job: EtlJob, task: Callable[[Progress], Any]) -> None:
+        job._set_status(RUNNING, "Job démarré")
+        try:
+            job.result = task(job.report)
+        except Exception as e:
+            job.error = str(e)
+            logger.error(f"❌ Job ETL {job.job_id} ({job.dataset}) en échec: {e}\n{traceback.format_exc()}")
+            status, message = FAILED, f"Erreur ETL: {e}"
+        else:
+            status, message = SUCCEEDED, "Job terminé"
+        with self._lock:
+            if self._active.get(job.dataset) is job:
+                del self._active[job.dataset]
+        job._set_status(status, message)
+
+    def get(self, job_id: str) -> Optional[EtlJob]:
+        return self._jobs.get(job_id)
+
+    def active(self, dataset: str) -> Optional[EtlJob]:
+        job = self._active.get(dataset)
+        return job if job is not None and not job.done else None
+
+    def jobs(self, limit: int = 20) -> List[EtlJob]:
+        """Derniers jobs, du plus récent au plus ancien"""
+        return list(reversed(list(self._jobs.values())))[:limit]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+ETL_JOBS = EtlJobRunner()
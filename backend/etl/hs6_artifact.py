@@ -0,0 +1,310 @@
+"""
+ARTEFACT BINAIRE DE LA BASE HS6
+===============================
+Format colonnaire de la base HS6 fusionnée (base CSV SH2022, produits
+clés, extensions par chapitre) et des types de sous-positions, produit par
+etl/hs6_compile.py et lu par etl/hs6_database.py.
+
+Structure du fichier (hs6_database.bin):
+- en-tête: MAGIC, longueur puis JSON décrivant les sections
+- pool de chaînes partagé (UTF-8 concaténé + offsets): chaque libellé,
+  catégorie ou exigence d'origine n'est stocké qu'une fois
+- une colonne d'identifiants de chaînes par champ texte, une colonne par
+  champ numérique, les types de sous-positions en CSR
+- SUB_POSITION_TYPES en JSON
+
+Le fichier est projeté en mémoire (mmap) au premier accès; les chaînes
+sont décodées à la demande et les enregistrements reconstruits à chaque
+lecture, sous la même forme que les anciens dictionnaires Python.
+"""
+
+import json
+import logging
+import mmap
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HS6_ARTIFACT_PATH = Path(__file__).resolve().parent / "hs6_database.bin"
+
+MAGIC = b"HS6COL\x00\x01"
+FORMAT_VERSION = 1
+
+# Colonnes texte (identifiants dans le pool de chaînes)
+STRING_COLUMNS = (
+    "code", "chapter", "description_fr", "description_en", "category", "sensitivity",
+    "rule_type", "rule_requirement_fr", "rule_requirement_en",
+)
+
+RECORD_KEYS = {
+    "chapter", "description_fr", "description_en", "category", "sensitivity",
+    "has_sub_positions", "typical_sub_position_types", "rule_of_origin",
+}
+RULE_KEYS = {"type", "requirement_fr", "requirement_en", "regional_content"}
+
+
+def build_artifact(records: Dict[str, Dict], sub_position_types: Dict) -> bytes:
+    """
+    Compiler la base HS6 fusionnée au format colonnaire
+
+    Args:
+        records: {code HS6: enregistrement} dans l'ordre de fusion
+        sub_position_types: SUB_POSITION_TYPES
+
+    Raises:
+        ValueError: si un enregistrement ne suit pas le schéma HS6
+    """
+    pool: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        string_id = pool.get(text)
+        if string_id is None:
+            string_id = pool[text] = len(pool)
+        return string_id
+
+    columns = {name: array("I") for name in STRING_COLUMNS}
+    has_sub_positions = array("B")
+    regional_content = array("i")
+    sub_types_offsets = array("I", [0])
+    sub_types = array("I")
+
+    for code, record in records.items():
+        rule = record.get("rule_of_origin") or {}
+        if set(record) != RECORD_KEYS or set(rule) != RULE_KEYS:
+            raise ValueError(f"HS6 {code}: unexpected fields {sorted(record)} / {sorted(rule)}")
+        values = {
+            "code": code,
+            "chapter": record["chapter"],
+            "description_fr": record["description_fr"],
+            "description_en": record["description_en"],
+            "category": record["category"],
+            "sensitivity": record["sensitivity"],
+            "rule_type": rule["type"],
+            "rule_requirement_fr": rule["requirement_fr"],
+            "rule_requirement_en": rule["requirement_en"],
+        }
+        for name in STRING_COLUMNS:
+            columns[name].append(intern(values[name]))
+        has_sub_positions.append(1 if record["has_sub_positions"] else 0)
+        regional_content.append(int(rule["regional_content"]))
+        sub_types.extend(intern(t) for t in record["typical_sub_position_types"])
+        sub_types_offsets.append(len(sub_types))
+
+    encoded = [text.encode("utf-8") for text in pool]
+    string_offsets = array("I", [0])
+    for blob in encoded:
+        string_offsets.append(string_offsets[-1] + len(blob))
+
+    sections: List[Tuple[str, str, bytes]] = [
+        ("strings", "B", b"".join(encoded)),
+        ("string_offsets", "I", string_offsets.tobytes()),
+        *((f"col_{name}", "I", columns[name].tobytes()) for name in STRING_COLUMNS),
+        ("has_sub_positions", "B", has_sub_positions.tobytes()),
+        ("regional_content", "i", regional_content.tobytes()),
+        ("sub_types_offsets", "I", sub_types_offsets.tobytes()),
+        ("sub_types", "I", sub_types.tobytes()),
+        ("sub_position_types", "B", json.dumps(sub_position_types, ensure_ascii=False).encode("utf-8")),
+    ]
+
+    # Offsets relatifs au début de la zone de données, alignés sur 8 octets
+    layout = {}
+    data = bytearray()
+    for name, typecode, payload in sections:
+        data.extend(b"\x00" * (-len(data) % 8))
+        layout[name] = [len(data), len(payload), typecode]
+        data.extend(payload)
+
+    header = json.dumps({
+        "version": FORMAT_VERSION,
+        "count": len(records),
+        "strings": len(pool),
+        "sections": layout,
+    }).encode("utf-8")
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    prefix += b"\x00" * (-len(prefix) % 8)
+    return prefix + bytes(data)
+
+
+class HS6Artifact:
+    """
+    Lazy, read-only view over the compiled HS6 artifact
+    """
+
+    def __init__(self, path: Path = HS6_ARTIFACT_PATH):
+        self.path = Path(path)
+        self.records = HS6Records(self)
+        self.sub_position_types = SubPositionTypes(self)
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            if self.path.exists():
+                with open(self.path, "rb") as f:
+                    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # Artefact absent (arbre de développement): compilation en mémoire
+                logger.warning(f"HS6 artifact {self.path} missing, compiling from sources "
+                               f"(run `python -m etl.hs6_compile`)")
+                from .hs6_compile import merge_sources
+                buffer = build_artifact(*merge_sources())
+            self._open(memoryview(buffer))
+            self._loaded = True
+
+    def _open(self, view: memoryview) -> None:
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{self.path}: not an HS6 artifact")
+        (header_len,) = struct.unpack_from("<I", view, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(bytes(view[header_start:header_start + header_len]))
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"{self.path}: unsupported HS6 artifact version {header['version']}")
+        base = header_start + header_len
+        base += -base % 8
+
+        def section(name: str) -> memoryview:
+            offset, length, typecode = header["sections"][name]
+            raw = view[base + offset:base + offset + length]
+            return raw if typecode == "B" else raw.cast(typecode)
+
+        self._count = header["count"]
+        self._strings = section("strings")
+        self._string_offsets = section("string_offsets")
+        self._decoded: List[Optional[str]] = [None] * header["strings"]
+        self._columns = {name: section(f"col_{name}") for name in STRING_COLUMNS}
+        self._has_sub_positions = section("has_sub_positions")
+        self._regional_content = section("regional_content")
+        self._sub_types_offsets = section("sub_types_offsets")
+        self._sub_types = section("sub_types")
+        self._sub_position_types = json.loads(bytes(section("sub_position_types")))
+        self._codes = [self._string(i) for i in self._columns["code"]]
+        self._rows = {code: row for row, code in enumerate(self._codes)}
+        # Lignes triées par code: plages de préfixe (chapitre, position) par dichotomie
+        self._sorted_rows = sorted(range(self._count), key=self._codes.__getitem__)
+        self._sorted_codes = [self._codes[row] for row in self._sorted_rows]
+
+    def _string(self, string_id: int) -> str:
+        text = self._decoded[string_id]
+        if text is None:
+            start, end = self._string_offsets[string_id], self._string_offsets[string_id + 1]
+            text = self._decoded[string_id] = str(self._strings[start:end], "utf-8")
+        return text
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self._load()
+
+    def row(self, code: str) -> Optional[int]:
+        self._ensure_loaded()
+        return self._rows.get(code)
+
+    def record(self, row: int) -> Dict:
+        """Reconstruire l'enregistrement d'une ligne (nouveau dict à chaque appel)"""
+        col = self._columns
+        start, end = self._sub_types_offsets[row], self._sub_types_offsets[row + 1]
+        return {
+            "chapter": self._string(col["chapter"][row]),
+            "description_fr": self._string(col["description_fr"][row]),
+            "description_en": self._string(col["description_en"][row]),
+            "category": self._string(col["category"][row]),
+            "sensitivity": self._string(col["sensitivity"][row]),
+            "has_sub_positions": bool(self._has_sub_positions[row]),
+            "typical_sub_position_types": [self._string(i) for i in self._sub_types[start:end]],
+            "rule_of_origin": {
+                "type": self._string(col["rule_type"][row]),
+                "requirement_fr": self._string(col["rule_requirement_fr"][row]),
+                "requirement_en": self._string(col["rule_requirement_en"][row]),
+                "regional_content": self._regional_content[row],
+            },
+        }
+
+    def prefix_rows(self, prefix: str) -> List[int]:
+        """Lignes des codes commençant par prefix, triées par code"""
+        self._ensure_loaded()
+        start = bisect_left(self._sorted_codes, prefix)
+        end = bisect_left(self._sorted_codes, prefix + "\uffff", start)
+        return self._sorted_rows[start:end]
+
+    def column(self, name: str, prefix: Optional[str] = None) -> List:
+        """
+        Valeurs d'une colonne sans reconstruire les enregistrements: dans
+        l'ordre des codes, ou triées par code pour les codes commençant par prefix
+        """
+        self._ensure_loaded()
+        if prefix is None:
+            if name == "has_sub_positions":
+                return [bool(v) for v in self._has_sub_positions]
+            if name == "regional_content":
+                return self._regional_content.tolist()
+            return [self._string(i) for i in self._columns[name]]
+        rows = self.prefix_rows(prefix)
+        if name == "has_sub_positions":
+            return [bool(self._has_sub_positions[row]) for row in rows]
+        if name == "regional_content":
+            return [self._regional_content[row] for row in rows]
+        values = self._columns[name]
+        return [self._string(values[row]) for row in rows]
+
+
+class HS6Records(Mapping):
+    """
+    Read-only mapping code HS6 -> enregistrement, same interface as the
+    former HS6_DATABASE dict
+    """
+
+    def __init__(self, artifact: HS6Artifact):
+        self._artifact = artifact
+
+    def __getitem__(self, code: str) -> Dict:
+        row = self._artifact.row(code)
+        if row is None:
+            raise KeyError(code)
+        return self._artifact.record(row)
+
+    def __contains__(self, code) -> bool:
+        return self._artifact.row(code) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        self._artifact._ensure_loaded()
+        return iter(self._artifact._codes)
+
+    def __len__(self) -> int:
+        self._artifact._ensure_loaded()
+        return self._artifact._count
+
+    def column(self, name: str, prefix: Optional[str] = None) -> List:
+        return self._artifact.column(name, prefix)
+
+    def __repr__(self) -> str:
+        return f"<HS6Records {self._artifact.path.name}>"
+
+
+class SubPositionTypes(Mapping):
+    """Read-only SUB_POSITION_TYPES loaded from the artifact on first access"""
+
+    def __init__(self, artifact: HS6Artifact):
+        self._artifact = artifact
+
+    def _data(self) -> Dict:
+        self._artifact._ensure_loaded()
+        return self._artifact._sub_position_types
+
+    def __getitem__(self, key: str) -> Dict:
+        return self._data()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._data())
+
+
+HS6_ARTIFACT = HS6Artifact()
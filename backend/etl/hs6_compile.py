@@ -0,0 +1,68 @@
+"""
+COMPILATION DE LA BASE HS6
+==========================
+Fusionne les sources Python de la base HS6 dans le même ordre que
+l'ancienne construction à l'import:
+1. produits clés (hs6_base_data.HS6_BASE_DATABASE)
+2. base SH2022 complète (codes_sh6_complet.csv, 5762 codes)
+3. extensions manuelles par chapitre (priorité sur le CSV)
+
+puis écrit l'artefact colonnaire lu par l'API (hs6_database.bin).
+
+À relancer après toute modification de ces sources ou du CSV:
+    python -m etl.hs6_compile
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+from .hs6_artifact import HS6_ARTIFACT_PATH, build_artifact
+
+
+def merge_sources() -> Tuple[Dict[str, Dict], Dict]:
+    """
+    Importer et fusionner les sources HS6
+
+    Returns:
+        (enregistrements par code dans l'ordre de fusion, SUB_POSITION_TYPES)
+    """
+    from .hs6_base_data import HS6_BASE_DATABASE, SUB_POSITION_TYPES
+    from .import_hs6_csv import load_hs6_csv_database
+    from .hs6_extended_ch01_06 import HS6_EXTENDED as HS6_EXTENDED_CH01_06
+    from .hs6_extended_ch07_15 import HS6_EXTENDED_CH07_15
+    from .hs6_extended_ch16_24 import HS6_EXTENDED_CH16_24
+    from .hs6_extended_ch25_40 import HS6_EXTENDED_CH25_40
+    from .hs6_extended_ch41_63 import HS6_EXTENDED_CH41_63
+    from .hs6_extended_ch72_89 import HS6_EXTENDED_CH72_89
+    from .hs6_extended_ch32_38 import HS6_EXTENDED_CH32_38
+    from .hs6_extended_ch42_49 import HS6_EXTENDED_CH42_49
+
+    records = dict(HS6_BASE_DATABASE)
+    records.update(load_hs6_csv_database())
+    for extension in (
+        HS6_EXTENDED_CH01_06, HS6_EXTENDED_CH07_15, HS6_EXTENDED_CH16_24,
+        HS6_EXTENDED_CH25_40, HS6_EXTENDED_CH41_63, HS6_EXTENDED_CH72_89,
+        HS6_EXTENDED_CH32_38, HS6_EXTENDED_CH42_49,
+    ):
+        records.update(extension)
+    return records, SUB_POSITION_TYPES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the HS6 database artifact")
+    parser.add_argument("--output", type=Path, default=HS6_ARTIFACT_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    records, sub_position_types = merge_sources()
+    payload = build_artifact(records, sub_position_types)
+    args.output.write_bytes(payload)
+
+    print(f"✓ {len(records)} HS6 codes, {len(sub_position_types)} sub-position types")
+    print(f"💾 {args.output} ({len(payload) / 1024:.0f} KB) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ taux par chapitre.
 
 from typing import Dict, Optional, Tuple
 
+from .hs_search_index import HSSearchIndex
+
 # =============================================================================
 # TARIFS SH6 SPÉCIFIQUES - PRODUITS AGRICOLES AFRICAINS CLÉS
 # =============================================================================
@@ -272,34 +274,43 @@ def get_hs6_tariff_rates(hs6_code: str) -> Tuple[float, float]:
     return (None, None)
 
 
+_search_index: Optional[HSSearchIndex] = None
+
+
+def _get_search_index() -> HSSearchIndex:
+    global _search_index
+    if _search_index is None:
+        _search_index = HSSearchIndex(
+            (code, {"fr": data.get("description_fr", ""), "en": data.get("description_en", "")})
+            for code, data in HS6_TARIFFS.items()
+        )
+    return _search_index
+
+
 def search_hs6_tariffs(query: str, language: str = 'fr', limit: int = 20) -> list:
     """
-    Rechercher des codes SH6 avec leurs tarifs par mot-clé
+    Rechercher des codes SH6 avec leurs tarifs par code ou mot-clé
     
     Args:
-        query: Terme de recherche
+        query: Terme de recherche (accents ignorés)
         language: 'fr' ou 'en'
         limit: Nombre maximum de résultats
         
     Returns:
-        Liste de codes SH6 correspondants avec tarifs
+        Liste de codes SH6 correspondants avec tarifs, par pertinence
     """
-    query_lower = query.lower()
     results = []
     desc_key = f"description_{language}"
     
-    for code, data in HS6_TARIFFS.items():
-        description = data.get(desc_key, data.get("description_fr", ""))
-        if query_lower in description.lower() or query_lower in code:
-            results.append({
-                "code": code,
-                "description": description,
-                "normal_rate": data["normal"],
-                "zlecaf_rate": data["zlecaf"],
-                "savings_pct": round((data["normal"] - data["zlecaf"]) / data["normal"] * 100, 1) if data["normal"] > 0 else 0
-            })
-            if len(results) >= limit:
-                break
+    for code in _get_search_index().search(query, language, limit):
+        data = HS6_TARIFFS[code]
+        results.append({
+            "code": code,
+            "description": data.get(desc_key, data.get("description_fr", "")),
+            "normal_rate": data["normal"],
+            "zlecaf_rate": data["zlecaf"],
+            "savings_pct": round((data["normal"] - data["zlecaf"]) / data["normal"] * 100, 1) if data["normal"] > 0 else 0
+        })
     
     return results
 
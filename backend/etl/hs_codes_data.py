@@ -12,6 +12,8 @@ Last updated: January 2025
 
 from typing import Dict, List, Optional
 
+from .hs_search_index import HSSearchIndex
+
 # =============================================================================
 # CHAPITRES HS (2 chiffres) - SECTIONS PRINCIPALES
 # =============================================================================
@@ -961,24 +963,30 @@ def normalize_accent(text: str) -> str:
         if unicodedata.category(c) != 'Mn'
     )
 
+_search_index: Optional[HSSearchIndex] = None
+
+
+def _get_search_index() -> HSSearchIndex:
+    global _search_index
+    if _search_index is None:
+        _search_index = HSSearchIndex(
+            (code, {"fr": labels.get('fr', ''), "en": labels.get('en', '')})
+            for code, labels in HS6_CODES.items()
+        )
+    return _search_index
+
+
 def search_hs_codes(query: str, language: str = 'fr', limit: int = 20) -> List[Dict]:
-    """Search HS codes by keyword (accent-insensitive)"""
-    query_normalized = normalize_accent(query.lower())
+    """Search HS codes by code or keyword (accent-insensitive, ranked)"""
     results = []
-    
-    for code, labels in HS6_CODES.items():
-        label = labels.get(language, labels.get('fr', ''))
-        label_normalized = normalize_accent(label.lower())
-        if query_normalized in label_normalized or query_normalized in code:
-            results.append({
-                "code": code,
-                "label": label,
-                "chapter": code[:2],
-                "chapter_name": HS_CHAPTERS.get(code[:2], {}).get(language, '')
-            })
-            if len(results) >= limit:
-                break
-    
+    for code in _get_search_index().search(query, language, limit):
+        labels = HS6_CODES[code]
+        results.append({
+            "code": code,
+            "label": labels.get(language, labels.get('fr', '')),
+            "chapter": code[:2],
+            "chapter_name": HS_CHAPTERS.get(code[:2], {}).get(language, '')
+        })
     return results
 
 def get_codes_by_chapter(chapter: str, language: str = 'fr') -> List[Dict]:
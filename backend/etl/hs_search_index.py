@@ -0,0 +1,210 @@
+"""
+INDEX DE RECHERCHE PLEIN TEXTE SH
+=================================
+Index inversé partagé par les recherches de codes SH (base HS6, libellés
+SH2022, tarifs SH6, tarifs SH6 par pays).
+
+Construit une seule fois par jeu de données:
+- textes normalisés (minuscules, sans accents) par champ: fr, en, catégorie
+- postings par mot (token), par bigramme et par trigramme pour les
+  correspondances partielles
+- liste triée des codes pour la recherche par préfixe de code
+
+Les résultats couvrent au minimum ceux de l'ancienne recherche par
+sous-chaîne (requête contenue dans le code ou dans un libellé) et sont
+classés: code exact > préfixe de code > libellé dans la langue demandée >
+autre langue > catégorie > tous les mots de la requête présents (en début
+de mot) dans un ordre quelconque.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Poids des champs texte (la langue demandée est toujours prioritaire)
+FIELD_WEIGHTS = {"primary": 300, "secondary": 200, "category": 100}
+
+
+def fold(text: str) -> str:
+    """Minuscules et suppression des accents"""
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', text.lower())
+        if unicodedata.category(c) != 'Mn'
+    )
+
+
+def tokenize(folded: str) -> List[str]:
+    return _TOKEN_RE.findall(folded)
+
+
+def ngrams(folded: str, n: int = 3) -> Set[str]:
+    return {folded[i:i + n] for i in range(len(folded) - n + 1)}
+
+
+class HSSearchIndex:
+    """
+    Inverted index over HS codes and their FR/EN descriptions
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Dict[str, str]]]):
+        """
+        Args:
+            entries: (code, {"fr": ..., "en": ..., "category": ...}) dans
+                l'ordre de la source (utilisé pour départager les scores)
+        """
+        self.codes: List[str] = []
+        self._fields: List[Dict[str, str]] = []
+        self._tokens: Dict[str, Set[int]] = defaultdict(set)
+        # Clés de longueur 2 (bigrammes) et 3 (trigrammes)
+        self._grams: Dict[str, Set[int]] = defaultdict(set)
+
+        for doc, (code, texts) in enumerate(entries):
+            fields = {name: fold(text) for name, text in texts.items() if text}
+            fields["code"] = code
+            self.codes.append(code)
+            self._fields.append(fields)
+            for text in fields.values():
+                for token in tokenize(text):
+                    self._tokens[token].add(doc)
+                for n in (2, 3):
+                    for gram in ngrams(text, n):
+                        self._grams[gram].add(doc)
+
+        self._vocabulary = sorted(self._tokens)
+        self._sorted_codes = sorted((code, doc) for doc, code in enumerate(self.codes))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    # ------------------------------------------------------------------
+    # Candidats
+    # ------------------------------------------------------------------
+
+    def _substring_candidates(self, fragment: str) -> Set[int]:
+        """Documents dont un champ peut contenir `fragment` (à vérifier)"""
+        if len(fragment) >= 3:
+            postings = [self._grams.get(gram, set()) for gram in ngrams(fragment, 3)]
+            postings.sort(key=len)
+            result = set(postings[0])
+            for posting in postings[1:]:
+                result &= posting
+                if not result:
+                    break
+            return result
+        if len(fragment) == 2:
+            return set(self._grams.get(fragment, ()))
+        # Un seul caractère: parcours des textes normalisés
+        return {
+            doc for doc, fields in enumerate(self._fields)
+            if any(fragment in text for text in fields.values())
+        }
+
+    def _word_prefix_docs(self, prefix: str) -> Set[int]:
+        """Documents contenant un mot qui commence par `prefix`"""
+        result: Set[int] = set()
+        start = bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            result |= self._tokens[token]
+        return result
+
+    def _code_prefix(self, prefix: str) -> List[int]:
+        start = bisect_left(self._sorted_codes, (prefix, -1))
+        docs = []
+        for code, doc in self._sorted_codes[start:]:
+            if not code.startswith(prefix):
+                break
+            docs.append(doc)
+        return docs
+
+    # ------------------------------------------------------------------
+    # Classement
+    # ------------------------------------------------------------------
+
+    def _phrase_score(self, fields: Dict[str, str], query: str, language: str) -> int:
+        other = "en" if language == "fr" else "fr"
+        best = 0
+        for name, weight in ((language, "primary"), (other, "secondary"), ("category", "category")):
+            text = fields.get(name)
+            if not text:
+                continue
+            pos = text.find(query)
+            if pos < 0:
+                continue
+            score = FIELD_WEIGHTS[weight]
+            end = pos + len(query)
+            starts_word = pos == 0 or not text[pos - 1].isalnum()
+            ends_word = end == len(text) or not text[end].isalnum()
+            if pos == 0:
+                score += 50
+            elif starts_word:
+                score += 30
+            if starts_word and ends_word:
+                score += 20
+            best = max(best, score)
+        return best
+
+    def search(
+        self,
+        query: str,
+        language: str = "fr",
+        limit: Optional[int] = 20
+    ) -> List[str]:
+        """
+        Rechercher des codes par code, préfixe de code ou mots-clés
+
+        Args:
+            query: Code SH (préfixe) ou texte libre, accents ignorés
+            language: Langue prioritaire pour le classement ('fr' ou 'en')
+            limit: Nombre maximum de codes (None = tous)
+
+        Returns:
+            Codes classés par pertinence décroissante
+        """
+        q = fold(query).strip()
+        if not q:
+            return []
+
+        scores: Dict[int, int] = {}
+
+        if q.isdigit():
+            for doc in self._code_prefix(q):
+                scores[doc] = 1000 if self.codes[doc] == q else 900
+
+        for doc in self._substring_candidates(q):
+            if doc in scores:
+                continue
+            fields = self._fields[doc]
+            if q in fields["code"]:
+                scores[doc] = 800
+                continue
+            score = self._phrase_score(fields, q, language)
+            if score:
+                scores[doc] = score
+
+        # Tous les mots présents (en début de mot), dans un ordre quelconque
+        tokens = tokenize(q)
+        if len(tokens) > 1:
+            candidates = None
+            for token in sorted(tokens, key=len, reverse=True):
+                docs = self._word_prefix_docs(token)
+                candidates = docs if candidates is None else candidates & docs
+                if not candidates:
+                    break
+            for doc in candidates or ():
+                if doc in scores:
+                    continue
+                primary_words = tokenize(self._fields[doc].get(language, ""))
+                scores[doc] = 50 + sum(
+                    any(word.startswith(token) for word in primary_words) for token in tokens
+                )
+
+        ranked = sorted(scores, key=lambda doc: (-scores[doc], doc))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self.codes[doc] for doc in ranked]
@@ -1,11 +1,15 @@
 """
-Script ETL pour importer les codes HS6 depuis le fichier CSV officiel SH2022
-et générer le fichier Python de la base de données complète.
+Script ETL pour importer les codes HS6 depuis le fichier CSV officiel SH2022.
+La base obtenue est compilée avec les autres sources HS6 dans l'artefact
+binaire de l'API par etl/hs6_compile.py.
 """
 
 import csv
 import re
 from collections import defaultdict
+from pathlib import Path
+
+CSV_PATH = Path(__file__).resolve().parent / "codes_sh6_complet.csv"
 
 # Catégories par chapitre HS
 CHAPTER_CATEGORIES = {
@@ -131,62 +135,23 @@ def import_csv(filepath):
     
     return hs6_data
 
-def generate_python_file(hs6_data, output_path):
-    """Génère le fichier Python avec la base de données complète"""
-    
-    # Trier par code
-    sorted_codes = sorted(hs6_data.keys())
-    
-    # Compter par chapitre
-    chapter_counts = defaultdict(int)
-    for code in sorted_codes:
-        chapter_counts[code[:2]] += 1
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('"""\n')
-        f.write('BASE DE DONNÉES HS6 COMPLÈTE - Générée depuis SH2022 officiel\n')
-        f.write(f'Total: {len(sorted_codes)} codes HS6\n')
-        f.write(f'Chapitres couverts: {len(chapter_counts)}\n')
-        f.write('"""\n\n')
-        f.write('HS6_CSV_DATABASE = {\n')
-        
-        for code in sorted_codes:
-            entry = hs6_data[code]
-            f.write(f'    "{code}": {{\n')
-            f.write(f'        "chapter": "{entry["chapter"]}",\n')
-            
-            # Escape quotes in descriptions
-            desc_fr = entry["description_fr"].replace('"', '\\"')
-            desc_en = entry["description_en"].replace('"', '\\"')
-            
-            f.write(f'        "description_fr": "{desc_fr}",\n')
-            f.write(f'        "description_en": "{desc_en}",\n')
-            f.write(f'        "category": "{entry["category"]}",\n')
-            f.write(f'        "sensitivity": "{entry["sensitivity"]}",\n')
-            f.write(f'        "has_sub_positions": {entry["has_sub_positions"]},\n')
-            f.write(f'        "typical_sub_position_types": {entry["typical_sub_position_types"]},\n')
-            f.write(f'        "rule_of_origin": {entry["rule_of_origin"]}\n')
-            f.write('    },\n')
-        
-        f.write('}\n')
-    
-    return len(sorted_codes), dict(chapter_counts)
+def load_hs6_csv_database(filepath=CSV_PATH):
+    """Base SH2022 issue du CSV officiel, triée par code (source de etl/hs6_compile.py)"""
+    hs6_data = import_csv(filepath)
+    return {code: hs6_data[code] for code in sorted(hs6_data)}
 
 if __name__ == "__main__":
-    import sys
-    
-    csv_path = "/app/backend/etl/codes_sh6_complet.csv"
-    output_path = "/app/backend/etl/hs6_csv_database.py"
-    
-    print(f"Importation de {csv_path}...")
-    hs6_data = import_csv(csv_path)
+    print(f"Importation de {CSV_PATH}...")
+    hs6_data = load_hs6_csv_database()
     
-    print(f"Génération de {output_path}...")
-    total, chapters = generate_python_file(hs6_data, output_path)
+    chapters = defaultdict(int)
+    for code in hs6_data:
+        chapters[code[:2]] += 1
     
     print(f"\n=== RÉSULTAT ===")
-    print(f"Total codes HS6: {total}")
+    print(f"Total codes HS6: {len(hs6_data)}")
     print(f"Chapitres couverts: {len(chapters)}")
     print("\nCodes par chapitre:")
     for ch in sorted(chapters.keys()):
         print(f"  Chapitre {ch}: {chapters[ch]} codes")
+    print("\nCompiler la base HS6: python -m etl.hs6_compile")
@@ -18,7 +18,7 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 import logging
 
 # Configuration logging
@@ -31,10 +31,11 @@ logger = logging.getLogger(__name__)
 # Chemins
 ROOT_DIR = Path(__file__).parent.parent.parent
 PORTS_FILE = ROOT_DIR / 'ports_africains.json'
-ETL_LOG_FILE = ROOT_DIR / 'backend' / 'etl' / 'etl_log.json'
 
 # Import des données TRS officielles
 from .trs_official_data import TRS_OFFICIAL_DATA, LPI_2023_DATA, GLOBAL_BENCHMARKS
+# Journal append-only des modifications (remplace etl_log.json)
+from .etl_changelog import ETL_CHANGELOG
 
 
 class PortsETL:
@@ -61,9 +62,18 @@ class PortsETL:
             return []
     
     def _save_ports(self):
-        """Sauvegarde les données portuaires."""
-        with open(PORTS_FILE, 'w', encoding='utf-8') as f:
+        """
+        Sauvegarde les données portuaires.
+        
+        Écriture dans un fichier temporaire puis os.replace: les lecteurs de
+        l'API voient l'ancien ou le nouveau fichier, jamais un fichier partiel.
+        """
+        tmp = PORTS_FILE.with_name(f"{PORTS_FILE.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
             json.dump(self.ports, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, PORTS_FILE)
         logger.info(f"✅ Données sauvegardées: {PORTS_FILE}")
     
     def _log_update(self, port_id: str, field: str, old_value: Any, new_value: Any, source: str):
@@ -78,22 +88,10 @@ class PortsETL:
         })
     
     def _save_etl_log(self):
-        """Sauvegarde le log ETL."""
-        ETL_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Charger le log existant
-        existing_log = []
-        if ETL_LOG_FILE.exists():
-            with open(ETL_LOG_FILE, 'r', encoding='utf-8') as f:
-                existing_log = json.load(f)
-        
-        # Ajouter les nouvelles entrées
-        existing_log.extend(self.etl_log)
-        
-        with open(ETL_LOG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(existing_log, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"📋 Log ETL mis à jour: {len(self.etl_log)} entrées")
+        """Ajoute les entrées de l'exécution au journal ETL (sans relire l'historique)."""
+        run = ETL_CHANGELOG.append_run(self.etl_log)
+        logger.info(f"📋 Log ETL mis à jour: {len(self.etl_log)} entrées (run {run['run_id']})")
+        return run
     
     def update_trs_data(self):
         """
@@ -209,10 +207,15 @@ class PortsETL:
                 "source": GLOBAL_BENCHMARKS['source']
             }
     
-    def run_full_etl(self):
+    def run_full_etl(self, progress: Optional[Callable[..., None]] = None):
         """
         Exécute le pipeline ETL complet.
+        
+        Args:
+            progress: callback optionnel progress(step, percent, message)
+                      appelé à chaque étape (voir etl_jobs.py)
         """
+        progress = progress or (lambda *args, **kwargs: None)
         logger.info("=" * 60)
         logger.info("🔄 DÉMARRAGE PIPELINE ETL - PORTS AFRICAINS")
         logger.info("=" * 60)
@@ -220,17 +223,22 @@ class PortsETL:
         start_time = datetime.now(timezone.utc)
         
         # 1. Mise à jour TRS
+        progress("trs", 10, f"Mise à jour TRS ({len(self.ports)} ports)")
         trs_updated, trs_na = self.update_trs_data()
         
         # 2. Mise à jour LPI
+        progress("lpi", 40, f"TRS: {trs_updated} ports avec données, {trs_na} NA")
         lpi_updated = self.update_lpi_data()
         
         # 3. Ajout benchmarks
+        progress("benchmarks", 60, f"LPI 2023: {lpi_updated} ports mis à jour")
         self.add_global_benchmarks()
         
         # 4. Sauvegarde
+        progress("save", 75, "Sauvegarde des données portuaires")
         self._save_ports()
-        self._save_etl_log()
+        progress("log", 90, f"Journal ETL: {len(self.etl_log)} entrées")
+        run = self._save_etl_log()
         
         end_time = datetime.now(timezone.utc)
         duration = (end_time - start_time).total_seconds()
@@ -249,14 +257,15 @@ class PortsETL:
             "trs_updated": trs_updated,
             "trs_na": trs_na,
             "lpi_updated": lpi_updated,
+            "run_id": run["run_id"],
             "timestamp": end_time.isoformat()
         }
 
 
-def run_etl():
+def run_etl(progress: Optional[Callable[..., None]] = None):
     """Point d'entrée pour exécuter le pipeline ETL."""
     etl = PortsETL()
-    return etl.run_full_etl()
+    return etl.run_full_etl(progress)
 
 
 if __name__ == "__main__":
@@ -1,21 +1,15 @@
 
-import json
-from pathlib import Path
 from typing import List, Dict
 
-ROOT_DIR = Path(__file__).parent.parent
+from logistics_repository import free_zones_index
 
 def load_free_zones():
-    """Charger les zones franches depuis le fichier JSON"""
-    try:
-        with open(ROOT_DIR / 'zones_franches_afrique.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
+    """Charger les zones franches depuis le fichier JSON (cache partagé, ne pas modifier)"""
+    return free_zones_index().records
 
 def get_free_zones_by_country(country_iso3: str = None) -> List[Dict]:
     """Récupérer les zones franches, filtre optionnel par pays"""
-    zones = load_free_zones()
+    index = free_zones_index()
     if country_iso3:
-        return [z for z in zones if z['country_iso'] == country_iso3]
-    return zones
+        return index.country(country_iso3)
+    return list(index.records)
@@ -1,74 +1,49 @@
 """
 Logistics Air Cargo data loader for African airports
+
+Les données sont servies par logistics_repository (fichier lu une fois,
+index secondaires, rechargé quand airports_africains.json change).
 """
-import json
-from pathlib import Path
 from typing import List, Optional
 
-ROOT_DIR = Path(__file__).parent.parent
+from logistics_repository import airports_index
 
 def load_airports_data():
-    """Load African airports data from JSON file"""
-    airports_path = ROOT_DIR / "airports_africains.json"
-    with open(airports_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load African airports data from JSON file (cached, do not modify)"""
+    return airports_index().records
 
 def get_all_airports(country_iso: Optional[str] = None) -> List[dict]:
     """
     Get all airports or filter by country ISO code
     """
-    airports = load_airports_data()
+    index = airports_index()
     
     if country_iso:
-        country_iso = country_iso.upper()
-        airports = [a for a in airports if a['country_iso'] == country_iso]
+        return index.country(country_iso.upper())
     
-    return airports
+    return list(index.records)
 
 def get_airport_by_id(airport_id: str) -> Optional[dict]:
     """
     Get detailed airport information by airport ID
     """
-    airports = load_airports_data()
-    
-    for airport in airports:
-        if airport['airport_id'] == airport_id:
-            return airport
-    
-    return None
+    return airports_index().by_id.get(airport_id)
+
+def get_airport_by_iata(iata_code: str) -> Optional[dict]:
+    """
+    Get airport information by IATA code (e.g. JNB)
+    """
+    return airports_index().by_code["iata_code"].get(iata_code.upper())
 
 def get_top_airports_by_cargo(limit: int = 20) -> List[dict]:
     """
     Get top airports by cargo throughput (tons)
     """
-    airports = load_airports_data()
-    
-    # Filter airports with cargo data and sort by cargo descending
-    airports_with_cargo = [
-        a for a in airports 
-        if a.get('historical_stats') and len(a['historical_stats']) > 0
-    ]
-    
-    sorted_airports = sorted(
-        airports_with_cargo,
-        key=lambda x: x['historical_stats'][0].get('cargo_throughput_tons', 0),
-        reverse=True
-    )
-    
-    return sorted_airports[:limit]
+    # Classement pré-trié par tonnage fret décroissant
+    return airports_index().top(limit)
 
 def search_airports(query: str) -> List[dict]:
     """
     Search airports by name or IATA code
     """
-    airports = load_airports_data()
-    query_lower = query.lower()
-    
-    results = [
-        a for a in airports 
-        if query_lower in a['airport_name'].lower() 
-        or query_lower in a.get('iata_code', '').lower()
-        or query_lower in a['country_name'].lower()
-    ]
-    
-    return results
+    return airports_index().search(query)
@@ -1,82 +1,56 @@
 """
 Logistics API endpoints for African maritime ports
+
+Les données sont servies par logistics_repository (fichier lu une fois,
+index secondaires, rechargé quand ports_africains.json change).
 """
-import json
-from pathlib import Path
 from typing import List, Optional
 from fastapi import HTTPException
 
-ROOT_DIR = Path(__file__).parent.parent
+from logistics_repository import ports_index
 
 def load_ports_data():
-    """Load African ports data from JSON file"""
-    ports_path = ROOT_DIR / "ports_africains.json"
-    with open(ports_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load African ports data from JSON file (cached, do not modify)"""
+    return ports_index().records
 
 def get_all_ports(country_iso: Optional[str] = None) -> List[dict]:
     """
     Get all ports or filter by country ISO code
     """
-    ports = load_ports_data()
+    index = ports_index()
     
     if country_iso:
-        country_iso = country_iso.upper()
-        ports = [p for p in ports if p['country_iso'] == country_iso]
+        return index.country(country_iso.upper())
     
-    return ports
+    return list(index.records)
 
 def get_port_by_id(port_id: str) -> Optional[dict]:
     """
     Get detailed port information by port ID
     """
-    ports = load_ports_data()
-    
-    for port in ports:
-        if port['port_id'] == port_id:
-            return port
-    
-    return None
+    return ports_index().by_id.get(port_id)
+
+def get_port_by_locode(un_locode: str) -> Optional[dict]:
+    """
+    Get port information by UN LOCODE (e.g. MAPTM)
+    """
+    return ports_index().by_code["un_locode"].get(un_locode.upper())
 
 def get_ports_by_type(port_type: str) -> List[dict]:
     """
     Get ports filtered by type (Hub Transhipment, Hub Regional, Maritime Commercial)
     """
-    ports = load_ports_data()
-    return [p for p in ports if p.get('port_type', '').lower() == port_type.lower()]
+    return list(ports_index().by_type.get(port_type.lower(), ()))
 
 def get_top_ports_by_teu(limit: int = 20) -> List[dict]:
     """
     Get top ports by container throughput (TEU)
     """
-    ports = load_ports_data()
-    
-    # Filter ports with TEU data and sort by TEU descending
-    ports_with_teu = [
-        p for p in ports 
-        if p.get('latest_stats', {}).get('container_throughput_teu')
-    ]
-    
-    sorted_ports = sorted(
-        ports_with_teu, 
-        key=lambda x: x['latest_stats']['container_throughput_teu'],
-        reverse=True
-    )
-    
-    return sorted_ports[:limit]
+    # Classement pré-trié par TEU décroissant (ports avec données TEU)
+    return ports_index().top(limit)
 
 def search_ports(query: str) -> List[dict]:
     """
-    Search ports by name or UN LOCODE
+    Search ports by name, UN LOCODE or country name
     """
-    ports = load_ports_data()
-    query_lower = query.lower()
-    
-    results = [
-        p for p in ports 
-        if query_lower in p['port_name'].lower() 
-        or query_lower in p.get('un_locode', '').lower()
-        or query_lower in p['country_name'].lower()
-    ]
-    
-    return results
+    return ports_index().search(query)
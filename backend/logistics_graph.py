@@ -0,0 +1,681 @@
+"""
+Graphe logistique multimodal et calcul d'itinéraires
+
+Le graphe est construit une fois à partir des référentiels existants et
+reconstruit quand l'un des fichiers change (ports, aéroports, corridors):
+- ports (logistics_repository): un nœud côté terre et un nœud côté mer,
+  reliés par une arête de passage portuaire dont la durée est le temps de
+  séjour conteneur (TRS, sinon LPI pays, sinon moyenne Afrique); un port
+  sans UN/LOCODE situé à moins de DUPLICATE_PORT_KM d'un port du même pays
+  qui en a un est un doublon (import ETL): son identifiant désigne ce port
+- aéroports: nœud côté terre et nœud côté air, reliés par une arête de
+  manutention fret
+- corridors terrestres (corridors_terrestres.json): nœuds logistiques
+  (postes frontières, OSBP, ports secs, terminaux) et segments du
+  corridor; les extrémités sont rattachées au nœud existant le plus proche
+  (port, aéroport, nœud) ou deviennent des nœuds "ville"
+- liaisons maritimes entre ports voisins, liaisons aériennes entre
+  aéroports voisins et depuis les hubs fret
+- un nœud par pays (barycentre de ses nœuds), relié à ses nœuds côté
+  terre par des arêtes d'accès (pré/post-acheminement routier, mode
+  "access"); il sert d'origine ou de destination, jamais de transit
+
+Chaque arête porte une distance (km), une durée (heures, dont temps
+d'attente) et un coût indicatif (USD par tonne). find_routes() renvoie les
+k meilleurs itinéraires (A* et algorithme de Yen) et le moins cher; deux
+itinéraires aux mêmes étapes de transport ne sont pas deux alternatives.
+Les corridors "multimodal" (route et rail) sont ouverts aux modes road et rail.
+Les arbres de plus courts chemins depuis les pays sont mis en cache: un
+itinéraire pays-pays est une simple lecture de l'arbre.
+
+Les vitesses et coûts unitaires ci-dessous sont des paramètres indicatifs
+d'ordre de grandeur, pas des tarifs de transporteurs.
+"""
+import heapq
+import json
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from constants import AFRICAN_COUNTRIES
+from data_loader import DATA_FILE_CACHE
+from etl.trs_official_data import GLOBAL_BENCHMARKS, LPI_2023_DATA, TRS_OFFICIAL_DATA
+from logistics_repository import airports_index, ports_index
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CORRIDORS_PATH = ROOT_DIR / "corridors_terrestres.json"
+
+METRICS = ("time", "distance", "cost")
+MODES = ("sea", "air", "road", "rail", "multimodal")
+# Modes demandés -> modes d'arêtes admis (corridors route + rail)
+MODE_ALIASES = {"road": ("road", "multimodal"), "rail": ("rail", "multimodal")}
+# Arêtes pays <-> nœuds côté terre: jamais filtrées par modes, comme les
+# passages portuaires et la manutention aéroportuaire
+ACCESS_MODE = "access"
+MAX_ROUTES = 5
+
+# Vitesses commerciales moyennes (km/h)
+SPEED_KMH = {"sea": 28.0, "air": 700.0, "road": 40.0, "rail": 25.0, "multimodal": 30.0}
+# Coûts de transport indicatifs (USD par tonne-km)
+COST_PER_TONNE_KM = {"sea": 0.01, "air": 1.5, "road": 0.10, "rail": 0.05, "multimodal": 0.07}
+# Allongement de la distance orthodromique (routes maritimes, pré/post-acheminement routier)
+SEA_DETOUR = 1.25
+ROAD_DETOUR = 1.3
+
+PORT_HANDLING_USD_PER_TONNE = 15.0
+AIR_HANDLING_USD_PER_TONNE = 120.0
+AIR_HANDLING_HOURS = 24.0
+BORDER_USD_PER_TONNE = 8.0
+BORDER_DEFAULT_HOURS = 24.0
+DWELL_USD_PER_TONNE_DAY = 2.0
+
+SEA_NEIGHBOURS = 6
+AIR_NEIGHBOURS = 6
+AIR_HUBS = 8
+# Rayon de rattachement des extrémités de corridors à un nœud existant
+SNAP_KM = 30.0
+# Distance sous laquelle un port sans UN/LOCODE double un port du même pays
+DUPLICATE_PORT_KM = 5.0
+
+TREE_CACHE_SIZE = 512
+ROUTE_CACHE_SIZE = 1024
+
+LANDSIDE_KINDS = {"port", "airport", "city", "border_crossing", "dry_port", "rail_terminal", "intermodal_hub"}
+COUNTRY_NAMES = {c["iso3"]: c["name"] for c in AFRICAN_COUNTRIES}
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * 6371.0 * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _number(value) -> Optional[float]:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def port_dwell_days(port: Dict) -> Tuple[float, str]:
+    """Temps de séjour conteneur d'un port (jours) et sa source"""
+    trs = TRS_OFFICIAL_DATA.get(port.get("port_id"), {})
+    days = _number(trs.get("container_dwell_time_days"))
+    if days is not None:
+        return days, trs.get("source_type", "TRS")
+    lpi = LPI_2023_DATA.get(port.get("country_iso"), {})
+    days = _number(lpi.get("import_dwell_median"))
+    if days is not None:
+        return days, "WORLD_BANK_LPI"
+    return float(GLOBAL_BENCHMARKS["container_dwell_time_days_africa_avg"]), "AFRICA_AVERAGE"
+
+
+def _read_json(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class LogisticsGraph:
+    """
+    Directed multimodal graph with cached shortest-path trees
+    """
+
+    def __init__(self, ports: Sequence[Dict], airports: Sequence[Dict], corridors: Sequence[Dict],
+                 airport_hubs: Iterable[str] = ()):
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.kinds: List[str] = []
+        self.countries: List[Optional[str]] = []
+        self.lat: List[float] = []
+        self.lon: List[float] = []
+        self.info: List[Dict] = []
+        self.index: Dict[str, int] = {}
+        self.adj: List[List[Tuple[int, int]]] = []
+        # Arêtes orientées
+        self.edge_src: List[int] = []
+        self.edge_dst: List[int] = []
+        self.edge_mode: List[str] = []
+        self.edge_km: List[float] = []
+        self.edge_hours: List[float] = []
+        self.edge_dwell: List[float] = []
+        self.edge_cost: List[float] = []
+        self.edge_corridor: List[Optional[str]] = []
+        self._dwell_hours: Dict[int, float] = {}
+
+        self._add_ports(ports)
+        self._add_airports(airports, set(airport_hubs))
+        self._add_corridors(corridors)
+        self._add_countries()
+
+        self.weights = {"time": self.edge_hours, "distance": self.edge_km, "cost": self.edge_cost}
+        self._h_factor = {metric: self._heuristic_factor(weights) for metric, weights in self.weights.items()}
+        self._trees: "OrderedDict[Tuple, Tuple[List[float], List[int]]]" = OrderedDict()
+        self._routes: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def _add_node(self, node_id: str, name: str, kind: str, country: Optional[str],
+                  lat: float, lon: float, **info) -> int:
+        idx = self.index.get(node_id)
+        if idx is not None:
+            return idx
+        idx = len(self.ids)
+        self.index[node_id] = idx
+        self.ids.append(node_id)
+        self.names.append(name)
+        self.kinds.append(kind)
+        self.countries.append(country)
+        self.lat.append(float(lat))
+        self.lon.append(float(lon))
+        self.info.append(info)
+        self.adj.append([])
+        return idx
+
+    def _add_edge(self, u: int, v: int, mode: str, km: float, hours: float, cost: float,
+                  dwell: float = 0.0, corridor: Optional[str] = None, both: bool = True) -> None:
+        for src, dst in ((u, v), (v, u)) if both else ((u, v),):
+            # Temps d'attente au nœud d'arrivée (postes frontières)
+            wait = dwell + self._dwell_hours.get(dst, 0.0)
+            extra_cost = BORDER_USD_PER_TONNE if dst in self._dwell_hours else 0.0
+            e = len(self.edge_src)
+            self.edge_src.append(src)
+            self.edge_dst.append(dst)
+            self.edge_mode.append(mode)
+            self.edge_km.append(km)
+            self.edge_hours.append(hours + wait)
+            self.edge_dwell.append(wait)
+            self.edge_cost.append(cost + extra_cost)
+            self.edge_corridor.append(corridor)
+            self.adj[src].append((dst, e))
+
+    def _distance(self, u: int, v: int) -> float:
+        return haversine_km(self.lat[u], self.lon[u], self.lat[v], self.lon[v])
+
+    def _add_link(self, u: int, v: int, mode: str, detour: float = 1.0, **kwargs) -> None:
+        km = self._distance(u, v) * detour
+        self._add_edge(u, v, mode, km, km / SPEED_KMH[mode], km * COST_PER_TONNE_KM[mode], **kwargs)
+
+    def _nearest(self, nodes: Sequence[int], count: int) -> Iterable[Tuple[int, int]]:
+        for u in nodes:
+            others = sorted((self._distance(u, v), v) for v in nodes if v != u)
+            for _, v in others[:count]:
+                yield (u, v) if u < v else (v, u)
+
+    def _duplicate_port(self, port: Dict, lat: float, lon: float) -> Optional[int]:
+        """Nœud côté terre du port doublé par un enregistrement sans UN/LOCODE"""
+        if port.get("un_locode"):
+            return None
+        for idx, kind in enumerate(self.kinds):
+            if (kind == "port" and self.info[idx].get("un_locode") and self.countries[idx] == port.get("country_iso")
+                    and haversine_km(self.lat[idx], self.lon[idx], lat, lon) <= DUPLICATE_PORT_KM):
+                return idx
+        return None
+
+    def _add_ports(self, ports: Sequence[Dict]) -> None:
+        sea = []
+        # Ports avec UN/LOCODE d'abord: les doublons ETL s'y rattachent
+        for port in sorted(ports, key=lambda p: not p.get("un_locode")):
+            lat, lon = _number(port.get("geo_lat")), _number(port.get("geo_lon"))
+            if lat is None or lon is None:
+                continue
+            primary = self._duplicate_port(port, lat, lon)
+            if primary is not None:
+                self.index[f"port:{port['port_id']}"] = primary
+                self.index[f"port:{port['port_id']}:sea"] = self.index[f"{self.ids[primary]}:sea"]
+                continue
+            days, source = port_dwell_days(port)
+            land = self._add_node(f"port:{port['port_id']}", port.get("port_name", port["port_id"]), "port",
+                                  port.get("country_iso"), lat, lon, un_locode=port.get("un_locode"),
+                                  dwell_days=days, dwell_source=source)
+            quay = self._add_node(f"port:{port['port_id']}:sea", port.get("port_name", port["port_id"]),
+                                  "port_sea", port.get("country_iso"), lat, lon)
+            self._add_edge(land, quay, "port", 0.0, 0.0,
+                           PORT_HANDLING_USD_PER_TONNE + days * DWELL_USD_PER_TONNE_DAY, dwell=days * 24)
+            sea.append(quay)
+        for u, v in set(self._nearest(sea, SEA_NEIGHBOURS)):
+            self._add_link(u, v, "sea", SEA_DETOUR)
+
+    def _add_airports(self, airports: Sequence[Dict], hubs: Set[str]) -> None:
+        air, hub_nodes = [], []
+        for airport in airports:
+            lat, lon = _number(airport.get("geo_lat")), _number(airport.get("geo_lon"))
+            if lat is None or lon is None:
+                continue
+            name = airport.get("airport_name", airport["airport_id"])
+            land = self._add_node(f"airport:{airport['airport_id']}", name, "airport", airport.get("country_iso"),
+                                  lat, lon, iata_code=airport.get("iata_code"))
+            apron = self._add_node(f"airport:{airport['airport_id']}:air", name, "airport_air",
+                                   airport.get("country_iso"), lat, lon)
+            self._add_edge(land, apron, "airport", 0.0, 0.0, AIR_HANDLING_USD_PER_TONNE, dwell=AIR_HANDLING_HOURS)
+            air.append(apron)
+            if airport["airport_id"] in hubs:
+                hub_nodes.append(apron)
+        pairs = set(self._nearest(air, AIR_NEIGHBOURS))
+        pairs.update((min(h, v), max(h, v)) for h in hub_nodes for v in air if v != h)
+        for u, v in pairs:
+            self._add_link(u, v, "air")
+
+    def _snap(self, lat: float, lon: float) -> Optional[int]:
+        best, best_km = None, SNAP_KM
+        for idx, kind in enumerate(self.kinds):
+            if kind in LANDSIDE_KINDS:
+                km = haversine_km(lat, lon, self.lat[idx], self.lon[idx])
+                if km <= best_km:
+                    best, best_km = idx, km
+        return best
+
+    def _nearest_country(self, lat: float, lon: float) -> Optional[str]:
+        candidates = [i for i, kind in enumerate(self.kinds) if kind in LANDSIDE_KINDS and self.countries[i]]
+        if not candidates:
+            return None
+        return self.countries[min(candidates, key=lambda i: haversine_km(lat, lon, self.lat[i], self.lon[i]))]
+
+    def _add_corridors(self, corridors: Sequence[Dict]) -> None:
+        # 1. Nœuds logistiques de tous les corridors
+        for corridor in corridors:
+            border_hours = _number(corridor.get("stats", {}).get("avg_border_crossing_time_hours"))
+            for node in corridor.get("nodes", []):
+                lat, lon = _number(node.get("geo_lat")), _number(node.get("geo_lon"))
+                if lat is None or lon is None:
+                    continue
+                idx = self._add_node(f"land:{node['node_id']}", node.get("node_name", node["node_id"]),
+                                     node.get("node_type", "land"), node.get("country_iso"), lat, lon,
+                                     is_osbp=bool(node.get("is_osbp")))
+                if node.get("node_type") == "border_crossing":
+                    hours = border_hours if border_hours is not None else BORDER_DEFAULT_HOURS
+                    self._dwell_hours[idx] = max(self._dwell_hours.get(idx, 0.0), hours)
+
+        # 2. Segments: extrémité de départ, nœuds, extrémité d'arrivée
+        for corridor in corridors:
+            coordinates = corridor.get("coordinates") or []
+            path = []
+            for end, name, coordinate in (("start", corridor.get("start_node"), coordinates[:1]),
+                                          ("end", corridor.get("end_node"), coordinates[-1:])):
+                if not coordinate:
+                    continue
+                lat, lon = coordinate[0]
+                idx = self._snap(lat, lon)
+                if idx is None:
+                    idx = self._add_node(f"city:{corridor['corridor_id']}:{end}", name or end, "city",
+                                         self._nearest_country(lat, lon), lat, lon)
+                path.append(idx)
+            nodes = [self.index[f"land:{n['node_id']}"] for n in corridor.get("nodes", [])
+                     if f"land:{n['node_id']}" in self.index]
+            path = path[:1] + nodes + path[1:]
+            path = [idx for i, idx in enumerate(path) if i == 0 or idx != path[i - 1]]
+            if len(path) < 2:
+                continue
+
+            mode = corridor.get("corridor_type") if corridor.get("corridor_type") in SPEED_KMH else "road"
+            segments = [self._distance(u, v) for u, v in zip(path, path[1:])]
+            straight = sum(segments)
+            length = _number(corridor.get("length_km")) or straight * ROAD_DETOUR
+            transit = _number(corridor.get("stats", {}).get("avg_transit_time_hours"))
+            for (u, v), segment in zip(zip(path, path[1:]), segments):
+                share = segment / straight if straight else 1 / len(segments)
+                km = length * share
+                hours = transit * share if transit is not None else km / SPEED_KMH[mode]
+                self._add_edge(u, v, mode, km, hours, km * COST_PER_TONNE_KM[mode],
+                               corridor=corridor["corridor_id"])
+
+    def _add_countries(self) -> None:
+        members: Dict[str, List[int]] = {}
+        for idx, kind in enumerate(self.kinds):
+            if kind in LANDSIDE_KINDS and self.countries[idx]:
+                members.setdefault(self.countries[idx], []).append(idx)
+        for iso3, nodes in sorted(members.items()):
+            lat = sum(self.lat[i] for i in nodes) / len(nodes)
+            lon = sum(self.lon[i] for i in nodes) / len(nodes)
+            country = self._add_node(f"country:{iso3}", COUNTRY_NAMES.get(iso3, iso3), "country", iso3, lat, lon)
+            for idx in nodes:
+                km = self._distance(country, idx) * ROAD_DETOUR
+                self._add_edge(country, idx, ACCESS_MODE, km, km / SPEED_KMH["road"], km * COST_PER_TONNE_KM["road"])
+
+    def _heuristic_factor(self, weights: List[float]) -> float:
+        """Plus petit poids par km orthodromique: heuristique A* admissible"""
+        factor = math.inf
+        for e, weight in enumerate(weights):
+            km = self._distance(self.edge_src[e], self.edge_dst[e])
+            if km > 1.0:
+                factor = min(factor, weight / km)
+        return 0.0 if math.isinf(factor) else factor
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+
+    def resolve(self, ref: str) -> int:
+        """
+        Nœud d'une référence: identifiant du graphe (port:…, country:…),
+        code pays ISO3, identifiant de port/aéroport/nœud, UN/LOCODE ou IATA
+        """
+        ref = ref.strip()
+        for candidate in (ref, f"country:{ref.upper()}", f"port:{ref}", f"airport:{ref}", f"land:{ref}"):
+            if candidate in self.index:
+                return self.index[candidate]
+        code = ref.upper()
+        for idx, info in enumerate(self.info):
+            if code and code in (info.get("un_locode"), info.get("iata_code")):
+                return idx
+        raise KeyError(ref)
+
+    def _allowed(self, modes: Optional[frozenset]) -> Optional[List[bool]]:
+        if modes is None:
+            return None
+        return [mode not in MODES or mode in modes for mode in self.edge_mode]
+
+    def tree(self, source: int, metric: str) -> Tuple[List[float], List[int]]:
+        """Arbre des plus courts chemins depuis source (distances, arête précédente), mis en cache"""
+        key = (source, metric)
+        with self._lock:
+            cached = self._trees.get(key)
+            if cached is not None:
+                self._trees.move_to_end(key)
+                return cached
+        weights = self.weights[metric]
+        dist = [math.inf] * len(self.ids)
+        pred = [-1] * len(self.ids)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        kinds = self.kinds
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u] or (u != source and kinds[u] == "country"):
+                continue
+            for v, e in self.adj[u]:
+                nd = d + weights[e]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    pred[v] = e
+                    heapq.heappush(heap, (nd, v))
+        with self._lock:
+            self._trees[key] = (dist, pred)
+            while len(self._trees) > TREE_CACHE_SIZE:
+                self._trees.popitem(last=False)
+        return dist, pred
+
+    def _tree_path(self, source: int, target: int, metric: str) -> Optional[Tuple[float, List[int]]]:
+        dist, pred = self.tree(source, metric)
+        if math.isinf(dist[target]):
+            return None
+        edges, node = [], target
+        while node != source:
+            e = pred[node]
+            edges.append(e)
+            node = self.edge_src[e]
+        return dist[target], edges[::-1]
+
+    def _astar(self, source: int, target: int, metric: str, allowed: Optional[List[bool]] = None,
+               banned_nodes: Set[int] = frozenset(), banned_edges: Set[int] = frozenset()
+               ) -> Optional[Tuple[float, List[int]]]:
+        weights = self.weights[metric]
+        factor = self._h_factor[metric]
+        t_lat, t_lon = self.lat[target], self.lon[target]
+        lat, lon, kinds, adj = self.lat, self.lon, self.kinds, self.adj
+        heuristic: Dict[int, float] = {}
+
+        def h(n: int) -> float:
+            value = heuristic.get(n)
+            if value is None:
+                value = heuristic[n] = factor * haversine_km(lat[n], lon[n], t_lat, t_lon) if factor else 0.0
+            return value
+
+        dist = {source: 0.0}
+        pred: Dict[int, int] = {}
+        closed = set()
+        heap = [(h(source), 0.0, source)]
+        while heap:
+            _, d, u = heapq.heappop(heap)
+            if u in closed:
+                continue
+            if u == target:
+                edges, node = [], target
+                while node != source:
+                    e = pred[node]
+                    edges.append(e)
+                    node = self.edge_src[e]
+                return d, edges[::-1]
+            closed.add(u)
+            if u != source and kinds[u] == "country":
+                continue
+            for v, e in adj[u]:
+                if v in banned_nodes or e in banned_edges or v in closed or (allowed is not None and not allowed[e]):
+                    continue
+                nd = d + weights[e]
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    pred[v] = e
+                    heapq.heappush(heap, (nd + h(v), nd, v))
+        return None
+
+    def shortest(self, source: int, target: int, metric: str,
+                 modes: Optional[frozenset] = None) -> Optional[Tuple[float, List[int]]]:
+        """Meilleur itinéraire: arbre en cache depuis un pays, A* sinon"""
+        if modes is None and self.kinds[source] == "country":
+            return self._tree_path(source, target, metric)
+        return self._astar(source, target, metric, self._allowed(modes))
+
+    def _legs_signature(self, edges: List[int]) -> Tuple:
+        """Étapes de transport d'un itinéraire, hors accès, passages portuaires et arêtes de longueur nulle"""
+        return tuple((self.edge_mode[e], self.edge_src[e], self.edge_dst[e]) for e in edges
+                     if self.edge_mode[e] in MODES and self.edge_km[e] > 0)
+
+    def k_shortest(self, source: int, target: int, metric: str, k: int,
+                   modes: Optional[frozenset] = None) -> List[Tuple[float, List[int]]]:
+        """k meilleurs itinéraires sans boucle (algorithme de Yen)"""
+        best = self.shortest(source, target, metric, modes)
+        if best is None:
+            return []
+        weights = self.weights[metric]
+        allowed = self._allowed(modes)
+        found = [best]
+        seen = {tuple(best[1])}
+        signatures = {self._legs_signature(best[1])}
+        candidates: List[Tuple[float, int, List[int]]] = []
+        counter = 0
+        while len(found) < k:
+            _, prev_edges = found[-1]
+            prev_nodes = [source] + [self.edge_dst[e] for e in prev_edges]
+            for i in range(len(prev_edges)):
+                spur = prev_nodes[i]
+                root = prev_edges[:i]
+                banned_edges = {edges[i] for _, edges in found if edges[:i] == root and len(edges) > i}
+                banned_nodes = set(prev_nodes[:i])
+                spur_path = self._astar(spur, target, metric, allowed, banned_nodes, banned_edges)
+                if spur_path is None:
+                    continue
+                edges = root + spur_path[1]
+                if tuple(edges) in seen:
+                    continue
+                seen.add(tuple(edges))
+                counter += 1
+                heapq.heappush(candidates, (sum(weights[e] for e in edges), counter, edges))
+            # Un candidat aux mêmes étapes de transport qu'un itinéraire retenu
+            # n'en diffère que par des nœuds confondus: ce n'est pas une alternative
+            while candidates:
+                cost, _, edges = heapq.heappop(candidates)
+                signature = self._legs_signature(edges)
+                if signature not in signatures:
+                    break
+            else:
+                break
+            signatures.add(signature)
+            found.append((cost, edges))
+        return found
+
+    # ------------------------------------------------------------------
+    # Résultats
+    # ------------------------------------------------------------------
+
+    def node(self, idx: int) -> Dict:
+        kind = self.kinds[idx]
+        node_id = self.ids[idx]
+        return {
+            "node_id": node_id,
+            "name": self.names[idx],
+            "type": kind,
+            "country_iso": self.countries[idx],
+            "geo_lat": round(self.lat[idx], 4),
+            "geo_lon": round(self.lon[idx], 4),
+            **{k: v for k, v in self.info[idx].items() if v is not None},
+        }
+
+    def describe(self, edges: List[int], metric: str) -> Dict:
+        """Itinéraire détaillé: étapes, nœuds traversés et totaux"""
+        legs = []
+        for e in edges:
+            legs.append({
+                "from": self.ids[self.edge_src[e]],
+                "to": self.ids[self.edge_dst[e]],
+                "mode": self.edge_mode[e],
+                "distance_km": round(self.edge_km[e], 1),
+                "hours": round(self.edge_hours[e], 1),
+                "dwell_hours": round(self.edge_dwell[e], 1),
+                "cost_usd_per_tonne": round(self.edge_cost[e], 2),
+                "corridor_id": self.edge_corridor[e],
+            })
+        path = [self.edge_src[edges[0]]] + [self.edge_dst[e] for e in edges] if edges else []
+        visible = [idx for idx in path if self.kinds[idx] not in ("port_sea", "airport_air")]
+        nodes = [self.node(idx) for i, idx in enumerate(visible) if i == 0 or idx != visible[i - 1]]
+        modes = []
+        for leg in legs:
+            if leg["mode"] in MODES and (not modes or modes[-1] != leg["mode"]):
+                modes.append(leg["mode"])
+        hours = sum(self.edge_hours[e] for e in edges)
+        return {
+            "metric": metric,
+            "modes": modes,
+            "distance_km": round(sum(self.edge_km[e] for e in edges), 1),
+            "transit_hours": round(hours, 1),
+            "transit_days": round(hours / 24, 1),
+            "dwell_hours": round(sum(self.edge_dwell[e] for e in edges), 1),
+            "cost_usd_per_tonne": round(sum(self.edge_cost[e] for e in edges), 2),
+            "nodes": nodes,
+            "legs": legs,
+        }
+
+    def routes(self, origin: str, destination: str, metric: str = "time", k: int = 3,
+               modes: Optional[Iterable[str]] = None) -> Dict:
+        """
+        k meilleurs itinéraires selon metric et itinéraire le moins cher
+
+        Raises:
+            KeyError: origine ou destination inconnue
+            ValueError: paramètre invalide
+        """
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {', '.join(METRICS)}")
+        if not 1 <= k <= MAX_ROUTES:
+            raise ValueError(f"k must be between 1 and {MAX_ROUTES}")
+        modes = frozenset(m.lower() for m in modes) if modes else None
+        if modes is not None and not modes <= set(MODES):
+            raise ValueError(f"modes must be among {', '.join(MODES)}")
+        if modes is not None:
+            modes = frozenset(alias for m in modes for alias in MODE_ALIASES.get(m, (m,)))
+        source, target = self.resolve(origin), self.resolve(destination)
+
+        key = (source, target, metric, k, modes)
+        with self._lock:
+            cached = self._routes.get(key)
+            if cached is not None:
+                self._routes.move_to_end(key)
+                return cached
+
+        found = self.k_shortest(source, target, metric, k, modes) if source != target else []
+        cheapest = found[0] if metric == "cost" and found else self.shortest(source, target, "cost", modes)
+        result = {
+            "origin": self.node(source),
+            "destination": self.node(target),
+            "metric": metric,
+            "modes": sorted(modes) if modes else list(MODES),
+            "count": len(found),
+            "routes": [self.describe(edges, metric) for _, edges in found],
+            "cheapest": self.describe(cheapest[1], "cost") if cheapest and source != target else None,
+        }
+        with self._lock:
+            self._routes[key] = result
+            while len(self._routes) > ROUTE_CACHE_SIZE:
+                self._routes.popitem(last=False)
+        return result
+
+    def warm_countries(self, metrics: Iterable[str] = METRICS) -> int:
+        """Précalculer les arbres depuis chaque pays (tous les couples pays-pays)"""
+        count = 0
+        for idx, kind in enumerate(self.kinds):
+            if kind == "country":
+                for metric in metrics:
+                    self.tree(idx, metric)
+                    count += 1
+        return count
+
+    def stats(self) -> Dict:
+        kinds: Dict[str, int] = {}
+        for kind in self.kinds:
+            kinds[kind] = kinds.get(kind, 0) + 1
+        modes: Dict[str, int] = {}
+        for mode in self.edge_mode:
+            modes[mode] = modes.get(mode, 0) + 1
+        return {"nodes": len(self.ids), "edges": len(self.edge_src), "node_types": kinds, "edge_modes": modes,
+                "cached_trees": len(self._trees), "cached_routes": len(self._routes)}
+
+
+# ----------------------------------------------------------------------
+# Graphe partagé, reconstruit quand une source change
+# ----------------------------------------------------------------------
+
+_graph: Optional[LogisticsGraph] = None
+_graph_sources: Tuple = ()
+_graph_lock = threading.Lock()
+
+
+def _corridors() -> List[Dict]:
+    try:
+        return DATA_FILE_CACHE.get(CORRIDORS_PATH, _read_json).get("corridors", [])
+    except FileNotFoundError:
+        return []
+
+
+def get_graph() -> LogisticsGraph:
+    """Graphe multimodal courant (reconstruit si ports, aéroports ou corridors ont changé)"""
+    global _graph, _graph_sources
+    ports, airports, corridors = ports_index(), airports_index(), _corridors()
+    sources = (ports, airports, corridors)
+    if _graph is not None and all(a is b for a, b in zip(sources, _graph_sources)):
+        return _graph
+    with _graph_lock:
+        if _graph is None or not all(a is b for a, b in zip(sources, _graph_sources)):
+            start = time.perf_counter()
+            hubs = [a["airport_id"] for a in airports.ranking[:AIR_HUBS]]
+            _graph = LogisticsGraph(ports.records, airports.records, corridors, hubs)
+            _graph_sources = sources
+            logger.info(f"Logistics graph built in {(time.perf_counter() - start) * 1000:.0f} ms "
+                        f"({len(_graph.ids)} nodes, {len(_graph.edge_src)} edges)")
+    return _graph
+
+
+def find_routes(origin: str, destination: str, metric: str = "time", k: int = 3,
+                modes: Optional[Iterable[str]] = None) -> Dict:
+    """Itinéraires entre deux pays (ISO3) ou nœuds (voir LogisticsGraph.resolve)"""
+    return get_graph().routes(origin, destination, metric, k, modes)
+
+
+def route_summary(origin: str, destination: str, metric: str = "cost",
+                  modes: Optional[Iterable[str]] = None) -> Optional[Dict]:
+    """Totaux du meilleur itinéraire (sans le détail des étapes), None si aucun"""
+    result = find_routes(origin, destination, metric, 1, modes)
+    if not result["routes"]:
+        return None
+    route = result["routes"][0]
+    return {k: v for k, v in route.items() if k not in ("nodes", "legs")}
+
+
+def get_graph_stats() -> Dict:
+    return get_graph().stats()
@@ -0,0 +1,171 @@
+"""
+Référentiel logistique: ports, aéroports et zones franches
+
+Chaque fichier JSON est lu une seule fois puis servi depuis DATA_FILE_CACHE
+(voir data_loader.py), qui le relit automatiquement quand il change sur
+disque, par exemple après une exécution du pipeline ETL.
+
+À chaque chargement, un LogisticsIndex est construit:
+- index secondaires: identifiant, pays ISO3, type, codes (UN/LOCODE, IATA, ICAO)
+- classement pré-trié (TEU pour les ports, tonnage fret pour les aéroports)
+- index de mots pour la recherche: les candidats sont ceux dont un mot
+  contient chaque mot de la requête, puis la correspondance exacte
+  (sous-chaîne, comme l'ancienne recherche linéaire) est vérifiée
+
+Les enregistrements renvoyés sont partagés par le cache: ne pas les modifier.
+"""
+import json
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from data_loader import DATA_FILE_CACHE
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+PORTS_PATH = ROOT_DIR / "ports_africains.json"
+AIRPORTS_PATH = ROOT_DIR / "airports_africains.json"
+FREE_ZONES_PATH = ROOT_DIR / "zones_franches_afrique.json"
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class LogisticsIndex:
+    """
+    Records of one logistics file with secondary indexes, ranking and token search
+    """
+
+    def __init__(self, records: List[Dict], id_field: str, search_fields: Sequence[str] = (),
+                 type_field: Optional[str] = None, code_fields: Sequence[str] = (),
+                 rank: Optional[Tuple[Callable[[Dict], object], Callable[[Dict], object]]] = None):
+        """
+        Args:
+            records: enregistrements du fichier, dans l'ordre du fichier
+            id_field: champ identifiant unique
+            search_fields: champs texte utilisés par search()
+            type_field: champ indexé sans tenir compte de la casse (by_type)
+            code_fields: champs de codes indexés en majuscules (by_code)
+            rank: (filtre, clé) du classement décroissant
+        """
+        self.records = records
+        self.by_id: Dict[str, Dict] = {}
+        self.by_country: Dict[str, List[Dict]] = {}
+        self.by_type: Dict[str, List[Dict]] = {}
+        self.by_code: Dict[str, Dict[str, Dict]] = {field: {} for field in code_fields}
+        for record in records:
+            self.by_id.setdefault(record[id_field], record)
+            self.by_country.setdefault(record.get("country_iso"), []).append(record)
+            if type_field is not None:
+                self.by_type.setdefault((record.get(type_field) or "").lower(), []).append(record)
+            for field in code_fields:
+                code = record.get(field)
+                if code:
+                    self.by_code[field].setdefault(code.upper(), record)
+
+        # Classement calculé une fois (tri stable: ordre du fichier à égalité)
+        self.ranking: List[Dict] = []
+        if rank is not None:
+            keep, key = rank
+            self.ranking = sorted((r for r in records if keep(r)), key=key, reverse=True)
+
+        # Champs de recherche en minuscules et index mot -> positions
+        self._fields: List[Tuple[str, ...]] = [
+            tuple((record.get(field) or "").lower() for field in search_fields) for record in records
+        ]
+        self._postings: Dict[str, Set[int]] = {}
+        for position, fields in enumerate(self._fields):
+            for text in fields:
+                for token in _tokens(text):
+                    self._postings.setdefault(token, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def country(self, country_iso: str) -> List[Dict]:
+        return list(self.by_country.get(country_iso, ()))
+
+    def top(self, limit: int) -> List[Dict]:
+        return self.ranking[:limit]
+
+    def _candidates(self, query_tokens: Iterable[str]) -> Optional[Set[int]]:
+        candidates = None
+        for query_token in query_tokens:
+            matches = set()
+            for token, positions in self._postings.items():
+                if query_token in token:
+                    matches |= positions
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return set()
+        return candidates
+
+    def search(self, query: str) -> List[Dict]:
+        """
+        Enregistrements dont un champ de recherche contient query (sans casse)
+
+        Chaque mot de la requête est une sous-chaîne d'un mot du champ
+        correspondant: l'index réduit les candidats sans changer le résultat.
+        """
+        query_lower = query.lower()
+        candidates = self._candidates(_tokens(query_lower))
+        positions = range(len(self.records)) if candidates is None else sorted(candidates)
+        return [
+            self.records[position] for position in positions
+            if any(query_lower in text for text in self._fields[position])
+        ]
+
+
+def _read_json(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _parse_ports(path: Path) -> LogisticsIndex:
+    return LogisticsIndex(
+        _read_json(path), "port_id",
+        search_fields=("port_name", "un_locode", "country_name"),
+        type_field="port_type",
+        code_fields=("un_locode",),
+        rank=(
+            lambda p: p.get('latest_stats', {}).get('container_throughput_teu'),
+            lambda p: p['latest_stats']['container_throughput_teu'],
+        ),
+    )
+
+
+def _parse_airports(path: Path) -> LogisticsIndex:
+    return LogisticsIndex(
+        _read_json(path), "airport_id",
+        search_fields=("airport_name", "iata_code", "country_name"),
+        code_fields=("iata_code", "icao_code"),
+        rank=(
+            lambda a: a.get('historical_stats') and len(a['historical_stats']) > 0,
+            lambda a: a['historical_stats'][0].get('cargo_throughput_tons', 0),
+        ),
+    )
+
+
+def _parse_free_zones(path: Path) -> LogisticsIndex:
+    return LogisticsIndex(_read_json(path), "id", search_fields=("name", "country"), type_field="type")
+
+
+def ports_index() -> LogisticsIndex:
+    """Index des ports (rechargé si ports_africains.json change)"""
+    return DATA_FILE_CACHE.get(PORTS_PATH, _parse_ports, "ports_africains.json (index)")
+
+
+def airports_index() -> LogisticsIndex:
+    """Index des aéroports (rechargé si airports_africains.json change)"""
+    return DATA_FILE_CACHE.get(AIRPORTS_PATH, _parse_airports, "airports_africains.json (index)")
+
+
+def free_zones_index() -> LogisticsIndex:
+    """Index des zones franches (vide si le fichier est absent)"""
+    try:
+        return DATA_FILE_CACHE.get(FREE_ZONES_PATH, _parse_free_zones, "zones_franches_afrique.json (index)")
+    except FileNotFoundError:
+        return LogisticsIndex([], "id")
@@ -2,7 +2,7 @@
 Pydantic models for ZLECAf API
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
@@ -83,6 +83,67 @@ class TariffCalculationResponse(BaseModel):
     # Données économiques des pays
     origin_country_data: Dict[str, Any]
     destination_country_data: Dict[str, Any]
+    # Fraîcheur des données d'enrichissement (cache Banque Mondiale / OEC)
+    enrichment_status: Optional[Dict[str, Any]] = None
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+class TariffBatchRequest(BaseModel):
+    """Request model for batch tariff calculation (one invoice, many lines)"""
+    lines: List[TariffCalculationRequest] = Field(..., min_length=1, max_length=10000)
+
+
+class TariffBatchResponse(BaseModel):
+    """Response model for batch tariff calculation"""
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    count: int
+    # Résultats dans l'ordre des lignes d'entrée
+    results: List[Dict[str, Any]]
+    # Totaux de la facture
+    totals: Dict[str, Any]
+    computation_order_ref: str
+    last_verified: str
+    computation_time_ms: float
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+class LandedCostRequest(BaseModel):
+    """Request model for landed cost (tariffs, taxes and logistics in one call)"""
+    origin_country: str
+    destination_country: str
+    hs_code: str
+    # Valeur FOB de la marchandise (USD)
+    value: float = Field(..., ge=0)
+    weight_tonnes: float = Field(1.0, gt=0)
+    # auto = tous les modes; sinon mode principal (pré/post-acheminement routier inclus)
+    mode: Literal["auto", "sea", "air", "road", "rail"] = "auto"
+    # Critère de choix de l'itinéraire
+    route_metric: Literal["cost", "time", "distance"] = "cost"
+    alternatives: int = Field(1, ge=1, le=5)
+
+
+class LandedCostResponse(BaseModel):
+    """Response model for landed cost"""
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    origin_country: str
+    destination_country: str
+    hs_code: str
+    hs6_code: str
+    value: float
+    weight_tonnes: float
+    mode: str
+    # Fret, assurance et valeur CIF
+    logistics: Dict[str, Any]
+    # Droits et taxes: taux appliqués et décomposition NPF / ZLECAf
+    tariff: Dict[str, Any]
+    normal: Dict[str, Any]
+    zlecaf: Dict[str, Any]
+    savings: Dict[str, Any]
+    route: Optional[Dict[str, Any]] = None
+    alternatives: List[Dict[str, Any]] = []
+    # Durée de chaque étape (ms) et durée totale
+    timings_ms: Dict[str, float]
+    computation_time_ms: float
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -4,10 +4,17 @@ API endpoints pour exporter les données
 from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone
+import asyncio
 import csv
 import io
-import pandas as pd
+import re
+import tempfile
 from motor.motor_asyncio import AsyncIOMotorClient
+from openpyxl import Workbook
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
 import os
 
 router = APIRouter(prefix="/api/export", tags=["export"])
@@ -32,49 +39,251 @@ def get_db():
     return _db
 
 
+# Colonnes de l'export CSV des lignes tarifaires
+CSV_FIELDS = ["country", "hs_code", "description", "unit", "customs_duty", "vat", "source", "date"]
+EXCEL_COLUMNS = ["HS Code", "Description", "Unit", "Customs Duty", "VAT"]
+# Seuls les champs exportés sont lus depuis MongoDB
+TARIFF_PROJECTION = {"_id": 0, "country_code": 1, "imported_at": 1, "tariffs.tariff_lines": 1}
+# Documents par lot de curseur / lignes CSV par fragment envoyé
+EXPORT_BATCH_SIZE = 50
+CSV_FLUSH_ROWS = 1000
+# Classeur Excel / fichier Parquet gardés en mémoire jusqu'à cette taille, puis sur disque
+EXCEL_SPOOL_BYTES = 8 * 1024 * 1024
+
+# Schéma typé des exports colonnaires (Parquet, Arrow): taux en %, date d'import UTC
+TARIFF_SCHEMA = pa.schema([
+    ("country", pa.string()),
+    ("hs_code", pa.string()),
+    ("description", pa.string()),
+    ("unit", pa.string()),
+    ("customs_duty", pa.float64()),
+    ("vat", pa.float64()),
+    ("customs_duty_text", pa.string()),
+    ("vat_text", pa.string()),
+    ("source", pa.string()),
+    ("date", pa.timestamp("us", tz="UTC")),
+])
+COLUMNAR_COMPRESSION = "zstd"
+# Lignes par row group Parquet / record batch Arrow
+ROW_GROUP_ROWS = 64 * 1024
+
+
+def _tariff_lines(data):
+    return data.get("tariffs", {}).get("tariff_lines", [])
+
+
+async def _single(document):
+    yield document
+
+
+async def _latest_documents(db, country_list):
+    """Dernier import de chaque pays (pays sans données ignorés)"""
+    for country in country_list:
+        data = await db["customs_data"].find_one({"country_code": country}, TARIFF_PROJECTION,
+                                                 sort=[("imported_at", -1)])
+        if data:
+            yield data
+
+
+def _tariff_documents(db, country_list, latest: bool):
+    if latest:
+        return _latest_documents(db, country_list)
+    query = {"country_code": country_list[0] if len(country_list) == 1 else {"$in": country_list}}
+    return db["customs_data"].find(query, TARIFF_PROJECTION).sort("imported_at", -1).batch_size(EXPORT_BATCH_SIZE)
+
+
+async def _csv_chunks(documents):
+    """Fragments CSV au fil des documents (en-tête seulement s'il y a des lignes)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header = False
+    pending = 0
+    async for data in documents:
+        for line in _tariff_lines(data):
+            if not header:
+                writer.writerow(CSV_FIELDS)
+                header = True
+            writer.writerow([
+                data.get("country_code"),
+                line.get("hs_code", ""),
+                line.get("description", ""),
+                line.get("unit", ""),
+                line.get("customs_duty", ""),
+                line.get("vat", ""),
+                line.get("source", ""),
+                data.get("imported_at", ""),
+            ])
+            pending += 1
+            if pending >= CSV_FLUSH_ROWS:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _file_chunks(file, chunk_size: int = 64 * 1024):
+    """Relire un fichier temporaire par blocs, puis le fermer (supprimé)"""
+    try:
+        file.seek(0)
+        while chunk := file.read(chunk_size):
+            yield chunk
+    finally:
+        file.close()
+
+
+async def _excel_file(documents):
+    """
+    Classeur Excel (une feuille par pays) dans un fichier temporaire
+
+    Classeur en écriture seule: les lignes sont écrites sur disque au fil de
+    l'eau. None si aucun document n'a de lignes.
+    """
+    workbook = Workbook(write_only=True)
+    async for data in documents:
+        lines = _tariff_lines(data)
+        if not lines:
+            continue
+        sheet = workbook.create_sheet(title=str(data.get("country_code"))[:31])  # Excel sheet name limit is 31 chars
+        sheet.append(EXCEL_COLUMNS)
+        for line in lines:
+            sheet.append([
+                line.get("hs_code"),
+                line.get("description"),
+                line.get("unit"),
+                line.get("customs_duty"),
+                line.get("vat"),
+            ])
+    if not workbook.worksheets:
+        return None
+    output = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_BYTES)
+    await asyncio.to_thread(workbook.save, output)
+    return output
+
+
+RATE_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
+
+
+def _is_missing(value) -> bool:
+    return value is None or value != value  # None ou NaN
+
+
+def _text(values) -> pa.Array:
+    return pa.array([None if _is_missing(v) else v if isinstance(v, str) else str(v) for v in values],
+                    type=pa.string())
+
+
+def _rate(values) -> pa.Array:
+    """Taux en % d'une colonne hétérogène ("10%", "16", 2.5, "Exempt" -> null)"""
+    parsed = {}
+    out = []
+    for value in values:
+        key = (type(value), value)
+        if key not in parsed:
+            # une analyse par valeur distincte: les taux se répètent d'une ligne à l'autre
+            match = None if _is_missing(value) else RATE_RE.search(str(value))
+            parsed[key] = float(match.group().replace(",", ".")) if match else None
+        out.append(parsed[key])
+    return pa.array(out, type=pa.float64())
+
+
+def _tariff_batch(data):
+    """Lignes tarifaires d'un document au schéma TARIFF_SCHEMA (None si aucune)"""
+    lines = _tariff_lines(data)
+    if not lines:
+        return None
+    columns = {
+        field: [line.get(field) for line in lines]
+        for field in ("hs_code", "description", "unit", "customs_duty", "vat", "source")
+    }
+    imported_at = pd.to_datetime(data.get("imported_at"), utc=True, errors="coerce")
+    date = None if pd.isna(imported_at) else imported_at.to_pydatetime()
+    return pa.RecordBatch.from_arrays([
+        pa.array([data.get("country_code")] * len(lines), type=pa.string()),
+        _text(columns["hs_code"]),
+        _text(columns["description"]),
+        _text(columns["unit"]),
+        _rate(columns["customs_duty"]),
+        _rate(columns["vat"]),
+        _text(columns["customs_duty"]),
+        _text(columns["vat"]),
+        _text(columns["source"]),
+        pa.array([date] * len(lines), type=TARIFF_SCHEMA.field("date").type),
+    ], schema=TARIFF_SCHEMA)
+
+
+async def _parquet_file(documents):
+    """Fichier Parquet compressé, un row group par lot de lignes, dans un fichier temporaire"""
+    output = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_BYTES)
+    writer = pq.ParquetWriter(output, TARIFF_SCHEMA, compression=COLUMNAR_COMPRESSION)
+    async for data in documents:
+        batch = _tariff_batch(data)
+        if batch is not None:
+            writer.write_table(pa.Table.from_batches([batch]), row_group_size=ROW_GROUP_ROWS)
+    writer.close()
+    return output
+
+
+class _ChunkSink:
+    """File-like sink collecting the bytes written by an Arrow IPC writer"""
+
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def take(self) -> bytes:
+        out = b"".join(self.chunks)
+        self.chunks.clear()
+        return out
+
+
+async def _arrow_chunks(documents):
+    """Flux Arrow IPC: schéma puis un record batch compressé par document"""
+    sink = _ChunkSink()
+    writer = ipc.new_stream(sink, TARIFF_SCHEMA, options=ipc.IpcWriteOptions(compression=COLUMNAR_COMPRESSION))
+    yield sink.take()
+    async for data in documents:
+        batch = _tariff_batch(data)
+        if batch is not None:
+            writer.write_table(pa.Table.from_batches([batch]), max_chunksize=ROW_GROUP_ROWS)
+            yield sink.take()
+    writer.close()
+    yield sink.take()
+
+
 @router.get("/tariffs/csv")
 async def export_tariffs_csv(
     country: str = Query(..., description="Country code"),
     latest: bool = Query(True, description="Latest only")
 ):
-    """Export tariffs as CSV"""
+    """Export tariffs as CSV (streamed)"""
     try:
         db = get_db()
         query = {"country_code": country}
 
         if latest:
-            data = await db["customs_data"].find_one(query, sort=[("imported_at", -1)])
+            data = await db["customs_data"].find_one(query, TARIFF_PROJECTION, sort=[("imported_at", -1)])
             if not data:
                 raise HTTPException(404, f"No data for {country}")
-            data_list = [data]
+            documents = _single(data)
         else:
-            cursor = db["customs_data"].find(query).sort("imported_at", -1)
-            data_list = await cursor.to_list(length=None)
-
-        rows = []
-        for data in data_list:
-            for line in data.get("tariffs", {}).get("tariff_lines", []):
-                rows.append({
-                    "country": data.get("country_code"),
-                    "hs_code": line.get("hs_code", ""),
-                    "description": line.get("description", ""),
-                    "unit": line.get("unit", ""),
-                    "customs_duty": line.get("customs_duty", ""),
-                    "vat": line.get("vat", ""),
-                    "source": line.get("source", ""),
-                    "date": data.get("imported_at", "")
-                })
-
-        output = io.StringIO()
-        if rows:
-            writer = csv.DictWriter(output, fieldnames=rows[0].keys())
-            writer.writeheader()
-            writer.writerows(rows)
+            documents = db["customs_data"].find(query, TARIFF_PROJECTION).sort("imported_at", -1).batch_size(EXPORT_BATCH_SIZE)
 
         filename = f"tariffs_{country}_{datetime.now(timezone.utc).strftime('%Y%m%d')}.csv"
 
-        return Response(
-            content=output.getvalue(),
+        return StreamingResponse(
+            _csv_chunks(documents),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -90,43 +299,71 @@ async def export_tariffs_excel(
     countries: str = Query(..., description="Comma-separated country codes"),
     latest: bool = Query(True)
 ):
-    """Export tariffs as Excel (multi-sheet)"""
+    """Export tariffs as Excel (multi-sheet, write-only workbook)"""
     try:
         db = get_db()
         country_list = [c.strip() for c in countries.split(",")]
-        output = io.BytesIO()
 
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            for country in country_list:
-                query = {"country_code": country}
-                data = await db["customs_data"].find_one(query, sort=[("imported_at", -1)])
-
-                if not data:
-                    continue
-
-                rows = []
-                for line in data.get("tariffs", {}).get("tariff_lines", []):
-                    rows.append({
-                        "HS Code": line.get("hs_code"),
-                        "Description": line.get("description"),
-                        "Unit": line.get("unit"),
-                        "Customs Duty": line.get("customs_duty"),
-                        "VAT": line.get("vat")
-                    })
-
-                if rows:
-                    df = pd.DataFrame(rows)
-                    df.to_excel(writer, sheet_name=country[:31], index=False)  # Excel sheet name limit is 31 chars
-
-        output.seek(0)
+        output = await _excel_file(_latest_documents(db, country_list))
+        if output is None:
+            raise HTTPException(404, f"No data for {countries}")
         filename = f"tariffs_{datetime.now(timezone.utc).strftime('%Y%m%d')}.xlsx"
 
         return StreamingResponse(
-            io.BytesIO(output.read()),
+            _file_chunks(output),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
 
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(500, str(e))
+
+
+@router.get("/tariffs/parquet")
+async def export_tariffs_parquet(
+    countries: str = Query(..., description="Comma-separated country codes"),
+    latest: bool = Query(True, description="Latest import only")
+):
+    """Export tariffs as Parquet (typed columns, zstd)"""
+    try:
+        db = get_db()
+        country_list = [c.strip() for c in countries.split(",")]
+        output = await _parquet_file(_tariff_documents(db, country_list, latest))
+        filename = f"tariffs_{datetime.now(timezone.utc).strftime('%Y%m%d')}.parquet"
+
+        return StreamingResponse(
+            _file_chunks(output),
+            media_type="application/vnd.apache.parquet",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(500, str(e))
+
+
+@router.get("/tariffs/arrow")
+async def export_tariffs_arrow(
+    countries: str = Query(..., description="Comma-separated country codes"),
+    latest: bool = Query(True, description="Latest import only")
+):
+    """Export tariffs as an Arrow IPC stream (one record batch per import)"""
+    try:
+        db = get_db()
+        country_list = [c.strip() for c in countries.split(",")]
+        filename = f"tariffs_{datetime.now(timezone.utc).strftime('%Y%m%d')}.arrows"
+
+        return StreamingResponse(
+            _arrow_chunks(_tariff_documents(db, country_list, latest)),
+            media_type="application/vnd.apache.arrow.stream",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(500, str(e))
 
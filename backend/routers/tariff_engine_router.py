@@ -1,6 +1,9 @@
-import json
-from pathlib import Path
-from fastapi import APIRouter, HTTPException
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from tariff_engine.bloc_store import BLOC_STORE, hs_key
 
 
 router = APIRouter(prefix="/api/tariff-engine", tags=["tariff-engine"])
@@ -9,30 +12,40 @@ def ping():
     return {"ok": True}
 
 
-DATA_DIR = Path("tariff_engine/normalized")
-_cache = {}
+MAX_SCAN = 5000
 
-def load_bloc(bloc: str):
-    b = bloc.upper().strip()
-    candidates = [
-        DATA_DIR / f"{b}_MASTER_indexed.json",
-        DATA_DIR / f"{b}_MASTER_14_80_indexed.json",
-    ]
-    for p in candidates:
-        if p.exists():
-            if b not in _cache:
-                _cache[b] = json.loads(p.read_text(encoding="utf-8"))
-            return _cache[b], str(p)
-    raise FileNotFoundError(f"No indexed JSON for bloc={b}. Expected: {candidates}")
 
-@router.get("/{bloc}")
-def get_tariff(bloc: str, hs: str):
+class BulkLookupRequest(BaseModel):
+    """Codes HS à résoudre en un seul appel"""
+    hs_codes: List[str] = Field(..., min_length=1, max_length=10000)
+
+
+def load_bloc(bloc: str):
+    # index binaire partagé avec tariff_engine/api*.py (cwd = racine du dépôt)
     try:
-        data, src = load_bloc(bloc)
+        return BLOC_STORE.load(bloc)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
-    key = hs.replace(".", "").strip()
+
+def _scan(bloc: str, start: str, end: Optional[str], limit: int):
+    data, src = load_bloc(bloc)
+    total = data.count(start, end)
+    rows = [dict(row, hs_key=key) for key, row in data.scan(start, end, limit)]
+    return {
+        "bloc": bloc.upper(),
+        "dataset": src,
+        "count": len(rows),
+        "total": total,
+        "truncated": total > len(rows),
+        "results": rows,
+    }
+
+@router.get("/{bloc}")
+def get_tariff(bloc: str, hs: str):
+    data, src = load_bloc(bloc)
+
+    key = hs_key(hs)
     row = data.get(key)
     if not row:
         raise HTTPException(status_code=404, detail={"error": "not found", "bloc": bloc.upper(), "hs": key, "dataset": src})
@@ -45,16 +58,28 @@ def get_tariff(bloc: str, hs: str):
 @router.get("/{bloc}/meta")
 def meta(bloc: str):
     data, src = load_bloc(bloc)
-    keys = list(data.keys())
-    # stats rapides
-    rate_ok = sum(1 for k in keys if data[k].get("duty_rate_pct") is not None)
-    unit_ok = sum(1 for k in keys if str(data[k].get("unit","")).strip() != "")
+    # statistiques calculées une fois à la compilation de l'index
+    return {"bloc": bloc.upper(), "dataset": src, **data.stats()}
+
+@router.get("/{bloc}/prefix")
+def prefix(bloc: str, hs: str, limit: int = Query(1000, ge=1, le=MAX_SCAN)):
+    """Toutes les lignes tarifaires sous un préfixe HS (chapitre, HS4, HS6...)"""
+    return _scan(bloc, hs_key(hs), None, limit)
+
+@router.get("/{bloc}/range")
+def hs_range(bloc: str, start: str, end: str, limit: int = Query(1000, ge=1, le=MAX_SCAN)):
+    """Lignes dont le code est entre start et end (bornes incluses, comparées en préfixe)"""
+    return _scan(bloc, hs_key(start), hs_key(end), limit)
+
+@router.post("/{bloc}/bulk")
+def bulk(bloc: str, request: BulkLookupRequest):
+    """Recherche exacte de plusieurs codes HS en un aller-retour"""
+    data, src = load_bloc(bloc)
+    results = data.get_many(hs_key(hs) for hs in request.hs_codes)
     return {
         "bloc": bloc.upper(),
         "dataset": src,
-        "keys": len(keys),
-        "rate_non_null": rate_ok,
-        "unit_non_empty": unit_ok,
-        "sample_keys": keys[:10],
+        "found": sum(1 for row in results.values() if row is not None),
+        "missing": [key for key, row in results.items() if row is None],
+        "results": results,
     }
-
@@ -16,6 +16,7 @@ MIGRATION STATUS:
 - substitution.py: COMPLETE
 - gemini_analysis.py: COMPLETE
 - trade_data.py: COMPLETE (UN COMTRADE & WTO integration)
+- landed_cost.py: COMPLETE (tarifs + logistique en un appel)
 """
 
 from fastapi import APIRouter
@@ -34,6 +35,7 @@ from .etl import router as etl_router
 from .substitution import router as substitution_router
 from .gemini_analysis import router as gemini_router
 from .trade_data import router as trade_data_router
+from .landed_cost import router as landed_cost_router
 
 # Import export router from backend.routers
 try:
@@ -57,6 +59,7 @@ def register_routes(api_router: APIRouter):
     api_router.include_router(substitution_router, tags=["Trade Substitution"])
     api_router.include_router(gemini_router, tags=["AI Analysis"])
     api_router.include_router(trade_data_router, tags=["Trade Data Sources"])
+    api_router.include_router(landed_cost_router, tags=["Landed Cost"])
     
     # Register export router if available
     if EXPORT_ROUTER_AVAILABLE:
@@ -8,16 +8,20 @@ import logging
 import json
 import unicodedata
 
-from country_data import get_country_data, REAL_COUNTRY_DATA
 from constants import AFRICAN_COUNTRIES
 from data_loader import (
     get_country_commerce_profile,
     get_country_customs_info,
 )
-from projects_data import get_country_ongoing_projects
 from models import CountryInfo, CountryEconomicProfile
 from translations import translate_country_name, translate_region
-from gold_reserves_data import GOLD_RESERVES_GAI_DATA
+from datasets import DATASETS
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+get_country_data = DATASETS.function("country_data", "get_country_data")
+country_data = DATASETS.module("country_data")
+get_country_ongoing_projects = DATASETS.function("projects", "get_country_ongoing_projects")
+gold_reserves = DATASETS.module("gold_reserves")
 
 router = APIRouter()
 
@@ -127,14 +131,14 @@ async def get_country_profile(country_code: str) -> CountryEconomicProfile:
                     profile.projections[key] = value
         
         # Gold reserves data
-        gold_data = GOLD_RESERVES_GAI_DATA['gold_reserves'].get(country['iso3'], {})
+        gold_data = gold_reserves.GOLD_RESERVES_GAI_DATA['gold_reserves'].get(country['iso3'], {})
         if gold_data:
             profile.projections['gold_reserves_tonnes'] = gold_data.get('tonnes', 0.0)
             profile.projections['gold_reserves_rank_africa'] = gold_data.get('rank_africa')
             profile.projections['gold_reserves_rank_global'] = gold_data.get('rank_global')
         
         # Global Attractiveness Index 2025
-        gai_data = GOLD_RESERVES_GAI_DATA['global_attractiveness_index_2025'].get(country['iso3'], {})
+        gai_data = gold_reserves.GOLD_RESERVES_GAI_DATA['global_attractiveness_index_2025'].get(country['iso3'], {})
         if gai_data:
             profile.projections['gai_2025_score'] = gai_data.get('score')
             profile.projections['gai_2025_rank_africa'] = gai_data.get('rank_africa')
@@ -2,20 +2,58 @@
 ETL routes - Data pipeline administration and monitoring
 Handles TRS data updates, coverage reports, and pipeline status
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pathlib import Path
+from typing import Optional
+import asyncio
 import json
 import logging
 
-from logistics_data import get_all_ports
+from datasets import DATASETS
+from etl.etl_changelog import ETL_CHANGELOG
+from etl.etl_jobs import ETL_JOBS, FAILED, JOB_HISTORY, SUCCEEDED
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+get_all_ports = DATASETS.function("ports", "get_all_ports")
 
 router = APIRouter(prefix="/etl")
 
 ROOT_DIR = Path(__file__).parent.parent
 
+# Jeu de données verrouillé par le pipeline ports (un seul job actif)
+PORTS_DATASET = "ports"
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+def _run_ports_etl(progress):
+    import sys
+    sys.path.insert(0, str(ROOT_DIR))
+    from etl.ports_etl import run_etl
+    return run_etl(progress)
+
+
+def _job_response(job, created: bool = True) -> dict:
+    return {
+        **job.to_dict(),
+        "created": created,
+        "status_url": f"/api/etl/jobs/{job.job_id}",
+        "events_url": f"/api/etl/jobs/{job.job_id}/events",
+    }
+
 
-@router.post("/run")
-async def run_etl_pipeline():
+def _get_job(job_id: str):
+    job = ETL_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job ETL non trouvé: {job_id}")
+    return job
+
+
+@router.post("/run", status_code=202)
+async def run_etl_pipeline(
+    response: Response,
+    wait: bool = Query(False, description="Attendre la fin du pipeline (ancien comportement)")
+):
     """
     Exécute le pipeline ETL pour mettre à jour les données portuaires.
     
@@ -26,20 +64,77 @@ async def run_etl_pipeline():
     
     IMPORTANT: Seules les données officielles sont utilisées.
     Les ports sans données officielles sont marqués "NA".
+    
+    Le pipeline est exécuté en arrière-plan (voir etl/etl_jobs.py): la
+    réponse 202 contient l'identifiant du job, à suivre via
+    /etl/jobs/{job_id} ou /etl/jobs/{job_id}/events (SSE). Si un pipeline
+    est déjà en cours, le job existant est renvoyé.
     """
-    try:
-        import sys
-        sys.path.insert(0, str(ROOT_DIR))
-        from etl.ports_etl import run_etl
-        
-        result = run_etl()
-        return {
-            "status": "success",
-            "message": "Pipeline ETL exécuté avec succès",
-            "details": result
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur ETL: {str(e)}")
+    job, created = ETL_JOBS.submit(PORTS_DATASET, _run_ports_etl)
+    if not wait:
+        return _job_response(job, created)
+
+    await asyncio.to_thread(job.wait)
+    if job.status == FAILED:
+        raise HTTPException(status_code=500, detail=f"Erreur ETL: {job.error}")
+    response.status_code = 200
+    return {
+        "status": "success",
+        "message": "Pipeline ETL exécuté avec succès",
+        "job_id": job.job_id,
+        "details": job.result
+    }
+
+
+@router.get("/jobs")
+async def list_etl_jobs(limit: int = Query(20, ge=1, le=JOB_HISTORY)):
+    """
+    Derniers jobs ETL (du plus récent au plus ancien).
+    """
+    return {
+        "active": {dataset: job.job_id for dataset in (PORTS_DATASET,) if (job := ETL_JOBS.active(dataset))},
+        "jobs": [job.to_dict() for job in ETL_JOBS.jobs(limit)]
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_etl_job(job_id: str):
+    """
+    État d'un job ETL (polling).
+    """
+    job = _get_job(job_id)
+    return {**job.to_dict(), "events": job.events_since(0, timeout=0)}
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_etl_job_events(job_id: str, last_event_id: int = Query(-1, ge=-1)):
+    """
+    Progression d'un job ETL en Server-Sent Events.
+    
+    Le flux se termine après l'événement final (succeeded ou failed).
+    """
+    job = _get_job(job_id)
+
+    async def events():
+        seq = last_event_id + 1
+        while True:
+            batch = await asyncio.to_thread(job.events_since, seq, SSE_KEEPALIVE_SECONDS)
+            if not batch:
+                if job.done:
+                    break
+                yield ": keep-alive\n\n"
+                continue
+            for event in batch:
+                yield f"id: {event['seq']}\nevent: {event['event']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+            seq = batch[-1]["seq"] + 1
+            if batch[-1]["status"] in (SUCCEEDED, FAILED) and batch[-1]["event"] == "status":
+                break
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/status")
@@ -48,18 +143,14 @@ async def get_etl_status():
     Retourne le statut du dernier pipeline ETL.
     """
     try:
-        log_file = ROOT_DIR / 'etl' / 'etl_log.json'
-        if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-            
-            # Dernière exécution
-            last_entries = log_data[-68:] if len(log_data) >= 68 else log_data
-            last_timestamp = last_entries[-1]['timestamp'] if last_entries else None
-            
+        # Index du journal uniquement: l'historique n'est pas relu
+        last_run = ETL_CHANGELOG.last_run()
+        if last_run:
             return {
-                "last_run": last_timestamp,
-                "total_updates": len(log_data),
+                "last_run": last_run["timestamp"],
+                "last_run_id": last_run["run_id"],
+                "last_run_changes": last_run["entries"],
+                "total_updates": ETL_CHANGELOG.total_entries(),
                 "ports_with_trs_data": 4,
                 "ports_without_trs_data": 64,
                 "data_sources": [
@@ -82,6 +173,29 @@ async def get_etl_status():
         raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
 
 
+@router.get("/changes")
+async def get_etl_changes(
+    limit: int = Query(50, ge=1, le=1000, description="Nombre de modifications"),
+    port_id: Optional[str] = Query(None, description="Modifications d'un port")
+):
+    """
+    Dernières modifications du journal ETL, éventuellement pour un seul port.
+    """
+    try:
+        if port_id:
+            changes = ETL_CHANGELOG.port_changes(port_id, limit)
+        else:
+            changes = ETL_CHANGELOG.tail(limit)
+        return {
+            "port_id": port_id,
+            "count": len(changes),
+            "changes": changes,
+            "runs": ETL_CHANGELOG.runs(5),
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
+
+
 @router.get("/trs-coverage")
 async def get_trs_coverage():
     """
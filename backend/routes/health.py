@@ -51,6 +51,30 @@ async def detailed_health():
             "message": f"Notification system error: {str(e)}"
         }
 
+    # Check World Bank / OEC enrichment cache
+    try:
+        from services.enrichment_cache import enrichment_cache
+        cache_stats = enrichment_cache.get_stats()
+        checks["enrichment_cache"] = {
+            "status": "up" if cache_stats["running"] else "idle",
+            **cache_stats
+        }
+    except Exception as e:
+        checks["enrichment_cache"] = {
+            "status": "error",
+            "message": f"Enrichment cache error: {str(e)}"
+        }
+
+    # Check 2024 data files cache
+    try:
+        from data_loader import get_data_cache_stats
+        checks["data_files"] = {"status": "up", **get_data_cache_stats()}
+    except Exception as e:
+        checks["data_files"] = {
+            "status": "error",
+            "message": f"Data file cache error: {str(e)}"
+        }
+
     # Check COMTRADE API
     try:
         from services.comtrade_service import comtrade_service
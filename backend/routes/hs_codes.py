@@ -4,20 +4,24 @@ Using complete HS6_DATABASE with 5800+ codes
 """
 from fastapi import APIRouter, HTTPException, Query
 
-from etl.hs_codes_data import (
-    get_hs_chapters,
-    get_hs6_code,
-)
-from etl.hs6_database import (
-    HS6_DATABASE,
+from datasets import DATASETS
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+get_hs_chapters, get_hs6_code = DATASETS.functions("hs_codes", "get_hs_chapters", "get_hs6_code")
+(
     search_hs6_codes,
     get_database_stats,
     get_hs6_info,
     get_sub_position_suggestions,
     get_rule_of_origin,
     get_all_categories,
-    get_codes_by_category as get_codes_by_category_db
+    get_codes_by_category_db
+) = DATASETS.functions(
+    "hs6_database",
+    "search_hs6_codes", "get_database_stats", "get_hs6_info", "get_sub_position_suggestions",
+    "get_rule_of_origin", "get_all_categories", "get_codes_by_category"
 )
+hs6_database = DATASETS.module("hs6_database")
 
 router = APIRouter(prefix="/hs-codes")
 
@@ -37,16 +41,19 @@ async def get_all_hs6_codes_endpoint(language: str = Query("fr", description="La
     """
     Get all HS6 codes with their labels from the complete database (5800+ codes)
     """
-    result = []
     chapters = get_hs_chapters()
-    for code, data in HS6_DATABASE.items():
-        desc_key = "description_fr" if language == "fr" else "description_en"
-        result.append({
+    desc_key = "description_fr" if language == "fr" else "description_en"
+    # Colonnes de l'artefact HS6: pas de reconstruction des enregistrements
+    database = hs6_database.HS6_DATABASE
+    result = [
+        {
             "code": code,
-            "label": data.get(desc_key, data.get("description_fr", "")),
+            "label": label,
             "chapter": code[:2],
             "chapter_name": chapters.get(code[:2], {}).get(language, "")
-        })
+        }
+        for code, label in zip(database, database.column(desc_key))
+    ]
     
     return {
         "codes": result,
@@ -61,8 +68,8 @@ async def get_single_hs_code(hs_code: str, language: str = Query("fr", descripti
     Get a specific HS6 code with its label from complete database
     """
     # Try complete database first
-    if hs_code in HS6_DATABASE:
-        data = HS6_DATABASE[hs_code]
+    if hs_code in hs6_database.HS6_DATABASE:
+        data = hs6_database.HS6_DATABASE[hs_code]
         desc_key = "description_fr" if language == "fr" else "description_en"
         chapters = get_hs_chapters()
         return {
@@ -126,21 +133,24 @@ async def get_hs_codes_by_chapter(
     if len(chapter) != 2 or chapter not in chapters:
         raise HTTPException(status_code=404, detail=f"Chapter {chapter} not found")
     
-    # Get codes from complete database
-    codes = []
+    # Codes du chapitre uniquement (plage triée de l'artefact HS6)
     desc_key = "description_fr" if language == "fr" else "description_en"
-    for code, data in HS6_DATABASE.items():
-        if code[:2] == chapter:
-            codes.append({
-                "code": code,
-                "label": data.get(desc_key, data.get("description_fr", "")),
-                "chapter": chapter,
-                "category": data.get("category", ""),
-                "sensitivity": data.get("sensitivity", "normal")
-            })
-    
-    # Sort codes
-    codes.sort(key=lambda x: x["code"])
+    database = hs6_database.HS6_DATABASE
+    codes = [
+        {
+            "code": code,
+            "label": label,
+            "chapter": chapter,
+            "category": category,
+            "sensitivity": sensitivity
+        }
+        for code, label, category, sensitivity in zip(
+            database.column("code", chapter),
+            database.column(desc_key, chapter),
+            database.column("category", chapter),
+            database.column("sensitivity", chapter),
+        )
+    ]
     
     chapter_info = chapters.get(chapter, {})
     
@@ -162,7 +172,7 @@ async def get_hs_codes_statistics():
     
     # Count codes per chapter from complete database
     codes_per_chapter = {}
-    for code in HS6_DATABASE.keys():
+    for code in hs6_database.HS6_DATABASE.keys():
         ch = code[:2]
         codes_per_chapter[ch] = codes_per_chapter.get(ch, 0) + 1
     
@@ -170,7 +180,7 @@ async def get_hs_codes_statistics():
     
     return {
         "total_chapters": len(chapters),
-        "total_codes": db_stats.get("total_codes", len(HS6_DATABASE)),
+        "total_codes": db_stats.get("total_codes", len(hs6_database.HS6_DATABASE)),
         "top_chapters": [
             {
                 "chapter": ch,
@@ -0,0 +1,34 @@
+"""
+Landed cost routes - Tariffs, taxes and logistics routing in one call
+"""
+from fastapi import APIRouter, HTTPException
+
+from models import LandedCostRequest, LandedCostResponse
+from services.landed_cost_service import landed_cost_service
+
+router = APIRouter()
+
+
+@router.post("/landed-cost", response_model=LandedCostResponse)
+async def calculate_landed_cost(request: LandedCostRequest):
+    """
+    Coût rendu d'une expédition: fret, assurance, droits et taxes
+
+    Les taux (même priorité que /calculate-tariff), les taxes du pays de
+    destination et l'itinéraire multimodal sont calculés en parallèle;
+    timings_ms donne la durée de chaque étape.
+    """
+    try:
+        result = await landed_cost_service.compute(
+            request.origin_country,
+            request.destination_country,
+            request.hs_code,
+            request.value,
+            weight_tonnes=request.weight_tonnes,
+            mode=request.mode,
+            route_metric=request.route_metric,
+            alternatives=request.alternatives
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return LandedCostResponse(**result)
@@ -3,23 +3,20 @@ Logistics routes - Ports, Airports, Land corridors, Free Zones
 Multimodal logistics platform for African trade infrastructure
 """
 from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from typing import List, Optional
 
-from logistics_data import (
-    get_all_ports,
-    get_port_by_id,
-    get_ports_by_type,
-    get_top_ports_by_teu,
-    search_ports
+from datasets import DATASETS
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+get_all_ports, get_port_by_id, get_ports_by_type, get_top_ports_by_teu, search_ports = DATASETS.functions(
+    "ports", "get_all_ports", "get_port_by_id", "get_ports_by_type", "get_top_ports_by_teu", "search_ports"
 )
-from logistics_air_data import (
-    get_all_airports,
-    get_airport_by_id,
-    get_top_airports_by_cargo,
-    search_airports
+get_all_airports, get_airport_by_id, get_top_airports_by_cargo, search_airports = DATASETS.functions(
+    "airports", "get_all_airports", "get_airport_by_id", "get_top_airports_by_cargo", "search_airports"
 )
-from free_zones_data import get_free_zones_by_country
-from logistics_land_data import (
+get_free_zones_by_country = DATASETS.function("free_zones", "get_free_zones_by_country")
+find_routes, get_graph_stats = DATASETS.functions("logistics_graph", "find_routes", "get_graph_stats")
+(
     get_all_corridors,
     get_corridors_by_country,
     get_corridor_by_id,
@@ -30,6 +27,11 @@ from logistics_land_data import (
     get_operators_by_type,
     search_corridors,
     get_corridors_statistics
+) = DATASETS.functions(
+    "corridors",
+    "get_all_corridors", "get_corridors_by_country", "get_corridor_by_id", "get_all_nodes",
+    "get_nodes_by_type", "get_osbp_nodes", "get_all_operators", "get_operators_by_type", "search_corridors",
+    "get_corridors_statistics"
 )
 
 router = APIRouter(prefix="/logistics")
@@ -345,3 +347,35 @@ async def search_land_corridors(q: str):
 async def get_land_logistics_statistics():
     """Get global statistics about African land corridors"""
     return get_corridors_statistics()
+
+# ==========================================
+# MULTIMODAL ROUTING
+# ==========================================
+
+@router.get("/route")
+async def get_logistics_route(
+    origin: str = Query(..., description="Pays ISO3 (ex. CIV) ou nœud: port, aéroport, UN/LOCODE, IATA"),
+    destination: str = Query(..., description="Pays ISO3 ou nœud de destination"),
+    metric: str = Query("time", description="Critère: time, distance, cost"),
+    k: int = Query(3, ge=1, le=5, description="Nombre d'itinéraires"),
+    modes: Optional[List[str]] = Query(None, description="Modes autorisés: sea, air, road, rail, multimodal")
+):
+    """
+    K best routes between two countries or nodes, plus the cheapest route
+    
+    Routes run on the multimodal graph (ports, airports, land corridors and
+    OSBP nodes) with distance, transit time (port dwell times included)
+    and indicative cost per tonne. Country-to-country routes are served
+    from cached shortest-path trees.
+    """
+    try:
+        return find_routes(origin, destination, metric=metric, k=k, modes=modes)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Unknown node or country: {e.args[0]}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/route/graph")
+async def get_logistics_graph_statistics():
+    """Size of the multimodal routing graph and of its caches"""
+    return get_graph_stats()
@@ -5,7 +5,12 @@ from fastapi import APIRouter, Query
 from typing import Optional
 import logging
 
-from etl.news_aggregator import get_news, get_news_by_region, get_news_by_category
+from datasets import DATASETS
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+get_news, get_news_by_region, get_news_by_category = DATASETS.functions(
+    "news", "get_news", "get_news_by_region", "get_news_by_category"
+)
 
 router = APIRouter(prefix="/news")
 
@@ -5,7 +5,10 @@ Covers all 4 dimensions: Macro, Agriculture, Manufacturing, Mining
 from fastapi import APIRouter, Query
 from typing import Optional
 
-from production_data import (
+from datasets import DATASETS
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+(
     get_value_added,
     get_value_added_by_country,
     get_agriculture_production,
@@ -13,9 +16,15 @@ from production_data import (
     get_manufacturing_production,
     get_manufacturing_by_country,
     get_mining_production,
-    get_mining_by_country as get_mining_by_country_data,
+    get_mining_by_country_data,
     get_production_statistics,
     get_country_production_overview
+) = DATASETS.functions(
+    "production",
+    "get_value_added", "get_value_added_by_country", "get_agriculture_production",
+    "get_agriculture_by_country", "get_manufacturing_production", "get_manufacturing_by_country",
+    "get_mining_production", "get_mining_by_country", "get_production_statistics",
+    "get_country_production_overview"
 )
 
 router = APIRouter(prefix="/production")
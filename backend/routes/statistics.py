@@ -5,20 +5,24 @@ Comprehensive statistics for African trade and ZLECAf analysis
 from fastapi import APIRouter, Query
 from typing import Optional
 
-from etl.trade_products_data import (
+from etl.translations import translate_product, translate_country_list
+from datasets import DATASETS
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+(
     get_trade_summary,
     get_top_imports_from_world,
     get_top_exports_to_world,
     get_top_intra_african_imports,
     get_top_intra_african_exports,
     get_all_trade_products_data
+) = DATASETS.functions(
+    "trade_products",
+    "get_trade_summary", "get_top_imports_from_world", "get_top_exports_to_world",
+    "get_top_intra_african_imports", "get_top_intra_african_exports", "get_all_trade_products_data"
 )
-from etl.translations import translate_product, translate_country_list
-from etl.unctad_data import (
-    get_unctad_port_statistics,
-    get_unctad_trade_flows,
-    get_unctad_lsci,
-    get_all_unctad_data
+get_unctad_port_statistics, get_unctad_trade_flows, get_unctad_lsci, get_all_unctad_data = DATASETS.functions(
+    "unctad", "get_unctad_port_statistics", "get_unctad_trade_flows", "get_unctad_lsci", "get_all_unctad_data"
 )
 
 def translate_products_list(products: list, language: str = 'fr') -> list:
@@ -4,44 +4,91 @@ Complete tariff data for 54 African countries with ZLECAf rates
 """
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
+import time
 
 from constants import AFRICAN_COUNTRIES
-from etl.hs_codes_data import get_hs_chapters, get_hs6_code
-from etl.hs6_tariffs import (
+from models import TariffBatchRequest, TariffBatchResponse
+from services.tariff_batch_service import batch_tariff_engine
+from datasets import DATASETS
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+get_hs_chapters, get_hs6_code = DATASETS.functions("hs_codes", "get_hs_chapters", "get_hs6_code")
+(
     get_hs6_tariff,
     get_hs6_tariff_rates,
     search_hs6_tariffs,
     get_hs6_tariffs_by_chapter,
-    get_hs6_statistics,
-    HS6_TARIFFS_AGRICULTURE,
-    HS6_TARIFFS_MINING,
-    HS6_TARIFFS_MANUFACTURED
+    get_hs6_statistics
+) = DATASETS.functions(
+    "hs6_tariffs",
+    "get_hs6_tariff", "get_hs6_tariff_rates", "search_hs6_tariffs", "get_hs6_tariffs_by_chapter",
+    "get_hs6_statistics"
 )
-from etl.country_tariffs_complete import (
+hs6_tariffs = DATASETS.module("hs6_tariffs")
+(
     get_tariff_rate_for_country,
     get_zlecaf_tariff_rate,
     get_vat_rate_for_country,
     get_other_taxes_for_country,
-    get_all_country_rates,
-    ISO2_TO_ISO3
+    get_all_country_rates
+) = DATASETS.functions(
+    "country_tariffs_complete",
+    "get_tariff_rate_for_country", "get_zlecaf_tariff_rate", "get_vat_rate_for_country",
+    "get_other_taxes_for_country", "get_all_country_rates"
 )
-from etl.country_hs6_tariffs import (
+country_tariffs_complete = DATASETS.module("country_tariffs_complete")
+(
     get_country_hs6_tariff,
     search_country_hs6_tariffs,
-    get_available_country_tariffs,
-    COUNTRY_HS6_TARIFFS
+    get_available_country_tariffs
+) = DATASETS.functions(
+    "country_hs6_tariffs",
+    "get_country_hs6_tariff", "search_country_hs6_tariffs", "get_available_country_tariffs"
 )
-from etl.country_hs6_detailed import (
+country_hs6_tariffs = DATASETS.module("country_hs6_tariffs")
+(
     get_detailed_tariff,
     get_sub_position_rate,
     get_all_sub_positions,
     has_varying_rates,
-    get_tariff_summary,
-    COUNTRY_HS6_DETAILED
+    get_tariff_summary
+) = DATASETS.functions(
+    "country_hs6_detailed",
+    "get_detailed_tariff", "get_sub_position_rate", "get_all_sub_positions", "has_varying_rates",
+    "get_tariff_summary"
 )
+country_hs6_detailed = DATASETS.module("country_hs6_detailed")
 
 router = APIRouter()
 
+# =============================================================================
+# BATCH TARIFF CALCULATION
+# =============================================================================
+
+@router.post("/calculate-tariff/batch", response_model=TariffBatchResponse)
+async def calculate_tariff_batch(request: TariffBatchRequest):
+    """
+    Calculer les tarifs d'une facture complète (jusqu'à 10 000 lignes)
+
+    Même ordre de priorité des tarifs que /calculate-tariff, mais les taux sont
+    résolus une fois par couple (destination, code SH) et les montants calculés
+    de façon vectorisée. Les résultats sont renvoyés dans l'ordre des lignes.
+    """
+    start = time.perf_counter()
+    try:
+        results, totals = batch_tariff_engine.calculate([line.dict() for line in request.lines])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return TariffBatchResponse(
+        count=len(results),
+        results=results,
+        totals=totals,
+        computation_order_ref="Codes douaniers nationaux + Directives CEDEAO/UEMOA/CEMAC/EAC/SACU",
+        last_verified="2025-01",
+        computation_time_ms=round((time.perf_counter() - start) * 1000, 2)
+    )
+
 # =============================================================================
 # HS6 TARIFFS ENDPOINTS
 # =============================================================================
@@ -139,18 +186,18 @@ async def get_african_export_products(language: str = Query("fr")):
     return {
         "agriculture": {
             "title": "Produits Agricoles" if language == "fr" else "Agricultural Products",
-            "count": len(HS6_TARIFFS_AGRICULTURE),
-            "products": format_products(HS6_TARIFFS_AGRICULTURE, "agriculture")
+            "count": len(hs6_tariffs.HS6_TARIFFS_AGRICULTURE),
+            "products": format_products(hs6_tariffs.HS6_TARIFFS_AGRICULTURE, "agriculture")
         },
         "mining": {
             "title": "Produits Miniers" if language == "fr" else "Mining Products",
-            "count": len(HS6_TARIFFS_MINING),
-            "products": format_products(HS6_TARIFFS_MINING, "mining")
+            "count": len(hs6_tariffs.HS6_TARIFFS_MINING),
+            "products": format_products(hs6_tariffs.HS6_TARIFFS_MINING, "mining")
         },
         "manufactured": {
             "title": "Produits Manufacturés" if language == "fr" else "Manufactured Products",
-            "count": len(HS6_TARIFFS_MANUFACTURED),
-            "products": format_products(HS6_TARIFFS_MANUFACTURED, "manufactured")
+            "count": len(hs6_tariffs.HS6_TARIFFS_MANUFACTURED),
+            "products": format_products(hs6_tariffs.HS6_TARIFFS_MANUFACTURED, "manufactured")
         }
     }
 
@@ -168,7 +215,7 @@ async def get_country_tariffs_endpoint(
     Retourne les taux NPF, ZLECAf, TVA et autres taxes
     """
     if len(country_code) == 2:
-        country_iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
+        country_iso3 = country_tariffs_complete.ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
     else:
         country_iso3 = country_code.upper()
     
@@ -218,7 +265,7 @@ async def compare_country_tariffs(
     results = []
     for cc in country_list:
         if len(cc) == 2:
-            iso3 = ISO2_TO_ISO3.get(cc, cc)
+            iso3 = country_tariffs_complete.ISO2_TO_ISO3.get(cc, cc)
         else:
             iso3 = cc
         
@@ -268,7 +315,7 @@ async def search_country_hs6_endpoint(
 ):
     """Rechercher les tarifs SH6 spécifiques à un pays"""
     if len(country_code) == 2:
-        iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
+        iso3 = country_tariffs_complete.ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
     else:
         iso3 = country_code.upper()
     
@@ -288,7 +335,7 @@ async def get_country_hs6_tariff_endpoint(
 ):
     """Obtenir le tarif SH6 spécifique à un pays"""
     if len(country_code) == 2:
-        iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
+        iso3 = country_tariffs_complete.ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
     else:
         iso3 = country_code.upper()
     
@@ -319,11 +366,11 @@ async def get_all_country_hs6_tariffs(
 ):
     """Obtenir tous les tarifs SH6 d'un pays"""
     if len(country_code) == 2:
-        iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
+        iso3 = country_tariffs_complete.ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
     else:
         iso3 = country_code.upper()
     
-    if iso3 not in COUNTRY_HS6_TARIFFS:
+    if iso3 not in country_hs6_tariffs.COUNTRY_HS6_TARIFFS:
         return {
             "country_code": iso3,
             "available": False,
@@ -331,7 +378,7 @@ async def get_all_country_hs6_tariffs(
             "tariffs": []
         }
     
-    tariffs = COUNTRY_HS6_TARIFFS[iso3]
+    tariffs = country_hs6_tariffs.COUNTRY_HS6_TARIFFS[iso3]
     return {
         "country_code": iso3,
         "available": True,
@@ -354,7 +401,7 @@ async def get_detailed_tariff_endpoint(
     Supporte les codes de 6 à 12 chiffres
     """
     if len(country_code) == 2:
-        iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
+        iso3 = country_tariffs_complete.ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
     else:
         iso3 = country_code.upper()
     
@@ -374,7 +421,7 @@ async def get_sub_position_rate_endpoint(
 ):
     """Obtenir le taux pour une sous-position nationale spécifique (8-12 chiffres)"""
     if len(country_code) == 2:
-        iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
+        iso3 = country_tariffs_complete.ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
     else:
         iso3 = country_code.upper()
     
@@ -404,7 +451,7 @@ async def get_all_sub_positions_endpoint(
 ):
     """Obtenir toutes les sous-positions nationales pour un code SH6"""
     if len(country_code) == 2:
-        iso3 = ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
+        iso3 = country_tariffs_complete.ISO2_TO_ISO3.get(country_code.upper(), country_code.upper())
     else:
         iso3 = country_code.upper()
     
@@ -425,7 +472,7 @@ async def get_all_sub_positions_endpoint(
 async def get_detailed_countries_list():
     """Liste des pays avec tarifs détaillés (sous-positions nationales) disponibles"""
     return {
-        "countries": list(COUNTRY_HS6_DETAILED.keys()),
-        "count": len(COUNTRY_HS6_DETAILED),
+        "countries": list(country_hs6_detailed.COUNTRY_HS6_DETAILED.keys()),
+        "count": len(country_hs6_detailed.COUNTRY_HS6_DETAILED),
         "description": "Pays avec sous-positions nationales (8-12 chiffres) disponibles"
     }
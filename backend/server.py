@@ -9,18 +9,15 @@ from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict, Any, Union
 import uuid
 from datetime import datetime
-import requests
 import pandas as pd
 import asyncio
 import json
-from country_data import get_country_data, REAL_COUNTRY_DATA
 from constants import AFRICAN_COUNTRIES, ZLECAF_RULES_OF_ORIGIN
 from models import CountryInfo, TariffCalculationRequest, TariffCalculationResponse, CountryEconomicProfile
 from translations import (
     COUNTRY_TRANSLATIONS, REGION_TRANSLATIONS, RULES_TRANSLATIONS,
     translate_country_name, translate_region, translate_rule
 )
-from gold_reserves_data import GOLD_RESERVES_GAI_DATA
 from tax_rates import calculate_all_taxes, get_vat_rate
 from data_loader import (
     load_corrections_data, 
@@ -32,65 +29,43 @@ from data_loader import (
     get_country_customs_info,
     get_country_infrastructure_ranking
 )
-from logistics_data import (
-    get_all_ports,
-    get_port_by_id,
-    get_ports_by_type,
-    get_top_ports_by_teu,
-    search_ports
-)
-from logistics_air_data import (
-    get_all_airports,
-    get_airport_by_id,
-    get_top_airports_by_cargo,
-    search_airports
-)
-from projects_data import get_country_ongoing_projects
-from etl.country_tariffs import get_country_tariff_rate, get_available_rates, get_tariff_regime
-from free_zones_data import load_free_zones, get_free_zones_by_country
-from etl.hs_codes_data import (
-    get_hs_chapters,
-    get_hs6_codes,
-    get_hs6_code,
-    search_hs_codes,
-    get_codes_by_chapter,
-    get_all_hs_data
+from datasets import DATASETS, DATASET_WARMUP
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+get_hs_chapters, get_hs6_code = DATASETS.functions(
+    "hs_codes", "get_hs_chapters", "get_hs6_code"
 )
-from etl.hs6_tariffs import (
-    get_hs6_tariff,
-    get_hs6_tariff_rates,
-    search_hs6_tariffs,
-    get_hs6_tariffs_by_chapter,
-    get_hs6_statistics
+get_hs6_tariff, search_hs6_tariffs, get_hs6_tariffs_by_chapter, get_hs6_statistics = DATASETS.functions(
+    "hs6_tariffs", "get_hs6_tariff", "search_hs6_tariffs", "get_hs6_tariffs_by_chapter", "get_hs6_statistics"
 )
-from etl.country_tariffs_complete import (
+(
     get_tariff_rate_for_country,
     get_zlecaf_tariff_rate,
     get_vat_rate_for_country,
     get_other_taxes_for_country,
-    get_complete_taxes_for_country,
     get_all_country_rates,
-    COUNTRY_VAT_RATES,
-    COUNTRY_OTHER_TAXES
+    resolve_npf_rate
+) = DATASETS.functions(
+    "country_tariffs_complete",
+    "get_tariff_rate_for_country", "get_zlecaf_tariff_rate", "get_vat_rate_for_country",
+    "get_other_taxes_for_country", "get_all_country_rates", "resolve_npf_rate"
 )
-from etl.country_hs6_tariffs import (
-    get_country_hs6_tariff,
-    get_country_hs6_dd_rate,
-    search_country_hs6_tariffs,
-    get_available_country_tariffs,
-    COUNTRY_HS6_TARIFFS
+get_country_hs6_tariff, search_country_hs6_tariffs, get_available_country_tariffs = DATASETS.functions(
+    "country_hs6_tariffs", "get_country_hs6_tariff", "search_country_hs6_tariffs", "get_available_country_tariffs"
 )
-from etl.country_hs6_detailed import (
+(
     get_detailed_tariff,
     get_sub_position_rate,
     get_all_sub_positions,
     has_varying_rates,
-    get_tariff_summary,
-    COUNTRY_HS6_DETAILED
+    get_tariff_summary
+) = DATASETS.functions(
+    "country_hs6_detailed",
+    "get_detailed_tariff", "get_sub_position_rate", "get_all_sub_positions",
+    "has_varying_rates", "get_tariff_summary"
 )
-from etl.hs6_database import (
-    HS6_DATABASE,
-    SUB_POSITION_TYPES,
+country_hs6_detailed = DATASETS.module("country_hs6_detailed")
+(
     get_hs6_info,
     get_sub_position_suggestions,
     get_rule_of_origin,
@@ -98,6 +73,10 @@ from etl.hs6_database import (
     get_all_categories,
     get_codes_by_category,
     get_database_stats
+) = DATASETS.functions(
+    "hs6_database",
+    "get_hs6_info", "get_sub_position_suggestions", "get_rule_of_origin", "search_hs6_codes",
+    "get_all_categories", "get_codes_by_category", "get_database_stats"
 )
 
 # Import routes module for modular endpoint registration
@@ -106,6 +85,9 @@ from routes import register_routes
 # Import notification manager for system-wide notifications
 from backend.notifications import NotificationManager
 
+# Background cache for World Bank / OEC enrichment
+from services.enrichment_cache import enrichment_cache
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
@@ -130,96 +112,8 @@ api_router = APIRouter(prefix="/api")
 # Pays membres de la ZLECAf avec données économiques
 # AFRICAN_COUNTRIES and ZLECAF_RULES_OF_ORIGIN moved to constants.py
 
-# API Clients pour données externes
-class WorldBankAPIClient:
-    def __init__(self):
-        self.base_url = "https://api.worldbank.org/v2"
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'ZLECAf-API/1.0'})
-
-    async def get_country_data(self, country_codes: List[str], indicators: List[str] = None) -> Dict[str, Any]:
-        """Récupérer les données économiques des pays depuis la Banque Mondiale"""
-        if indicators is None:
-            indicators = ['NY.GDP.MKTP.CD', 'SP.POP.TOTL', 'NY.GDP.PCAP.CD', 'FP.CPI.TOTL.ZG']
-        
-        try:
-            all_data = {}
-            for country in country_codes:
-                country_data = {}
-                for indicator in indicators:
-                    url = f"{self.base_url}/country/{country}/indicator/{indicator}"
-                    params = {
-                        'format': 'json',
-                        'date': '2020:2023',
-                        'per_page': 10
-                    }
-                    
-                    response = self.session.get(url, params=params, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if len(data) > 1 and data[1]:
-                            latest_data = data[1][0] if data[1] else None
-                            if latest_data and latest_data['value']:
-                                country_data[indicator] = {
-                                    'value': latest_data['value'],
-                                    'date': latest_data['date']
-                                }
-                
-                all_data[country] = country_data
-            
-            return all_data
-        except Exception as e:
-            logging.error(f"Erreur World Bank API: {e}")
-            return {}
-
-class OECAPIClient:
-    def __init__(self):
-        self.base_url = "https://api-v2.oec.world"
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'ZLECAf-API/1.0'})
-
-    async def get_top_producers(self, hs_code: str, year: int = 2021) -> List[Dict[str, Any]]:
-        """Récupérer le top 5 des pays africains producteurs pour un code SH"""
-        try:
-            endpoint = "tesseract/data.jsonrecords"
-            params = {
-                'cube': 'trade_i_hs4_eci',
-                'drilldowns': 'Reporter',
-                'measures': 'Export Value',
-                'Product': hs_code[:4] if len(hs_code) > 4 else hs_code,
-                'time': str(year),
-                'Trade Flow': '2'  # Exports
-            }
-            
-            response = self.session.get(f"{self.base_url}/{endpoint}", params=params, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                if 'data' in data and data['data']:
-                    # Filtrer pour les pays africains seulement
-                    african_codes = [country['iso3'] for country in AFRICAN_COUNTRIES]
-                    african_exports = []
-                    
-                    for item in data['data']:
-                        if item.get('Reporter') in african_codes:
-                            african_exports.append({
-                                'country_code': item.get('Reporter'),
-                                'country_name': next((c['name'] for c in AFRICAN_COUNTRIES if c['iso3'] == item.get('Reporter')), item.get('Reporter')),
-                                'export_value': item.get('Export Value', 0),
-                                'year': year
-                            })
-                    
-                    # Trier par valeur d'export et prendre le top 5
-                    african_exports.sort(key=lambda x: x['export_value'], reverse=True)
-                    return african_exports[:5]
-            
-            return []
-        except Exception as e:
-            logging.error(f"Erreur OEC API: {e}")
-            return []
-
-# Clients API globaux
-wb_client = WorldBankAPIClient()
-oec_client = OECAPIClient()
+# Données externes (Banque Mondiale, OEC): cache TTL actualisé en arrière-plan
+# WorldBankAPIClient and OECAPIClient moved to services/enrichment_cache.py
 
 # Define Models
 # Models moved to models.py
@@ -407,18 +301,11 @@ async def calculate_comprehensive_tariff(request: TariffCalculationRequest):
     
     # ============================================================
     # PRIORITÉ 2: Tarifs SH6 RÉELS par pays de destination
+    # PRIORITÉ 3: Fallback vers taux par chapitre du pays
+    # (table compilée du pays de destination)
     # ============================================================
     if tariff_precision == "chapter":
-        hs6_tariff = get_country_hs6_tariff(dest_iso3, hs6_code)
-        
-        if hs6_tariff:
-            normal_rate = hs6_tariff["dd"]
-            npf_source = f"Tarif SH6 {dest_iso3} ({hs6_code})"
-            tariff_precision = "hs6_country"
-        else:
-            # PRIORITÉ 3: Fallback vers taux par chapitre du pays
-            normal_rate, npf_source = get_tariff_rate_for_country(dest_iso3, hs6_code)
-            tariff_precision = "chapter"
+        normal_rate, npf_source, tariff_precision = resolve_npf_rate(dest_iso3, hs6_code)
     
     # Obtenir le taux ZLECAf calculé selon le calendrier de libéralisation
     # Le taux ZLECAf est calculé à partir du taux normal avec réduction progressive
@@ -581,11 +468,11 @@ async def calculate_comprehensive_tariff(request: TariffCalculationRequest):
             "reference_url": "https://au.int/sites/default/files/treaties/36437-ax-AfCFTA_RULES_OF_ORIGIN_MANUAL.pdf"
         }
     
-    # Récupérer les top producteurs africains
-    top_producers = await oec_client.get_top_producers(request.hs_code)
+    # Récupérer les top producteurs africains (cache uniquement, pas d'appel réseau)
+    top_producers, producers_status = enrichment_cache.get_top_producers(request.hs_code)
     
-    # Récupérer les données économiques des pays
-    wb_data = await wb_client.get_country_data([origin_country['wb_code'], dest_country['wb_code']])
+    # Récupérer les données économiques des pays (cache uniquement)
+    wb_data, wb_status = enrichment_cache.get_country_data([origin_country['wb_code'], dest_country['wb_code']])
     
     # Vérifier si des sous-positions alternatives existent pour ce HS6
     sub_positions_available = get_all_sub_positions(dest_iso3, hs6_code)
@@ -665,7 +552,12 @@ async def calculate_comprehensive_tariff(request: TariffCalculationRequest):
         rules_of_origin=rules,
         top_african_producers=top_producers,
         origin_country_data=wb_data.get(origin_country['wb_code'], {}),
-        destination_country_data=wb_data.get(dest_country['wb_code'], {})
+        destination_country_data=wb_data.get(dest_country['wb_code'], {}),
+        enrichment_status={
+            "top_african_producers": producers_status,
+            "origin_country_data": wb_status.get(origin_country['wb_code']),
+            "destination_country_data": wb_status.get(dest_country['wb_code'])
+        }
     )
     
     # Sauvegarder en base de données
@@ -1047,38 +939,13 @@ async def get_trade_performance_intra_african():
 # ==========================================
 # ETL PIPELINE ENDPOINTS
 # NOTE: /etl/* endpoints MIGRATED to /routes/etl.py
-# Routes: POST /etl/run, GET /etl/status, GET /etl/trs-coverage
+# Routes: POST /etl/run, GET /etl/jobs, GET /etl/jobs/{job_id}[/events],
+#         GET /etl/status, GET /etl/changes, GET /etl/trs-coverage
 
 
 # ==========================================
 # LAND LOGISTICS ENDPOINTS (TERRESTRIAL)
 # ==========================================
-
-from logistics_land_data import (
-    get_all_corridors,
-    get_corridor_by_id,
-    get_corridors_by_country,
-    get_all_nodes,
-    get_nodes_by_type,
-    get_osbp_nodes,
-    get_all_operators,
-    get_operators_by_type,
-    get_corridors_statistics,
-    search_corridors
-)
-from production_data import (
-    get_value_added,
-    get_value_added_by_country,
-    get_agriculture_production,
-    get_agriculture_by_country,
-    get_manufacturing_production,
-    get_manufacturing_by_country,
-    get_mining_production,
-    get_mining_by_country as get_mining_by_country_data,
-    get_production_statistics,
-    get_country_production_overview
-)
-
 # NOTE: /logistics/land/* endpoints MIGRATED to /routes/logistics.py
 # Routes: /land/corridors, /land/corridors/{id}, /land/nodes, 
 #         /land/operators, /land/search, /land/statistics
@@ -1613,7 +1480,7 @@ async def get_detailed_tariff_countries():
     Obtenir la liste des pays avec tarifs détaillés (sous-positions nationales)
     """
     countries_data = {}
-    for iso3, tariffs in COUNTRY_HS6_DETAILED.items():
+    for iso3, tariffs in country_hs6_detailed.COUNTRY_HS6_DETAILED.items():
         total_sub_positions = sum(
             len(hs6_data.get("sub_positions", {}))
             for hs6_data in tariffs.values()
@@ -1781,7 +1648,7 @@ async def get_hs6_database_statistics():
     
     # Ajouter les stats des sous-positions nationales
     country_stats = {}
-    for iso3, tariffs in COUNTRY_HS6_DETAILED.items():
+    for iso3, tariffs in country_hs6_detailed.COUNTRY_HS6_DETAILED.items():
         total_sub = sum(len(hs6_data.get("sub_positions", {})) for hs6_data in tariffs.values())
         country_stats[iso3] = {
             "hs6_codes": len(tariffs),
@@ -1859,19 +1726,29 @@ async def smart_search_with_suggestions(
 # FAOSTAT ENRICHED DATA ENDPOINTS
 # ==========================================
 
-from etl import (
+(
     get_faostat_country_data,
     get_africa_top_producers,
     get_all_commodities,
     get_all_faostat_data,
     get_fisheries_rankings,
-    get_faostat_statistics,
+    get_faostat_statistics
+) = DATASETS.functions(
+    "faostat",
+    "get_faostat_country_data", "get_africa_top_producers", "get_all_commodities",
+    "get_all_faostat_data", "get_fisheries_rankings", "get_faostat_statistics"
+)
+(
     get_unido_country_data,
     get_all_unido_data,
     get_isic_sectors,
     get_countries_by_mva,
     get_sector_analysis,
     get_unido_statistics
+) = DATASETS.functions(
+    "unido",
+    "get_unido_country_data", "get_all_unido_data", "get_isic_sectors",
+    "get_countries_by_mva", "get_sector_analysis", "get_unido_statistics"
 )
 
 @api_router.get("/production/faostat/statistics")
@@ -1986,13 +1863,17 @@ async def get_all_unido():
 # TRADE PRODUCTS ENDPOINTS (TOP 20)
 # ==========================================
 
-from etl.trade_products_data import (
+(
     get_top_imports_from_world,
     get_top_exports_to_world,
     get_top_intra_african_imports,
     get_top_intra_african_exports,
     get_all_trade_products_data,
     get_trade_summary
+) = DATASETS.functions(
+    "trade_products",
+    "get_top_imports_from_world", "get_top_exports_to_world", "get_top_intra_african_imports",
+    "get_top_intra_african_exports", "get_all_trade_products_data", "get_trade_summary"
 )
 from etl.translations import translate_product, translate_country_list
 
@@ -2097,11 +1978,8 @@ async def get_all_trade_products():
 # UNCTAD DATA ENDPOINTS
 # =============================================================================
 
-from etl.unctad_data import (
-    get_unctad_port_statistics,
-    get_unctad_trade_flows,
-    get_unctad_lsci,
-    get_all_unctad_data
+get_unctad_port_statistics, get_unctad_trade_flows, get_unctad_lsci, get_all_unctad_data = DATASETS.functions(
+    "unctad", "get_unctad_port_statistics", "get_unctad_trade_flows", "get_unctad_lsci", "get_all_unctad_data"
 )
 
 @api_router.get("/statistics/unctad/ports")
@@ -2178,4 +2056,30 @@ register_routes(api_router)
 register_substitution_routes(api_router)
 
 # Include the router in the main app
-app.include_router(api_router)
\ No newline at end of file
+app.include_router(api_router)
+
+
+@app.on_event("startup")
+async def warm_up_datasets():
+    """Précharger en arrière-plan les jeux de données de DATASET_WARMUP (index HS6 par défaut)"""
+    names = DATASETS.resolve(DATASET_WARMUP)
+    if names:
+        asyncio.get_running_loop().run_in_executor(None, DATASETS.warm_up, names)
+
+
+@app.on_event("startup")
+async def start_enrichment_cache():
+    """Démarrer l'actualisation en arrière-plan des données Banque Mondiale / OEC"""
+    enrichment_cache.start()
+
+
+@app.on_event("shutdown")
+async def stop_enrichment_cache():
+    await enrichment_cache.stop()
+
+
+@app.on_event("shutdown")
+async def close_trade_data_client():
+    """Fermer le client HTTP mutualisé du service OEC"""
+    from services.real_trade_data_service import real_trade_service
+    await real_trade_service.aclose()
\ No newline at end of file
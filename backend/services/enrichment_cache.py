@@ -0,0 +1,326 @@
+"""
+External Enrichment Cache (World Bank / OEC)
+Cache TTL alimenté en arrière-plan pour les données d'enrichissement
+du calculateur tarifaire:
+- Indicateurs Banque Mondiale par (pays, indicateur)
+- Top producteurs africains OEC par (HS4, année)
+
+Les calculs ne lisent que le cache: une clé absente est planifiée pour la
+prochaine actualisation et la réponse indique l'âge des données. Les appels
+HTTP (requests, bloquants) s'exécutent dans des threads, jamais sur la
+boucle d'événements.
+
+Les clés en attente sont plafonnées (MAX_PENDING). Une clé dont la
+récupération échoue n'est retentée qu'après un délai croissant
+(RETRY_BACKOFF, doublé à chaque échec jusqu'à MAX_RETRY_BACKOFF) et une
+clé jamais obtenue est abandonnée après MAX_FETCH_ATTEMPTS échecs, jusqu'à
+expiration de son délai: une API indisponible ne déclenche pas une vague
+d'appels à chaque absence dans le cache.
+"""
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import requests
+
+from constants import AFRICAN_COUNTRIES
+
+logger = logging.getLogger(__name__)
+
+WB_INDICATORS = ['NY.GDP.MKTP.CD', 'SP.POP.TOTL', 'NY.GDP.PCAP.CD', 'FP.CPI.TOTL.ZG']
+OEC_DEFAULT_YEAR = 2021
+
+# Durées de validité et période d'actualisation (secondes)
+WB_TTL = int(os.getenv("ENRICHMENT_WB_TTL", str(24 * 3600)))
+OEC_TTL = int(os.getenv("ENRICHMENT_OEC_TTL", str(7 * 24 * 3600)))
+REFRESH_INTERVAL = int(os.getenv("ENRICHMENT_REFRESH_INTERVAL", "600"))
+MAX_CONCURRENT_FETCHES = 4
+# Clés en attente au maximum et nouvelles tentatives après échec (secondes)
+MAX_PENDING = int(os.getenv("ENRICHMENT_MAX_PENDING", "1024"))
+RETRY_BACKOFF = int(os.getenv("ENRICHMENT_RETRY_BACKOFF", "60"))
+MAX_RETRY_BACKOFF = int(os.getenv("ENRICHMENT_MAX_RETRY_BACKOFF", str(6 * 3600)))
+MAX_FETCH_ATTEMPTS = 5
+
+
+class WorldBankAPIClient:
+    def __init__(self):
+        self.base_url = "https://api.worldbank.org/v2"
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'ZLECAf-API/1.0'})
+
+    def fetch_indicator(self, country: str, indicator: str) -> Optional[Dict[str, Any]]:
+        """Récupérer la dernière valeur d'un indicateur Banque Mondiale (appel bloquant)"""
+        url = f"{self.base_url}/country/{country}/indicator/{indicator}"
+        params = {
+            'format': 'json',
+            'date': '2020:2023',
+            'per_page': 10
+        }
+        response = self.session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        if len(data) > 1 and data[1]:
+            latest_data = data[1][0]
+            if latest_data and latest_data['value']:
+                return {
+                    'value': latest_data['value'],
+                    'date': latest_data['date']
+                }
+        return None
+
+
+class OECAPIClient:
+    def __init__(self):
+        self.base_url = "https://api-v2.oec.world"
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'ZLECAf-API/1.0'})
+
+    def fetch_top_producers(self, hs4: str, year: int = OEC_DEFAULT_YEAR) -> List[Dict[str, Any]]:
+        """Récupérer le top 5 des pays africains producteurs pour un code HS4 (appel bloquant)"""
+        endpoint = "tesseract/data.jsonrecords"
+        params = {
+            'cube': 'trade_i_hs4_eci',
+            'drilldowns': 'Reporter',
+            'measures': 'Export Value',
+            'Product': hs4,
+            'time': str(year),
+            'Trade Flow': '2'  # Exports
+        }
+        response = self.session.get(f"{self.base_url}/{endpoint}", params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
+
+        names = {country['iso3']: country['name'] for country in AFRICAN_COUNTRIES}
+        african_exports = []
+        for item in data.get('data') or []:
+            reporter = item.get('Reporter')
+            if reporter in names:
+                african_exports.append({
+                    'country_code': reporter,
+                    'country_name': names[reporter],
+                    'export_value': item.get('Export Value', 0),
+                    'year': year
+                })
+
+        # Trier par valeur d'export et prendre le top 5
+        african_exports.sort(key=lambda x: x['export_value'], reverse=True)
+        return african_exports[:5]
+
+
+class EnrichmentCache:
+    """
+    TTL cache for World Bank and OEC enrichment, refreshed in the background
+    """
+
+    def __init__(self, wb_client: WorldBankAPIClient = None, oec_client: OECAPIClient = None):
+        self.wb_client = wb_client or WorldBankAPIClient()
+        self.oec_client = oec_client or OECAPIClient()
+        # clé -> (valeur, horodatage epoch du dernier succès)
+        self._entries: Dict[Tuple, Tuple[Any, float]] = {}
+        # clés demandées par les calculs mais absentes du cache
+        self._pending: Set[Tuple] = set()
+        # clé -> (échecs consécutifs, epoch de la prochaine tentative)
+        self._failures: Dict[Tuple, Tuple[int, float]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"hits": 0, "misses": 0, "fetches": 0, "fetch_errors": 0, "dropped": 0,
+                      "last_refresh": None}
+
+    # ------------------------------------------------------------------
+    # Lecture (hot path, aucun appel réseau)
+    # ------------------------------------------------------------------
+
+    def _ttl(self, key: Tuple) -> int:
+        return WB_TTL if key[0] == "wb" else OEC_TTL
+
+    def _backing_off(self, key: Tuple, now: float) -> bool:
+        failure = self._failures.get(key)
+        return failure is not None and failure[1] > now
+
+    def _lookup(self, key: Tuple) -> Tuple[Any, Optional[float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            # Planifier la clé une seule fois, sauf file pleine ou échec récent
+            if key not in self._pending:
+                if len(self._pending) >= MAX_PENDING or self._backing_off(key, time.time()):
+                    self.stats["dropped"] += 1
+                else:
+                    self._pending.add(key)
+                    if self._wakeup is not None:
+                        self._wakeup.set()
+            return None, None
+        self.stats["hits"] += 1
+        return entry
+
+    def _status(self, fetched_at: List[Optional[float]], ttl: int) -> Dict[str, Any]:
+        """Résumé de fraîcheur pour un ensemble de clés"""
+        known = [t for t in fetched_at if t is not None]
+        if not known:
+            return {"status": "missing", "fetched_at": None, "age_seconds": None}
+        oldest = min(known)
+        age = time.time() - oldest
+        if len(known) < len(fetched_at):
+            status = "partial"
+        else:
+            status = "stale" if age > ttl else "fresh"
+        return {
+            "status": status,
+            "fetched_at": datetime.fromtimestamp(oldest, tz=timezone.utc).isoformat(),
+            "age_seconds": int(age)
+        }
+
+    def get_country_data(self, country_codes: List[str], indicators: List[str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Indicateurs Banque Mondiale depuis le cache
+
+        Returns:
+            Tuple (données par pays au format WorldBank, statut de fraîcheur par pays)
+        """
+        indicators = indicators or WB_INDICATORS
+        data, status = {}, {}
+        for country in country_codes:
+            country_data, fetched = {}, []
+            for indicator in indicators:
+                value, fetched_at = self._lookup(("wb", country, indicator))
+                fetched.append(fetched_at)
+                if value:
+                    country_data[indicator] = value
+            data[country] = country_data
+            status[country] = self._status(fetched, WB_TTL)
+        return data, status
+
+    def get_top_producers(self, hs_code: str, year: int = OEC_DEFAULT_YEAR) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Top producteurs africains OEC depuis le cache
+
+        Returns:
+            Tuple (top 5 producteurs, statut de fraîcheur)
+        """
+        hs4 = hs_code[:4] if len(hs_code) > 4 else hs_code
+        value, fetched_at = self._lookup(("oec", hs4, year))
+        return value or [], self._status([fetched_at], OEC_TTL)
+
+    # ------------------------------------------------------------------
+    # Actualisation en arrière-plan
+    # ------------------------------------------------------------------
+
+    def _fetch(self, key: Tuple) -> Any:
+        if key[0] == "wb":
+            return self.wb_client.fetch_indicator(key[1], key[2])
+        return self.oec_client.fetch_top_producers(key[1], key[2])
+
+    def _due_keys(self) -> List[Tuple]:
+        now = time.time()
+        # Échecs expirés de clés abandonnées: oubliés
+        for key in [k for k, (_, retry_at) in self._failures.items() if retry_at <= now
+                    and k not in self._pending and k not in self._entries]:
+            del self._failures[key]
+        due = [key for key, (_, fetched_at) in self._entries.items() if now - fetched_at > self._ttl(key)]
+        due.extend(self._pending)
+        return [key for key in dict.fromkeys(due) if not self._backing_off(key, now)]
+
+    def _record_failure(self, key: Tuple) -> None:
+        attempts = self._failures.get(key, (0, 0.0))[0] + 1
+        delay = min(RETRY_BACKOFF * 2 ** (attempts - 1), MAX_RETRY_BACKOFF)
+        self._failures[key] = (attempts, time.time() + delay)
+        if attempts >= MAX_FETCH_ATTEMPTS and key not in self._entries:
+            self._pending.discard(key)
+            self.stats["dropped"] += 1
+
+    async def refresh(self, keys: List[Tuple] = None) -> int:
+        """
+        Actualiser les clés expirées ou demandées (appels HTTP dans des threads)
+
+        En cas d'échec, la dernière valeur connue est conservée et la clé
+        n'est retentée qu'après son délai d'attente.
+
+        Returns:
+            Nombre de clés actualisées avec succès
+        """
+        keys = self._due_keys() if keys is None else keys
+        if not keys:
+            return 0
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def fetch_one(key: Tuple) -> bool:
+            async with semaphore:
+                try:
+                    value = await asyncio.to_thread(self._fetch, key)
+                except Exception as e:
+                    self.stats["fetch_errors"] += 1
+                    self._record_failure(key)
+                    logger.debug(f"Enrichment refresh failed for {key}: {e}")
+                    return False
+                self._entries[key] = (value, time.time())
+                self._pending.discard(key)
+                self._failures.pop(key, None)
+                self.stats["fetches"] += 1
+                return True
+
+        results = await asyncio.gather(*(fetch_one(key) for key in keys))
+        self.stats["last_refresh"] = datetime.now(timezone.utc).isoformat()
+        refreshed = sum(results)
+        if refreshed < len(keys):
+            logger.warning(f"Enrichment refresh: {len(keys) - refreshed}/{len(keys)} fetches failed, keeping last known values")
+        return refreshed
+
+    async def _run(self) -> None:
+        # Préchargement: indicateurs Banque Mondiale des 54 pays
+        self._pending.update(
+            ("wb", country["wb_code"], indicator)
+            for country in AFRICAN_COUNTRIES
+            for indicator in WB_INDICATORS
+        )
+        while True:
+            # Effacer avant l'actualisation: une absence pendant refresh() la relance ensuite
+            self._wakeup.clear()
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Enrichment refresh loop error: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_wait())
+            except asyncio.TimeoutError:
+                pass
+
+    def _next_wait(self) -> float:
+        """Délai avant la prochaine actualisation (plus tôt si une clé en attente peut être retentée)"""
+        retries = [self._failures[key][1] for key in self._pending if key in self._failures]
+        if not retries:
+            return REFRESH_INTERVAL
+        return min(REFRESH_INTERVAL, max(min(retries) - time.time(), 1.0))
+
+    def start(self) -> None:
+        """Démarrer l'actualisation périodique (à appeler depuis la boucle de l'application)"""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"Enrichment cache refresh started (interval {REFRESH_INTERVAL}s)")
+
+    async def stop(self) -> None:
+        """Arrêter l'actualisation périodique"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "pending": len(self._pending),
+            "backing_off": sum(1 for _, retry_at in self._failures.values() if retry_at > time.time()),
+            "running": self._task is not None and not self._task.done(),
+            "refresh_interval_seconds": REFRESH_INTERVAL
+        }
+
+
+# Singleton instance
+enrichment_cache = EnrichmentCache()
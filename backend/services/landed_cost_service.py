@@ -0,0 +1,218 @@
+"""
+Landed Cost Service
+Coût rendu (landed cost) d'une expédition en un seul appel
+
+Remplace l'enchaînement /api/calculate-tariff + /api/logistics/* côté
+client. Les pays sont résolus une seule fois, puis trois étapes
+indépendantes sont lancées en parallèle (asyncio.gather):
+- rates: taux NPF et facteur ZLECAf (même priorité que /calculate-tariff:
+  sous-position nationale > SH6 pays > chapitre)
+- taxes: TVA, autres taxes (RS, PCS, CEDEAO, TCI) et période de transition
+- route: itinéraire sur le graphe multimodal (logistics_graph)
+
+Le chiffrage combine ensuite les résultats:
+- valeur CIF = valeur FOB + fret (coût de l'itinéraire × tonnage) + assurance
+- droits, autres taxes et TVA calculés sur la valeur CIF, comme
+  /calculate-tariff, au taux NPF et au taux ZLECAf
+
+Les journaux de calcul et règles d'origine restent réservés à
+/calculate-tariff. Le fret est indicatif (voir logistics_graph).
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from data_loader import get_tariff_corrections
+from datasets import DATASETS
+from services.tariff_batch_service import batch_tariff_engine
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+find_routes = DATASETS.function("logistics_graph", "find_routes")
+
+logger = logging.getLogger(__name__)
+
+# Assurance: pourcentage de (valeur FOB + fret)
+INSURANCE_RATE = 0.005
+
+# Modes principaux autorisés sur le graphe pour chaque mode demandé.
+# Le pré et post-acheminement routier (arêtes "access" du graphe) reste
+# toujours possible; les corridors "multimodal" sont ouverts à la route et
+# au rail. Un itinéraire retenu emprunte au moins une étape de ces modes.
+MODE_FILTERS = {
+    "auto": None,
+    "sea": ["sea"],
+    "air": ["air"],
+    "road": ["road", "multimodal"],
+    "rail": ["rail", "multimodal"],
+}
+
+
+async def _timed(timings: Dict[str, float], stage: str, fn: Callable, *args) -> Any:
+    """Exécuter fn dans un thread et enregistrer sa durée (ms)"""
+    start = time.perf_counter()
+    try:
+        return await asyncio.to_thread(fn, *args)
+    finally:
+        timings[stage] = round((time.perf_counter() - start) * 1000, 3)
+
+
+def _country_taxes(dest_iso3: str, hs6_code: str) -> Dict:
+    taxes = batch_tariff_engine.resolve_country_taxes(dest_iso3)
+    transition_periods = get_tariff_corrections().get("transition_periods", {})
+    taxes["transition_period"] = transition_periods.get(hs6_code[:2], "immediate")
+    return taxes
+
+
+def _routes(origin_iso3: str, dest_iso3: str, metric: str, k: int, mode: str) -> List[Dict]:
+    """Itinéraires dans le mode demandé (vide si aucun ou expédition nationale)"""
+    if origin_iso3 == dest_iso3:
+        return []
+    modes = MODE_FILTERS[mode]
+    try:
+        routes = find_routes(origin_iso3, dest_iso3, metric=metric, k=k, modes=modes)["routes"]
+    except KeyError:
+        # Pays sans nœud logistique dans le graphe
+        return []
+    if modes is None:
+        return routes
+    return [route for route in routes if any(leg["mode"] in modes for leg in route["legs"])]
+
+
+def _duties(cif: float, rate: float, taxes: Dict) -> Dict:
+    """Droits et taxes sur la valeur CIF (même séquence que /calculate-tariff)"""
+    customs = cif * rate
+    other_taxes = cif * taxes["other_taxes_rate"]
+    vat_base = cif + customs + other_taxes
+    vat = vat_base * taxes["vat_rate"]
+    return {
+        "tariff_rate": rate,
+        "tariff_amount": round(customs, 2),
+        "statistical_fee": round(cif * taxes["rs_rate"], 2),
+        "community_levy": round(cif * taxes["pcs_rate"], 2),
+        "ecowas_levy": round(cif * taxes["cedeao_rate"], 2),
+        "integration_levy": round(cif * taxes["tci_rate"], 2),
+        "other_taxes_total": round(other_taxes, 2),
+        "vat_base": round(vat_base, 2),
+        "vat_amount": round(vat, 2),
+        "duties_and_taxes": round(customs + other_taxes + vat, 2),
+        "landed_cost": round(cif + customs + other_taxes + vat, 2),
+    }
+
+
+def _route_summary(route: Dict, weight_tonnes: float) -> Dict:
+    summary = {k: v for k, v in route.items() if k != "legs"}
+    summary["freight_cost"] = round(route["cost_usd_per_tonne"] * weight_tonnes, 2)
+    summary["legs"] = route["legs"]
+    return summary
+
+
+class LandedCostService:
+    """
+    Composite landed cost: rate resolution, taxes and routing run concurrently
+    """
+
+    def resolve_countries(self, origin: str, destination: str) -> Tuple[Dict, Dict]:
+        """
+        Raises:
+            ValueError: pays non membre de la ZLECAf
+        """
+        origin_country = batch_tariff_engine.resolve_country(origin)
+        dest_country = batch_tariff_engine.resolve_country(destination)
+        if not origin_country or not dest_country:
+            raise ValueError("L'un des pays sélectionnés n'est pas membre de la ZLECAf")
+        return origin_country, dest_country
+
+    async def compute(self, origin_country: str, destination_country: str, hs_code: str, value: float,
+                      weight_tonnes: float = 1.0, mode: str = "auto", route_metric: str = "cost",
+                      alternatives: int = 1) -> Dict:
+        """
+        Coût rendu d'une expédition
+
+        Raises:
+            ValueError: pays non membre de la ZLECAf ou mode inconnu
+        """
+        start = time.perf_counter()
+        if mode not in MODE_FILTERS:
+            raise ValueError(f"mode must be one of {', '.join(MODE_FILTERS)}")
+        origin, dest = self.resolve_countries(origin_country, destination_country)
+        origin_iso3, dest_iso3 = origin["iso3"], dest["iso3"]
+        hs_code_clean = hs_code.replace(".", "").replace(" ", "")
+        hs6_code = hs_code_clean[:6].zfill(6)
+
+        timings: Dict[str, float] = {}
+        rates, taxes, found = await asyncio.gather(
+            _timed(timings, "rates", batch_tariff_engine.resolve_line_rate, dest_iso3, hs_code_clean),
+            _timed(timings, "taxes", _country_taxes, dest_iso3, hs6_code),
+            _timed(timings, "route", _routes, origin_iso3, dest_iso3, route_metric, alternatives, mode),
+        )
+
+        # ============================================================
+        # CHIFFRAGE
+        # ============================================================
+        pricing_start = time.perf_counter()
+        route = found[0] if found else None
+        freight = route["cost_usd_per_tonne"] * weight_tonnes if route else 0.0
+        insurance = (value + freight) * INSURANCE_RATE
+        cif = value + freight + insurance
+
+        normal_rate = rates["normal_rate"]
+        zlecaf_rate = normal_rate * rates["zlecaf_factor"]
+        normal = _duties(cif, normal_rate, taxes)
+        zlecaf = _duties(cif, zlecaf_rate, taxes)
+        savings = normal["landed_cost"] - zlecaf["landed_cost"]
+
+        result = {
+            "origin_country": origin_iso3,
+            "destination_country": dest_iso3,
+            "hs_code": hs_code,
+            "hs6_code": rates["hs6_code"],
+            "value": value,
+            "weight_tonnes": weight_tonnes,
+            "mode": mode,
+            "logistics": {
+                "fob_value": round(value, 2),
+                "freight_cost": round(freight, 2),
+                "insurance_cost": round(insurance, 2),
+                "insurance_rate": INSURANCE_RATE,
+                "cif_value": round(cif, 2),
+                "transit_days": route["transit_days"] if route else 0.0,
+                "route_metric": route_metric,
+                "route_found": route is not None,
+                "note": None if route or origin_iso3 == dest_iso3
+                else "Aucun itinéraire trouvé: fret non inclus" if mode == "auto"
+                else f"Aucun itinéraire trouvé en mode {mode}: fret non inclus",
+            },
+            "tariff": {
+                "normal_rate": normal_rate,
+                "zlecaf_rate": zlecaf_rate,
+                "vat_rate": taxes["vat_rate"],
+                "other_taxes_rate": taxes["other_taxes_rate"],
+                "tariff_precision": rates["tariff_precision"],
+                "sub_position_used": rates["sub_position_used"],
+                "rate_source": f"Tarif officiel {dest_iso3} - {rates['npf_source']}",
+                "product_category": rates["product_category"],
+                "transition_period": taxes["transition_period"],
+            },
+            "normal": normal,
+            "zlecaf": zlecaf,
+            "savings": {
+                "tariff": round(normal["tariff_amount"] - zlecaf["tariff_amount"], 2),
+                "total": round(savings, 2),
+                "percentage": round(savings / normal["landed_cost"] * 100, 1) if normal["landed_cost"] > 0 else 0,
+            },
+            "route": _route_summary(route, weight_tonnes) if route else None,
+            "alternatives": [
+                {**{k: v for k, v in r.items() if k not in ("nodes", "legs")},
+                 "freight_cost": round(r["cost_usd_per_tonne"] * weight_tonnes, 2)}
+                for r in found[1:]
+            ],
+        }
+        timings["pricing"] = round((time.perf_counter() - pricing_start) * 1000, 3)
+        result["timings_ms"] = timings
+        result["computation_time_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+
+# Singleton instance
+landed_cost_service = LandedCostService()
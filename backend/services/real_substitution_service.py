@@ -14,6 +14,7 @@ from services.real_trade_data_service import (
     get_country_name,
     get_product_name
 )
+from services.trade_matrix import TradeMatrix, get_trade_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +42,22 @@ class RealSubstitutionService:
         1. Get what the country imports from outside Africa (OEC API)
         2. For each product, find African countries that export it
         3. Calculate substitution potential
+        
+        Served from the precomputed trade matrix when it holds the importer's
+        import table and every supplier's export table for the year,
+        otherwise from live OEC queries.
         """
         importer = importer_iso3.upper()
         if importer not in self.african_countries:
             return {"error": f"Country {importer} not found in AfCFTA"}
         
+        matrix = get_trade_matrix()
+        if matrix is not None and matrix.covers_import_substitution(importer, year):
+            try:
+                return self._import_substitution_from_matrix(matrix, importer, year, min_value, lang)
+            except Exception as e:
+                logger.error(f"Trade matrix import substitution error: {str(e)}")
+        
         try:
             # Step 1: Get imports from outside Africa
             import_data = await real_trade_service.get_oec_bilateral_from_world(
@@ -126,27 +138,11 @@ class RealSubstitutionService:
                     opportunities.append(opportunity)
                     total_substitutable += substitution_potential
             
-            # Sort by substitution potential
-            opportunities.sort(key=lambda x: x["substitution_potential"], reverse=True)
-            
-            return {
-                "importer": {
-                    "iso3": importer,
-                    "name": get_country_name(importer, lang)
-                },
-                "year": year,
-                "analysis_date": datetime.utcnow().isoformat(),
-                "data_source": "OEC (Observatory of Economic Complexity)",
-                "summary": {
-                    "total_opportunities": len(opportunities),
-                    "total_substitutable_value": total_substitutable,
-                    "total_imports_from_outside": import_data.get("from_outside", 0),
-                    "potential_savings_percent": 17.0,  # AfCFTA tariff + logistics savings
-                    "top_sectors": self._identify_top_sectors(opportunities, lang)
-                },
-                "opportunities": opportunities[:20],  # Top 20
-                "sources": ["OEC/BACI International Trade Data", "UN Comtrade"]
-            }
+            return self._import_substitution_response(
+                importer, year, opportunities, total_substitutable,
+                import_data.get("from_outside", 0), lang,
+                data_source="OEC (Observatory of Economic Complexity)"
+            )
             
         except Exception as e:
             logger.error(f"Error in import substitution analysis: {str(e)}")
@@ -165,11 +161,24 @@ class RealSubstitutionService:
         1. Get what the country exports (OEC API)
         2. For each product, find African countries that import it from outside
         3. Calculate market capture potential
+        
+        Served from the precomputed trade matrix when it holds the exporter's
+        export table and every market's import table for the year,
+        otherwise from live OEC queries.
         """
         exporter = exporter_iso3.upper()
         if exporter not in self.african_countries:
             return {"error": f"Country {exporter} not found in AfCFTA"}
         
+        matrix = get_trade_matrix()
+        if matrix is not None and matrix.covers_export_opportunities(exporter, year):
+            try:
+                return self._export_opportunities_from_matrix(
+                    matrix, exporter, year, min_market_size, lang
+                )
+            except Exception as e:
+                logger.error(f"Trade matrix export opportunities error: {str(e)}")
+        
         try:
             # Step 1: Get what this country exports
             exports = await real_trade_service.get_oec_exports(
@@ -234,25 +243,10 @@ class RealSubstitutionService:
                     opportunities.append(opportunity)
                     total_market_potential += total_capture
             
-            opportunities.sort(key=lambda x: x["estimated_capture"], reverse=True)
-            
-            return {
-                "exporter": {
-                    "iso3": exporter,
-                    "name": get_country_name(exporter, lang)
-                },
-                "year": year,
-                "analysis_date": datetime.utcnow().isoformat(),
-                "data_source": "OEC (Observatory of Economic Complexity)",
-                "summary": {
-                    "total_opportunities": len(opportunities),
-                    "total_market_potential": total_market_potential,
-                    "top_products": [o["exportable_product"]["name"] for o in opportunities[:5]],
-                    "top_markets": self._identify_top_markets(opportunities, lang)
-                },
-                "opportunities": opportunities[:15],
-                "sources": ["OEC/BACI International Trade Data", "UN Comtrade"]
-            }
+            return self._export_opportunities_response(
+                exporter, year, opportunities, total_market_potential, lang,
+                data_source="OEC (Observatory of Economic Complexity)"
+            )
             
         except Exception as e:
             logger.error(f"Error in export opportunity analysis: {str(e)}")
@@ -295,6 +289,160 @@ class RealSubstitutionService:
             logger.error(f"Error in product analysis: {str(e)}")
             return {"error": str(e)}
     
+    def _import_substitution_from_matrix(
+        self,
+        matrix: TradeMatrix,
+        importer: str,
+        year: int,
+        min_value: int,
+        lang: str
+    ) -> Dict:
+        """Import substitution opportunities from the precomputed trade matrix"""
+        opportunities = []
+        total_substitutable = 0
+        
+        for product in matrix.import_substitution(importer, year, min_value):
+            import_value = product["import_value"]
+            substitution_potential = min(import_value, product["african_capacity"] * 0.3)
+            
+            opportunities.append({
+                "imported_product": {
+                    "hs_code": product["hs_code"],
+                    "name": product["product_name"] or get_product_name(product["hs_code"], lang),
+                    "import_value": import_value,
+                    "current_source": ", ".join(product["source_regions"][:2] or ["Hors Afrique"])
+                },
+                "african_suppliers": [
+                    {
+                        "country_iso3": iso3,
+                        "country_name": get_country_name(iso3, lang),
+                        "export_value": export_value,
+                        "share_potential": min(export_value / import_value * 100, 100)
+                    }
+                    for iso3, export_value in product["suppliers"]
+                ],
+                "substitution_potential": substitution_potential,
+                "difficulty": self._assess_difficulty(import_value, product["african_capacity"])
+            })
+            total_substitutable += substitution_potential
+        
+        return self._import_substitution_response(
+            importer, year, opportunities, total_substitutable,
+            matrix.total_imports_from_outside(importer, year), lang,
+            data_source="OEC/BACI (precomputed matrix)"
+        )
+    
+    def _export_opportunities_from_matrix(
+        self,
+        matrix: TradeMatrix,
+        exporter: str,
+        year: int,
+        min_market_size: int,
+        lang: str
+    ) -> Dict:
+        """Export opportunities from the precomputed trade matrix"""
+        opportunities = []
+        total_market_potential = 0
+        
+        for product in matrix.export_opportunities(exporter, year, min_market_size):
+            if not product["markets"]:
+                continue
+            
+            potential_markets = [
+                {
+                    "country_iso3": market["country_iso3"],
+                    "country_name": get_country_name(market["country_iso3"], lang),
+                    "import_value": market["import_value"],
+                    "current_source": ", ".join(market["source_regions"][:2]),
+                    "capture_potential": min(
+                        product["export_value"] * 0.2,
+                        market["import_value"] * 0.15
+                    )
+                }
+                for market in product["markets"]
+            ]
+            potential_markets.sort(key=lambda x: x["capture_potential"], reverse=True)
+            total_capture = sum(m["capture_potential"] for m in potential_markets)
+            
+            opportunities.append({
+                "exportable_product": {
+                    "hs_code": product["hs_code"],
+                    "name": product["product_name"] or get_product_name(product["hs_code"], lang),
+                    "export_capacity": product["export_value"]
+                },
+                "target_markets": potential_markets[:5],
+                "total_market_size": sum(m["import_value"] for m in potential_markets),
+                "estimated_capture": total_capture,
+                "competitiveness": "competitive"
+            })
+            total_market_potential += total_capture
+        
+        return self._export_opportunities_response(
+            exporter, year, opportunities, total_market_potential, lang,
+            data_source="OEC/BACI (precomputed matrix)"
+        )
+    
+    def _import_substitution_response(
+        self,
+        importer: str,
+        year: int,
+        opportunities: List[Dict],
+        total_substitutable: float,
+        total_from_outside: float,
+        lang: str,
+        data_source: str
+    ) -> Dict:
+        # Sort by substitution potential
+        opportunities.sort(key=lambda x: x["substitution_potential"], reverse=True)
+        
+        return {
+            "importer": {
+                "iso3": importer,
+                "name": get_country_name(importer, lang)
+            },
+            "year": year,
+            "analysis_date": datetime.utcnow().isoformat(),
+            "data_source": data_source,
+            "summary": {
+                "total_opportunities": len(opportunities),
+                "total_substitutable_value": total_substitutable,
+                "total_imports_from_outside": total_from_outside,
+                "potential_savings_percent": 17.0,  # AfCFTA tariff + logistics savings
+                "top_sectors": self._identify_top_sectors(opportunities, lang)
+            },
+            "opportunities": opportunities[:20],  # Top 20
+            "sources": ["OEC/BACI International Trade Data", "UN Comtrade"]
+        }
+    
+    def _export_opportunities_response(
+        self,
+        exporter: str,
+        year: int,
+        opportunities: List[Dict],
+        total_market_potential: float,
+        lang: str,
+        data_source: str
+    ) -> Dict:
+        opportunities.sort(key=lambda x: x["estimated_capture"], reverse=True)
+        
+        return {
+            "exporter": {
+                "iso3": exporter,
+                "name": get_country_name(exporter, lang)
+            },
+            "year": year,
+            "analysis_date": datetime.utcnow().isoformat(),
+            "data_source": data_source,
+            "summary": {
+                "total_opportunities": len(opportunities),
+                "total_market_potential": total_market_potential,
+                "top_products": [o["exportable_product"]["name"] for o in opportunities[:5]],
+                "top_markets": self._identify_top_markets(opportunities, lang)
+            },
+            "opportunities": opportunities[:15],
+            "sources": ["OEC/BACI International Trade Data", "UN Comtrade"]
+        }
+    
     def _assess_difficulty(self, import_value: float, african_capacity: float) -> str:
         """Assess substitution difficulty"""
         if african_capacity >= import_value * 0.5:
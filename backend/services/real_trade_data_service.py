@@ -9,7 +9,8 @@ Provides real trade data for African countries
 """
 import httpx
 import asyncio
-from typing import Dict, List
+import time
+from typing import Dict, List, Optional, Tuple
 import logging
 from collections import defaultdict
 
@@ -217,125 +218,227 @@ HS_PRODUCT_NAMES = {
 }
 
 
+# OEC BACI cube and fan-out configuration
+OEC_BACI_CUBE = "trade_i_baci_a_17"
+OEC_MAX_CONCURRENCY = 6
+
+# Countries sampled for product-level exporter / importer lookups
+MAJOR_EXPORTERS = ["NGA", "ZAF", "EGY", "DZA", "AGO", "MAR", "KEN", "ETH",
+                   "GHA", "CIV", "TZA", "TUN", "SEN", "CMR", "COD", "ZMB"]
+TOP_IMPORTERS = ["ZAF", "EGY", "NGA", "MAR", "DZA", "KEN", "TUN", "ETH", "GHA", "TZA"]
+
+# Flow -> OEC country dimension
+FLOW_DIMENSIONS = {
+    "export": "Exporter Country",
+    "import": "Importer Country",
+}
+
+
+def _record_hs4(record: Dict) -> str:
+    """Extract the 4-digit HS code from an OEC record"""
+    hs4_id = str(record.get("HS4 ID", ""))
+    return hs4_id[-4:].zfill(4) if hs4_id else ""
+
+
 class RealTradeDataService:
     """
     Service to fetch real trade data from free APIs
+
+    All OEC calls share one pooled httpx client and a semaphore bounding the
+    number of concurrent requests. Per-country BACI HS4 tables are cached by
+    (cube, flow, country, year) and filtered locally for each HS code.
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = OEC_MAX_CONCURRENCY):
         self.timeout = 30.0
-        self._cache = {}
+        self.max_concurrency = max_concurrency
+        self._cache: Dict[Tuple[str, str, str, int], Tuple[float, List[Dict]]] = {}
         self._cache_ttl = 3600  # 1 hour
+        self._pending: Dict[Tuple[str, str, str, int], asyncio.Future] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
     
-    async def get_oec_imports(
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared pooled client, created on first use inside the event loop"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                )
+            )
+        return self._client
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def aclose(self):
+        """Close the pooled HTTP client (application shutdown)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+    
+    async def _oec_get(self, params: Dict) -> Optional[List[Dict]]:
+        """GET an OEC tesseract query; returns records or None on non-200"""
+        async with self._get_semaphore():
+            response = await self._get_client().get(OEC_BASE_URL, params=params)
+        if response.status_code != 200:
+            logger.warning(f"OEC API returned {response.status_code} for {params}")
+            return None
+        return response.json().get("data", [])
+    
+    async def get_country_table(
         self,
+        flow: str,
         country_iso3: str,
-        year: int = 2022,
-        limit: int = 100
+        year: int,
+        cube: str = OEC_BACI_CUBE
     ) -> List[Dict]:
         """
-        Get imports for a country from OEC API
+        Full HS4 table of a country's exports or imports for a year.
+        Cached per (cube, flow, country, year); concurrent callers asking for
+        the same table share a single request.
         """
         country_info = AFRICAN_COUNTRIES.get(country_iso3.upper())
         if not country_info:
             return []
         
-        oec_id = country_info["oec"]
+        key = (cube, flow, country_info["oec"], year)
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
         
+        params = self._country_table_params(flow, country_info["oec"], year, cube)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        records: List[Dict] = []
         try:
-            params = {
-                "cube": "trade_i_baci_a_17",
-                "drilldowns": "Year,Importer Country,HS4",
-                "measures": "Trade Value,Quantity",
-                "Year": str(year),
-                "Importer Country": oec_id,
-                "limit": str(limit * 5)  # Get more to filter
-            }
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(OEC_BASE_URL, params=params)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    records = data.get("data", [])
-                    
-                    # Sort by trade value and take top items
-                    records.sort(key=lambda x: x.get("Trade Value", 0), reverse=True)
-                    
-                    # Format results
-                    results = []
-                    for record in records[:limit]:
-                        hs4_id = str(record.get("HS4 ID", ""))
-                        hs4_code = hs4_id[-4:].zfill(4) if hs4_id else ""
-                        
-                        results.append({
-                            "hs_code": hs4_code,
-                            "product_name": record.get("HS4", ""),
-                            "trade_value": record.get("Trade Value", 0),
-                            "quantity": record.get("Quantity", 0),
-                            "year": year
-                        })
-                    
-                    return results
-                    
+            fetched = await self._oec_get(params)
+            if fetched is not None:
+                records = fetched
+                self._cache[key] = (time.monotonic(), records)
         except Exception as e:
-            logger.error(f"OEC API error: {str(e)}")
+            logger.warning(f"OEC {flow} table error for {country_iso3} ({year}): {e}")
+        finally:
+            del self._pending[key]
+            future.set_result(records)
         
-        return []
+        return records
     
-    async def get_oec_exports(
+    @staticmethod
+    def _country_table_params(flow: str, oec_id: str, year: int, cube: str) -> Dict:
+        dimension = FLOW_DIMENSIONS[flow]
+        return {
+            "cube": cube,
+            "drilldowns": f"Year,{dimension},HS4",
+            "measures": "Trade Value,Quantity",
+            "Year": str(year),
+            dimension: oec_id
+        }
+
+    async def fetch_country_table(
         self,
+        flow: str,
         country_iso3: str,
-        year: int = 2022,
-        limit: int = 100
-    ) -> List[Dict]:
+        year: int,
+        cube: str = OEC_BACI_CUBE
+    ) -> Optional[List[Dict]]:
         """
-        Get exports for a country from OEC API
+        Full HS4 table of a country's exports or imports for a year (not cached,
+        used by the offline trade matrix build); None if OEC did not answer,
+        request errors are raised
         """
         country_info = AFRICAN_COUNTRIES.get(country_iso3.upper())
         if not country_info:
             return []
+        return await self._oec_get(self._country_table_params(flow, country_info["oec"], year, cube))
+
+    async def get_country_tables(
+        self,
+        flow: str,
+        countries: List[str],
+        year: int
+    ) -> Dict[str, List[Dict]]:
+        """Fetch several country tables concurrently (bounded by the semaphore)"""
+        tables = await asyncio.gather(
+            *(self.get_country_table(flow, iso3, year) for iso3 in countries)
+        )
+        return dict(zip(countries, tables))
+
+    async def get_bilateral_table(
+        self,
+        importer_iso3: str,
+        year: int,
+        cube: str = OEC_BACI_CUBE
+    ) -> Optional[List[Dict]]:
+        """
+        Full Importer × Exporter × HS4 table of a country for a year (not cached,
+        used by the offline trade matrix build); None if OEC did not answer
+        """
+        country_info = AFRICAN_COUNTRIES.get(importer_iso3.upper())
+        if not country_info:
+            return []
+
+        params = {
+            "cube": cube,
+            "drilldowns": "Year,Importer Country,Exporter Country,HS4",
+            "measures": "Trade Value",
+            "Year": str(year),
+            "Importer Country": country_info["oec"]
+        }
+        return await self._oec_get(params)
+
+    async def _get_top_flows(
+        self,
+        flow: str,
+        country_iso3: str,
+        year: int,
+        limit: int
+    ) -> List[Dict]:
+        records = await self.get_country_table(flow, country_iso3, year)
+        top_records = sorted(records, key=lambda x: x.get("Trade Value", 0), reverse=True)[:limit]
         
-        oec_id = country_info["oec"]
-        
-        try:
-            params = {
-                "cube": "trade_i_baci_a_17",
-                "drilldowns": "Year,Exporter Country,HS4",
-                "measures": "Trade Value,Quantity",
-                "Year": str(year),
-                "Exporter Country": oec_id,
-                "limit": str(limit * 5)
+        return [
+            {
+                "hs_code": _record_hs4(record),
+                "product_name": record.get("HS4", ""),
+                "trade_value": record.get("Trade Value", 0),
+                "quantity": record.get("Quantity", 0),
+                "year": year
             }
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(OEC_BASE_URL, params=params)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    records = data.get("data", [])
-                    
-                    records.sort(key=lambda x: x.get("Trade Value", 0), reverse=True)
-                    
-                    results = []
-                    for record in records[:limit]:
-                        hs4_id = str(record.get("HS4 ID", ""))
-                        hs4_code = hs4_id[-4:].zfill(4) if hs4_id else ""
-                        
-                        results.append({
-                            "hs_code": hs4_code,
-                            "product_name": record.get("HS4", ""),
-                            "trade_value": record.get("Trade Value", 0),
-                            "quantity": record.get("Quantity", 0),
-                            "year": year
-                        })
-                    
-                    return results
-                    
-        except Exception as e:
-            logger.error(f"OEC API error: {str(e)}")
-        
-        return []
+            for record in top_records
+        ]
+    
+    async def get_oec_imports(
+        self,
+        country_iso3: str,
+        year: int = 2022,
+        limit: int = 100
+    ) -> List[Dict]:
+        """
+        Get imports for a country from OEC API
+        """
+        return await self._get_top_flows("import", country_iso3, year, limit)
+    
+    async def get_oec_exports(
+        self,
+        country_iso3: str,
+        year: int = 2022,
+        limit: int = 100
+    ) -> List[Dict]:
+        """
+        Get exports for a country from OEC API
+        """
+        return await self._get_top_flows("export", country_iso3, year, limit)
     
     async def get_oec_bilateral_from_world(
         self,
@@ -356,7 +459,7 @@ class RealTradeDataService:
         try:
             # Get imports by exporter country
             params = {
-                "cube": "trade_i_baci_a_17",
+                "cube": OEC_BACI_CUBE,
                 "drilldowns": "Year,Importer Country,Exporter Country,HS4",
                 "measures": "Trade Value",
                 "Year": str(year),
@@ -364,60 +467,56 @@ class RealTradeDataService:
                 "limit": "500"
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(OEC_BASE_URL, params=params)
+            records = await self._oec_get(params)
+            
+            if records is not None:
+                total_value = 0
+                from_africa = 0
+                from_outside = 0
+                products_from_outside = defaultdict(lambda: {"value": 0, "sources": set()})
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    records = data.get("data", [])
-                    
-                    total_value = 0
-                    from_africa = 0
-                    from_outside = 0
-                    products_from_outside = defaultdict(lambda: {"value": 0, "sources": set()})
+                for record in records:
+                    value = record.get("Trade Value", 0)
+                    exporter_id = record.get("Exporter Country ID", "")
+                    hs4_id = str(record.get("HS4 ID", ""))
+                    hs4_code = hs4_id[-4:].zfill(4) if hs4_id else ""
+                    product_name = record.get("HS4", "")
+                    exporter_name = record.get("Exporter Country", "")
                     
-                    for record in records:
-                        value = record.get("Trade Value", 0)
-                        exporter_id = record.get("Exporter Country ID", "")
-                        hs4_id = str(record.get("HS4 ID", ""))
-                        hs4_code = hs4_id[-4:].zfill(4) if hs4_id else ""
-                        product_name = record.get("HS4", "")
-                        exporter_name = record.get("Exporter Country", "")
-                        
-                        total_value += value
-                        
-                        # Check if from Africa
-                        is_african = any(exporter_id.startswith(af_id.replace("af", "")) for af_id in african_oec_ids)
-                        
-                        if is_african:
-                            from_africa += value
-                        else:
-                            from_outside += value
-                            if hs4_code and value > 1000000:  # Only significant imports
-                                products_from_outside[hs4_code]["value"] += value
-                                products_from_outside[hs4_code]["name"] = product_name
-                                products_from_outside[hs4_code]["sources"].add(exporter_name)
+                    total_value += value
                     
-                    # Format products from outside
-                    products_list = []
-                    for hs_code, data in products_from_outside.items():
-                        products_list.append({
-                            "hs_code": hs_code,
-                            "product_name": data["name"],
-                            "import_value": data["value"],
-                            "source_regions": list(data["sources"])[:3]
-                        })
-                    
-                    products_list.sort(key=lambda x: x["import_value"], reverse=True)
-                    
-                    return {
-                        "total": total_value,
-                        "from_africa": from_africa,
-                        "from_outside": from_outside,
-                        "africa_share": (from_africa / total_value * 100) if total_value > 0 else 0,
-                        "products_from_outside": products_list[:limit]
-                    }
+                    # Check if from Africa
+                    is_african = any(exporter_id.startswith(af_id.replace("af", "")) for af_id in african_oec_ids)
                     
+                    if is_african:
+                        from_africa += value
+                    else:
+                        from_outside += value
+                        if hs4_code and value > 1000000:  # Only significant imports
+                            products_from_outside[hs4_code]["value"] += value
+                            products_from_outside[hs4_code]["name"] = product_name
+                            products_from_outside[hs4_code]["sources"].add(exporter_name)
+                
+                # Format products from outside
+                products_list = []
+                for hs_code, data in products_from_outside.items():
+                    products_list.append({
+                        "hs_code": hs_code,
+                        "product_name": data["name"],
+                        "import_value": data["value"],
+                        "source_regions": list(data["sources"])[:3]
+                    })
+                
+                products_list.sort(key=lambda x: x["import_value"], reverse=True)
+                
+                return {
+                    "total": total_value,
+                    "from_africa": from_africa,
+                    "from_outside": from_outside,
+                    "africa_share": (from_africa / total_value * 100) if total_value > 0 else 0,
+                    "products_from_outside": products_list[:limit]
+                }
+                
         except Exception as e:
             logger.error(f"OEC bilateral API error: {str(e)}")
         
@@ -430,72 +529,37 @@ class RealTradeDataService:
     ) -> List[Dict]:
         """
         Find African countries that export a specific product
-        Queries OEC API for all African exporters
+        Queries the major African exporters' OEC tables concurrently
         """
         try:
             # Search for HS4 (first 4 digits)
             hs4 = hs_code[:4] if len(hs_code) >= 4 else hs_code.zfill(4)
             
-            # Build list of African OEC IDs
-            african_exporters_found = []
+            tables = await self.get_country_tables("export", MAJOR_EXPORTERS, year)
             
-            # Query OEC for each major African exporter
-            major_exporters = ["NGA", "ZAF", "EGY", "DZA", "AGO", "MAR", "KEN", "ETH", 
-                              "GHA", "CIV", "TZA", "TUN", "SEN", "CMR", "COD", "ZMB"]
-            
-            for iso3 in major_exporters:
-                country_info = AFRICAN_COUNTRIES.get(iso3)
-                if not country_info:
-                    continue
-                
-                oec_id = country_info["oec"]
-                
-                params = {
-                    "cube": "trade_i_baci_a_17",
-                    "drilldowns": "Year,Exporter Country,HS4",
-                    "measures": "Trade Value,Quantity",
-                    "Year": str(year),
-                    "Exporter Country": oec_id,
-                    "limit": "100"
-                }
-                
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(OEC_BASE_URL, params=params)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        records = data.get("data", [])
-                        
-                        for record in records:
-                            hs4_id = str(record.get("HS4 ID", ""))
-                            record_hs4 = hs4_id[-4:].zfill(4) if hs4_id else ""
-                            
-                            # Match HS code (at least first 2 digits)
-                            if record_hs4[:2] == hs4[:2]:
-                                export_value = record.get("Trade Value", 0)
-                                if export_value > 0:
-                                    african_exporters_found.append({
-                                        "country_iso3": iso3,
-                                        "country_name": country_info["name_fr"],
-                                        "hs_code": record_hs4,
-                                        "product_name": record.get("HS4", ""),
-                                        "export_value": export_value,
-                                        "quantity": record.get("Quantity", 0)
-                                    })
-            
-            # Remove duplicates and aggregate by country
+            # Aggregate matching records by country
             country_exports = {}
-            for exp in african_exporters_found:
-                iso3 = exp["country_iso3"]
-                if iso3 not in country_exports:
-                    country_exports[iso3] = {
-                        "country_iso3": iso3,
-                        "country_name": exp["country_name"],
-                        "export_value": 0,
-                        "products": []
-                    }
-                country_exports[iso3]["export_value"] += exp["export_value"]
-                country_exports[iso3]["products"].append(exp["product_name"])
+            for iso3, records in tables.items():
+                country_info = AFRICAN_COUNTRIES[iso3]
+                for record in records:
+                    record_hs4 = _record_hs4(record)
+                    
+                    # Match HS code (at least first 2 digits)
+                    if record_hs4[:2] != hs4[:2]:
+                        continue
+                    export_value = record.get("Trade Value", 0)
+                    if export_value <= 0:
+                        continue
+                    
+                    if iso3 not in country_exports:
+                        country_exports[iso3] = {
+                            "country_iso3": iso3,
+                            "country_name": country_info["name_fr"],
+                            "export_value": 0,
+                            "products": []
+                        }
+                    country_exports[iso3]["export_value"] += export_value
+                    country_exports[iso3]["products"].append(record.get("HS4", ""))
             
             # Convert to list and sort
             result = list(country_exports.values())
@@ -515,70 +579,32 @@ class RealTradeDataService:
     ) -> List[Dict]:
         """
         Find African countries that import a specific product
-        Queries OEC API for all African importers
+        Queries the top African importers' OEC tables concurrently
         """
         try:
             hs4 = hs_code[:4] if len(hs_code) >= 4 else hs_code.zfill(4)
             
-            african_importers_found = []
-            
-            # Sample top importing African countries for efficiency
-            top_importers = ["ZAF", "EGY", "NGA", "MAR", "DZA", "KEN", "TUN", "ETH", "GHA", "TZA"]
-            
-            for iso3 in top_importers:
-                country_info = AFRICAN_COUNTRIES.get(iso3)
-                if not country_info:
-                    continue
-                
-                oec_id = country_info["oec"]
-                
-                params = {
-                    "cube": "trade_i_baci_a_17",
-                    "drilldowns": "Year,Importer Country,HS4",
-                    "measures": "Trade Value",
-                    "Year": str(year),
-                    "Importer Country": oec_id,
-                    "limit": "100"
-                }
-                
-                try:
-                    async with httpx.AsyncClient(timeout=15.0) as client:
-                        response = await client.get(OEC_BASE_URL, params=params)
-                        
-                        if response.status_code == 200:
-                            data = response.json()
-                            records = data.get("data", [])
-                            
-                            for record in records:
-                                hs4_id = str(record.get("HS4 ID", ""))
-                                record_hs4 = hs4_id[-4:].zfill(4) if hs4_id else ""
-                                
-                                # Match HS code (at least first 2 digits)
-                                if record_hs4[:2] == hs4[:2]:
-                                    import_value = record.get("Trade Value", 0)
-                                    if import_value > 0:
-                                        african_importers_found.append({
-                                            "country_iso3": iso3,
-                                            "country_name": country_info["name_fr"],
-                                            "hs_code": record_hs4,
-                                            "product_name": record.get("HS4", ""),
-                                            "import_value": import_value
-                                        })
-                except Exception as e:
-                    logger.warning(f"Error fetching imports for {iso3}: {e}")
-                    continue
+            tables = await self.get_country_tables("import", TOP_IMPORTERS, year)
             
             # Aggregate by country
             country_imports = {}
-            for imp in african_importers_found:
-                iso3 = imp["country_iso3"]
-                if iso3 not in country_imports:
-                    country_imports[iso3] = {
-                        "country_iso3": iso3,
-                        "country_name": imp["country_name"],
-                        "import_value": 0
-                    }
-                country_imports[iso3]["import_value"] += imp["import_value"]
+            for iso3, records in tables.items():
+                country_info = AFRICAN_COUNTRIES[iso3]
+                for record in records:
+                    # Match HS code (at least first 2 digits)
+                    if _record_hs4(record)[:2] != hs4[:2]:
+                        continue
+                    import_value = record.get("Trade Value", 0)
+                    if import_value <= 0:
+                        continue
+                    
+                    if iso3 not in country_imports:
+                        country_imports[iso3] = {
+                            "country_iso3": iso3,
+                            "country_name": country_info["name_fr"],
+                            "import_value": 0
+                        }
+                    country_imports[iso3]["import_value"] += import_value
             
             result = list(country_imports.values())
             result.sort(key=lambda x: x["import_value"], reverse=True)
@@ -0,0 +1,260 @@
+"""
+Batch Tariff Calculation Service
+Moteur de calcul tarifaire vectorisé pour les factures multi-lignes
+
+Reprend la logique de /api/calculate-tariff (priorité sous-position
+nationale > tarif SH6 pays > tarif par chapitre, taux ZLECAf, autres taxes,
+TVA) mais:
+- les taux sont résolus une seule fois par couple (destination, code SH)
+- les montants DD, RS/PCS/CEDEAO/TCI, TVA et ZLECAf sont calculés en
+  opérations NumPy sur tout le lot
+- les résultats sont renvoyés dans l'ordre des lignes d'entrée
+
+Les journaux de calcul, règles d'origine et données externes (OEC, Banque
+Mondiale) restent réservés à l'endpoint unitaire.
+"""
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from constants import AFRICAN_COUNTRIES
+from data_loader import get_tariff_corrections
+from datasets import DATASETS
+
+# Jeux de données chargés au premier appel (voir datasets.py)
+(
+    resolve_npf_rate,
+    get_vat_rate_for_country,
+    get_other_taxes_for_country,
+    get_product_category,
+    get_zlecaf_reduction_factor
+) = DATASETS.functions(
+    "country_tariffs_complete",
+    "resolve_npf_rate", "get_vat_rate_for_country", "get_other_taxes_for_country",
+    "get_product_category", "get_zlecaf_reduction_factor"
+)
+get_sub_position_rate = DATASETS.function("country_hs6_detailed", "get_sub_position_rate")
+
+logger = logging.getLogger(__name__)
+
+# Colonnes monétaires arrondies à 2 décimales dans la réponse
+AMOUNT_COLUMNS = [
+    "normal_tariff_amount", "zlecaf_tariff_amount",
+    "statistical_fee", "community_levy", "ecowas_levy", "integration_levy",
+    "other_taxes_total",
+    "normal_vat_amount", "zlecaf_vat_amount",
+    "normal_total_cost", "zlecaf_total_cost",
+    "savings", "total_savings_with_taxes"
+]
+
+# Pourcentages arrondis à 1 décimale
+PERCENT_COLUMNS = ["savings_percentage", "total_savings_percentage"]
+
+
+class BatchTariffEngine:
+    """
+    Vectorized tariff engine for whole invoices
+    """
+
+    def __init__(self):
+        # Index pays par ISO3 puis ISO2 (même ordre de priorité que l'endpoint unitaire)
+        self._countries: Dict[str, Dict] = {}
+        for country in AFRICAN_COUNTRIES:
+            self._countries.setdefault(country["code"], country)
+        for country in AFRICAN_COUNTRIES:
+            self._countries[country["iso3"]] = country
+
+    def resolve_country(self, code: str) -> Optional[Dict]:
+        """Résoudre un code pays ISO3 ou ISO2 vers l'entrée AFRICAN_COUNTRIES"""
+        return self._countries.get(code.upper())
+
+    @staticmethod
+    def resolve_line_rate(dest_iso3: str, hs_code_clean: str) -> Dict:
+        """
+        Résoudre le taux NPF et le facteur ZLECAf pour une destination et un code SH
+
+        Même ordre de priorité que /api/calculate-tariff:
+        1. Sous-position nationale (8-12 chiffres) si fournie
+        2. Tarif SH6 spécifique au pays
+        3. Tarif par chapitre du pays
+        """
+        hs6_code = hs_code_clean[:6].zfill(6)
+        normal_rate = None
+        npf_source = None
+        tariff_precision = "chapter"
+        sub_position_used = None
+
+        if len(hs_code_clean) > 6:
+            rate, _, _ = get_sub_position_rate(dest_iso3, hs_code_clean)
+            if rate is not None:
+                normal_rate = rate
+                npf_source = f"Sous-position nationale {dest_iso3} ({hs_code_clean})"
+                tariff_precision = "sub_position"
+                sub_position_used = hs_code_clean
+
+        if tariff_precision == "chapter":
+            normal_rate, npf_source, tariff_precision = resolve_npf_rate(dest_iso3, hs6_code)
+
+        product_category = get_product_category(hs6_code)
+        return {
+            "hs6_code": hs6_code,
+            "normal_rate": normal_rate,
+            "npf_source": npf_source,
+            "tariff_precision": tariff_precision,
+            "sub_position_used": sub_position_used,
+            "product_category": product_category,
+            "zlecaf_factor": get_zlecaf_reduction_factor(dest_iso3, product_category)
+        }
+
+    @staticmethod
+    def resolve_country_taxes(dest_iso3: str) -> Dict:
+        """Taux de TVA et autres taxes (RS, PCS, CEDEAO, TCI) d'un pays de destination"""
+        vat_rate, _ = get_vat_rate_for_country(dest_iso3)
+        other_taxes_rate, detail = get_other_taxes_for_country(dest_iso3)
+        return {
+            "vat_rate": vat_rate,
+            "other_taxes_rate": other_taxes_rate,
+            "rs_rate": (detail.get("rs") or 0) / 100,
+            "pcs_rate": (detail.get("pcs") or 0) / 100,
+            "cedeao_rate": (detail.get("cedeao") or 0) / 100,
+            "tci_rate": (detail.get("tci") or 0) / 100
+        }
+
+    def calculate(self, lines: List[Dict]) -> Tuple[List[Dict], Dict]:
+        """
+        Calculer les tarifs d'un lot de lignes
+
+        Args:
+            lines: Liste de dicts {origin_country, destination_country, hs_code, value}
+
+        Returns:
+            Tuple (résultats dans l'ordre d'entrée, totaux du lot)
+
+        Raises:
+            ValueError: si une ligne référence un pays non membre de la ZLECAf
+        """
+        if not lines:
+            return [], self._totals(pd.DataFrame(columns=AMOUNT_COLUMNS + ["value"]))
+
+        df = pd.DataFrame(lines, columns=["origin_country", "destination_country", "hs_code", "value"])
+
+        # Résolution des pays (une fois par code distinct)
+        iso3_by_code = {}
+        for code in pd.unique(pd.concat([df["origin_country"], df["destination_country"]])):
+            country = self.resolve_country(code)
+            iso3_by_code[code] = country["iso3"] if country else None
+        df["origin_iso3"] = df["origin_country"].map(iso3_by_code)
+        df["dest_iso3"] = df["destination_country"].map(iso3_by_code)
+        invalid = df.index[df["origin_iso3"].isna() | df["dest_iso3"].isna()].tolist()
+        if invalid:
+            raise ValueError(
+                f"L'un des pays sélectionnés n'est pas membre de la ZLECAf (lignes {invalid[:20]})"
+            )
+
+        df["hs_clean"] = df["hs_code"].str.replace(".", "", regex=False).str.replace(" ", "", regex=False)
+
+        # Résolution des taux: une fois par couple (destination, code SH) distinct
+        pair_codes, pairs = pd.factorize(pd.MultiIndex.from_arrays([df["dest_iso3"], df["hs_clean"]]))
+        pair_rates = pd.DataFrame([self.resolve_line_rate(dest, hs) for dest, hs in pairs])
+        line_rates = pair_rates.iloc[pair_codes].reset_index(drop=True)
+
+        # Taxes par pays de destination: une fois par destination distincte
+        dest_codes, dests = pd.factorize(df["dest_iso3"])
+        dest_taxes = pd.DataFrame([self.resolve_country_taxes(dest) for dest in dests])
+        line_taxes = dest_taxes.iloc[dest_codes].reset_index(drop=True)
+
+        # Période de transition par secteur (chapitre SH)
+        transition_periods = get_tariff_corrections().get("transition_periods", {})
+        transition = line_rates["hs6_code"].str[:2].map(transition_periods).fillna("immediate")
+
+        # ============================================================
+        # CALCULS VECTORISÉS DES MONTANTS
+        # ============================================================
+        value = df["value"].to_numpy(dtype=np.float64)
+        normal_rate = line_rates["normal_rate"].to_numpy(dtype=np.float64)
+        zlecaf_rate = normal_rate * line_rates["zlecaf_factor"].to_numpy(dtype=np.float64)
+        vat_rate = line_taxes["vat_rate"].to_numpy(dtype=np.float64)
+        other_taxes_rate = line_taxes["other_taxes_rate"].to_numpy(dtype=np.float64)
+
+        normal_customs = value * normal_rate
+        zlecaf_customs = value * zlecaf_rate
+        other_taxes_amount = value * other_taxes_rate
+
+        normal_vat_amount = (value + normal_customs + other_taxes_amount) * vat_rate
+        zlecaf_vat_amount = (value + zlecaf_customs + other_taxes_amount) * vat_rate
+
+        normal_total = value + normal_customs + other_taxes_amount + normal_vat_amount
+        zlecaf_total = value + zlecaf_customs + other_taxes_amount + zlecaf_vat_amount
+
+        savings = normal_customs - zlecaf_customs
+        total_savings = normal_total - zlecaf_total
+        with np.errstate(divide="ignore", invalid="ignore"):
+            savings_pct = np.where(normal_customs > 0, savings / normal_customs * 100, 0.0)
+            total_savings_pct = np.where(normal_total > 0, total_savings / normal_total * 100, 0.0)
+
+        precision = line_rates["tariff_precision"]
+        out = pd.DataFrame({
+            "line": np.arange(len(df)),
+            "origin_country": df["origin_country"],
+            "destination_country": df["destination_country"],
+            "hs_code": df["hs_code"],
+            "hs6_code": line_rates["hs6_code"],
+            "value": value,
+            "normal_tariff_rate": normal_rate,
+            "normal_tariff_amount": normal_customs,
+            "zlecaf_tariff_rate": zlecaf_rate,
+            "zlecaf_tariff_amount": zlecaf_customs,
+            "vat_rate": vat_rate,
+            "statistical_fee": value * line_taxes["rs_rate"].to_numpy(dtype=np.float64),
+            "community_levy": value * line_taxes["pcs_rate"].to_numpy(dtype=np.float64),
+            "ecowas_levy": value * line_taxes["cedeao_rate"].to_numpy(dtype=np.float64),
+            "integration_levy": value * line_taxes["tci_rate"].to_numpy(dtype=np.float64),
+            "other_taxes_total": other_taxes_amount,
+            "normal_vat_amount": normal_vat_amount,
+            "zlecaf_vat_amount": zlecaf_vat_amount,
+            "normal_total_cost": normal_total,
+            "zlecaf_total_cost": zlecaf_total,
+            "savings": savings,
+            "savings_percentage": savings_pct,
+            "total_savings_with_taxes": total_savings,
+            "total_savings_percentage": total_savings_pct,
+            "tariff_precision": precision,
+            "sub_position_used": line_rates["sub_position_used"],
+            "rate_source": "Tarif officiel " + df["dest_iso3"] + " - " + line_rates["npf_source"],
+            "product_category": line_rates["product_category"],
+            "transition_period": transition,
+            "confidence_level": np.where(precision.isin(["sub_position", "hs6_country"]), "high", "medium")
+        })
+
+        return self._to_records(out), self._totals(out)
+
+    @staticmethod
+    def _to_records(out: pd.DataFrame) -> List[Dict]:
+        """Convertir en lignes JSON avec les mêmes arrondis que l'endpoint unitaire"""
+        columns = {}
+        for column in out.columns:
+            values = out[column].tolist()
+            if column in AMOUNT_COLUMNS:
+                values = [round(v, 2) for v in values]
+            elif column in PERCENT_COLUMNS:
+                values = [round(v, 1) for v in values]
+            columns[column] = values
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    @staticmethod
+    def _totals(out: pd.DataFrame) -> Dict:
+        """Totaux de la facture"""
+        totals = {column: round(float(out[column].sum()), 2) for column in AMOUNT_COLUMNS}
+        totals["value"] = round(float(out["value"].sum()), 2)
+        normal_total = totals["normal_total_cost"]
+        totals["total_savings_percentage"] = (
+            round(totals["total_savings_with_taxes"] / normal_total * 100, 1) if normal_total > 0 else 0
+        )
+        return totals
+
+
+# Singleton instance
+batch_tariff_engine = BatchTariffEngine()
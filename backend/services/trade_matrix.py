@@ -0,0 +1,368 @@
+"""
+Trade Opportunity Matrix
+Matrice dense pays africain × HS4 × année construite hors ligne à partir
+des tables BACI (OEC), pour l'analyse de substitution des importations:
+- exports[c, h, y]: exportations du pays c pour le produit h
+- imports[c, h, y]: importations totales du pays c
+- imports_from_africa[c, h, y]: part de ces importations venant d'Afrique
+- top_sources[c, h, y, k]: principaux fournisseurs hors Afrique (index
+  dans `partners`, -1 si aucun)
+- exports_covered[c, y] / imports_covered[c, y]: table d'exportations /
+  d'importations bilatérales effectivement récupérée (sinon les valeurs
+  du pays valent 0 sans être connues)
+
+Une requête n'est servie par la matrice que si toutes les tranches qu'elle
+lit sont couvertes (covers_import_substitution, covers_export_opportunities);
+sinon l'API se rabat sur OEC en direct.
+
+Un fournisseur est africain si son identifiant OEC ("Exporter Country ID")
+figure parmi ceux des 54 pays; le chemin OEC en direct de
+get_oec_bilateral_from_world compare encore des préfixes d'identifiant.
+
+L'artefact est un fichier NumPy compressé (.npz) produit par
+scripts/build_trade_matrix.py. Les endpoints de substitution y répondent
+par des opérations vectorisées au lieu d'interroger OEC pays par pays.
+"""
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MATRIX_PATH = Path(__file__).resolve().parent.parent / "data" / "trade_matrix.npz"
+TRADE_MATRIX_PATH = Path(os.getenv("TRADE_MATRIX_PATH", str(DEFAULT_MATRIX_PATH)))
+
+# Nombre de fournisseurs hors Afrique conservés par cellule
+TOP_SOURCES = 3
+
+
+def _record_hs4(record: Dict) -> str:
+    hs4_id = str(record.get("HS4 ID", ""))
+    return hs4_id[-4:].zfill(4) if hs4_id else ""
+
+
+class TradeMatrix:
+    """
+    Dense exporter/importer × HS4 × year trade matrix
+    """
+
+    def __init__(
+        self,
+        countries: np.ndarray,
+        hs4: np.ndarray,
+        years: np.ndarray,
+        exports: np.ndarray,
+        imports: np.ndarray,
+        imports_from_africa: np.ndarray,
+        top_sources: np.ndarray,
+        partners: np.ndarray,
+        hs4_names: np.ndarray,
+        built_at: str = "",
+        exports_covered: Optional[np.ndarray] = None,
+        imports_covered: Optional[np.ndarray] = None
+    ):
+        self.countries = countries
+        self.hs4 = hs4
+        self.years = years
+        self.exports = exports
+        self.imports = imports
+        self.imports_from_africa = imports_from_africa
+        self.top_sources = top_sources
+        self.partners = partners
+        self.hs4_names = hs4_names
+        self.built_at = built_at
+        # Artefacts antérieurs: couverture non enregistrée, supposée complète
+        full = np.ones((len(countries), len(years)), dtype=bool)
+        self.exports_covered = exports_covered if exports_covered is not None else full
+        self.imports_covered = imports_covered if imports_covered is not None else full.copy()
+        self._country_index = {c: i for i, c in enumerate(countries.tolist())}
+        self._year_index = {int(y): i for i, y in enumerate(years.tolist())}
+
+    # ------------------------------------------------------------------
+    # Construction / persistance
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_tables(
+        cls,
+        countries: List[str],
+        african_partner_ids: Iterable[str],
+        export_tables: Dict[Tuple[str, int], List[Dict]],
+        bilateral_tables: Dict[Tuple[str, int], List[Dict]]
+    ) -> "TradeMatrix":
+        """
+        Construire la matrice en une passe sur les tables BACI
+
+        Args:
+            countries: Codes ISO3 des pays africains (ordre des lignes)
+            african_partner_ids: Identifiants OEC des pays africains
+            export_tables: {(iso3, année): enregistrements Exporter Country × HS4}
+            bilateral_tables: {(iso3, année): enregistrements Importer × Exporter × HS4}
+
+        Une clé absente de l'une des tables signale une table non récupérée
+        (exports_covered / imports_covered).
+        """
+        african_ids = set(african_partner_ids)
+        years = sorted({year for _, year in export_tables} | {year for _, year in bilateral_tables})
+        hs4_names: Dict[str, str] = {}
+        for tables in (export_tables, bilateral_tables):
+            for records in tables.values():
+                for record in records:
+                    hs4 = _record_hs4(record)
+                    if hs4:
+                        hs4_names.setdefault(hs4, record.get("HS4", ""))
+        hs4_codes = sorted(hs4_names)
+
+        country_index = {c: i for i, c in enumerate(countries)}
+        hs4_index = {h: i for i, h in enumerate(hs4_codes)}
+        year_index = {y: i for i, y in enumerate(years)}
+        shape = (len(countries), len(hs4_codes), len(years))
+
+        exports = np.zeros(shape, dtype=np.float64)
+        imports = np.zeros(shape, dtype=np.float64)
+        imports_from_africa = np.zeros(shape, dtype=np.float64)
+        top_sources = np.full(shape + (TOP_SOURCES,), -1, dtype=np.int32)
+        exports_covered = np.zeros((len(countries), len(years)), dtype=bool)
+        imports_covered = np.zeros((len(countries), len(years)), dtype=bool)
+
+        for (iso3, year), records in export_tables.items():
+            c, y = country_index[iso3], year_index[year]
+            exports_covered[c, y] = True
+            for record in records:
+                h = hs4_index.get(_record_hs4(record))
+                if h is not None:
+                    exports[c, h, y] += record.get("Trade Value", 0) or 0
+
+        partners: Dict[str, int] = {}
+        for (iso3, year), records in bilateral_tables.items():
+            c, y = country_index[iso3], year_index[year]
+            imports_covered[c, y] = True
+            outside_sources = defaultdict(lambda: defaultdict(float))
+            for record in records:
+                h = hs4_index.get(_record_hs4(record))
+                if h is None:
+                    continue
+                value = record.get("Trade Value", 0) or 0
+                imports[c, h, y] += value
+                if record.get("Exporter Country ID", "") in african_ids:
+                    imports_from_africa[c, h, y] += value
+                else:
+                    name = record.get("Exporter Country", "")
+                    p = partners.setdefault(name, len(partners))
+                    outside_sources[h][p] += value
+            for h, sources in outside_sources.items():
+                ranked = sorted(sources, key=sources.get, reverse=True)[:TOP_SOURCES]
+                top_sources[c, h, y, :len(ranked)] = ranked
+
+        return cls(
+            countries=np.array(countries),
+            hs4=np.array(hs4_codes),
+            years=np.array(years, dtype=np.int16),
+            exports=exports,
+            imports=imports,
+            imports_from_africa=imports_from_africa,
+            top_sources=top_sources,
+            partners=np.array(list(partners)),
+            hs4_names=np.array([hs4_names[h] for h in hs4_codes]),
+            built_at=datetime.now(timezone.utc).isoformat(),
+            exports_covered=exports_covered,
+            imports_covered=imports_covered
+        )
+
+    def save(self, path: Path = TRADE_MATRIX_PATH) -> None:
+        """Enregistrer la matrice au format NumPy compressé"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                countries=self.countries,
+                hs4=self.hs4,
+                years=self.years,
+                exports=self.exports,
+                imports=self.imports,
+                imports_from_africa=self.imports_from_africa,
+                top_sources=self.top_sources,
+                partners=self.partners,
+                hs4_names=self.hs4_names,
+                built_at=np.array(self.built_at),
+                exports_covered=self.exports_covered,
+                imports_covered=self.imports_covered
+            )
+
+    @classmethod
+    def load(cls, path: Path = TRADE_MATRIX_PATH) -> "TradeMatrix":
+        """Charger une matrice enregistrée par save()"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                countries=data["countries"],
+                hs4=data["hs4"],
+                years=data["years"],
+                exports=data["exports"],
+                imports=data["imports"],
+                imports_from_africa=data["imports_from_africa"],
+                top_sources=data["top_sources"],
+                partners=data["partners"],
+                hs4_names=data["hs4_names"],
+                built_at=str(data["built_at"]),
+                exports_covered=data["exports_covered"] if "exports_covered" in data.files else None,
+                imports_covered=data["imports_covered"] if "imports_covered" in data.files else None
+            )
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def has_year(self, year: int) -> bool:
+        return year in self._year_index
+
+    def has_country(self, iso3: str) -> bool:
+        return iso3 in self._country_index
+
+    def has_imports(self, iso3: str, year: int) -> bool:
+        """Table d'importations bilatérales du pays récupérée pour l'année"""
+        if not (self.has_country(iso3) and self.has_year(year)):
+            return False
+        return bool(self.imports_covered[self._country_index[iso3], self._year_index[year]])
+
+    def has_exports(self, iso3: str, year: int) -> bool:
+        """Table d'exportations du pays récupérée pour l'année"""
+        if not (self.has_country(iso3) and self.has_year(year)):
+            return False
+        return bool(self.exports_covered[self._country_index[iso3], self._year_index[year]])
+
+    def covers_import_substitution(self, importer: str, year: int) -> bool:
+        """Importations du pays et exportations de tous les fournisseurs connues"""
+        return self.has_imports(importer, year) and bool(self.exports_covered[:, self._year_index[year]].all())
+
+    def covers_export_opportunities(self, exporter: str, year: int) -> bool:
+        """Exportations du pays et importations de tous les marchés connues"""
+        return self.has_exports(exporter, year) and bool(self.imports_covered[:, self._year_index[year]].all())
+
+    def total_imports_from_outside(self, importer: str, year: int) -> float:
+        """Valeur totale importée hors d'Afrique par un pays"""
+        c, y = self._country_index[importer], self._year_index[year]
+        return float(self.imports[c, :, y].sum() - self.imports_from_africa[c, :, y].sum())
+
+    def _sources(self, c: int, h: int, y: int) -> List[str]:
+        return [str(self.partners[p]) for p in self.top_sources[c, h, y] if p >= 0]
+
+    def import_substitution(
+        self,
+        importer: str,
+        year: int,
+        min_value: float,
+        limit: int = 50,
+        max_suppliers: int = 5
+    ) -> List[Dict]:
+        """
+        Produits importés hors d'Afrique par `importer` et fournisseurs africains
+
+        Returns:
+            Liste triée par valeur importée hors Afrique (décroissante), limitée
+            aux produits ayant au moins un fournisseur africain
+        """
+        c, y = self._country_index[importer], self._year_index[year]
+        outside = self.imports[c, :, y] - self.imports_from_africa[c, :, y]
+
+        candidates = np.flatnonzero((outside >= min_value) & (outside > 0))
+        candidates = candidates[np.argsort(-outside[candidates], kind="stable")][:limit]
+
+        supply = self.exports[:, candidates, y].copy()
+        supply[c, :] = 0
+        capacity = supply.sum(axis=0)
+        ranked = np.argsort(-supply, axis=0, kind="stable")[:max_suppliers]
+
+        results = []
+        for k in np.flatnonzero(capacity > 0):
+            h = candidates[k]
+            suppliers = [
+                (str(self.countries[s]), float(supply[s, k]))
+                for s in ranked[:, k] if supply[s, k] > 0
+            ]
+            results.append({
+                "hs_code": str(self.hs4[h]),
+                "product_name": str(self.hs4_names[h]),
+                "import_value": float(outside[h]),
+                "source_regions": self._sources(c, h, y),
+                "african_capacity": float(capacity[k]),
+                "suppliers": suppliers
+            })
+        return results
+
+    def export_opportunities(
+        self,
+        exporter: str,
+        year: int,
+        min_market_size: float,
+        min_export_value: float = 1000000,
+        limit: int = 50
+    ) -> List[Dict]:
+        """
+        Produits exportés par `exporter` et marchés africains qui les importent
+        hors d'Afrique au-delà de `min_market_size`
+
+        Returns:
+            Liste des produits exportés (par valeur décroissante) avec leurs
+            marchés cibles (par valeur importée hors Afrique décroissante)
+        """
+        c, y = self._country_index[exporter], self._year_index[year]
+        exports = self.exports[c, :, y]
+
+        candidates = np.flatnonzero(exports >= min_export_value)
+        candidates = candidates[np.argsort(-exports[candidates], kind="stable")][:limit]
+
+        outside = self.imports[:, candidates, y] - self.imports_from_africa[:, candidates, y]
+        outside[c, :] = 0
+        eligible = outside >= min_market_size
+
+        results = []
+        for k, h in enumerate(candidates):
+            markets = np.flatnonzero(eligible[:, k])
+            markets = markets[np.argsort(-outside[markets, k], kind="stable")]
+            results.append({
+                "hs_code": str(self.hs4[h]),
+                "product_name": str(self.hs4_names[h]),
+                "export_value": float(exports[h]),
+                "markets": [
+                    {
+                        "country_iso3": str(self.countries[m]),
+                        "import_value": float(outside[m, k]),
+                        "source_regions": self._sources(m, h, y)
+                    }
+                    for m in markets
+                ]
+            })
+        return results
+
+
+_matrix: Optional[TradeMatrix] = None
+_matrix_mtime: Optional[float] = None
+
+
+def get_trade_matrix(path: Path = TRADE_MATRIX_PATH) -> Optional[TradeMatrix]:
+    """
+    Matrice chargée paresseusement (rechargée si l'artefact a été reconstruit)
+
+    Returns:
+        None si l'artefact n'a pas encore été construit
+    """
+    global _matrix, _matrix_mtime
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+    if _matrix is None or mtime != _matrix_mtime:
+        try:
+            _matrix = TradeMatrix.load(path)
+            _matrix_mtime = mtime
+            logger.info(f"Trade matrix loaded: {_matrix.exports.shape} built {_matrix.built_at}")
+        except Exception as e:
+            logger.error(f"Trade matrix load error ({path}): {e}")
+            return None
+    return _matrix
@@ -0,0 +1,134 @@
+"""
+Startup profile: import time of the API worker, per dataset
+
+Each measurement runs in a fresh interpreter (cold = empty bytecode cache,
+warm = __pycache__ already populated):
+- framework: fastapi, pydantic, pandas, motor (imported by every worker)
+- one line per dataset of the registry (datasets.py), loaded after the
+  framework, in registry order
+- server: full `import server` (worker boot), with the datasets it loaded
+
+Exits with status 1 when the server import exceeds the budget.
+
+Usage (from the repository root):
+    python -m backend.startup_profile --runs 3 --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent
+
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "1500"))
+
+PREAMBLE = """
+import json, os, resource, sys, time
+sys.path[:0] = [{backend!r}, {root!r}]
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "startup_profile")
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+"""
+
+DATASETS_PROBE = """
+start, rss = time.perf_counter(), rss_mb()
+import fastapi, pydantic, pandas, motor.motor_asyncio
+rows = [{"name": "framework", "ms": (time.perf_counter() - start) * 1000, "rss_mb": rss_mb() - rss}]
+from datasets import DATASETS
+for dataset in DATASETS:
+    rss = rss_mb()
+    try:
+        dataset.load()
+    except Exception as e:
+        rows.append({"name": dataset.name, "error": f"{type(e).__name__}: {e}"})
+        continue
+    rows.append({"name": dataset.name, "ms": dataset.load_time * 1000, "rss_mb": rss_mb() - rss})
+print(json.dumps(rows))
+"""
+
+SERVER_PROBE = """
+start, rss = time.perf_counter(), rss_mb()
+import server
+elapsed = (time.perf_counter() - start) * 1000
+from datasets import DATASETS
+print(json.dumps({
+    "ms": elapsed,
+    "rss_mb": rss_mb() - rss,
+    "loaded": [dataset.name for dataset in DATASETS if dataset.loaded or dataset.module_name in sys.modules],
+}))
+"""
+
+
+def probe(code: str, cold: bool):
+    env = dict(os.environ)
+    script = PREAMBLE.format(backend=str(BACKEND_DIR), root=str(BACKEND_DIR.parent)) + code
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if cold:
+            env["PYTHONPYCACHEPREFIX"] = cache_dir
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+        )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def median_rows(samples):
+    rows = []
+    for row_samples in zip(*samples):
+        row = dict(row_samples[0])
+        if "error" not in row:
+            row["ms"] = statistics.median(r["ms"] for r in row_samples)
+            row["rss_mb"] = statistics.median(r["rss_mb"] for r in row_samples)
+        rows.append(row)
+    return rows
+
+
+def run(runs: int, budget_ms: float) -> int:
+    probe(DATASETS_PROBE, cold=False)  # populate __pycache__
+    profiles = {mode: median_rows([probe(DATASETS_PROBE, cold=mode == "cold") for _ in range(runs)])
+                for mode in ("cold", "warm")}
+
+    print(f"{'dataset':<26} {'cold (ms)':>10} {'warm (ms)':>10} {'RSS (MB)':>9}")
+    total = {"cold": 0.0, "warm": 0.0}
+    for cold_row, warm_row in zip(profiles["cold"], profiles["warm"]):
+        if "error" in warm_row:
+            print(f"{warm_row['name']:<26} {warm_row['error']}")
+            continue
+        print(f"{warm_row['name']:<26} {cold_row['ms']:>10.1f} {warm_row['ms']:>10.1f} {warm_row['rss_mb']:>9.1f}")
+        if warm_row["name"] != "framework":
+            total["cold"] += cold_row["ms"]
+            total["warm"] += warm_row["ms"]
+    print(f"{'all datasets':<26} {total['cold']:>10.1f} {total['warm']:>10.1f}")
+    print()
+
+    try:
+        server = {mode: [probe(SERVER_PROBE, cold=mode == "cold") for _ in range(runs)]
+                  for mode in ("cold", "warm")}
+    except RuntimeError as e:
+        print(f"import server failed: {e}")
+        return 2
+    cold_ms = statistics.median(s["ms"] for s in server["cold"])
+    warm_ms = statistics.median(s["ms"] for s in server["warm"])
+    loaded = server["warm"][0]["loaded"]
+    print(f"{'import server':<26} {cold_ms:>10.1f} {warm_ms:>10.1f} "
+          f"{statistics.median(s['rss_mb'] for s in server['warm']):>9.1f}")
+    print(f"datasets loaded at import: {', '.join(loaded) if loaded else 'none'}")
+
+    within_budget = warm_ms <= budget_ms
+    print(f"budget {budget_ms:.0f} ms (warm): {'OK' if within_budget else 'EXCEEDED'}")
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    args = parser.parse_args()
+    sys.exit(run(args.runs, args.budget_ms))
@@ -0,0 +1,105 @@
+"""
+Data Loader Cache Tests
+=======================
+Tests for the mtime-keyed file cache of data_loader.py.
+"""
+
+import pytest
+import sys
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import data_loader
+from data_loader import DataFileCache
+
+
+def read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestDataFileCache:
+    """Files are parsed once and reloaded when they change on disk"""
+
+    def test_hit_and_reload_on_change(self, tmp_path):
+        path = tmp_path / "corrections.json"
+        path.write_text(json.dumps({"tariff_corrections": {"v": 1}}))
+        cache = DataFileCache()
+
+        first = cache.get(path, read_json)
+        assert cache.get(path, read_json) is first
+        assert cache.stats["hits"] == 1 and cache.stats["reloads"] == 1
+
+        path.write_text(json.dumps({"tariff_corrections": {"v": 22}}))
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        assert cache.get(path, read_json)["tariff_corrections"]["v"] == 22
+        stats = cache.get_stats()["files"]["corrections.json"]
+        assert stats["reloads"] == 2 and stats["reload_ms"] >= 0
+
+    def test_one_entry_per_parser(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text("[1, 2, 3]")
+        cache = DataFileCache()
+        assert cache.get(path, read_json) == [1, 2, 3]
+        assert cache.get(path, lambda p: len(read_json(p)), "data.json (count)") == 3
+        assert set(cache.get_stats()["files"]) == {"data.json", "data.json (count)"}
+
+
+    def test_concurrent_hits_are_counted(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text("[1]")
+        cache = DataFileCache()
+        cache.get(path, read_json)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: cache.get(path, read_json), range(2000)))
+        assert cache.get_stats()["hits"] == 2000
+        assert cache.get_stats()["files"]["data.json"]["hits"] == 2000
+
+
+class TestCommerceData:
+    """Commerce profiles indexed by ISO3"""
+
+    def test_profile_lookup(self):
+        profile = data_loader.get_country_commerce_profile("nga")
+        assert profile["code"] == "NGA"
+        assert isinstance(profile["gdp_2024_billion_usd"], float)
+        assert data_loader.get_country_commerce_profile("XXX") is None
+
+    def test_profiles_are_copies(self):
+        profile = data_loader.get_country_commerce_profile("NGA")
+        profile["ratings"]["sp"] = "MODIFIED"
+        assert data_loader.get_country_commerce_profile("NGA")["ratings"]["sp"] != "MODIFIED"
+
+    def test_trade_performance_matches_frame(self):
+        df = data_loader.load_commerce_data()
+        performance = data_loader.get_all_countries_trade_performance()
+        assert [c["code"] for c in performance] == list(df["Code_ISO"])
+
+    def test_corrections_are_cached(self):
+        data_loader.get_tariff_corrections()
+        hits = data_loader.get_data_cache_stats()["files"]["zlecaf_corrections_2024.json"]["hits"]
+        assert data_loader.get_tariff_corrections() == data_loader.get_tariff_corrections()
+        assert data_loader.get_data_cache_stats()["files"]["zlecaf_corrections_2024.json"]["hits"] == hits + 2
+
+    @pytest.mark.parametrize("getter", [
+        "load_corrections_data", "get_enhanced_statistics", "get_tariff_corrections",
+        "load_customs_data", "load_infrastructure_ranking",
+    ])
+    def test_returned_data_can_be_modified(self, getter):
+        # /api/statistics met à jour trade_evolution: le cache partagé ne doit pas changer
+        load = getattr(data_loader, getter)
+        expected = load()
+        value = load()
+        if isinstance(value, dict):
+            for item in list(value.values()):
+                if isinstance(item, dict):
+                    item["modified"] = True
+            value["modified"] = True
+        else:
+            value[0]["modified"] = True
+            value.append("modified")
+        assert load() == expected
@@ -0,0 +1,72 @@
+"""
+Dataset Registry Tests
+======================
+Tests for the lazily imported dataset registry used at API startup.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from datasets import DATASETS, DatasetRegistry
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    (tmp_path / "fake_dataset.py").write_text(
+        "LOADS = 1\n"
+        "TABLE = {'CIV': 12.5}\n"
+        "def get_rate(iso3):\n"
+        "    return TABLE.get(iso3)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "fake_dataset", raising=False)
+    registry = DatasetRegistry()
+    registry.register("fake", "fake_dataset", warm=lambda module: module.TABLE.setdefault("warm", True))
+    return registry
+
+
+class TestDatasetRegistry:
+    """Tests for lazy loading through proxies"""
+
+    def test_function_proxy_imports_on_first_call(self, registry):
+        get_rate = registry.function("fake", "get_rate")
+        assert "fake_dataset" not in sys.modules
+        assert get_rate.__name__ == "get_rate"
+
+        assert get_rate("CIV") == 12.5
+        assert registry["fake"].loaded
+        assert registry["fake"].load_time is not None
+
+    def test_module_proxy(self, registry):
+        fake = registry.module("fake")
+        assert not registry["fake"].loaded
+        assert fake.TABLE["CIV"] == 12.5
+        assert registry.load("fake") is sys.modules["fake_dataset"]
+
+    def test_warm_up_runs_warm_hook(self, registry):
+        timings = registry.warm_up(registry.resolve("all"))
+        assert list(timings) == ["fake"]
+        assert sys.modules["fake_dataset"].TABLE["warm"] is True
+
+    def test_resolve(self, registry):
+        assert registry.resolve("none") == []
+        assert registry.resolve(" fake ") == ["fake"]
+        with pytest.raises(ValueError):
+            registry.resolve("fake,unknown")
+
+
+class TestRegisteredDatasets:
+    """The API registry points at importable modules"""
+
+    def test_default_warm_up_is_registered(self):
+        from datasets import DATASET_WARMUP
+        assert DATASETS.resolve(DATASET_WARMUP)
+
+    def test_hs6_warm_up_builds_search_index(self):
+        timings = DATASETS.warm_up(["hs6_database"])
+        assert "hs6_database" in timings
+        assert DATASETS.load("hs6_database")._search_index is not None
@@ -0,0 +1,147 @@
+"""
+Enrichment Cache Tests
+======================
+Tests for the background World Bank / OEC enrichment cache.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import Mock
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services import enrichment_cache as enrichment_module
+from services.enrichment_cache import EnrichmentCache, MAX_FETCH_ATTEMPTS, WB_INDICATORS
+
+
+def make_cache():
+    wb_client = Mock()
+    wb_client.fetch_indicator.side_effect = lambda country, indicator: {"value": 1.0, "date": "2023"}
+    oec_client = Mock()
+    oec_client.fetch_top_producers.side_effect = lambda hs4, year: [
+        {"country_code": "CIV", "country_name": "Côte d'Ivoire", "export_value": 10, "year": year}
+    ]
+    return EnrichmentCache(wb_client, oec_client), wb_client, oec_client
+
+
+class TestEnrichmentCache:
+    """Tests for the enrichment cache"""
+
+    def test_miss_returns_empty_without_fetching(self):
+        cache, wb_client, oec_client = make_cache()
+        producers, status = cache.get_top_producers("180100")
+        data, wb_status = cache.get_country_data(["CIV"])
+
+        assert producers == []
+        assert status["status"] == "missing"
+        assert data == {"CIV": {}}
+        assert wb_status["CIV"]["status"] == "missing"
+        oec_client.fetch_top_producers.assert_not_called()
+        wb_client.fetch_indicator.assert_not_called()
+
+    def test_refresh_fills_requested_keys(self):
+        cache, wb_client, oec_client = make_cache()
+        cache.get_top_producers("180100")
+        cache.get_country_data(["CIV"])
+
+        refreshed = asyncio.run(cache.refresh())
+        assert refreshed == 1 + len(WB_INDICATORS)
+        oec_client.fetch_top_producers.assert_called_once_with("1801", 2021)
+
+        producers, status = cache.get_top_producers("1801")
+        data, wb_status = cache.get_country_data(["CIV"])
+        assert producers[0]["country_code"] == "CIV"
+        assert status["status"] == "fresh"
+        assert status["age_seconds"] == 0
+        assert set(data["CIV"]) == set(WB_INDICATORS)
+        assert wb_status["CIV"]["status"] == "fresh"
+
+    def test_failed_refresh_keeps_last_value(self):
+        cache, _, oec_client = make_cache()
+        cache.get_top_producers("1801")
+        asyncio.run(cache.refresh())
+
+        oec_client.fetch_top_producers.side_effect = RuntimeError("OEC down")
+        asyncio.run(cache.refresh([("oec", "1801", 2021)]))
+
+        producers, _ = cache.get_top_producers("1801")
+        assert producers[0]["country_code"] == "CIV"
+        assert cache.get_stats()["fetch_errors"] == 1
+
+    def test_expired_entries_are_due(self):
+        cache, _, _ = make_cache()
+        cache.get_top_producers("1801")
+        asyncio.run(cache.refresh())
+        value, fetched_at = cache._entries[("oec", "1801", 2021)]
+        cache._entries[("oec", "1801", 2021)] = (value, fetched_at - 365 * 24 * 3600)
+
+        _, status = cache.get_top_producers("1801")
+        assert status["status"] == "stale"
+        assert ("oec", "1801", 2021) in cache._due_keys()
+
+    def test_pending_keys_are_capped(self, monkeypatch):
+        monkeypatch.setattr(enrichment_module, "MAX_PENDING", 3)
+        cache, _, _ = make_cache()
+        for hs4 in ("0101", "0102", "0103", "0104", "0105"):
+            cache.get_top_producers(hs4)
+        cache.get_top_producers("0101")
+        stats = cache.get_stats()
+        assert stats["pending"] == 3
+        assert stats["dropped"] == 2
+
+    def test_failed_keys_back_off_then_are_dropped(self):
+        cache, _, oec_client = make_cache()
+        oec_client.fetch_top_producers.side_effect = RuntimeError("OEC down")
+        key = ("oec", "1801", 2021)
+        cache.get_top_producers("1801")
+
+        for attempt in range(1, MAX_FETCH_ATTEMPTS + 1):
+            assert asyncio.run(cache.refresh()) == 0
+            assert oec_client.fetch_top_producers.call_count == attempt
+            # Pas de nouvelle tentative avant la fin du délai, même après d'autres absences
+            cache.get_top_producers("1801")
+            assert cache._due_keys() == []
+            assert asyncio.run(cache.refresh()) == 0
+            assert oec_client.fetch_top_producers.call_count == attempt
+            attempts, retry_at = cache._failures[key]
+            cache._failures[key] = (attempts, retry_at - 365 * 24 * 3600)
+
+        # Abandonnée après MAX_FETCH_ATTEMPTS échecs, puis oubliée à l'expiration du délai
+        assert key not in cache._pending
+        assert cache._due_keys() == []
+        assert key not in cache._failures
+
+        oec_client.fetch_top_producers.side_effect = None
+        oec_client.fetch_top_producers.return_value = []
+        cache.get_top_producers("1801")
+        assert asyncio.run(cache.refresh()) == 1
+        assert key not in cache._failures
+
+    def test_miss_during_refresh_wakes_the_loop(self, monkeypatch):
+        monkeypatch.setattr(enrichment_module, "REFRESH_INTERVAL", 60)
+        cache, _, _ = make_cache()
+        calls = []
+
+        async def refresh(keys=None):
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                # Nouvelle clé demandée pendant l'actualisation
+                cache.get_top_producers("1801")
+            return 0
+
+        cache.refresh = refresh
+
+        async def run():
+            cache.start()
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if len(calls) >= 2:
+                    break
+            await cache.stop()
+
+        asyncio.run(run())
+        assert len(calls) == 2
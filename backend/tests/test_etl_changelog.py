@@ -0,0 +1,119 @@
+"""
+ETL Change Log Tests
+====================
+Tests for the append-only, segmented ETL change log.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from etl.etl_changelog import EtlChangeLog, LEGACY_LOG_FILE
+
+
+def _entries(run: int, ports=("P1", "P2", "P3")):
+    return [
+        {
+            "timestamp": f"2025-01-0{run}T10:00:0{i}+00:00",
+            "port_id": port,
+            "field": "trs_analysis",
+            "old_value": run - 1,
+            "new_value": run,
+            "source": "WCO",
+        }
+        for i, port in enumerate(ports)
+    ]
+
+
+@pytest.fixture
+def changelog(tmp_path):
+    return EtlChangeLog(tmp_path / "etl_log", legacy_file=None)
+
+
+class TestEtlChangeLog:
+    """Tests for append, tail, per-port lookups and compaction"""
+
+    def test_empty(self, changelog):
+        assert changelog.last_run() is None
+        assert changelog.tail(10) == []
+        assert changelog.port_changes("P1") == []
+        assert changelog.total_entries() == 0
+
+    def test_append_run(self, changelog):
+        first = changelog.append_run(_entries(1), run_id="r1")
+        second = changelog.append_run(_entries(2), run_id="r2")
+        assert first["entries"] == 3
+        assert changelog.last_run() == second
+        assert [r["run_id"] for r in changelog.runs()] == ["r2", "r1"]
+        assert changelog.total_entries() == 6
+        assert [e["new_value"] for e in changelog.run_entries(first)] == [1, 1, 1]
+        assert [e["new_value"] for e in changelog.run_entries(second)] == [2, 2, 2]
+
+    def test_segments_are_append_only(self, changelog):
+        changelog.append_run(_entries(1), run_id="r1")
+        segment = changelog.root / changelog.index()["segments"][0]["name"]
+        before = segment.read_bytes()
+        changelog.append_run(_entries(2), run_id="r2")
+        assert segment.read_bytes().startswith(before)
+
+    def test_tail(self, changelog):
+        changelog.append_run(_entries(1), run_id="r1")
+        changelog.append_run(_entries(2), run_id="r2")
+        tail = changelog.tail(4)
+        assert [(e["run_id"], e["port_id"]) for e in tail] == [
+            ("r1", "P3"), ("r2", "P1"), ("r2", "P2"), ("r2", "P3"),
+        ]
+
+    def test_port_changes(self, changelog):
+        changelog.append_run(_entries(1), run_id="r1")
+        changelog.append_run(_entries(2, ports=("P1",)), run_id="r2")
+        changes = changelog.port_changes("P1")
+        assert [(e["run_id"], e["new_value"]) for e in changes] == [("r1", 1), ("r2", 2)]
+        assert changelog.port_changes("P1", limit=1)[0]["run_id"] == "r2"
+        assert changelog.port_changes("unknown") == []
+
+    def test_rotation(self, tmp_path):
+        changelog = EtlChangeLog(tmp_path / "etl_log", legacy_file=None, segment_max_bytes=200)
+        for run in range(1, 6):
+            changelog.append_run(_entries(run), run_id=f"r{run}")
+        index = changelog.index()
+        assert len(index["segments"]) > 1
+        assert sum(s["entries"] for s in index["segments"]) == 15
+        assert [e["run_id"] for e in changelog.tail(4)] == ["r4", "r5", "r5", "r5"]
+        assert [e["run_id"] for e in changelog.port_changes("P2")] == ["r1", "r2", "r3", "r4", "r5"]
+        assert len(changelog.run_entries(changelog.last_run())) == 3
+
+    def test_compact(self, tmp_path):
+        changelog = EtlChangeLog(tmp_path / "etl_log", legacy_file=None, segment_max_bytes=200)
+        for run in range(1, 6):
+            changelog.append_run(_entries(run), run_id=f"r{run}")
+        old = {s["name"] for s in changelog.index()["segments"]}
+        index = changelog.compact(keep_entries=4)
+        assert index["total_entries"] == 4
+        assert [r["run_id"] for r in changelog.runs()] == ["r5", "r4"]
+        assert [e["run_id"] for e in changelog.port_changes("P3")] == ["r4", "r5"]
+        assert not any((changelog.root / name).exists() for name in old)
+        changelog.append_run(_entries(6), run_id="r6")
+        assert changelog.total_entries() == 7
+        assert changelog.tail(1)[0]["run_id"] == "r6"
+
+    def test_legacy_import(self, tmp_path):
+        legacy = tmp_path / "etl_log.json"
+        legacy.write_text(json.dumps(_entries(1) + _entries(2)), encoding="utf-8")
+        changelog = EtlChangeLog(tmp_path / "etl_log", legacy_file=legacy)
+        assert changelog.total_entries() == 6
+        assert len(changelog.runs()) == 2
+        assert changelog.last_run()["timestamp"] == "2025-01-02T10:00:02+00:00"
+        assert json.loads(legacy.read_text(encoding="utf-8")) == _entries(1) + _entries(2)
+
+    def test_repository_legacy_log(self, tmp_path):
+        with open(LEGACY_LOG_FILE, "r", encoding="utf-8") as f:
+            legacy = json.load(f)
+        changelog = EtlChangeLog(tmp_path / "etl_log", legacy_file=LEGACY_LOG_FILE)
+        assert changelog.total_entries() == len(legacy)
+        assert changelog.tail(1)[0]["timestamp"] == legacy[-1]["timestamp"]
+        assert changelog.last_run()["timestamp"] == legacy[-1]["timestamp"]
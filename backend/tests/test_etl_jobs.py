@@ -0,0 +1,203 @@
+"""
+ETL Jobs Tests
+==============
+Tests for the background ETL job runner and the /api/etl/run, /api/etl/jobs routes.
+"""
+
+import importlib.util
+import json
+import threading
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BACKEND_DIR)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from etl import ports_etl
+from etl.etl_jobs import EtlJobRunner, FAILED, RUNNING, SUCCEEDED
+
+
+@pytest.fixture
+def runner():
+    runner = EtlJobRunner(max_workers=2)
+    yield runner
+    runner.shutdown()
+
+
+def _blocking_task(release: threading.Event, started: threading.Event):
+    def task(progress):
+        started.set()
+        progress("step", 50, "moitié")
+        release.wait(5)
+        return {"ok": True}
+    return task
+
+
+class TestEtlJobRunner:
+    """Tests for single-flight submission, progress events and failures"""
+
+    def test_success_and_events(self, runner):
+        job, created = runner.submit("ports", lambda progress: progress("a", 40) or 42)
+        assert created
+        assert job.wait(5)
+        assert job.status == SUCCEEDED
+        assert job.result == 42
+        assert job.progress == 100
+        events = job.events_since(0)
+        assert [e["status"] for e in events] == ["queued", RUNNING, RUNNING, SUCCEEDED]
+        assert [e["seq"] for e in events] == [0, 1, 2, 3]
+        assert events[2]["step"] == "a" and events[2]["progress"] == 40
+
+    def test_single_flight_per_dataset(self, runner):
+        release, started = threading.Event(), threading.Event()
+        first, created = runner.submit("ports", _blocking_task(release, started))
+        assert created and started.wait(5)
+        again, created_again = runner.submit("ports", lambda progress: None)
+        assert again is first and not created_again
+        assert runner.active("ports") is first
+
+        other, created_other = runner.submit("airports", lambda progress: "air")
+        assert created_other and other is not first
+        assert other.wait(5) and other.result == "air"
+
+        release.set()
+        assert first.wait(5)
+        assert runner.active("ports") is None
+        second, created = runner.submit("ports", lambda progress: None)
+        assert created and second is not first
+        assert second.wait(5)
+
+    def test_failure(self, runner):
+        def task(progress):
+            raise ValueError("boom")
+        job, _ = runner.submit("ports", task)
+        assert job.wait(5)
+        assert job.status == FAILED
+        assert job.error == "boom"
+        assert job.events_since(0)[-1]["message"] == "Erreur ETL: boom"
+        assert runner.active("ports") is None
+
+    def test_events_since_waits(self, runner):
+        release, started = threading.Event(), threading.Event()
+        job, _ = runner.submit("ports", _blocking_task(release, started))
+        assert started.wait(5)
+        seen = len(job.events_since(0))
+        assert job.events_since(seen, timeout=0.05) == []
+        release.set()
+        assert job.events_since(seen, timeout=5)[-1]["status"] == SUCCEEDED
+
+    def test_history_is_bounded(self):
+        runner = EtlJobRunner(max_workers=1, history=3)
+        try:
+            for _ in range(6):
+                job, _ = runner.submit("ports", lambda progress: None)
+                job.wait(5)
+            assert len(runner.jobs(10)) <= 4
+            assert runner.jobs(1)[0] is job
+        finally:
+            runner.shutdown()
+
+
+class TestPortsEtlSave:
+    """Tests for the atomic replacement of the ports file"""
+
+    def test_save_ports_atomic(self, tmp_path, monkeypatch):
+        ports_file = tmp_path / "ports_africains.json"
+        ports_file.write_text("[]", encoding="utf-8")
+        monkeypatch.setattr(ports_etl, "PORTS_FILE", ports_file)
+        etl = ports_etl.PortsETL()
+        etl.ports = [{"port_id": "P1"}]
+        etl._save_ports()
+        assert json.loads(ports_file.read_text(encoding="utf-8")) == [{"port_id": "P1"}]
+        assert [p.name for p in tmp_path.iterdir()] == ["ports_africains.json"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # routes/__init__.py importe tous les routeurs: charger uniquement etl.py
+    spec = importlib.util.spec_from_file_location("etl_routes", os.path.join(BACKEND_DIR, "routes", "etl.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    runner = EtlJobRunner()
+    monkeypatch.setattr(module, "ETL_JOBS", runner)
+    app = FastAPI()
+    app.include_router(module.router, prefix="/api")
+    yield module, TestClient(app)
+    runner.shutdown()
+
+
+class TestEtlRoutes:
+    """Tests for the job-based ETL endpoints"""
+
+    def test_run_returns_job(self, client, monkeypatch):
+        module, http = client
+        monkeypatch.setattr(module, "_run_ports_etl", lambda progress: progress("trs", 10) or {"trs_updated": 4})
+        response = http.post("/api/etl/run")
+        assert response.status_code == 202
+        body = response.json()
+        assert body["created"] is True
+        job = module.ETL_JOBS.get(body["job_id"])
+        assert job.wait(5)
+
+        status = http.get(body["status_url"]).json()
+        assert status["status"] == SUCCEEDED
+        assert status["result"] == {"trs_updated": 4}
+        assert status["events"][-1]["status"] == SUCCEEDED
+
+        jobs = http.get("/api/etl/jobs").json()
+        assert jobs["active"] == {}
+        assert jobs["jobs"][0]["job_id"] == body["job_id"]
+
+    def test_run_wait(self, client, monkeypatch):
+        module, http = client
+        monkeypatch.setattr(module, "_run_ports_etl", lambda progress: {"trs_updated": 4})
+        response = http.post("/api/etl/run", params={"wait": True})
+        assert response.status_code == 200
+        assert response.json()["status"] == "success"
+        assert response.json()["details"] == {"trs_updated": 4}
+
+    def test_run_wait_failure(self, client, monkeypatch):
+        module, http = client
+
+        def fail(progress):
+            raise RuntimeError("fichier absent")
+        monkeypatch.setattr(module, "_run_ports_etl", fail)
+        response = http.post("/api/etl/run", params={"wait": True})
+        assert response.status_code == 500
+        assert "fichier absent" in response.json()["detail"]
+
+    def test_concurrent_run_joins_active_job(self, client, monkeypatch):
+        module, http = client
+        release, started = threading.Event(), threading.Event()
+        monkeypatch.setattr(module, "_run_ports_etl", _blocking_task(release, started))
+        first = http.post("/api/etl/run").json()
+        assert started.wait(5)
+        second = http.post("/api/etl/run").json()
+        assert second["job_id"] == first["job_id"]
+        assert second["created"] is False
+        assert http.get("/api/etl/jobs").json()["active"] == {"ports": first["job_id"]}
+        release.set()
+
+    def test_events_stream(self, client, monkeypatch):
+        module, http = client
+        monkeypatch.setattr(module, "_run_ports_etl", lambda progress: progress("lpi", 40, "LPI") or {})
+        body = http.post("/api/etl/run").json()
+        response = http.get(body["events_url"])
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [json.loads(line[len("data: "):]) for line in response.text.splitlines() if line.startswith("data: ")]
+        assert events[-1]["status"] == SUCCEEDED
+        assert any(e["step"] == "lpi" for e in events)
+
+        resumed = http.get(body["events_url"], params={"last_event_id": events[-2]["seq"]})
+        assert resumed.text.count("data: ") == 1
+
+    def test_unknown_job(self, client):
+        _, http = client
+        assert http.get("/api/etl/jobs/unknown").status_code == 404
+        assert http.get("/api/etl/jobs/unknown/events").status_code == 404
@@ -70,9 +70,16 @@ def mock_db():
         def sort(self, *args, **kwargs):
             return self
 
+        def batch_size(self, size):
+            return self
+
         async def to_list(self, length=None):
             return self.data_list
 
+        async def __aiter__(self):
+            for data in self.data_list:
+                yield data
+
     def mock_find(*args, **kwargs):
         query = args[0] if args else {}
         country = query.get('country_code')
@@ -152,6 +159,54 @@ class TestExportTariffsCSV:
         assert response.status_code == 404
 
 
+    @pytest.mark.asyncio
+    async def test_export_csv_all_imports_streamed(self, mock_db):
+        """Test CSV export with latest=false streams every import"""
+        class LargeCursor:
+            def __init__(self):
+                self.projection = None
+
+            def sort(self, *args, **kwargs):
+                return self
+
+            def batch_size(self, size):
+                return self
+
+            async def __aiter__(self):
+                for i in range(5):
+                    yield {
+                        "country_code": "KE",
+                        "imported_at": f"2024-01-0{i + 1}T00:00:00Z",
+                        "tariffs": {"tariff_lines": [
+                            {"hs_code": f"{n:06d}", "description": "Ligne, avec virgule", "customs_duty": "10%"}
+                            for n in range(1000)
+                        ]},
+                    }
+
+        cursor = LargeCursor()
+
+        def mock_find(query, projection=None):
+            cursor.projection = projection
+            return cursor
+
+        mock_db["customs_data"].find = mock_find
+        init_db(mock_db)
+
+        from fastapi import FastAPI
+        app = FastAPI()
+        app.include_router(router)
+        response = TestClient(app).get("/api/export/tariffs/csv?country=KE&latest=false")
+        assert response.status_code == 200
+
+        df = pd.read_csv(io.StringIO(response.text), dtype=str)
+        assert len(df) == 5000
+        assert list(df.columns) == ["country", "hs_code", "description", "unit", "customs_duty", "vat", "source", "date"]
+        assert df["description"].iloc[0] == "Ligne, avec virgule"
+        assert df["date"].nunique() == 5
+        # seuls les champs exportés sont lus
+        assert cursor.projection["tariffs.tariff_lines"] == 1
+
+
 class TestExportTariffsExcel:
     """Test Excel export endpoint"""
 
@@ -185,6 +240,66 @@ class TestExportTariffsExcel:
         df = df_dict["KE"]
         assert "HS Code" in df.columns
         assert "Description" in df.columns
+        assert df["Customs Duty"].tolist() == ["10%", "25%"]
+
+    @pytest.mark.asyncio
+    async def test_export_excel_no_data(self, mock_db):
+        """Test Excel export when no country has data"""
+        async def mock_find_one_none(*args, **kwargs):
+            return None
+
+        mock_db["customs_data"].find_one = mock_find_one_none
+        init_db(mock_db)
+
+        from fastapi import FastAPI
+        app = FastAPI()
+        app.include_router(router)
+        response = TestClient(app).get("/api/export/tariffs/excel?countries=XX")
+        assert response.status_code == 404
+
+
+class TestExportTariffsColumnar:
+    """Test Parquet and Arrow IPC export endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_export_parquet_typed_columns(self, client_with_mock_db):
+        """Test Parquet export has typed rate and date columns"""
+        import pyarrow.parquet as pq
+
+        response = client_with_mock_db.get("/api/export/tariffs/parquet?countries=KE,TZ")
+        assert response.status_code == 200
+        assert ".parquet" in response.headers["content-disposition"]
+
+        table = pq.read_table(io.BytesIO(response.content))
+        assert table.num_rows == 4
+        assert str(table.schema.field("customs_duty").type) == "double"
+        assert str(table.schema.field("date").type) == "timestamp[us, tz=UTC]"
+        df = table.to_pandas()
+        assert df["customs_duty"].tolist() == [10.0, 25.0, 10.0, 25.0]
+        assert df["vat_text"].iloc[0] == "16%"
+        assert df["country"].tolist() == ["KE", "KE", "TZ", "TZ"]
+        assert df["date"].iloc[0] == pd.Timestamp("2024-01-01", tz="UTC")
+
+    @pytest.mark.asyncio
+    async def test_export_arrow_stream(self, client_with_mock_db):
+        """Test Arrow IPC stream export (all imports)"""
+        import pyarrow.ipc as ipc
+
+        response = client_with_mock_db.get("/api/export/tariffs/arrow?countries=KE&latest=false")
+        assert response.status_code == 200
+        assert "arrow" in response.headers["content-type"]
+
+        table = ipc.open_stream(response.content).read_all()
+        assert table.num_rows == 2
+        assert table.column("hs_code").to_pylist() == ["010110", "010120"]
+        assert table.column("vat").to_pylist() == [16.0, 16.0]
+
+    def test_rate_parsing(self):
+        """Test rate text to float conversion"""
+        from backend.routers.export_router import _rate
+
+        values = ["10%", "2,5 %", 16, "Exempt", None, float("nan"), "5% + 100 FCFA/kg", "10%"]
+        assert _rate(values).to_pylist() == [10.0, 2.5, 16.0, None, None, None, 5.0, 10.0]
 
 
 class TestValidationReportJSON:
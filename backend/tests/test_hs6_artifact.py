@@ -0,0 +1,81 @@
+"""
+HS6 Artifact Tests
+==================
+Tests for the compiled, lazily loaded HS6 database artifact.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from etl.hs6_artifact import HS6_ARTIFACT_PATH, HS6Artifact, build_artifact
+from etl.hs6_compile import merge_sources
+from etl.hs6_database import HS6_DATABASE, SUB_POSITION_TYPES, get_hs6_info, get_database_stats
+
+
+@pytest.fixture(scope="module")
+def sources():
+    return merge_sources()
+
+
+class TestHS6Artifact:
+    """Tests for the compiled HS6 database"""
+
+    def test_artifact_is_up_to_date(self, sources):
+        # Recompile with `python -m etl.hs6_compile` if this fails
+        assert HS6_ARTIFACT_PATH.read_bytes() == build_artifact(*sources)
+
+    def test_records_match_sources(self, sources):
+        records, sub_position_types = sources
+        assert list(HS6_DATABASE) == list(records)
+        assert dict(HS6_DATABASE.items()) == records
+        assert dict(SUB_POSITION_TYPES) == sub_position_types
+
+    def test_read_only_mapping(self):
+        assert "870323" in HS6_DATABASE
+        assert "000000" not in HS6_DATABASE
+        assert HS6_DATABASE.get("000000") is None
+        with pytest.raises(TypeError):
+            HS6_DATABASE["870323"] = {}
+        # Records are rebuilt on each access: mutating one does not leak
+        HS6_DATABASE["870323"]["category"] = "changed"
+        assert HS6_DATABASE["870323"]["category"] != "changed"
+
+    def test_lazy_loading(self, tmp_path, sources):
+        path = tmp_path / "hs6.bin"
+        path.write_bytes(build_artifact(*sources))
+        artifact = HS6Artifact(path)
+        assert not artifact._loaded
+        assert artifact.records["010110"]["chapter"] == "01"
+        assert artifact._loaded
+
+    def test_schema_validation(self):
+        with pytest.raises(ValueError):
+            build_artifact({"010110": {"chapter": "01"}}, {})
+
+    def test_accessors(self):
+        info = get_hs6_info("8703230000", "en")
+        assert info["code"] == "870323"
+        assert info["chapter"] == "87"
+        stats = get_database_stats()
+        assert stats["total_codes"] == len(HS6_DATABASE)
+        assert sum(stats["categories"].values()) == len(HS6_DATABASE)
+
+    @pytest.mark.parametrize("name", ["code", "description_en", "category", "has_sub_positions", "regional_content"])
+    def test_columns(self, sources, name):
+        records, _ = sources
+
+        def value(code):
+            if name == "code":
+                return code
+            if name == "regional_content":
+                return records[code]["rule_of_origin"]["regional_content"]
+            return records[code][name]
+
+        assert HS6_DATABASE.column(name) == [value(code) for code in records]
+        for prefix in ("87", "8703", "01", "99", "870323", ""):
+            assert HS6_DATABASE.column(name, prefix) == [value(code) for code in sorted(records)
+                                                         if code.startswith(prefix)]
@@ -0,0 +1,84 @@
+"""
+HS Search Index Tests
+=====================
+Tests for the shared inverted index behind the HS code search endpoints.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from etl.hs_search_index import HSSearchIndex, fold
+from etl.hs6_database import HS6_DATABASE, get_hs6_search_index, search_hs6_codes
+from etl.hs6_tariffs import search_hs6_tariffs
+from etl.country_hs6_tariffs import search_country_hs6_tariffs
+
+
+@pytest.fixture
+def index():
+    return HSSearchIndex([
+        ("090111", {"fr": "Café non torréfié", "en": "Coffee, not roasted", "category": "coffee"}),
+        ("090121", {"fr": "Café torréfié", "en": "Coffee, roasted", "category": "coffee"}),
+        ("151110", {"fr": "Huile de palme brute", "en": "Crude palm oil", "category": "oils"}),
+        ("210111", {"fr": "Extraits de café", "en": "Coffee extracts", "category": "food"}),
+        ("870323", {"fr": "Voitures essence 1500-3000cm3", "en": "Petrol cars 1500-3000cc", "category": "vehicles"}),
+    ])
+
+
+class TestHSSearchIndex:
+    """Tests for indexing and ranking"""
+
+    def test_fold_removes_accents(self):
+        assert fold("Café Torréfié") == "cafe torrefie"
+
+    def test_accent_insensitive(self, index):
+        assert index.search("cafe") == index.search("café") == ["090111", "090121", "210111"]
+
+    def test_code_exact_and_prefix(self, index):
+        assert index.search("870323") == ["870323"]
+        assert index.search("0901") == ["090111", "090121"]
+
+    def test_partial_match_inside_word(self, index):
+        assert index.search("orrefi") == ["090111", "090121"]
+
+    def test_requested_language_ranked_first(self, index):
+        # "oil" only appears in the English label; "oils" in the category
+        assert index.search("oil", language="en") == ["151110"]
+        assert index.search("coffee", language="en")[:2] == ["090111", "090121"]
+
+    def test_words_in_any_order(self, index):
+        assert index.search("palme huile") == ["151110"]
+        assert index.search("huile de palme") == ["151110"]
+
+    def test_limit_and_empty_query(self, index):
+        assert len(index.search("caf", limit=1)) == 1
+        assert index.search("   ") == []
+
+
+class TestHS6DatabaseSearch:
+    """The index covers every result of the former substring search"""
+
+    @pytest.mark.parametrize("query", ["café", "8703", "riz", "textiles", "lait"])
+    def test_superset_of_substring_search(self, query):
+        q = fold(query)
+        expected = {
+            code for code, info in HS6_DATABASE.items()
+            if q in code
+            or q in fold(info.get("description_fr", ""))
+            or q in fold(info.get("description_en", ""))
+            or q in fold(info.get("category", ""))
+        }
+        assert expected <= set(get_hs6_search_index().search(query, limit=None))
+
+    def test_search_hs6_codes_format(self):
+        results = search_hs6_codes("870323", "en", 5)
+        assert results[0]["code"] == "870323"
+        assert set(results[0]) == {"code", "description", "category", "sensitivity", "has_sub_positions"}
+
+    def test_tariff_searches(self):
+        assert search_hs6_tariffs("cacao")[0]["code"] == "180100"
+        assert search_country_hs6_tariffs("NG", "rice", "en")[0]["hs6_code"].startswith("1006")
+        assert search_country_hs6_tariffs("XX", "rice") == []
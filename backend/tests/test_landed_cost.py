@@ -0,0 +1,144 @@
+"""
+Landed Cost Tests
+=================
+Tests for the composite landed cost service and the /api/landed-cost endpoint.
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+
+import pytest
+
+# Add backend directory to path for imports
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BACKEND_DIR)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from services import landed_cost_service as service_module
+from services.landed_cost_service import INSURANCE_RATE, landed_cost_service
+from services.tariff_batch_service import batch_tariff_engine
+
+
+def compute(*args, **kwargs):
+    return asyncio.run(landed_cost_service.compute(*args, **kwargs))
+
+
+class TestLandedCostService:
+    """Pricing combines the route freight with the tariff engine"""
+
+    def test_matches_batch_engine_on_cif_value(self):
+        result = compute("CIV", "NER", "100630", 10000, weight_tonnes=20)
+        logistics = result["logistics"]
+        assert logistics["route_found"]
+        assert logistics["freight_cost"] == pytest.approx(result["route"]["cost_usd_per_tonne"] * 20, abs=0.01)
+        assert logistics["insurance_cost"] == pytest.approx((10000 + logistics["freight_cost"]) * INSURANCE_RATE,
+                                                            abs=0.01)
+
+        lines, _ = batch_tariff_engine.calculate([{
+            "origin_country": "CIV", "destination_country": "NER", "hs_code": "100630",
+            "value": logistics["cif_value"]
+        }])
+        line = lines[0]
+        assert result["tariff"]["normal_rate"] == line["normal_tariff_rate"]
+        assert result["tariff"]["zlecaf_rate"] == line["zlecaf_tariff_rate"]
+        assert result["normal"]["landed_cost"] == pytest.approx(line["normal_total_cost"], abs=0.05)
+        assert result["zlecaf"]["landed_cost"] == pytest.approx(line["zlecaf_total_cost"], abs=0.05)
+        assert result["normal"]["other_taxes_total"] == pytest.approx(line["other_taxes_total"], abs=0.05)
+        assert result["tariff"]["transition_period"] == line["transition_period"]
+
+    def test_timings(self):
+        result = compute("KEN", "RWA", "8471300000", 5000, alternatives=3)
+        assert set(result["timings_ms"]) == {"rates", "taxes", "route", "pricing"}
+        assert result["computation_time_ms"] >= max(result["timings_ms"].values())
+        assert len(result["alternatives"]) == 2
+        assert result["tariff"]["tariff_precision"] in ("sub_position", "hs6_country", "chapter")
+
+    def test_mode_filter(self):
+        result = compute("MAR", "ZAF", "0901", 1000, mode="sea")
+        assert result["route"]["modes"] == ["sea"]
+        result = compute("MAR", "ZAF", "0901", 1000, mode="air", route_metric="time")
+        assert "air" in result["route"]["modes"]
+
+    @pytest.mark.parametrize("mode, main_modes", [("air", {"air"}), ("rail", {"rail", "multimodal"})])
+    def test_requested_mode_is_enforced(self, mode, main_modes):
+        # Itinéraire dans le mode demandé (la route n'est admise qu'en pré/post-acheminement), sinon aucun
+        result = compute("CIV", "NGA", "100630", 10000, weight_tonnes=2, mode=mode, alternatives=3)
+        routes = [result["route"]] + result["alternatives"] if result["route"] else []
+        for route in routes:
+            assert set(route["modes"]) & main_modes
+        if result["route"]:
+            assert all(leg["mode"] in main_modes | {"access", "port", "airport"} for leg in result["route"]["legs"])
+        else:
+            assert not result["logistics"]["route_found"]
+            assert result["logistics"]["freight_cost"] == 0
+            assert mode in result["logistics"]["note"]
+
+    def test_domestic_shipment(self):
+        result = compute("MAR", "MA", "0901", 1000)
+        assert result["route"] is None
+        assert result["logistics"]["freight_cost"] == 0
+        assert result["logistics"]["note"] is None
+        assert result["logistics"]["cif_value"] == pytest.approx(1000 * (1 + INSURANCE_RATE))
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            compute("FRA", "NER", "100630", 100)
+        with pytest.raises(ValueError):
+            compute("CIV", "NER", "100630", 100, mode="teleport")
+
+    def test_stages_run_concurrently(self, monkeypatch):
+        def slow(result):
+            def fn(*args):
+                time.sleep(0.2)
+                return result
+            return fn
+
+        rates = batch_tariff_engine.resolve_line_rate("NER", "100630")
+        taxes = service_module._country_taxes("NER", "100630")
+        monkeypatch.setattr(batch_tariff_engine, "resolve_line_rate", slow(rates))
+        monkeypatch.setattr(service_module, "_country_taxes", slow(taxes))
+        monkeypatch.setattr(service_module, "_routes", slow([]))
+        start = time.perf_counter()
+        result = compute("CIV", "NER", "100630", 100)
+        assert time.perf_counter() - start < 0.5
+        assert all(result["timings_ms"][stage] >= 190 for stage in ("rates", "taxes", "route"))
+        assert result["logistics"]["note"] == "Aucun itinéraire trouvé: fret non inclus"
+
+
+@pytest.fixture
+def client():
+    # routes/__init__.py importe tous les routeurs: charger uniquement landed_cost.py
+    spec = importlib.util.spec_from_file_location("landed_cost_routes",
+                                                  os.path.join(BACKEND_DIR, "routes", "landed_cost.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    app = FastAPI()
+    app.include_router(module.router, prefix="/api")
+    return TestClient(app)
+
+
+class TestLandedCostEndpoint:
+    """POST /api/landed-cost"""
+
+    def test_landed_cost(self, client):
+        response = client.post("/api/landed-cost", json={
+            "origin_country": "SEN", "destination_country": "MLI", "hs_code": "1006.30",
+            "value": 25000, "weight_tonnes": 10, "mode": "road"
+        })
+        assert response.status_code == 200
+        body = response.json()
+        assert body["hs6_code"] == "100630"
+        assert body["route"]["legs"]
+        assert body["zlecaf"]["landed_cost"] <= body["normal"]["landed_cost"]
+        assert body["logistics"]["cif_value"] > 25000
+
+    def test_errors(self, client):
+        base = {"origin_country": "SEN", "destination_country": "MLI", "hs_code": "100630", "value": 100}
+        assert client.post("/api/landed-cost", json={**base, "origin_country": "FRA"}).status_code == 400
+        assert client.post("/api/landed-cost", json={**base, "mode": "teleport"}).status_code == 422
+        assert client.post("/api/landed-cost", json={**base, "weight_tonnes": 0}).status_code == 422
@@ -0,0 +1,281 @@
+"""
+Logistics Graph Tests
+=====================
+Tests for the multimodal graph and the /api/logistics/route endpoint.
+"""
+
+import importlib.util
+import math
+import os
+import sys
+
+import pytest
+
+# Add backend directory to path for imports
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BACKEND_DIR)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from logistics_graph import LogisticsGraph, find_routes, get_graph
+
+
+PORTS = [
+    {"port_id": "AAA-P1", "port_name": "Port Un", "country_iso": "AAA", "un_locode": "AAPUN",
+     "geo_lat": 0.0, "geo_lon": 0.0},
+    {"port_id": "BBB-P2", "port_name": "Port Deux", "country_iso": "BBB", "un_locode": "BBPDX",
+     "geo_lat": 0.0, "geo_lon": 5.0},
+    {"port_id": "CCC-P3", "port_name": "Port Trois", "country_iso": "CCC", "geo_lat": 3.0, "geo_lon": 2.0},
+]
+AIRPORTS = [
+    {"airport_id": "AAA-A1", "airport_name": "Aéroport Un", "country_iso": "AAA", "iata_code": "AUN",
+     "geo_lat": 1.0, "geo_lon": 0.5},
+    {"airport_id": "DDD-A2", "airport_name": "Aéroport Deux", "country_iso": "DDD", "iata_code": "ADX",
+     "geo_lat": 4.0, "geo_lon": 6.0},
+]
+CORRIDORS = [
+    {"corridor_id": "CORR-1", "corridor_type": "road", "length_km": 900, "start_node": "Port Un",
+     "end_node": "Ville D", "coordinates": [[0.0, 0.0], [4.1, 6.0]],
+     "stats": {"avg_transit_time_hours": 30, "avg_border_crossing_time_hours": 10},
+     "nodes": [{"node_id": "N-B1", "node_name": "Frontière", "node_type": "border_crossing",
+                "country_iso": "AAA", "geo_lat": 2.0, "geo_lon": 3.0, "is_osbp": True}]},
+]
+
+
+@pytest.fixture(scope="module")
+def small():
+    return LogisticsGraph(PORTS, AIRPORTS, CORRIDORS, airport_hubs=["AAA-A1"])
+
+
+def _simple_paths(graph, source, target, metric, modes=None):
+    """All loopless paths (countries are never crossed), by brute force"""
+    weights = graph.weights[metric]
+    allowed = graph._allowed(modes)
+    out = []
+
+    def walk(u, visited, edges, cost):
+        if u == target:
+            out.append((cost, list(edges)))
+            return
+        if u != source and graph.kinds[u] == "country":
+            return
+        for v, e in graph.adj[u]:
+            if v in visited or (allowed is not None and not allowed[e]):
+                continue
+            visited.add(v)
+            edges.append(e)
+            walk(v, visited, edges, cost + weights[e])
+            edges.pop()
+            visited.remove(v)
+
+    walk(source, {source}, [], 0.0)
+    return sorted(out, key=lambda item: item[0])
+
+
+class TestGraphConstruction:
+    """Nodes, edges and weights of the multimodal graph"""
+
+    def test_nodes(self, small):
+        stats = small.stats()
+        assert stats["node_types"]["port"] == 3
+        assert stats["node_types"]["port_sea"] == 3
+        assert stats["node_types"]["airport_air"] == 2
+        assert stats["node_types"]["border_crossing"] == 1
+        assert {small.countries[i] for i, kind in enumerate(small.kinds) if kind == "country"} == {
+            "AAA", "BBB", "CCC", "DDD"}
+
+    def test_corridor_endpoints_snap_to_existing_nodes(self, small):
+        # Départ: Port Un; arrivée (à ~11 km): Aéroport Deux
+        corridor_edges = [e for e in range(len(small.edge_src)) if small.edge_corridor[e] == "CORR-1"]
+        endpoints = {small.ids[small.edge_src[e]] for e in corridor_edges}
+        assert endpoints == {"port:AAA-P1", "land:N-B1", "airport:DDD-A2"}
+        assert sum(small.edge_km[e] for e in corridor_edges) == pytest.approx(2 * 900)
+        assert sum(small.edge_hours[e] - small.edge_dwell[e] for e in corridor_edges) == pytest.approx(2 * 30)
+
+    def test_border_and_port_dwell(self, small):
+        into_border = [e for e in range(len(small.edge_src)) if small.ids[small.edge_dst[e]] == "land:N-B1"]
+        assert into_border and all(small.edge_dwell[e] == 10 for e in into_border)
+        port = small.index["port:AAA-P1"]
+        quay = small.index["port:AAA-P1:sea"]
+        transfer = next(e for v, e in small.adj[port] if v == quay)
+        assert small.edge_mode[transfer] == "port"
+        assert small.edge_dwell[transfer] == small.info[port]["dwell_days"] * 24
+
+    def test_resolve(self, small):
+        assert small.ids[small.resolve("aaa")] == "country:AAA"
+        assert small.ids[small.resolve("BBB-P2")] == "port:BBB-P2"
+        assert small.ids[small.resolve("bbpdx")] == "port:BBB-P2"
+        assert small.ids[small.resolve("ADX")] == "airport:DDD-A2"
+        assert small.ids[small.resolve("N-B1")] == "land:N-B1"
+        with pytest.raises(KeyError):
+            small.resolve("nowhere")
+
+
+class TestRouting:
+    """Shortest, k-shortest and cheapest routes"""
+
+    @pytest.mark.parametrize("metric", ["time", "distance", "cost"])
+    @pytest.mark.parametrize("pair", [("AAA", "DDD"), ("CCC", "BBB"), ("AUN", "BBB-P2")])
+    def test_k_shortest_matches_brute_force(self, small, metric, pair):
+        source, target = small.resolve(pair[0]), small.resolve(pair[1])
+        expected = _simple_paths(small, source, target, metric)
+        found = small.k_shortest(source, target, metric, 5)
+        assert [round(cost, 6) for cost, _ in found] == [round(cost, 6) for cost, _ in expected[:5]]
+        assert len({tuple(edges) for _, edges in found}) == len(found)
+
+    def test_modes_filter(self, small):
+        source, target = small.resolve("AAA"), small.resolve("DDD")
+        found = small.k_shortest(source, target, "time", 5, frozenset({"sea", "road"}))
+        expected = _simple_paths(small, source, target, "time", frozenset({"sea", "road"}))
+        assert [round(c, 6) for c, _ in found] == [round(c, 6) for c, _ in expected[:5]]
+        assert all(small.edge_mode[e] != "air" for _, edges in found for e in edges)
+
+    def test_country_access_is_never_filtered(self, small):
+        result = small.routes("AAA", "BBB", metric="time", k=1, modes=["sea"])
+        assert result["count"] == 1
+        legs = result["routes"][0]["legs"]
+        assert {leg["mode"] for leg in legs} == {"access", "port", "sea"}
+        assert legs[0]["mode"] == legs[-1]["mode"] == "access"
+        assert result["routes"][0]["modes"] == ["sea"]
+
+    def test_countries_are_not_transit_nodes(self, small):
+        source, target = small.resolve("CCC"), small.resolve("DDD")
+        for _, edges in small.k_shortest(source, target, "distance", 5):
+            inner = [small.edge_dst[e] for e in edges[:-1]]
+            assert all(small.kinds[n] != "country" for n in inner)
+
+    def test_tree_and_astar_agree(self, small):
+        for a in ("AAA", "BBB", "CCC", "DDD"):
+            for b in ("AAA", "BBB", "CCC", "DDD"):
+                if a == b:
+                    continue
+                source, target = small.resolve(a), small.resolve(b)
+                for metric in ("time", "distance", "cost"):
+                    tree = small._tree_path(source, target, metric)
+                    astar = small._astar(source, target, metric)
+                    assert tree[0] == pytest.approx(astar[0])
+
+    def test_routes_result(self, small):
+        result = small.routes("AAA", "DDD", metric="time", k=3)
+        assert result["count"] == len(result["routes"]) == 3
+        hours = [r["transit_hours"] for r in result["routes"]]
+        assert hours == sorted(hours)
+        route = result["routes"][0]
+        assert route["nodes"][0]["node_id"] == "country:AAA"
+        assert route["nodes"][-1]["node_id"] == "country:DDD"
+        assert not any(n["type"] in ("port_sea", "airport_air") for n in route["nodes"])
+        assert route["cost_usd_per_tonne"] == pytest.approx(sum(leg["cost_usd_per_tonne"] for leg in route["legs"]),
+                                                            abs=0.05)
+        cheapest = result["cheapest"]
+        assert cheapest["cost_usd_per_tonne"] <= min(r["cost_usd_per_tonne"] for r in result["routes"])
+        assert small.routes("AAA", "DDD", metric="time", k=3) is result
+
+    def test_invalid_parameters(self, small):
+        with pytest.raises(ValueError):
+            small.routes("AAA", "DDD", metric="speed")
+        with pytest.raises(ValueError):
+            small.routes("AAA", "DDD", k=0)
+        with pytest.raises(ValueError):
+            small.routes("AAA", "DDD", modes=["teleport"])
+        with pytest.raises(KeyError):
+            small.routes("AAA", "ZZZ")
+
+
+class TestRepositoryGraph:
+    """Graph built from the repository data files"""
+
+    def test_all_countries_connected(self):
+        graph = get_graph()
+        countries = [i for i, kind in enumerate(graph.kinds) if kind == "country"]
+        assert len(countries) > 40
+        dist, _ = graph.tree(graph.index["country:CIV"], "time")
+        assert all(dist[i] < math.inf for i in countries)
+
+    def test_country_route(self):
+        result = find_routes("SEN", "MLI", metric="cost", k=2)
+        assert result["count"] == 2
+        assert "CORR-DAKAR-BAMAKO-006" in {leg["corridor_id"] for leg in result["routes"][0]["legs"]}
+
+    def test_country_to_country_by_sea(self):
+        result = find_routes("CIV", "NGA", metric="cost", k=2, modes=["sea"])
+        assert result["count"] == 2
+        for route in result["routes"]:
+            assert route["modes"] == ["sea"]
+            assert {leg["mode"] for leg in route["legs"]} <= {"access", "port", "sea"}
+
+    def test_port_to_port_by_sea(self):
+        result = find_routes("MAPTM", "KEMBA", metric="time", k=1, modes=["sea"])
+        assert result["routes"][0]["modes"] == ["sea"]
+        assert result["routes"][0]["dwell_hours"] > 0
+
+    def test_duplicate_ports_are_merged(self):
+        graph = get_graph()
+        assert graph.resolve("GMB-BJL-b5e0fb39") == graph.resolve("GMB-BAN-001")
+        assert graph.resolve("NGA-LAG-001") != graph.resolve("NGA-TIN-001")
+
+    @pytest.mark.parametrize("origin", ["MAR", "EGY"])
+    def test_alternatives_differ_by_transport_legs(self, origin):
+        result = find_routes(origin, "ZAF", metric="time", k=3, modes=["sea"])
+        assert result["count"] == 3
+        signatures = {tuple((leg["mode"], leg["from"], leg["to"]) for leg in route["legs"]
+                            if leg["mode"] == "sea" and leg["distance_km"] > 0)
+                      for route in result["routes"]}
+        assert len(signatures) == 3
+        visited = {node for route in result["routes"] for leg in route["legs"] for node in (leg["from"], leg["to"])}
+        assert not any(node.startswith(("port:GMB-BJL-", "port:SDN-PTS-3ae1c38d")) for node in visited)
+
+    def test_road_includes_multimodal_corridors(self):
+        result = find_routes("KEN", "UGA", metric="time", k=1, modes=["road"])
+        assert result["count"] == 1
+        assert "multimodal" in result["modes"]
+        assert result["routes"][0]["modes"] == ["multimodal"]
+
+
+@pytest.fixture
+def client():
+    # routes/__init__.py importe tous les routeurs: charger uniquement logistics.py
+    spec = importlib.util.spec_from_file_location("logistics_routes", os.path.join(BACKEND_DIR, "routes", "logistics.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    app = FastAPI()
+    app.include_router(module.router, prefix="/api")
+    return TestClient(app)
+
+
+class TestRouteEndpoint:
+    """GET /api/logistics/route"""
+
+    def test_route(self, client):
+        response = client.get("/api/logistics/route", params={"origin": "KEN", "destination": "RWA", "k": 2})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["origin"]["node_id"] == "country:KEN"
+        assert body["count"] == 2
+        assert body["cheapest"]["cost_usd_per_tonne"] > 0
+
+    def test_modes(self, client):
+        response = client.get("/api/logistics/route", params=[("origin", "MAR"), ("destination", "ZAF"),
+                                                               ("modes", "sea"), ("modes", "road"), ("k", 1)])
+        assert response.status_code == 200
+        assert set(response.json()["routes"][0]["modes"]) <= {"sea", "road"}
+        response = client.get("/api/logistics/route", params={"origin": "CIV", "destination": "NGA", "modes": "air"})
+        assert response.status_code == 200
+        assert response.json()["count"] > 0
+        assert all(route["modes"] == ["air"] for route in response.json()["routes"])
+
+    def test_errors(self, client):
+        assert client.get("/api/logistics/route", params={"origin": "KEN", "destination": "XXX"}).status_code == 404
+        assert client.get("/api/logistics/route",
+                          params={"origin": "KEN", "destination": "RWA", "metric": "speed"}).status_code == 400
+        assert client.get("/api/logistics/route",
+                          params={"origin": "KEN", "destination": "RWA", "k": 9}).status_code == 422
+
+    def test_graph_stats(self, client):
+        stats = client.get("/api/logistics/route/graph").json()
+        assert stats["nodes"] > 0 and stats["edges"] > 0
+
+    def test_road_uses_multimodal_corridors(self, client):
+        response = client.get("/api/logistics/route", params={"origin": "KEN", "destination": "UGA", "modes": "road"})
+        assert response.status_code == 200
+        assert response.json()["count"] > 0
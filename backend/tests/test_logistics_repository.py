@@ -0,0 +1,164 @@
+"""
+Logistics Repository Tests
+==========================
+Tests for the cached, indexed ports / airports / free zones repository.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import logistics_air_data
+import logistics_data
+import logistics_repository
+from free_zones_data import get_free_zones_by_country
+from logistics_repository import AIRPORTS_PATH, FREE_ZONES_PATH, PORTS_PATH, LogisticsIndex
+
+
+def _load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def ports():
+    return _load(PORTS_PATH)
+
+
+@pytest.fixture(scope="module")
+def airports():
+    return _load(AIRPORTS_PATH)
+
+
+def _linear_search(records, fields, query):
+    query = query.lower()
+    return [r for r in records if any(query in (r.get(f) or '').lower() for f in fields)]
+
+
+QUERIES = ["tanger", "MAPTM", "Nigeria", "port", "al", "e", "dar es", "-", "zzz", "Saint-", "d'", "lagos apapa"]
+
+
+class TestPortsRepository:
+    """The indexed lookups return what the former linear scans returned"""
+
+    def test_all_and_country(self, ports):
+        assert logistics_data.get_all_ports() == ports
+        assert logistics_data.get_all_ports("mar") == [p for p in ports if p['country_iso'] == "MAR"]
+        assert logistics_data.get_all_ports("XXX") == []
+
+    def test_by_id(self, ports):
+        for port in ports:
+            assert logistics_data.get_port_by_id(port['port_id']) == port
+        assert logistics_data.get_port_by_id("unknown") is None
+
+    def test_by_locode(self, ports):
+        port = next(p for p in ports if p.get('un_locode'))
+        assert logistics_data.get_port_by_locode(port['un_locode'].lower()) == port
+        assert logistics_data.get_port_by_locode("ZZZZZ") is None
+
+    def test_by_type(self, ports):
+        for port_type in ["Hub Transhipment", "hub regional", "Maritime Commercial", "unknown"]:
+            expected = [p for p in ports if p.get('port_type', '').lower() == port_type.lower()]
+            assert logistics_data.get_ports_by_type(port_type) == expected
+
+    def test_top_teu(self, ports):
+        with_teu = [p for p in ports if p.get('latest_stats', {}).get('container_throughput_teu')]
+        expected = sorted(with_teu, key=lambda x: x['latest_stats']['container_throughput_teu'], reverse=True)
+        for limit in (1, 5, 20, 50, 1000):
+            assert logistics_data.get_top_ports_by_teu(limit) == expected[:limit]
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_search(self, ports, query):
+        expected = _linear_search(ports, ("port_name", "un_locode", "country_name"), query)
+        assert logistics_data.search_ports(query) == expected
+
+    def test_results_are_copies(self):
+        logistics_data.get_all_ports().clear()
+        logistics_data.get_top_ports_by_teu(5).clear()
+        assert logistics_data.get_all_ports()
+        assert logistics_data.get_top_ports_by_teu(5)
+
+
+class TestAirportsRepository:
+    """Airports lookups, ranking and search"""
+
+    def test_lookups(self, airports):
+        assert logistics_air_data.get_all_airports() == airports
+        assert logistics_air_data.get_all_airports("zaf") == [a for a in airports if a['country_iso'] == "ZAF"]
+        for airport in airports:
+            assert logistics_air_data.get_airport_by_id(airport['airport_id']) == airport
+        airport = next(a for a in airports if a.get('iata_code'))
+        assert logistics_air_data.get_airport_by_iata(airport['iata_code'].lower()) == airport
+
+    def test_top_cargo(self, airports):
+        with_cargo = [a for a in airports if a.get('historical_stats') and len(a['historical_stats']) > 0]
+        expected = sorted(with_cargo, key=lambda x: x['historical_stats'][0].get('cargo_throughput_tons', 0),
+                          reverse=True)
+        assert logistics_air_data.get_top_airports_by_cargo(10) == expected[:10]
+
+    @pytest.mark.parametrize("query", ["JNB", "addis", "Afrique", "ai", "cairo international"])
+    def test_search(self, airports, query):
+        expected = _linear_search(airports, ("airport_name", "iata_code", "country_name"), query)
+        assert logistics_air_data.search_airports(query) == expected
+
+
+class TestFreeZones:
+    """Free zones are served from the same cache"""
+
+    def test_by_country(self):
+        zones = _load(FREE_ZONES_PATH)
+        assert get_free_zones_by_country() == zones
+        assert get_free_zones_by_country("MAR") == [z for z in zones if z['country_iso'] == "MAR"]
+
+    def test_missing_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(logistics_repository, "FREE_ZONES_PATH", tmp_path / "absent.json")
+        assert get_free_zones_by_country() == []
+
+
+class TestHotReload:
+    """The index is rebuilt when the file changes on disk"""
+
+    def test_reload_after_replace(self, tmp_path, monkeypatch):
+        path = tmp_path / "ports_africains.json"
+        port = {"port_id": "P1", "port_name": "Port Un", "country_iso": "AAA", "country_name": "Pays",
+                "un_locode": "AAPUN", "port_type": "Hub Regional",
+                "latest_stats": {"container_throughput_teu": 10}}
+        path.write_text(json.dumps([port]), encoding="utf-8")
+        monkeypatch.setattr(logistics_repository, "PORTS_PATH", path)
+
+        index = logistics_repository.ports_index()
+        assert logistics_repository.ports_index() is index
+        assert logistics_data.get_port_by_id("P1")["port_name"] == "Port Un"
+
+        tmp = tmp_path / "ports.tmp"
+        tmp.write_text(json.dumps([port, dict(port, port_id="P2", port_name="Port Deux",
+                                              latest_stats={"container_throughput_teu": 20})]),
+                       encoding="utf-8")
+        stat = path.stat()
+        os.replace(tmp, path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert logistics_repository.ports_index() is not index
+        assert [p['port_id'] for p in logistics_data.get_top_ports_by_teu(5)] == ["P2", "P1"]
+        assert [p['port_id'] for p in logistics_data.search_ports("deux")] == ["P2"]
+
+
+class TestLogisticsIndex:
+    """Token search edge cases"""
+
+    def test_search_across_words_and_missing_fields(self):
+        records = [
+            {"id": "a", "name": "Port de Dar es Salaam", "code": None},
+            {"id": "b", "name": "Dakar", "code": "SNDKR"},
+        ]
+        index = LogisticsIndex(records, "id", search_fields=("name", "code"))
+        assert [r["id"] for r in index.search("dar es sal")] == ["a"]
+        assert [r["id"] for r in index.search("DKR")] == ["b"]
+        assert [r["id"] for r in index.search("ar")] == ["a", "b"]
+        assert [r["id"] for r in index.search(" ")] == ["a"]
+        assert index.search("es dak") == []
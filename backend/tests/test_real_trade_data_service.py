@@ -0,0 +1,98 @@
+"""
+Real Trade Data Service Tests
+=============================
+Tests for the pooled, cached OEC fan-out in RealTradeDataService.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.real_trade_data_service import (
+    RealTradeDataService,
+    MAJOR_EXPORTERS,
+    TOP_IMPORTERS,
+)
+
+
+def make_service(max_concurrency=3):
+    service = RealTradeDataService(max_concurrency=max_concurrency)
+    calls = []
+    state = {"active": 0, "peak": 0}
+
+    async def fake_oec_get(params):
+        calls.append(params)
+        async with service._get_semaphore():
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0)
+            state["active"] -= 1
+        return [
+            {"HS4 ID": 101801, "HS4": "Cocoa Beans", "Trade Value": 100, "Quantity": 5},
+            {"HS4 ID": 101806, "HS4": "Chocolate", "Trade Value": 40, "Quantity": 1},
+            {"HS4 ID": 52709, "HS4": "Crude Petroleum", "Trade Value": 900, "Quantity": 9},
+        ]
+
+    service._oec_get = fake_oec_get
+    return service, calls, state
+
+
+class TestRealTradeDataService:
+    """Tests for the OEC fan-out"""
+
+    def test_exporters_fetch_each_country_table_once(self):
+        service, calls, state = make_service()
+
+        async def run():
+            first = await service.get_african_exporters_for_product("180100")
+            second = await service.get_african_exporters_for_product("2709")
+            return first, second
+
+        cocoa, petroleum = asyncio.run(run())
+
+        assert len(calls) == len(MAJOR_EXPORTERS)
+        assert "limit" not in calls[0]
+        assert state["peak"] <= 3
+        assert len(cocoa) == len(MAJOR_EXPORTERS)
+        assert cocoa[0]["export_value"] == 140
+        assert cocoa[0]["products"] == ["Cocoa Beans", "Chocolate"]
+        assert petroleum[0]["export_value"] == 900
+
+    def test_concurrent_callers_share_pending_request(self):
+        service, calls, _ = make_service()
+
+        async def run():
+            return await asyncio.gather(
+                service.get_african_importers_for_product("1801"),
+                service.get_african_importers_for_product("1806"),
+            )
+
+        first, second = asyncio.run(run())
+
+        assert len(calls) == len(TOP_IMPORTERS)
+        assert first == second
+        assert first[0]["import_value"] == 140
+
+    def test_top_flows_sorted_from_cached_table(self):
+        service, calls, _ = make_service()
+
+        async def run():
+            exports = await service.get_oec_exports("CIV", year=2021, limit=2)
+            products = await service.get_african_exporters_for_product("1801", year=2021)
+            return exports, products
+
+        exports, _ = asyncio.run(run())
+
+        assert [e["hs_code"] for e in exports] == ["2709", "1801"]
+        assert exports[0]["year"] == 2021
+        # CIV export table is reused by the product fan-out
+        assert len(calls) == len(MAJOR_EXPORTERS)
+
+    def test_unknown_country_returns_empty(self):
+        service, calls, _ = make_service()
+        assert asyncio.run(service.get_oec_imports("XXX")) == []
+        assert calls == []
@@ -0,0 +1,69 @@
+"""
+Rules of Origin Table Tests
+===========================
+Tests for the precomputed resolution table of etl/afcfta_rules_of_origin.py.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from etl.afcfta_rules_of_origin import (
+    CHAPTER_RULES,
+    HEADING_RULES,
+    YTB_HEADINGS,
+    get_rule_of_origin,
+    get_rule_table,
+    resolve_many
+)
+
+
+class TestRuleOfOriginTable:
+    """Resolution through the precomputed table"""
+
+    @pytest.mark.parametrize("lang", ["fr", "en"])
+    def test_priority(self, lang):
+        assert get_rule_of_origin(YTB_HEADINGS[0] + "10", lang)["status"] == "YTB"
+        heading = next(iter(HEADING_RULES))
+        rule = get_rule_of_origin(heading + "10", lang)
+        assert rule["source"] == "HEADING"
+        assert rule["source_detail"].endswith(heading)
+        assert get_rule_of_origin("010121", lang)["source"] == "CHAPTER"
+        assert get_rule_of_origin("980000", lang)["source"] == "UNKNOWN"
+
+    def test_code_fields(self):
+        rule = get_rule_of_origin("01.01.21", "en")
+        assert (rule["hs6_code"], rule["heading"], rule["chapter"]) == ("010121", "0101", "01")
+        assert get_rule_of_origin("5", "fr")["chapter"] == "05"
+        assert get_rule_of_origin("52 04 10", "fr")["status"] == "YTB"
+
+    def test_languages(self):
+        heading = next(iter(HEADING_RULES))
+        assert get_rule_of_origin(heading, "fr")["notes"] == HEADING_RULES[heading]["description_fr"]
+        assert get_rule_of_origin(heading, "en")["notes"] == HEADING_RULES[heading]["description_en"]
+        # Langue hors table: même structure, calculée à la demande
+        rule = get_rule_of_origin(heading, "de")
+        assert rule["notes"] == "" and rule["primary_rule"]["code"] == HEADING_RULES[heading]["primary"]
+
+    def test_results_are_copies(self):
+        rule = get_rule_of_origin("010121", "fr")
+        rule["status"] = "MODIFIED"
+        rule["primary_rule"]["name"] = "MODIFIED"
+        fresh = get_rule_of_origin("010121", "fr")
+        assert fresh["status"] == "AGREED"
+        assert fresh["primary_rule"]["name"] != "MODIFIED"
+
+    def test_table_covers_rules(self):
+        headings, chapters, _ = get_rule_table()["fr"]
+        assert set(headings) == set(HEADING_RULES) | set(YTB_HEADINGS)
+        assert set(chapters) == set(CHAPTER_RULES)
+        with pytest.raises(TypeError):
+            headings["0101"] = {}
+
+    def test_resolve_many(self):
+        codes = ["010121", YTB_HEADINGS[0], "980000", "010121"]
+        assert resolve_many(codes, "en") == [get_rule_of_origin(code, "en") for code in codes]
+        assert resolve_many([], "fr") == []
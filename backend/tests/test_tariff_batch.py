@@ -0,0 +1,114 @@
+"""
+Batch Tariff Engine Tests
+=========================
+Tests for the vectorized /calculate-tariff/batch engine.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from etl.country_tariffs_complete import (
+    get_tariff_rate_for_country,
+    get_vat_rate_for_country,
+    get_other_taxes_for_country,
+    get_product_category,
+    get_zlecaf_reduction_factor
+)
+from services.tariff_batch_service import BatchTariffEngine
+
+# The routes package pulls in every route module (including the AI analysis
+# integrations); endpoint tests only run where the full backend is importable
+try:
+    from routes.tariffs import router as tariffs_router
+except ImportError:
+    tariffs_router = None
+
+
+LINES = [
+    {"origin_country": "CI", "destination_country": "NGA", "hs_code": "8703.21.10.00", "value": 10000},
+    {"origin_country": "KEN", "destination_country": "SEN", "hs_code": "180100", "value": 5000.5},
+    {"origin_country": "GHA", "destination_country": "KE", "hs_code": "847130", "value": 1234.56},
+    {"origin_country": "KEN", "destination_country": "SEN", "hs_code": "180100", "value": 70.0},
+]
+
+
+class TestBatchTariffEngine:
+    """Tests for the batch tariff engine"""
+
+    def setup_method(self):
+        self.engine = BatchTariffEngine()
+
+    def test_results_in_input_order(self):
+        results, _ = self.engine.calculate(LINES)
+        assert [r["line"] for r in results] == [0, 1, 2, 3]
+        assert [r["hs_code"] for r in results] == [line["hs_code"] for line in LINES]
+
+    def test_sub_position_priority(self):
+        results, _ = self.engine.calculate(LINES[:1])
+        assert results[0]["tariff_precision"] == "sub_position"
+        assert results[0]["sub_position_used"] == "8703211000"
+        assert results[0]["confidence_level"] == "high"
+
+    def test_amounts_match_scalar_formula(self):
+        results, _ = self.engine.calculate(LINES)
+        line, result = LINES[2], results[2]
+        if result["tariff_precision"] == "chapter":
+            normal_rate, _ = get_tariff_rate_for_country("KEN", "847130")
+        else:
+            normal_rate = result["normal_tariff_rate"]
+        zlecaf_rate = normal_rate * get_zlecaf_reduction_factor("KEN", get_product_category("847130"))
+        vat_rate, _ = get_vat_rate_for_country("KEN")
+        other_rate, _ = get_other_taxes_for_country("KEN")
+
+        value = line["value"]
+        other = value * other_rate
+        normal_total = value + value * normal_rate + other + (value + value * normal_rate + other) * vat_rate
+        zlecaf_total = value + value * zlecaf_rate + other + (value + value * zlecaf_rate + other) * vat_rate
+
+        assert result["normal_tariff_rate"] == normal_rate
+        assert result["normal_total_cost"] == round(normal_total, 2)
+        assert result["zlecaf_total_cost"] == round(zlecaf_total, 2)
+        assert result["other_taxes_total"] == round(other, 2)
+
+    def test_totals(self):
+        results, totals = self.engine.calculate(LINES)
+        assert totals["value"] == round(sum(line["value"] for line in LINES), 2)
+        assert totals["normal_total_cost"] == pytest.approx(sum(r["normal_total_cost"] for r in results), abs=0.05)
+
+    def test_unknown_country_raises(self):
+        with pytest.raises(ValueError):
+            self.engine.calculate([{"origin_country": "FRA", "destination_country": "NGA", "hs_code": "180100", "value": 1}])
+
+
+@pytest.mark.skipif(tariffs_router is None, reason="routes package not importable")
+class TestBatchTariffEndpoint:
+    """Tests for POST /calculate-tariff/batch"""
+
+    def setup_method(self):
+        app = FastAPI()
+        app.include_router(tariffs_router, prefix="/api")
+        self.client = TestClient(app)
+
+    def test_batch_endpoint(self):
+        response = self.client.post("/api/calculate-tariff/batch", json={"lines": LINES})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == len(LINES)
+        assert len(data["results"]) == len(LINES)
+        assert "computation_time_ms" in data
+
+    def test_batch_endpoint_invalid_country(self):
+        lines = LINES + [{"origin_country": "XX", "destination_country": "NGA", "hs_code": "180100", "value": 1}]
+        response = self.client.post("/api/calculate-tariff/batch", json={"lines": lines})
+        assert response.status_code == 400
+
+    def test_batch_endpoint_empty(self):
+        response = self.client.post("/api/calculate-tariff/batch", json={"lines": []})
+        assert response.status_code == 422
@@ -0,0 +1,90 @@
+"""
+Compiled Tariff Table Tests
+===========================
+Tests for the per-country tariff resolution tables of
+etl/country_tariffs_complete.py.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from etl.country_tariffs_complete import (
+    COUNTRY_TARIFFS_MAP,
+    ISO2_TO_ISO3,
+    get_tariff_table,
+    get_tariff_rate_for_country,
+    get_zlecaf_tariff_rate,
+    get_zlecaf_reduction_factor,
+    get_vat_rate_for_country,
+    get_other_taxes_for_country,
+    resolve_npf_rate
+)
+from etl.country_hs6_tariffs import COUNTRY_HS6_TARIFFS, get_country_hs6_tariff
+
+
+def scan_rate(iso3, hs_code):
+    """Former linear scan over the rate buckets (reference implementation)"""
+    chapter = hs_code[:2].zfill(2)
+    for rate_str, chapters in COUNTRY_TARIFFS_MAP[iso3].items():
+        try:
+            rate = 0.0 if rate_str == "00" else float(rate_str) / 100
+        except ValueError:
+            continue
+        if chapters == ["all"] or chapter in chapters:
+            return (rate, f"Tarif national {iso3}")
+    return (0.10, f"Taux générique {iso3}")
+
+
+class TestCompiledTariffTables:
+    """Tables return the same rates as the former bucket scan"""
+
+    @pytest.mark.parametrize("iso3", sorted(COUNTRY_TARIFFS_MAP))
+    def test_chapter_rates_match_scan(self, iso3):
+        for chapter in range(100):
+            hs_code = f"{chapter:02d}0100"
+            assert get_tariff_rate_for_country(iso3, hs_code) == scan_rate(iso3, hs_code)
+
+    def test_non_numeric_chapter_falls_back_to_scan(self):
+        assert get_tariff_rate_for_country("SOM", "ab") == scan_rate("SOM", "ab")
+        assert get_tariff_rate_for_country("NGA", "ab") == scan_rate("NGA", "ab")
+
+    def test_iso2_and_unknown_country(self):
+        assert get_tariff_table("ci") is get_tariff_table("CIV")
+        assert get_tariff_rate_for_country("XXX", "18") == (0.15, "Taux par défaut")
+        assert get_vat_rate_for_country("XXX") == (0.18, "Taux par défaut")
+        assert get_other_taxes_for_country("XXX") == (0.0, {"other": 0.0})
+
+    def test_zlecaf_factors(self):
+        # Année 5: produits normaux -90% (non-PMA) / -45% (PMA), sensibles non réduits
+        assert get_zlecaf_reduction_factor("NGA", "normal") == pytest.approx(0.1)
+        assert get_zlecaf_reduction_factor("SEN", "normal") == pytest.approx(0.55)
+        assert get_zlecaf_reduction_factor("SEN", "sensitive") == 1.0
+        assert get_zlecaf_reduction_factor("NGA", "unknown") == get_zlecaf_reduction_factor("NGA", "normal")
+
+        npf_rate, _ = get_tariff_rate_for_country("SEN", "180100")
+        assert get_zlecaf_tariff_rate("SN", "180100") == (npf_rate * 0.55, "ZLECAf (produit normal)")
+
+    def test_taxes(self):
+        vat_rate, _ = get_vat_rate_for_country("NGA")
+        other_rate, detail = get_other_taxes_for_country("CIV")
+        assert vat_rate == 0.075
+        assert other_rate == pytest.approx(sum(
+            v for k, v in detail.items() if k != "other" and isinstance(v, (int, float))
+        ) / 100)
+
+    def test_resolve_npf_rate_prefers_hs6(self):
+        for iso3, tariffs in COUNTRY_HS6_TARIFFS.items():
+            for hs6_code in list(tariffs)[:10]:
+                rate, source, precision = resolve_npf_rate(iso3, hs6_code)
+                assert precision == "hs6_country"
+                assert rate == get_country_hs6_tariff(iso3, hs6_code)["dd"]
+        assert resolve_npf_rate("NGA", "999999")[2] == "chapter"
+        assert resolve_npf_rate("NGA", "999999")[:2] == get_tariff_rate_for_country("NGA", "99")
+
+    def test_all_countries_have_tables(self):
+        for iso3 in set(ISO2_TO_ISO3.values()):
+            assert get_tariff_table(iso3) is not None
@@ -0,0 +1,199 @@
+"""
+Trade Matrix Tests
+==================
+Tests for the precomputed import-substitution trade matrix.
+"""
+
+import asyncio
+import numpy as np
+import pytest
+import sys
+import os
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.trade_matrix import TradeMatrix
+from services import real_substitution_service as substitution_module
+from services.real_substitution_service import RealSubstitutionService
+
+COUNTRIES = ["CIV", "GHA", "NGA", "SEN"]
+AFRICAN_IDS = ["afciv", "afgha", "afnga", "afsen"]
+
+
+def export_record(hs4_id, name, value):
+    return {"HS4 ID": hs4_id, "HS4": name, "Trade Value": value}
+
+
+def import_record(hs4_id, name, exporter_id, exporter, value):
+    return {
+        "HS4 ID": hs4_id, "HS4": name, "Trade Value": value,
+        "Exporter Country ID": exporter_id, "Exporter Country": exporter
+    }
+
+
+@pytest.fixture
+def matrix():
+    export_tables = {
+        ("CIV", 2022): [export_record(101801, "Cocoa Beans", 5e9)],
+        ("GHA", 2022): [export_record(101801, "Cocoa Beans", 2e9), export_record(52709, "Crude Petroleum", 4e9)],
+        ("NGA", 2022): [export_record(52709, "Crude Petroleum", 40e9)],
+        ("SEN", 2022): [export_record(52709, "Crude Petroleum", 1e9)],
+    }
+    bilateral_tables = {
+        ("CIV", 2022): [],
+        ("GHA", 2022): [],
+        ("NGA", 2022): [],
+        ("SEN", 2022): [
+            import_record(52709, "Crude Petroleum", "euesp", "Spain", 300e6),
+            import_record(52709, "Crude Petroleum", "asind", "India", 500e6),
+            import_record(52709, "Crude Petroleum", "afnga", "Nigeria", 100e6),
+            import_record(101801, "Cocoa Beans", "euFRA", "France", 1e6),
+        ],
+    }
+    return TradeMatrix.from_tables(COUNTRIES, AFRICAN_IDS, export_tables, bilateral_tables)
+
+
+class TestTradeMatrix:
+    """Tests for matrix construction and queries"""
+
+    def test_build_dense_matrix(self, matrix):
+        assert matrix.exports.shape == (4, 2, 1)
+        assert matrix.hs4.tolist() == ["1801", "2709"]
+        assert matrix.imports[3, 1, 0] == 900e6
+        assert matrix.imports_from_africa[3, 1, 0] == 100e6
+        assert matrix.total_imports_from_outside("SEN", 2022) == 801e6
+
+    def test_save_load_roundtrip(self, matrix, tmp_path):
+        path = tmp_path / "trade_matrix.npz"
+        matrix.save(path)
+        loaded = TradeMatrix.load(path)
+
+        assert loaded.countries.tolist() == COUNTRIES
+        assert loaded.built_at == matrix.built_at
+        assert (loaded.exports == matrix.exports).all()
+        assert (loaded.top_sources == matrix.top_sources).all()
+
+    def test_import_substitution(self, matrix):
+        products = matrix.import_substitution("SEN", 2022, min_value=5e6)
+
+        assert len(products) == 1
+        petroleum = products[0]
+        assert petroleum["hs_code"] == "2709"
+        assert petroleum["import_value"] == 800e6
+        assert petroleum["source_regions"] == ["India", "Spain"]
+        # The importer's own exports are not counted as African supply
+        assert petroleum["suppliers"] == [("NGA", 40e9), ("GHA", 4e9)]
+        assert petroleum["african_capacity"] == 44e9
+
+    def test_import_coverage(self, matrix, tmp_path):
+        assert matrix.has_imports("SEN", 2022)
+        assert not matrix.has_imports("SEN", 2021)
+        partial = TradeMatrix.from_tables(
+            COUNTRIES, AFRICAN_IDS, {("CIV", 2022): []}, {("CIV", 2022): []}
+        )
+        assert partial.has_imports("CIV", 2022)
+        assert not partial.has_imports("SEN", 2022)
+
+        assert partial.has_exports("CIV", 2022) and not partial.has_exports("GHA", 2022)
+        assert not partial.covers_import_substitution("CIV", 2022)
+        assert not partial.covers_export_opportunities("CIV", 2022)
+        assert matrix.covers_import_substitution("SEN", 2022)
+        assert matrix.covers_export_opportunities("GHA", 2022)
+
+        path = tmp_path / "trade_matrix.npz"
+        partial.save(path)
+        loaded = TradeMatrix.load(path)
+        assert loaded.imports_covered.tolist() == [[True], [False], [False], [False]]
+        assert loaded.exports_covered.tolist() == [[True], [False], [False], [False]]
+
+        # Artefact sans couverture enregistrée: supposée complète
+        with np.load(path) as data:
+            arrays = {k: data[k] for k in data.files if not k.endswith("_covered")}
+        np.savez_compressed(path, **arrays)
+        loaded = TradeMatrix.load(path)
+        assert loaded.has_imports("SEN", 2022) and loaded.has_exports("SEN", 2022)
+
+    def test_no_imports_no_opportunities(self, matrix):
+        assert matrix.import_substitution("NGA", 2022, min_value=0) == []
+
+    def test_export_opportunities(self, matrix):
+        products = matrix.export_opportunities("GHA", 2022, min_market_size=5e6)
+
+        assert [p["hs_code"] for p in products] == ["2709", "1801"]
+        assert products[0]["markets"] == [
+            {"country_iso3": "SEN", "import_value": 800e6, "source_regions": ["India", "Spain"]}
+        ]
+        assert products[1]["markets"] == []
+
+
+class TestSubstitutionFromMatrix:
+    """The substitution service answers from the matrix when it covers the year"""
+
+    def test_import_substitution_uses_matrix(self, matrix, monkeypatch):
+        monkeypatch.setattr(substitution_module, "get_trade_matrix", lambda: matrix)
+        result = asyncio.run(
+            RealSubstitutionService().find_import_substitution_opportunities("SEN", year=2022)
+        )
+
+        assert result["data_source"] == "OEC/BACI (precomputed matrix)"
+        assert result["summary"]["total_opportunities"] == 1
+        opportunity = result["opportunities"][0]
+        assert opportunity["imported_product"]["current_source"] == "India, Spain"
+        assert opportunity["african_suppliers"][0]["country_iso3"] == "NGA"
+        assert opportunity["substitution_potential"] == 800e6
+        assert opportunity["difficulty"] == "easy"
+
+    def test_export_opportunities_uses_matrix(self, matrix, monkeypatch):
+        monkeypatch.setattr(substitution_module, "get_trade_matrix", lambda: matrix)
+        result = asyncio.run(
+            RealSubstitutionService().find_export_opportunities("GHA", year=2022)
+        )
+
+        assert result["data_source"] == "OEC/BACI (precomputed matrix)"
+        assert result["summary"]["total_opportunities"] == 1
+        market = result["opportunities"][0]["target_markets"][0]
+        assert market["country_iso3"] == "SEN"
+        assert market["capture_potential"] == 120e6
+
+    @pytest.fixture
+    def live(self, monkeypatch):
+        live = substitution_module.real_trade_service
+
+        async def bilateral_from_world(importer, year, limit):
+            return {"products_from_outside": [], "from_outside": 0}
+
+        async def empty(*args, **kwargs):
+            return []
+
+        monkeypatch.setattr(live, "get_oec_bilateral_from_world", bilateral_from_world)
+        monkeypatch.setattr(live, "get_oec_imports", empty)
+        monkeypatch.setattr(live, "get_oec_exports", empty)
+        return live
+
+    @pytest.mark.parametrize("missing_exports, missing_imports", [((), ("SEN",)), (("NGA",), ())])
+    def test_import_substitution_falls_back_to_live(self, live, monkeypatch, missing_exports, missing_imports):
+        # Table d'importations du pays ou table d'exportations d'un fournisseur manquante
+        partial = TradeMatrix.from_tables(
+            COUNTRIES, AFRICAN_IDS,
+            {(iso3, 2022): [] for iso3 in COUNTRIES if iso3 not in missing_exports},
+            {(iso3, 2022): [] for iso3 in COUNTRIES if iso3 not in missing_imports}
+        )
+        monkeypatch.setattr(substitution_module, "get_trade_matrix", lambda: partial)
+        result = asyncio.run(
+            RealSubstitutionService().find_import_substitution_opportunities("SEN", year=2022)
+        )
+        assert result["data_source"] == "OEC (Observatory of Economic Complexity)"
+
+    @pytest.mark.parametrize("missing_exports, missing_imports", [(("GHA",), ()), ((), ("SEN",))])
+    def test_export_opportunities_fall_back_to_live(self, live, monkeypatch, missing_exports, missing_imports):
+        partial = TradeMatrix.from_tables(
+            COUNTRIES, AFRICAN_IDS,
+            {(iso3, 2022): [] for iso3 in COUNTRIES if iso3 not in missing_exports},
+            {(iso3, 2022): [] for iso3 in COUNTRIES if iso3 not in missing_imports}
+        )
+        monkeypatch.setattr(substitution_module, "get_trade_matrix", lambda: partial)
+        result = asyncio.run(
+            RealSubstitutionService().find_export_opportunities("GHA", year=2022)
+        )
+        assert result["data_source"] == "OEC (Observatory of Economic Complexity)"
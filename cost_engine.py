@@ -1,3 +1,19 @@
+"""
+Calcul du coût de revient à l'import (droits, PRCT, TCS, droits spécifiques, TVA)
+
+simulate calcule une ligne; simulate_many calcule des tableaux de lignes en
+une passe NumPy, avec les mêmes opérations flottantes dans le même ordre:
+les résultats sont identiques à ceux de simulate, ligne par ligne.
+Les entrées sont diffusées (broadcasting) les unes contre les autres, ce qui
+permet aussi d'évaluer une grille de scénarios (what_if).
+"""
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+RESULT_KEYS = ["cif", "duty", "prct", "tcs", "specific_sum", "vat", "total_taxes", "total_landed_cost"]
+
+
 def simulate(payload, tariff, country_rules, preference):
     cif = float(payload["cif_value"])
     qty = float(payload["quantity"])
@@ -30,3 +46,96 @@ def simulate(payload, tariff, country_rules, preference):
         "total_taxes": total_taxes,
         "total_landed_cost": cif + total_taxes
     }
+
+
+def simulate_many(cif_value, quantity, dd, vat_rate, prct=0.0, tcs=0.0, specific_amounts=None,
+                  vat_on_duty=True, origin_certificate=False, preference_dd=np.nan) -> Dict[str, np.ndarray]:
+    """
+    simulate sur des tableaux de lignes
+
+    Args:
+        cif_value, quantity, dd, vat_rate, prct, tcs: taux en %, un par ligne
+            (ou scalaire commun)
+        specific_amounts: montants spécifiques par unité, forme (lignes, k)
+            complétée par des 0 (ou (lignes,) pour un seul montant)
+        vat_on_duty, origin_certificate: booléens
+        preference_dd: taux DD préférentiel, NaN si aucune préférence
+
+    Returns:
+        {clé de simulate: tableau} à la forme diffusée des entrées
+    """
+    cif = np.asarray(cif_value, dtype=np.float64)
+    qty = np.asarray(quantity, dtype=np.float64)
+    preference_dd = np.asarray(preference_dd, dtype=np.float64)
+    certified = np.asarray(origin_certificate, dtype=bool) & ~np.isnan(preference_dd)
+    dd = np.where(certified, preference_dd, np.asarray(dd, dtype=np.float64))
+
+    duty = cif * dd / 100.0
+    prct = cif * np.asarray(prct, dtype=np.float64) / 100.0
+    tcs = cif * np.asarray(tcs, dtype=np.float64) / 100.0
+
+    # cumul colonne par colonne, dans l'ordre de tariff["SPECIFIC"] (0 + x et x + 0 sont exacts)
+    specific_sum = np.zeros(np.broadcast_shapes(cif.shape, qty.shape))
+    if specific_amounts is not None:
+        amounts = np.asarray(specific_amounts, dtype=np.float64)
+        if amounts.ndim <= 1:
+            amounts = amounts[..., np.newaxis]
+        for j in range(amounts.shape[-1]):
+            specific_sum = specific_sum + amounts[..., j] * qty
+
+    base = cif + np.where(np.asarray(vat_on_duty, dtype=bool), duty + specific_sum, 0.0)
+    vat = base * np.asarray(vat_rate, dtype=np.float64) / 100.0
+
+    total_taxes = duty + prct + tcs + specific_sum + vat
+    values = [cif, duty, prct, tcs, specific_sum, vat, total_taxes, cif + total_taxes]
+    shape = np.broadcast_shapes(*(v.shape for v in values))
+    return {k: np.broadcast_to(v, shape) for k, v in zip(RESULT_KEYS, values)}
+
+
+def specific_matrix(tariffs: Sequence[Dict]) -> np.ndarray:
+    """Montants tariff["SPECIFIC"] de chaque ligne, complétés par des 0"""
+    rows = [[float(st["amount"]) for st in t.get("SPECIFIC", [])] for t in tariffs]
+    width = max(map(len, rows), default=0)
+    return np.array([r + [0.0] * (width - len(r)) for r in rows], dtype=np.float64).reshape(len(rows), width)
+
+
+def simulate_lines(payloads: Sequence[Dict], tariffs: Sequence[Dict], country_rules: Sequence[Dict],
+                   preferences: Sequence[Dict]) -> Dict[str, np.ndarray]:
+    """
+    simulate_many à partir des mêmes dictionnaires que simulate (une entrée par ligne)
+
+    La conversion des dictionnaires domine le temps de calcul: pour de gros
+    volumes, passer directement des colonnes à simulate_many.
+    """
+    def column(rows: Iterable[Dict], key: str, default=0.0) -> List[float]:
+        return [float(r.get(key, default)) for r in rows]
+
+    return simulate_many(
+        cif_value=column(payloads, "cif_value"),
+        quantity=column(payloads, "quantity"),
+        dd=column(tariffs, "DD"),
+        prct=column(tariffs, "PRCT"),
+        tcs=column(tariffs, "TCS"),
+        specific_amounts=specific_matrix(tariffs),
+        vat_rate=column(country_rules, "vat_rate"),
+        vat_on_duty=[bool(r.get("vat_on_duty", True)) for r in country_rules],
+        origin_certificate=[bool(p.get("origin_certificate")) for p in payloads],
+        preference_dd=[np.nan if p.get("DD") is None else float(p["DD"]) for p in preferences],
+    )
+
+
+def what_if(preference_dd: Sequence[float], origin_certificate: Sequence[bool], **lines) -> Dict[str, np.ndarray]:
+    """
+    Grille de scénarios: préférence DD x certificat d'origine x lignes
+
+    Args:
+        preference_dd: taux préférentiels à tester (NaN = sans préférence)
+        origin_certificate: valeurs du certificat à tester
+        **lines: arguments de simulate_many pour les lignes (tableaux de forme (lignes,))
+
+    Returns:
+        tableaux de forme (len(preference_dd), len(origin_certificate), lignes)
+    """
+    preference = np.asarray(preference_dd, dtype=np.float64)[:, np.newaxis, np.newaxis]
+    certificate = np.asarray(origin_certificate, dtype=bool)[np.newaxis, :, np.newaxis]
+    return simulate_many(preference_dd=preference, origin_certificate=certificate, **lines)
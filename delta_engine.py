@@ -1,37 +1,270 @@
-import pandas as pd
+"""
+Comparaison de deux versions d'un tarif national normalisé (clé: national_code)
+
+Les deux tables sont alignées une seule fois, puis chaque champ de FIELDS est
+comparé par masque vectorisé. Les écarts (NEW / REMOVED / MODIFIED) peuvent
+être écrits au fil de l'eau en JSONL ou en Parquet.
+
+Pour des CSV trop gros pour la mémoire, compare_chunked lit les fichiers par
+blocs, les répartit sur disque par hachage de national_code puis compare
+partition par partition. Les colonnes y reprennent le type que read_csv
+donnerait au fichier entier: les écarts sont identiques à ceux de compare().
+
+Usage:
+    python delta_engine.py old.csv new.csv                      # JSON sur stdout
+    python delta_engine.py old.csv new.csv --out deltas.jsonl   # ou .parquet
+    python delta_engine.py old.csv new.csv --out deltas.parquet --chunksize 100000
+"""
+import argparse
 import json
 import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
 
 FIELDS = ["advalorem_json", "specific_json", "advantages_json", "formalities_json"]
 
+DELTA_COLUMNS = ["national_code", "change_type", "field_changed", "old_value", "new_value"]
+
+
+def _as_text(values: pd.Series) -> np.ndarray:
+    """Équivalent vectorisé de str(valeur) (NaN -> "nan")"""
+    return values.to_numpy(dtype=object).astype(str)
+
+
+def _field_text(df: pd.DataFrame, field: str, codes: pd.Index) -> np.ndarray:
+    if field not in df.columns:
+        return np.full(len(codes), "", dtype=object)
+    return _as_text(df[field].reindex(codes))
+
+
+def diff_frames(old: pd.DataFrame, new: pd.DataFrame, fields: List[str] = FIELDS) -> pd.DataFrame:
+    """
+    Écarts entre deux tables indexées par national_code
+
+    Ordre: NEW puis REMOVED (codes triés), puis MODIFIED dans l'ordre de
+    l'ancienne table et de FIELDS. En cas de code dupliqué, la première
+    ligne fait foi.
+    """
+    old = old[~old.index.duplicated()]
+    new = new[~new.index.duplicated()]
+
+    added = new.index.difference(old.index)
+    removed = old.index.difference(new.index)
+    common = old.index[old.index.isin(new.index)]
+
+    positions, field_ids, old_values, new_values = [], [], [], []
+    for i, f in enumerate(fields):
+        ov = _field_text(old, f, common)
+        nv = _field_text(new, f, common)
+        changed = np.flatnonzero(ov != nv)
+        positions.append(changed)
+        field_ids.append(np.full(len(changed), i))
+        old_values.append(ov[changed])
+        new_values.append(nv[changed])
+
+    position = np.concatenate(positions)
+    field_id = np.concatenate(field_ids)
+    order = np.lexsort((field_id, position))
+    modified = pd.DataFrame({
+        "national_code": common[position[order]],
+        "change_type": "MODIFIED",
+        "field_changed": np.asarray(fields, dtype=object)[field_id[order]],
+        "old_value": np.concatenate(old_values)[order],
+        "new_value": np.concatenate(new_values)[order],
+    })
+
+    frames = [
+        pd.DataFrame({"national_code": added, "change_type": "NEW"}),
+        pd.DataFrame({"national_code": removed, "change_type": "REMOVED"}),
+        modified,
+    ]
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=DELTA_COLUMNS)
+    return pd.concat(frames, ignore_index=True).reindex(columns=DELTA_COLUMNS)
+
+
+def to_records(deltas: pd.DataFrame) -> List[Dict]:
+    """Écarts au format de compare() (NEW/REMOVED sans champs de valeur)"""
+    out = []
+    for change_type, group in deltas.groupby("change_type", sort=False):
+        columns = DELTA_COLUMNS if change_type == "MODIFIED" else DELTA_COLUMNS[:2]
+        out.extend(group[columns].to_dict("records"))
+    return out
+
+
 def compare(old_csv: str, new_csv: str):
     old = pd.read_csv(old_csv).set_index("national_code")
     new = pd.read_csv(new_csv).set_index("national_code")
+    return to_records(diff_frames(old, new))
+
+
+class DeltaWriter:
+    """
+    Streamed delta output: JSON Lines (.jsonl) or Parquet (.parquet)
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.count = 0
+        self._parquet = self.path.suffix == ".parquet"
+        self._writer = None
+        self._file = None
+        if not self._parquet:
+            self._file = open(self.path, "w", encoding="utf-8")
+
+    def write(self, deltas: pd.DataFrame) -> None:
+        if deltas.empty:
+            return
+        self.count += len(deltas)
+        if self._parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.table({
+                c: pa.Array.from_pandas(deltas[c].astype(str).where(deltas[c].notna()), type=pa.string())
+                for c in DELTA_COLUMNS
+            })
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+            return
+        for record in to_records(deltas):
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+            self._file.write("\n")
+
+    def close(self) -> None:
+        if self._parquet:
+            if self._writer is None:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                pq.write_table(pa.table({c: pa.array([], pa.string()) for c in DELTA_COLUMNS}), self.path)
+            else:
+                self._writer.close()
+        else:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _merge_dtype(a: np.dtype, b: np.dtype) -> np.dtype:
+    """Type d'une colonne lue d'un bloc sachant le type des blocs précédents"""
+    if a == b:
+        return a
+    if a.kind in "iuf" and b.kind in "iuf":
+        return np.result_type(a, b)
+    return np.dtype(object)
+
+
+def _csv_dtypes(csv_path: str, columns: List[str], chunksize: int) -> Dict[str, np.dtype]:
+    """Types inférés par pd.read_csv sur le fichier entier, calculés bloc par bloc"""
+    dtypes: Dict[str, np.dtype] = {}
+    for chunk in pd.read_csv(csv_path, usecols=columns, chunksize=chunksize):
+        for c in columns:
+            dtypes[c] = _merge_dtype(dtypes[c], chunk[c].dtype) if c in dtypes else chunk[c].dtype
+    return dtypes
+
+
+def _typed(values: pd.Series, dtype: Optional[np.dtype]) -> pd.Series:
+    """Colonne lue en texte convertie au type du fichier entier"""
+    if dtype is None or dtype.kind == "O":
+        return values
+    if dtype.kind == "b":
+        return values.str.lower().map({"true": True, "false": False}).astype(dtype)
+    return pd.to_numeric(values).astype(dtype)
+
+
+def _partition(csv_path: str, out_dir: Path, partitions: int, chunksize: int, fields: List[str]) -> None:
+    """Répartir un CSV par hachage de national_code (un CSV par partition)"""
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = ["national_code"] + [f for f in fields if f in header]
+    written = set()
+    # national_code lu en texte: le typage ne doit pas varier d'un bloc à l'autre
+    for chunk in pd.read_csv(csv_path, usecols=usecols, dtype=str, chunksize=chunksize):
+        bucket = pd.util.hash_pandas_object(chunk["national_code"], index=False).to_numpy() % partitions
+        for b, part in chunk.groupby(bucket, sort=False):
+            path = out_dir / f"{b:04d}.csv"
+            part.to_csv(path, mode="a", header=b not in written, index=False)
+            written.add(b)
+    if not written:
+        # fichier vide: conserver les colonnes pour la comparaison
+        pd.DataFrame(columns=usecols).to_csv(out_dir / "0000.csv", index=False)
+
+
+def _read_partition(path: Path, columns: Iterable[str], dtypes: Dict[str, np.dtype]) -> pd.DataFrame:
+    if not path.exists():
+        return pd.DataFrame(columns=list(columns)).set_index("national_code")
+    part = pd.read_csv(path, dtype=str)
+    return part.apply(lambda col: _typed(col, dtypes.get(col.name))).set_index("national_code")
+
+
+def compare_chunked(old_csv: str, new_csv: str, out_path: str, chunksize: int = 100_000,
+                    partitions: int = 16, fields: List[str] = FIELDS,
+                    tmp_dir: Optional[str] = None) -> int:
+    """
+    Comparer deux CSV sans les charger en entier
+
+    Les écarts sont écrits partition par partition dans out_path (JSONL ou
+    Parquet); l'ordre n'est garanti qu'à l'intérieur d'une partition.
+
+    Returns:
+        nombre d'écarts écrits
+    """
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        old_dir, new_dir = Path(tmp) / "old", Path(tmp) / "new"
+        old_dir.mkdir()
+        new_dir.mkdir()
+        _partition(old_csv, old_dir, partitions, chunksize, fields)
+        _partition(new_csv, new_dir, partitions, chunksize, fields)
 
-    deltas = []
+        old_columns = pd.read_csv(old_csv, nrows=0).columns
+        new_columns = pd.read_csv(new_csv, nrows=0).columns
+        old_columns = ["national_code"] + [f for f in fields if f in old_columns]
+        new_columns = ["national_code"] + [f for f in fields if f in new_columns]
+        old_dtypes = _csv_dtypes(old_csv, old_columns, chunksize)
+        new_dtypes = _csv_dtypes(new_csv, new_columns, chunksize)
+        with DeltaWriter(out_path) as writer:
+            for b in range(partitions):
+                name = f"{b:04d}.csv"
+                old = _read_partition(old_dir / name, old_columns, old_dtypes)
+                new = _read_partition(new_dir / name, new_columns, new_dtypes)
+                writer.write(diff_frames(old, new, fields))
+            return writer.count
 
-    for c in new.index.difference(old.index):
-        deltas.append({"national_code": c, "change_type": "NEW"})
 
-    for c in old.index.difference(new.index):
-        deltas.append({"national_code": c, "change_type": "REMOVED"})
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Écarts entre deux versions d'un tarif national")
+    parser.add_argument("old_csv")
+    parser.add_argument("new_csv")
+    parser.add_argument("--out", help="fichier .jsonl ou .parquet (défaut: JSON sur stdout)")
+    parser.add_argument("--chunksize", type=int, default=0,
+                        help="lecture par blocs de N lignes (requiert --out)")
+    parser.add_argument("--partitions", type=int, default=16)
+    args = parser.parse_args(argv)
 
-    common = old.index.intersection(new.index)
-    for c in common:
-        for f in FIELDS:
-            ov = str(old.loc[c, f]) if f in old.columns else ""
-            nv = str(new.loc[c, f]) if f in new.columns else ""
-            if ov != nv:
-                deltas.append({
-                    "national_code": c,
-                    "change_type": "MODIFIED",
-                    "field_changed": f,
-                    "old_value": ov,
-                    "new_value": nv
-                })
+    if args.chunksize:
+        if not args.out:
+            parser.error("--chunksize requires --out")
+        count = compare_chunked(args.old_csv, args.new_csv, args.out, args.chunksize, args.partitions)
+        print(f"{count} deltas -> {args.out}", file=sys.stderr)
+    elif args.out:
+        old = pd.read_csv(args.old_csv).set_index("national_code")
+        new = pd.read_csv(args.new_csv).set_index("national_code")
+        with DeltaWriter(args.out) as writer:
+            writer.write(diff_frames(old, new))
+        print(f"{writer.count} deltas -> {args.out}", file=sys.stderr)
+    else:
+        print(json.dumps(compare(args.old_csv, args.new_csv), ensure_ascii=False, indent=2))
 
-    return deltas
 
 if __name__ == "__main__":
-    old_csv, new_csv = sys.argv[1], sys.argv[2]
-    print(json.dumps(compare(old_csv, new_csv), ensure_ascii=False, indent=2))
+    main()
@@ -1,6 +1,39 @@
-import pandas as pd
+"""
+Contrôle qualité d'un tarif national normalisé (CSV)
+
+run_qa charge le CSV en entier (mode historique). run_qa_streaming lit le
+fichier par blocs et calcule toutes les métriques en une passe, sous forme
+d'agrégats partiels fusionnables (QAStats): les blocs peuvent donc être
+traités en parallèle puis combinés.
+- colonnes JSON de taxes: chaque valeur distincte d'un bloc est analysée
+  une seule fois (codes présents, taux)
+- hs6 distincts: estimés par un sketch HyperLogLog (fusion = max des registres)
+
+Les taux missing_dd_pct / missing_tva_pct ne sont identiques à ceux de
+run_qa que pour du JSON compact. run_qa cherche la sous-chaîne
+'"code":"DD"', alors que le mode en flux analyse le JSON: une cellule
+'{"code": "DD"}' (avec espaces) porte DD ici mais pas dans run_qa, et une
+cellule illisible contenant '"code":"DD"' porte DD dans run_qa mais pas
+ici (elle est comptée dans invalid_json).
+
+Usage:
+    python qa_engine.py tarif.csv
+    python qa_engine.py tarif.csv --stream --chunksize 100000 --workers 4
+"""
+import argparse
 import json
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+TAX_COLUMNS = ["advalorem_json", "specific_json"]
+REPORTED_TAXES = ["DD", "TVA"]
+HLL_PRECISION = 14
+
 
 def run_qa(csv_path: str):
     df = pd.read_csv(csv_path)
@@ -18,5 +51,207 @@ def run_qa(csv_path: str):
     }
     return qa
 
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count sketch (2**precision one-byte registers)
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add(self, values: pd.Series) -> None:
+        values = values.dropna()
+        if values.empty:
+            return
+        hashes = pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy(dtype=np.uint64)
+        p = self.precision
+        buckets = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        # rang = position du premier bit à 1 dans les 64 - p bits restants
+        bit_length = np.zeros(len(rest), dtype=np.int64)
+        for shift in (32, 16, 8, 4, 2, 1):
+            high = rest >= np.uint64(1 << shift)
+            bit_length[high] += shift
+            rest = np.where(high, rest >> np.uint64(shift), rest)
+        bit_length += rest > 0
+        rank = (64 - p - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # petites cardinalités: comptage linéaire
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+def _tax_entries(raw: str):
+    """(code, taux) des entrées d'une cellule JSON de taxes; None si illisible"""
+    try:
+        entries = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    if isinstance(entries, dict):
+        entries = [entries]
+    if not isinstance(entries, list):
+        return None
+    out = []
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get("code") is not None:
+            rate = entry.get("rate")
+            out.append((str(entry["code"]), float(rate) if isinstance(rate, (int, float)) else None))
+    return out
+
+
+class QAStats:
+    """
+    Partial QA aggregates over a set of rows; merge() combines two partials
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.columns = set()
+        self.desc_missing = 0
+        self.desc_blank = 0
+        self.hs6 = HyperLogLog()
+        # colonne -> code -> nombre de lignes portant ce code
+        self.tax_rows: Dict[str, Counter] = {c: Counter() for c in TAX_COLUMNS}
+        # colonne -> code -> taux -> nombre d'occurrences
+        self.tax_rates: Dict[str, Dict[str, Counter]] = {c: {} for c in TAX_COLUMNS}
+        self.invalid_json: Counter = Counter()
+
+    def update(self, chunk: pd.DataFrame) -> "QAStats":
+        self.total += len(chunk)
+        self.columns.update(chunk.columns)
+        if "hs6" in chunk.columns:
+            self.hs6.add(chunk["hs6"])
+        if "description_fr" in chunk.columns:
+            desc = chunk["description_fr"]
+            self.desc_missing += int(desc.isna().sum())
+            self.desc_blank += int((desc.isna() | (desc.astype(str).str.strip() == "")).sum())
+        for column in TAX_COLUMNS:
+            if column in chunk.columns:
+                self._update_taxes(column, chunk[column])
+        return self
+
+    def _update_taxes(self, column: str, values: pd.Series) -> None:
+        rows, rates = self.tax_rows[column], self.tax_rates[column]
+        # une analyse JSON par valeur distincte du bloc, pondérée par son nombre de lignes
+        for raw, n in values.dropna().value_counts(sort=False).items():
+            entries = _tax_entries(raw)
+            if entries is None:
+                self.invalid_json[column] += n
+                continue
+            for code in {code for code, _ in entries}:
+                rows[code] += n
+            for code, rate in entries:
+                if rate is not None:
+                    rates.setdefault(code, Counter())[rate] += n
+
+    def merge(self, other: "QAStats") -> "QAStats":
+        self.total += other.total
+        self.columns |= other.columns
+        self.desc_missing += other.desc_missing
+        self.desc_blank += other.desc_blank
+        self.hs6.merge(other.hs6)
+        for column in TAX_COLUMNS:
+            self.tax_rows[column].update(other.tax_rows[column])
+            for code, counts in other.tax_rates[column].items():
+                self.tax_rates[column].setdefault(code, Counter()).update(counts)
+        self.invalid_json.update(other.invalid_json)
+        return self
+
+    def _pct(self, n: int) -> float:
+        return float(n * 100.0 / self.total) if self.total else float("nan")
+
+    def result(self) -> Dict:
+        """Métriques au format de run_qa, complétées par le détail par taxe"""
+        advalorem = self.tax_rows["advalorem_json"]
+        qa = {
+            "total_lines": int(self.total),
+            "unique_hs6": self.hs6.count() if "hs6" in self.columns else None,
+            **{f"missing_{code.lower()}_pct": 100.0 - self._pct(advalorem[code]) for code in REPORTED_TAXES},
+            "empty_desc_pct": self._pct(self.desc_missing) if "description_fr" in self.columns else None,
+            "blank_desc_pct": self._pct(self.desc_blank) if "description_fr" in self.columns else None,
+            "taxes": {},
+        }
+        for column in TAX_COLUMNS:
+            if column not in self.columns:
+                continue
+            taxes = {}
+            for code in sorted(self.tax_rows[column]):
+                present = self.tax_rows[column][code]
+                counts = self.tax_rates[column].get(code, Counter())
+                n = sum(counts.values())
+                taxes[code] = {
+                    "lines": int(present),
+                    "missing_pct": 100.0 - self._pct(present),
+                    "rates": {
+                        "count": int(n),
+                        "min": min(counts) if counts else None,
+                        "max": max(counts) if counts else None,
+                        "mean": sum(r * k for r, k in sorted(counts.items())) / n if n else None,
+                        "distribution": {str(r): int(k) for r, k in sorted(counts.items())},
+                    },
+                }
+            qa["taxes"][column] = {"invalid_json": int(self.invalid_json[column]), "codes": taxes}
+        return qa
+
+
+def _chunk_stats(chunk: pd.DataFrame) -> QAStats:
+    return QAStats().update(chunk)
+
+
+def _read_chunks(csv_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    # hs6 lu en texte: le typage ne doit pas varier d'un bloc à l'autre
+    yield from pd.read_csv(csv_path, chunksize=chunksize, dtype={"hs6": str})
+
+
+def aggregate(chunks: Iterable[pd.DataFrame], workers: int = 1) -> QAStats:
+    """Fusionner les agrégats des blocs, en série ou sur un pool de processus"""
+    stats = QAStats()
+    if workers <= 1:
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(_chunk_stats, chunk))
+            # au plus 2 blocs en attente par worker: mémoire bornée
+            if len(pending) >= 2 * workers:
+                stats.merge(pending.pop(0).result())
+        for future in pending:
+            stats.merge(future.result())
+    return stats
+
+
+def run_qa_streaming(csv_path: str, chunksize: int = 100_000, workers: int = 1) -> Dict:
+    return aggregate(_read_chunks(csv_path, chunksize), workers).result()
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Contrôle qualité d'un tarif normalisé")
+    parser.add_argument("csv_path")
+    parser.add_argument("--stream", action="store_true", help="lecture par blocs, agrégats fusionnables")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+    if args.stream:
+        qa = run_qa_streaming(args.csv_path, args.chunksize, args.workers)
+    else:
+        qa = run_qa(args.csv_path)
+    print(json.dumps(qa, ensure_ascii=False, indent=2))
+
+
 if __name__ == "__main__":
-    print(json.dumps(run_qa(sys.argv[1]), ensure_ascii=False, indent=2))
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed import-substitution trade matrix
+
+Fetches, for every African country and requested year, the full BACI HS4
+export table and the Importer × Exporter × HS4 import table from OEC, then
+writes the dense country × HS4 × year matrix used by the substitution
+endpoints (backend/services/trade_matrix.py).
+
+Usage:
+    python scripts/build_trade_matrix.py --years 2020 2021 2022
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from services.real_trade_data_service import AFRICAN_COUNTRIES, RealTradeDataService
+from services.trade_matrix import TRADE_MATRIX_PATH, TradeMatrix
+
+DEFAULT_YEARS = [2020, 2021, 2022]
+
+
+async def fetch_tables(years):
+    """Fetch export and bilateral import tables for all countries and years"""
+    service = RealTradeDataService()
+    countries = list(AFRICAN_COUNTRIES)
+    export_tables = {}
+    bilateral_tables = {}
+
+    try:
+        for year in years:
+            print(f"\n=== {year} ===")
+            exports = await asyncio.gather(
+                *(service.fetch_country_table("export", iso3, year) for iso3 in countries),
+                return_exceptions=True
+            )
+            for iso3, records in zip(countries, exports):
+                if isinstance(records, Exception) or records is None:
+                    # Table absente: l'API se rabat sur OEC en direct (voir TradeMatrix.covers_*)
+                    print(f"✗ Export table error for {iso3}: {records or 'no OEC response'}")
+                    continue
+                export_tables[(iso3, year)] = records
+
+            bilateral = await asyncio.gather(
+                *(service.get_bilateral_table(iso3, year) for iso3 in countries),
+                return_exceptions=True
+            )
+            for iso3, records in zip(countries, bilateral):
+                if isinstance(records, Exception) or records is None:
+                    # Table absente: l'API se rabat sur OEC en direct pour ce pays et cette année
+                    print(f"✗ Import table error for {iso3}: {records or 'no OEC response'}")
+                    continue
+                bilateral_tables[(iso3, year)] = records
+
+            fetched = [iso3 for iso3 in countries if (iso3, year) in export_tables]
+            empty = [iso3 for iso3 in fetched if not export_tables[(iso3, year)]]
+            imported = sum(1 for iso3 in countries if (iso3, year) in bilateral_tables)
+            print(f"✓ {len(fetched)}/{len(countries)} export tables, {imported}/{len(countries)} import tables")
+            if empty:
+                print(f"⚠ No export data: {', '.join(empty)}")
+    finally:
+        await service.aclose()
+
+    return countries, export_tables, bilateral_tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the BACI trade opportunity matrix")
+    parser.add_argument("--years", type=int, nargs="+", default=DEFAULT_YEARS)
+    parser.add_argument("--output", type=Path, default=TRADE_MATRIX_PATH)
+    args = parser.parse_args()
+
+    started = time.time()
+    print(f"Building trade matrix for {args.years}...")
+
+    countries, export_tables, bilateral_tables = asyncio.run(fetch_tables(args.years))
+    matrix = TradeMatrix.from_tables(
+        countries,
+        [info["oec"] for info in AFRICAN_COUNTRIES.values()],
+        export_tables,
+        bilateral_tables
+    )
+    matrix.save(args.output)
+
+    size_kb = args.output.stat().st_size / 1024
+    print(f"\n💾 Matrix {matrix.exports.shape} saved to {args.output} ({size_kb:.0f} KB)")
+    print(f"Done in {time.time() - started:.0f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,17 @@
-import json
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 
+from tariff_engine.bloc_store import BLOC_STORE
+
 DATA_PATH = Path("tariff_engine/normalized/EAC_MASTER_14_80_indexed.json")
 
 app = FastAPI(title="Tariff API (EAC)")
 
-_cache = None
-
 def load_data():
-    global _cache
-    if _cache is None:
-        if not DATA_PATH.exists():
-            raise FileNotFoundError(f"Missing data file: {DATA_PATH}")
-        _cache = json.loads(DATA_PATH.read_text(encoding="utf-8"))
-    return _cache
+    if not DATA_PATH.exists():
+        raise FileNotFoundError(f"Missing data file: {DATA_PATH}")
+    # index binaire partagé (tariff_engine/bloc_store.py)
+    return BLOC_STORE.open(DATA_PATH)
 
 @app.get("/api/tariff/eac")
 def get_eac(hs: str):
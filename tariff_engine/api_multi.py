@@ -1,30 +1,12 @@
-import json
-from pathlib import Path
 from fastapi import FastAPI, HTTPException
 
-DATA_DIR = Path("tariff_engine/normalized")
+from tariff_engine.bloc_store import BLOC_STORE
 
 app = FastAPI(title="Tariff API (multi-blocs)")
 
-_cache = {}
-
 def load_bloc(bloc: str):
-    bloc = bloc.upper().strip()
-
-    # Convention de nommage
-    candidates = [
-        DATA_DIR / f"{bloc}_MASTER_indexed.json",
-        DATA_DIR / f"{bloc}_MASTER_14_80_indexed.json",
-        DATA_DIR / f"{bloc}_MASTER_indexed.json".lower(),
-    ]
-
-    for p in candidates:
-        if p.exists():
-            if bloc not in _cache:
-                _cache[bloc] = json.loads(p.read_text(encoding="utf-8"))
-            return _cache[bloc], str(p)
-
-    raise FileNotFoundError(f"No indexed JSON found for bloc={bloc}. Expected one of: {', '.join(str(x) for x in candidates)}")
+    # Convention de nommage: voir bloc_store.bloc_candidates
+    return BLOC_STORE.load(bloc)
 
 @app.get("/api/tariff/{bloc}")
 def get_tariff(bloc: str, hs: str):
@@ -38,7 +20,7 @@ def get_tariff(bloc: str, hs: str):
     if not row:
         raise HTTPException(status_code=404, detail={"error": "not found", "bloc": bloc.upper(), "hs": key, "source": src})
 
-    # ajoute une trace utile côté client
+    # ajoute une trace utile côté client (row est une copie propre à la requête)
     row["_bloc"] = bloc.upper()
     row["_dataset"] = src
     return row
@@ -0,0 +1,44 @@
+"""
+Benchmark: extraction PDF page par page (eac_parser_v1_2) selon le nombre de workers
+
+Mesure les pages/s en séquentiel puis sur un pool de processus, et vérifie
+que le résultat est identique au mode séquentiel.
+
+Usage (depuis la racine du dépôt):
+    python -m tariff_engine.bench_extraction tariff_engine/pdf_sources/EAC/EAC.pdf --pages 14-80 --workers 1 2 4 8
+"""
+import argparse
+import time
+
+from tariff_engine.parsers.eac_parser_v1_2 import parse_pages
+
+
+def page_range(spec: str):
+    first, _, last = spec.partition("-")
+    return list(range(int(first), int(last or first) + 1))
+
+
+def run(pdf_path: str, pages, workers_list):
+    print(f"{'workers':>8} {'time (s)':>10} {'pages/s':>9} {'speedup':>9} {'hs rows':>8}")
+    reference, base = None, None
+    for workers in workers_list:
+        start = time.perf_counter()
+        df = parse_pages(pdf_path, pages, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference, base = df, elapsed
+            same = True
+        else:
+            same = df.reset_index(drop=True).equals(reference.reset_index(drop=True))
+        print(f"{workers:>8} {elapsed:>10.1f} {len(pages) / elapsed:>9.2f} {base / elapsed:>8.1f}x "
+              f"{len(df):>8}" + ("" if same else "  MISMATCH"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf")
+    parser.add_argument("--pages", default="14-80")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    run(args.pdf, page_range(args.pages), args.workers)
@@ -0,0 +1,370 @@
+"""
+Magasin partagé des blocs normalisés (tariff_engine/normalized/*_indexed.json)
+
+Chaque JSON indexé est compilé une fois par version (empreinte SHA-256 du
+JSON) en un index binaire voisin (<fichier>.idx), projeté en mémoire:
+- clés HS triées à largeur fixe + numéro de ligne de chaque clé
+  (recherche dichotomique directement dans le mmap, rien à construire)
+  et ordre du fichier d'origine (itération, sample_keys)
+- statistiques du bloc (/meta) calculées à la compilation, dans l'en-tête
+- préfixes (HS4/HS6) et plages: dichotomie puis tranche contiguë des clés triées
+- clés normalisées (hs_key): l'extraction PDF perd souvent le zéro initial
+  des chapitres 01 à 09 ('1012100' pour 0101.21.00); un code numérique de
+  longueur impaire est complété d'un zéro, à la compilation comme pour les
+  clés, préfixes et bornes demandés
+- une colonne par champ: identifiant dans un pool de valeurs partagé
+  (JSON de la valeur, décodé au premier accès puis mémorisé)
+
+api.py, api_multi.py et backend/routers/tariff_engine_router.py lisent
+tous via BLOC_STORE: un seul index par processus, aucune analyse du JSON
+au moment de la requête, et chaque lecture renvoie un nouveau dict.
+
+Usage (depuis la racine du dépôt, compile tous les index):
+    python -m tariff_engine.bloc_store
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from array import array
+from itertools import islice
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path("tariff_engine/normalized")
+
+MAGIC = b"BLOCIDX\x01"
+FORMAT_VERSION = 3
+ABSENT = 0xFFFFFFFF  # champ absent de l'enregistrement
+
+
+def bloc_candidates(bloc: str, data_dir: Path = DATA_DIR) -> List[Path]:
+    """Fichiers indexés possibles pour un bloc (convention de nommage)"""
+    b = bloc.upper().strip()
+    return [
+        data_dir / f"{b}_MASTER_indexed.json",
+        data_dir / f"{b}_MASTER_14_80_indexed.json",
+        data_dir / f"{b}_MASTER_indexed.json".lower(),
+    ]
+
+
+def hs_key(code: str) -> str:
+    """
+    Clé HS normalisée: les codes HS ont une longueur paire (chapitre, HS4,
+    HS6, lignes nationales à 8 ou 10 chiffres), une longueur impaire
+    signale un zéro initial perdu
+    """
+    code = code.replace(".", "").strip()
+    if code.isdigit() and len(code) % 2:
+        return "0" + code
+    return code
+
+
+def build_index(data: Dict[str, Dict], source_sha256: str) -> bytes:
+    """Compiler un JSON indexé {clé HS: enregistrement} au format binaire"""
+    normalized: Dict[str, Dict] = {}
+    for key, record in data.items():
+        key = hs_key(key)
+        if key in normalized:
+            logger.warning(f"Duplicate HS key {key} after normalization, keeping the first record")
+            continue
+        normalized[key] = record
+    data = normalized
+
+    fields: Dict[str, int] = {}
+    for record in data.values():
+        for name in record:
+            fields.setdefault(name, len(fields))
+
+    pool: Dict[str, int] = {}
+
+    def intern(value) -> int:
+        token = json.dumps(value, ensure_ascii=False)
+        value_id = pool.get(token)
+        if value_id is None:
+            value_id = pool[token] = len(pool)
+        return value_id
+
+    keys = [k.encode("utf-8") for k in data]
+    width = max((len(k) for k in keys), default=1)
+    columns = {name: array("I") for name in fields}
+    for record in data.values():
+        for name, column in columns.items():
+            column.append(intern(record[name]) if name in record else ABSENT)
+
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    rank = array("I", bytes(4 * len(keys)))
+    for position, row in enumerate(order):
+        rank[row] = position
+    encoded = [token.encode("utf-8") for token in pool]
+    value_offsets = array("I", [0])
+    for blob in encoded:
+        value_offsets.append(value_offsets[-1] + len(blob))
+
+    sections: List[Tuple[str, str, bytes]] = [
+        ("keys", "B", b"".join(keys[row].ljust(width, b"\x00") for row in order)),
+        ("rows", "I", array("I", order).tobytes()),
+        ("rank", "I", rank.tobytes()),
+        ("values", "B", b"".join(encoded)),
+        ("value_offsets", "I", value_offsets.tobytes()),
+        *((f"col_{i}", "I", columns[name].tobytes()) for i, name in enumerate(fields)),
+    ]
+    layout = {}
+    blob = bytearray()
+    for name, typecode, payload in sections:
+        blob.extend(b"\x00" * (-len(blob) % 8))
+        layout[name] = [len(blob), len(payload), typecode]
+        blob.extend(payload)
+
+    records = list(data.values())
+    stats = {
+        "keys": len(keys),
+        "rate_non_null": sum(1 for r in records if r.get("duty_rate_pct") is not None),
+        "unit_non_empty": sum(1 for r in records if str(r.get("unit", "")).strip() != ""),
+        "sample_keys": list(islice(data, 10)),
+    }
+    header = json.dumps({
+        "version": FORMAT_VERSION,
+        "source_sha256": source_sha256,
+        "count": len(keys),
+        "key_width": width,
+        "values": len(pool),
+        "fields": list(fields),
+        "stats": stats,
+        "sections": layout,
+    }).encode("utf-8")
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    prefix += b"\x00" * (-len(prefix) % 8)
+    return prefix + bytes(blob)
+
+
+def _read_header(view) -> Tuple[Dict, int]:
+    if bytes(view[:len(MAGIC)]) != MAGIC:
+        raise ValueError("not a bloc index")
+    (header_len,) = struct.unpack_from("<I", view, len(MAGIC))
+    start = len(MAGIC) + 4
+    header = json.loads(bytes(view[start:start + header_len]))
+    base = start + header_len
+    return header, base + (-base % 8)
+
+
+class BlocIndex(Mapping):
+    """
+    Read-only mapping clé HS -> enregistrement over a memory-mapped index
+    """
+
+    def __init__(self, source: Path, buffer):
+        self.source = Path(source)
+        view = memoryview(buffer)
+        header, base = _read_header(view)
+
+        def section(name: str) -> memoryview:
+            offset, length, typecode = header["sections"][name]
+            raw = view[base + offset:base + offset + length]
+            return raw if typecode == "B" else raw.cast(typecode)
+
+        self._buffer = buffer
+        self.source_sha256 = header["source_sha256"]
+        self._count = header["count"]
+        self._width = header["key_width"]
+        self._fields = header["fields"]
+        self._keys_at = base + header["sections"]["keys"][0]
+        self._rows = section("rows")
+        self._rank = section("rank")
+        self._values = section("values")
+        self._value_offsets = section("value_offsets")
+        self._columns = [section(f"col_{i}") for i in range(len(self._fields))]
+        self._decoded: List = [None] * header["values"]
+        self._is_decoded = bytearray(header["values"])
+        self._stats = header["stats"]
+
+    def _key(self, position: int) -> bytes:
+        start = self._keys_at + position * self._width
+        return self._buffer[start:start + self._width]
+
+    def _value(self, value_id: int):
+        if not self._is_decoded[value_id]:
+            start, end = self._value_offsets[value_id], self._value_offsets[value_id + 1]
+            self._decoded[value_id] = json.loads(str(self._values[start:end], "utf-8"))
+            self._is_decoded[value_id] = 1
+        return self._decoded[value_id]
+
+    def _bound(self, target: bytes) -> int:
+        """Première position dont la clé est >= target (clés complétées à la largeur)"""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def row(self, key: str) -> Optional[int]:
+        """Ligne de la clé (recherche dichotomique dans les clés triées)"""
+        target = hs_key(key).encode("utf-8")
+        if len(target) > self._width:
+            return None
+        target = target.ljust(self._width, b"\x00")
+        position = self._bound(target)
+        if position < self._count and self._key(position) == target:
+            return self._rows[position]
+        return None
+
+    def span(self, start: str, end: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Positions triées [lo, hi) des clés comprises entre start et end
+
+        Les bornes sont des préfixes: span("1517") couvre toutes les clés
+        commençant par 1517, span("15", "16") les chapitres 15 et 16.
+        """
+        start = hs_key(start)
+        end = start if end is None else hs_key(end)
+        lo = self._bound(start.encode("utf-8").ljust(self._width, b"\x00"))
+        hi = self._bound(end.encode("utf-8").ljust(self._width, b"\xff"))
+        return lo, max(lo, hi)
+
+    def scan(self, start: str, end: Optional[str] = None, limit: Optional[int] = None) -> Iterator[Tuple[str, Dict]]:
+        """(clé, enregistrement) par ordre de clé sur span(start, end)"""
+        lo, hi = self.span(start, end)
+        if limit is not None:
+            hi = min(hi, lo + max(limit, 0))
+        for position in range(lo, hi):
+            yield self._key(position).rstrip(b"\x00").decode("utf-8"), self.record(self._rows[position])
+
+    def count(self, start: str, end: Optional[str] = None) -> int:
+        lo, hi = self.span(start, end)
+        return hi - lo
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """Enregistrements de plusieurs clés (None si absente)"""
+        out = {}
+        for key in keys:
+            row = self.row(key)
+            out[key] = None if row is None else self.record(row)
+        return out
+
+    def record(self, row: int) -> Dict:
+        """Enregistrement d'une ligne (nouveau dict à chaque appel)"""
+        out = {}
+        for name, column in zip(self._fields, self._columns):
+            value_id = column[row]
+            if value_id != ABSENT:
+                out[name] = self._value(value_id)
+        return out
+
+    def __getitem__(self, key: str) -> Dict:
+        row = self.row(key)
+        if row is None:
+            raise KeyError(key)
+        return self.record(row)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self.row(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for row in range(self._count):
+            yield self._key(self._rank[row]).rstrip(b"\x00").decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def stats(self) -> Dict:
+        """Statistiques du bloc calculées à la compilation (clés, taux, unités, échantillon)"""
+        return dict(self._stats)
+
+    def __repr__(self) -> str:
+        return f"<BlocIndex {self.source.name} ({self._count} keys)>"
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def open_index(source: Path) -> BlocIndex:
+    """
+    Index binaire du JSON, (re)compilé si absent ou si le JSON a changé
+    """
+    source = Path(source)
+    digest = _sha256(source)
+    index_path = source.with_suffix(".idx")
+    if index_path.exists():
+        with open(index_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header, _ = _read_header(memoryview(buffer))
+            if header["version"] == FORMAT_VERSION and header["source_sha256"] == digest:
+                return BlocIndex(source, buffer)
+        except ValueError:
+            pass
+        buffer.close()
+
+    payload = build_index(json.loads(source.read_text(encoding="utf-8")), digest)
+    try:
+        tmp = index_path.with_suffix(f".idx.{os.getpid()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, index_path)
+        logger.info(f"Bloc index {index_path} built ({len(payload)} bytes)")
+    except OSError as e:
+        # Répertoire en lecture seule: index gardé en mémoire
+        logger.warning(f"Bloc index {index_path} not written: {e}")
+        return BlocIndex(source, payload)
+    with open(index_path, "rb") as f:
+        return BlocIndex(source, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+class BlocStore:
+    """
+    Process-wide registry of opened bloc indexes
+    """
+
+    def __init__(self, data_dir: Path = DATA_DIR):
+        self.data_dir = Path(data_dir)
+        self._indexes: Dict[str, BlocIndex] = {}
+        self._lock = threading.Lock()
+
+    def open(self, source: Path) -> BlocIndex:
+        """Index d'un JSON indexé donné (ouvert une fois par processus)"""
+        key = str(source)
+        index = self._indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(key)
+                if index is None:
+                    index = self._indexes[key] = open_index(Path(source))
+        return index
+
+    def load(self, bloc: str) -> Tuple[BlocIndex, str]:
+        """
+        Index du bloc et chemin du JSON source
+
+        Raises:
+            FileNotFoundError: aucun fichier indexé pour ce bloc
+        """
+        b = bloc.upper().strip()
+        candidates = bloc_candidates(b, self.data_dir)
+        for p in candidates:
+            if str(p) in self._indexes or p.exists():
+                return self.open(p), str(p)
+        raise FileNotFoundError(
+            f"No indexed JSON found for bloc={b}. Expected one of: {', '.join(str(x) for x in candidates)}"
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+BLOC_STORE = BlocStore()
+
+
+if __name__ == "__main__":
+    for path in sorted(DATA_DIR.glob("*_indexed.json")):
+        index = open_index(path)
+        print(f"{path.name}: {len(index)} keys -> {path.with_suffix('.idx')}")
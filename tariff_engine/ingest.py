@@ -1,4 +1,4 @@
-import pandas as pd
+import os
 import requests
 import urllib3
 from pathlib import Path
@@ -9,6 +9,9 @@ BASE = Path("tariff_engine")
 PDF_DIR = BASE / "pdf_sources"
 NORM_DIR = BASE / "normalized"
 
+# Extraction PDF répartie sur N processus (1 = séquentiel)
+PARSE_WORKERS = int(os.getenv("TARIFF_PARSE_WORKERS", os.cpu_count() or 1))
+
 PDF_DIR.mkdir(exist_ok=True, parents=True)
 NORM_DIR.mkdir(exist_ok=True, parents=True)
 
@@ -41,34 +44,21 @@ def download(url: str, out: Path) -> None:
     print("Saved (insecure SSL):", out, f"({out.stat().st_size} bytes)")
 
 def ingest_row(row: dict) -> None:
-    bloc = row["bloc"]
-    parser = row["parser"]
-    pdf_url = row["pdf_url"]
-
-    bloc_dir = PDF_DIR / bloc
-    bloc_dir.mkdir(exist_ok=True, parents=True)
-
-    pdf_path = bloc_dir / f"{bloc}.pdf"
-    download(pdf_url, pdf_path)
+    """Ingérer une ligne du registre (sans tenir compte du plan)"""
+    from tariff_engine.scheduler import IngestionScheduler, spec_from_row
 
-    out_csv = NORM_DIR / f"{bloc}_MASTER.csv"
-
-    if parser == "eac":
-        # Ici tu peux pointer vers ton parser "production"
-        # Pour l'instant, on réutilise celui qui marche déjà sur ton PDF EAC.
-        from tariff_engine.parsers.eac_parser_v1_2 import run_to_csv
-
-        # Extraction ciblée 14-80 (rapide)
-        pages = list(range(14, 81))
-        run_to_csv(str(pdf_path), str(out_csv), pages=pages)
-        print("Parsed ->", out_csv)
-    else:
-        raise ValueError(f"Unknown parser: {parser}")
+    spec = spec_from_row(row)
+    scheduler = IngestionScheduler(specs=[spec], parse_workers=PARSE_WORKERS)
+    manifest = scheduler.ingest(spec, "manual")
+    if manifest["status"] != "ok":
+        raise RuntimeError(manifest["error"])
+    print("Parsed ->", manifest["output"], f"({scheduler.cache.summary()})")
 
 def main():
-    reg = pd.read_csv("registry.csv").fillna("")
-    for _, r in reg.iterrows():
-        ingest_row(r.to_dict())
+    # Blocs à jour ignorés, les autres ingérés en parallèle (voir scheduler.py)
+    from tariff_engine.scheduler import IngestionScheduler
+
+    IngestionScheduler("registry.csv", parse_workers=PARSE_WORKERS).run()
 
 if __name__ == "__main__":
     main()
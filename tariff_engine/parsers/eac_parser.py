@@ -1,14 +1,20 @@
-import camelot
 import pandas as pd
 
-def parse(pdf_path: str, out_csv: str) -> str:
-    tables = camelot.read_pdf(pdf_path, pages="1-end", flavor="stream")
-    frames = []
-    for t in tables:
-        df = t.df
-        if df is None or df.empty:
-            continue
-        frames.append(df)
+from tariff_engine.parsers import pages as pf
+
+# Clé du cache de pages: à incrémenter à chaque modification de l'extraction
+PARSER_VERSION = "eac_parser@1"
+
+def parse_page(pdf_path: str, page: int, flavor: str = "stream") -> pf.PageResult:
+    """Tables brutes d'une page (exécuté dans un worker en mode parallèle)"""
+    frames = pf.read_tables(pdf_path, page, flavor, clean=False)
+    rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return pf.PageResult(page, rows, None)
+
+def parse(pdf_path: str, out_csv: str, workers: int = 1, cache=None) -> str:
+    pages = range(1, pf.page_count(pdf_path) + 1)
+    results = pf.iter_pages(parse_page, pdf_path, pages, "stream", workers, cache, PARSER_VERSION)
+    frames = [r.rows for r in results if not r.rows.empty]
 
     if not frames:
         raise RuntimeError("Aucune table extraite. PDF peut être scanné ou structure incompatible.")
@@ -1,90 +1,78 @@
 import re
 import warnings
-import camelot
 import pandas as pd
 
+from tariff_engine.parsers import pages as pf
+
 warnings.filterwarnings("ignore")
 
+# Clé du cache de pages: à incrémenter à chaque modification de l'extraction
+PARSER_VERSION = "eac_parser_v1_1@2"
+
 HS_RE = re.compile(r"\b(\d{4}\.\d{2}\.\d{2})\b|\b(\d{6,10})\b")
 PCT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
 
-def _clean(x: str) -> str:
-    return str(x).replace("\n", " ").replace("\r", " ").strip()
-
-def _to_hs(code: str) -> str:
-    c = _clean(code).replace(".", "")
-    return c if c.isdigit() else ""
-
-def _rate_pct(rate_cell: str):
-    s = _clean(rate_cell)
-    m = PCT_RE.search(s)
-    return float(m.group(1)) if m else None
-
-def parse_range(pdf_path: str, page_from: int = 14, page_to: int = 80, flavor: str = "stream") -> pd.DataFrame:
-    out = []
-    current_heading = None  # ex: "15.17" for context if needed
-
-    for p in range(page_from, page_to + 1):
-        try:
-            tables = camelot.read_pdf(pdf_path, pages=str(p), flavor=flavor)
-        except Exception:
-            continue
-
-        for tb in tables:
-            df = tb.df
-            if df is None or df.empty:
-                continue
-
-            df = df.applymap(_clean)
-
-            # Attendu: 7 colonnes (comme page 75). On tolère 5-8.
-            if df.shape[1] < 5:
-                continue
-
-            # Normaliser colonnes: on travaille sur index 0..n-1
-            for _, r in df.iterrows():
-                c0 = r.iloc[0] if df.shape[1] > 0 else ""
-                c1 = r.iloc[1] if df.shape[1] > 1 else ""
-                c2 = r.iloc[2] if df.shape[1] > 2 else ""
-                c3 = r.iloc[3] if df.shape[1] > 3 else ""
-                c4 = r.iloc[4] if df.shape[1] > 4 else ""
-                c5 = r.iloc[5] if df.shape[1] > 5 else ""
-                c6 = r.iloc[6] if df.shape[1] > 6 else ""
-
-                # détecter heading (ex "15.17") pour contexte
-                if re.fullmatch(r"\d{1,2}\.\d{2}", c0) and c1 == "":
-                    current_heading = c0
-
-                # HS code est généralement dans c1 (Tariff No.) sinon parfois dans c0
-                hs = _to_hs(c1) or _to_hs(c0)
-                if not hs or len(hs) < 6:
-                    continue
-
-                # Description: c2 + c3 (souvent split)
-                desc = " ".join([x for x in [c2, c3] if x]).strip()
-
-                # Unité: peut être en c4 ou c5 (selon ligne)
-                unit = ""
-                # heuristique: cellule courte alphabétique
-                for u in [c4, c5]:
-                    uu = _clean(u)
-                    if 0 < len(uu) <= 5 and re.fullmatch(r"[A-Za-z]+", uu):
-                        unit = uu.lower()
-                        break
-
-                duty = _rate_pct(c6) or _rate_pct(c5)  # parfois le taux glisse
-
-                out.append({
-                    "hs_code": hs,
-                    "heading_ctx": current_heading,
-                    "description": desc,
-                    "unit": unit,
-                    "duty_rate_pct": duty,
-                    "page": p,
-                    "source_pdf": pdf_path
-                })
-
-    df_out = pd.DataFrame(out)
+HEADING_RE = r"\d{1,2}\.\d{2}"
+UNIT_RE = r"[A-Za-z]{1,5}"
+
+
+def classify_table(df: pd.DataFrame, page: int, pdf_path: str):
+    """
+    Lignes tarifaires d'une table nettoyée (remplace la boucle iterrows)
+
+    Returns:
+        (lignes, dernière position vue dans la table)
+    """
+    # Attendu: 7 colonnes (comme page 75). On tolère 5-8.
+    if df.shape[1] < 5:
+        return pd.DataFrame(), None
+    df = df.reset_index(drop=True)
+    empty = pd.Series("", index=df.index)
+    c0, c1, c2, c3, c4, c5, c6 = (df.iloc[:, i] if df.shape[1] > i else empty for i in range(7))
+
+    # détecter heading (ex "15.17") pour contexte
+    headings = c0.where(c0.str.fullmatch(HEADING_RE) & (c1 == ""))
+    heading_ctx = headings.ffill()
+    last_heading = headings.dropna().iloc[-1] if headings.notna().any() else None
+
+    # HS code est généralement dans c1 (Tariff No.) sinon parfois dans c0
+    hs = pf.hs_column(c1)
+    hs = hs.where(hs != "", pf.hs_column(c0))
+    keep = hs.str.len() >= 6
+    if not keep.any():
+        return pd.DataFrame(), last_heading
+    c2, c3, c4, c5, c6 = (c[keep] for c in (c2, c3, c4, c5, c6))
+
+    # Unité: peut être en c4 ou c5 (selon ligne), cellule courte alphabétique
+    unit = c4.str.lower().where(c4.str.fullmatch(UNIT_RE), c5.str.lower().where(c5.str.fullmatch(UNIT_RE), ""))
+
+    # Taux en c6, parfois glissé en c5 (un taux nul en c6 compte comme absent)
+    rate6 = c6.str.extract(PCT_RE, expand=False).astype(float)
+    rate5 = c5.str.extract(PCT_RE, expand=False).astype(float)
+    duty = rate6.where(rate6.notna() & (rate6 != 0), rate5)
+
+    rows = pd.DataFrame({
+        "hs_code": hs[keep],
+        "heading_ctx": heading_ctx[keep],
+        # Description: c2 + c3 (souvent split)
+        "description": (c2 + " " + c3).str.strip(),
+        "unit": unit,
+        "duty_rate_pct": duty,
+        "page": int(page),
+        "source_pdf": pdf_path
+    })
+    return rows.reset_index(drop=True), last_heading
+
+
+def parse_page(pdf_path: str, page: int, flavor: str = "stream") -> pf.PageResult:
+    """Lire et classer une page (exécuté dans un worker en mode parallèle)"""
+    return pf.page_result(page, [classify_table(df, page, pdf_path) for df in pf.read_tables(pdf_path, page, flavor)])
+
+
+def parse_range(pdf_path: str, page_from: int = 14, page_to: int = 80, flavor: str = "stream",
+                workers: int = 1, cache=None) -> pd.DataFrame:
+    pages = range(page_from, page_to + 1)
+    df_out = pf.merge_pages(pf.iter_pages(parse_page, pdf_path, pages, flavor, workers, cache, PARSER_VERSION))
     if df_out.empty:
         return df_out
 
@@ -92,7 +80,8 @@ def parse_range(pdf_path: str, page_from: int = 14, page_to: int = 80, flavor: s
     df_out = df_out.sort_values(by=["hs_code", "page"]).drop_duplicates(subset=["hs_code"], keep="last")
     return df_out
 
-def run_to_csv(pdf_path: str, out_csv: str, page_from: int = 14, page_to: int = 80) -> str:
-    df = parse_range(pdf_path, page_from, page_to, flavor="stream")
+def run_to_csv(pdf_path: str, out_csv: str, page_from: int = 14, page_to: int = 80, workers: int = 1,
+               cache=None) -> str:
+    df = parse_range(pdf_path, page_from, page_to, flavor="stream", workers=workers, cache=cache)
     df.to_csv(out_csv, index=False)
     return out_csv
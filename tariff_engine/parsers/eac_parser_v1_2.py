@@ -1,10 +1,14 @@
 import re
 import warnings
-import camelot
 import pandas as pd
 
+from tariff_engine.parsers import pages as pf
+
 warnings.filterwarnings("ignore")
 
+# Clé du cache de pages: à incrémenter à chaque modification de l'extraction
+PARSER_VERSION = "eac_parser_v1_2@2"
+
 PCT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
 
 # whitelist d'unités courantes (à enrichir)
@@ -12,85 +16,67 @@ UNIT_OK = {
     "kg","g","l","hl","m","m2","m3","no","nos","u","unit","pair","prs","pc","pcs","set","doz","ton","t"
 }
 
-def _clean(x: str) -> str:
-    return str(x).replace("\n", " ").replace("\r", " ").strip()
-
-def _to_hs(code: str) -> str:
-    c = _clean(code).replace(".", "")
-    return c if c.isdigit() else ""
-
-def _find_rate_pct(cells) -> float:
-    for v in cells:
-        m = PCT_RE.search(_clean(v))
-        if m:
-            return float(m.group(1))
-    return None
-
-def _find_unit(cells) -> str:
-    # on cherche une cellule courte alphnum, puis on normalise
-    for v in cells:
-        u = _clean(v).lower()
-        u = u.replace(".", "")
-        if not u:
-            continue
-        if len(u) <= 6 and re.fullmatch(r"[a-z0-9]+", u):
-            if u in UNIT_OK:
-                return u
-    return ""
-
-def parse_pages(pdf_path: str, pages, flavor: str = "stream") -> pd.DataFrame:
-    out = []
-    current_heading = None
-
-    for p in pages:
-        try:
-            tables = camelot.read_pdf(pdf_path, pages=str(p), flavor=flavor)
-        except Exception:
-            continue
-
-        for tb in tables:
-            df = tb.df
-            if df is None or df.empty:
-                continue
-            df = df.applymap(_clean)
-
-            if df.shape[1] < 4 or df.shape[0] < 5:
-                continue
-
-            for _, r in df.iterrows():
-                cells = r.values.tolist()
-                c0 = cells[0] if len(cells) > 0 else ""
-                c1 = cells[1] if len(cells) > 1 else ""
-                c2 = cells[2] if len(cells) > 2 else ""
-                c3 = cells[3] if len(cells) > 3 else ""
-
-                # heading contexte (ex 15.17)
-                if re.fullmatch(r"\d{1,2}\.\d{2}", _clean(c0)) and _clean(c1) == "":
-                    current_heading = _clean(c0)
-
-                hs = _to_hs(c1) or _to_hs(c0)
-                if not hs or len(hs) < 6:
-                    continue
-
-                # description: concat des colonnes textuelles (on exclut les colonnes qui ressemblent à unit ou rate)
-                desc = " ".join([_clean(c2), _clean(c3)]).strip()
-
-                duty = _find_rate_pct(cells)
-
-                # unité: cherche dans toutes les cellules, mais whitelistée
-                unit = _find_unit(cells)
-
-                out.append({
-                    "hs_code": hs,
-                    "heading_ctx": current_heading,
-                    "description": desc,
-                    "unit": unit,
-                    "duty_rate_pct": duty,
-                    "page": int(p),
-                    "source_pdf": pdf_path
-                })
-
-    df_out = pd.DataFrame(out)
+HEADING_RE = r"\d{1,2}\.\d{2}"
+
+
+def _first_match(columns) -> pd.Series:
+    """Première valeur non manquante de chaque ligne, dans l'ordre des colonnes"""
+    result = None
+    for col in columns:
+        result = col if result is None else result.fillna(col)
+    return result
+
+
+def classify_table(df: pd.DataFrame, page: int, pdf_path: str):
+    """
+    Lignes tarifaires d'une table nettoyée (remplace la boucle iterrows)
+
+    Returns:
+        (lignes, dernière position vue dans la table)
+    """
+    if df.shape[1] < 4 or df.shape[0] < 5:
+        return pd.DataFrame(), None
+    df = df.reset_index(drop=True)
+    c0, c1, c2, c3 = (df.iloc[:, i] for i in range(4))
+
+    # heading contexte (ex 15.17)
+    headings = c0.where(c0.str.fullmatch(HEADING_RE) & (c1 == ""))
+    heading_ctx = headings.ffill()
+    last_heading = headings.dropna().iloc[-1] if headings.notna().any() else None
+
+    hs = pf.hs_column(c1)
+    hs = hs.where(hs != "", pf.hs_column(c0))
+    keep = hs.str.len() >= 6
+    if not keep.any():
+        return pd.DataFrame(), last_heading
+    cells = df[keep]
+
+    # taux: première cellule contenant un pourcentage
+    duty = _first_match(cells[c].str.extract(PCT_RE, expand=False).astype(float) for c in cells)
+    # unité: première cellule whitelistée
+    units = (cells[c].str.lower().str.replace(".", "", regex=False) for c in cells)
+    unit = _first_match(u.where(u.isin(UNIT_OK)) for u in units).fillna("")
+
+    rows = pd.DataFrame({
+        "hs_code": hs[keep],
+        "heading_ctx": heading_ctx[keep],
+        # description: concat des colonnes textuelles
+        "description": (c2[keep] + " " + c3[keep]).str.strip(),
+        "unit": unit,
+        "duty_rate_pct": duty,
+        "page": int(page),
+        "source_pdf": pdf_path
+    })
+    return rows.reset_index(drop=True), last_heading
+
+
+def parse_page(pdf_path: str, page: int, flavor: str = "stream") -> pf.PageResult:
+    """Lire et classer une page (exécuté dans un worker en mode parallèle)"""
+    return pf.page_result(page, [classify_table(df, page, pdf_path) for df in pf.read_tables(pdf_path, page, flavor)])
+
+
+def parse_pages(pdf_path: str, pages, flavor: str = "stream", workers: int = 1, cache=None) -> pd.DataFrame:
+    df_out = pf.merge_pages(pf.iter_pages(parse_page, pdf_path, pages, flavor, workers, cache, PARSER_VERSION))
     if df_out.empty:
         return df_out
 
@@ -100,7 +86,7 @@ def parse_pages(pdf_path: str, pages, flavor: str = "stream") -> pd.DataFrame:
     df_out = df_out.drop(columns=["has_rate"])
     return df_out
 
-def run_to_csv(pdf_path: str, out_csv: str, pages, flavor: str = "stream") -> str:
-    df = parse_pages(pdf_path, pages=pages, flavor=flavor)
+def run_to_csv(pdf_path: str, out_csv: str, pages, flavor: str = "stream", workers: int = 1, cache=None) -> str:
+    df = parse_pages(pdf_path, pages=pages, flavor=flavor, workers=workers, cache=cache)
     df.to_csv(out_csv, index=False)
     return out_csv
@@ -0,0 +1,88 @@
+"""
+Cache disque des pages extraites, adressé par contenu.
+
+Clé: (SHA-256 du PDF, numéro de page, version du parser, flavor camelot).
+Valeur: les lignes extraites de la page au format Parquet, la dernière
+position (heading) vue sur la page étant conservée dans les métadonnées.
+
+Une nouvelle ingestion d'un bulletin inchangé ne relit donc aucune page;
+après une modification du parser (PARSER_VERSION incrémentée), seules les
+pages de ce parser sont ré-extraites.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from tariff_engine.parsers.pages import PageResult
+
+CACHE_DIR = Path(os.getenv("TARIFF_PAGE_CACHE_DIR", "tariff_engine/page_cache"))
+
+LAST_HEADING_KEY = b"tariff_engine.last_heading"
+# Noms de colonnes d'origine (Parquet n'accepte que des noms texte; camelot numérote les colonnes)
+COLUMNS_KEY = b"tariff_engine.columns"
+
+_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 du fichier (mémorisé tant que taille et mtime sont inchangés)"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    digest = _digests.get(key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = _digests[key] = h.hexdigest()
+    return digest
+
+
+class PageCache:
+    """
+    Per-page extraction results stored as Parquet files
+    """
+
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, digest: str, page: int, parser_version: str, flavor: str) -> Path:
+        return self.root / digest[:2] / digest / f"{parser_version}-{flavor}" / f"{int(page):05d}.parquet"
+
+    def get(self, pdf_path: str, digest: str, page: int, parser_version: str, flavor: str) -> Optional[PageResult]:
+        path = self.path(digest, page, parser_version, flavor)
+        if not path.exists():
+            self.misses += 1
+            return None
+        table = pq.read_table(path)
+        metadata = table.schema.metadata or {}
+        rows = table.to_pandas()
+        rows.columns = json.loads(metadata[COLUMNS_KEY])
+        if "source_pdf" in rows:
+            # même contenu, éventuellement sous un autre chemin
+            rows["source_pdf"] = pdf_path
+        last_heading = json.loads(metadata[LAST_HEADING_KEY])
+        self.hits += 1
+        return PageResult(int(page), rows, last_heading)
+
+    def put(self, digest: str, parser_version: str, flavor: str, result: PageResult) -> None:
+        path = self.path(digest, result.page, parser_version, flavor)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rows = result.rows
+        table = pa.Table.from_pandas(rows.set_axis([str(c) for c in rows.columns], axis=1), preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[LAST_HEADING_KEY] = json.dumps(result.last_heading).encode("utf-8")
+        metadata[COLUMNS_KEY] = json.dumps(list(rows.columns)).encode("utf-8")
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        pq.write_table(table.replace_schema_metadata(metadata), tmp)
+        os.replace(tmp, path)
+
+    def summary(self) -> str:
+        return f"page cache: {self.hits} hits, {self.misses} misses"
@@ -0,0 +1,150 @@
+"""
+Extraction page par page des PDF tarifaires, en série ou sur un pool de processus.
+
+Chaque page est lue (camelot) et classée indépendamment par une fonction de
+niveau module du parser: page_fn(pdf_path, page, flavor) -> PageResult.
+Les résultats sont restitués dans l'ordre des pages, quel que soit le nombre
+de workers, et fusionnés au fil de l'eau: les lignes lues avant la première
+position (heading) d'une page reprennent la dernière position vue sur les
+pages précédentes, comme dans l'ancienne boucle séquentielle.
+
+Avec un PageCache (parsers/page_cache.py), seules les pages absentes du
+cache sont extraites; les autres sont relues depuis le disque. Une page dont
+la lecture échoue est restituée vide (failed=True) et n'est pas mise en
+cache: elle sera relue à la prochaine ingestion.
+"""
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+class PageResult(NamedTuple):
+    page: int
+    rows: pd.DataFrame  # heading_ctx manquant avant la première position de la page
+    last_heading: Optional[str]
+    failed: bool = False  # lecture en échec: ne pas mettre en cache
+
+
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Équivalent vectorisé de df.applymap(_clean)"""
+    return df.astype(str).apply(
+        lambda col: col.str.replace("\n", " ", regex=False).str.replace("\r", " ", regex=False).str.strip()
+    )
+
+
+def read_tables(pdf_path: str, page: int, flavor: str = "stream", clean: bool = True) -> List[pd.DataFrame]:
+    """Tables non vides d'une page, nettoyées (les erreurs camelot remontent)"""
+    import camelot
+
+    tables = camelot.read_pdf(pdf_path, pages=str(page), flavor=flavor)
+    frames = [tb.df for tb in tables if tb.df is not None and not tb.df.empty]
+    return [clean_frame(df) for df in frames] if clean else frames
+
+
+def hs_column(col: pd.Series) -> pd.Series:
+    """Équivalent vectorisé de _to_hs: chiffres sans points, sinon chaîne vide"""
+    c = col.str.replace(".", "", regex=False)
+    return c.where(c.str.isdigit(), "")
+
+
+def chain_headings(parts: Iterable[Tuple[pd.DataFrame, Optional[str]]],
+                   carry: Optional[str] = None) -> Tuple[List[pd.DataFrame], Optional[str]]:
+    """
+    Propager la position courante d'un bloc de lignes au suivant
+
+    Args:
+        parts: (lignes, dernière position du bloc) dans l'ordre du document
+        carry: position en cours avant le premier bloc
+
+    Returns:
+        (blocs complétés, dernière position)
+    """
+    frames = []
+    for rows, last_heading in parts:
+        if carry is not None and not rows.empty:
+            rows = rows.assign(heading_ctx=rows["heading_ctx"].fillna(carry))
+        frames.append(rows)
+        if last_heading is not None:
+            carry = last_heading
+    return frames, carry
+
+
+def page_result(page: int, parts: List[Tuple[pd.DataFrame, Optional[str]]]) -> PageResult:
+    """Regrouper les tables classées d'une page"""
+    frames, last_heading = chain_headings(parts)
+    frames = [f for f in frames if not f.empty]
+    rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return PageResult(page, rows, last_heading)
+
+
+def page_count(pdf_path: str) -> int:
+    from pypdf import PdfReader
+
+    return len(PdfReader(pdf_path).pages)
+
+
+def _read_page(page_fn: Callable[[str, int, str], PageResult], pdf_path: str, page: int,
+               flavor: str) -> PageResult:
+    """page_fn, une erreur de lecture donnant une page vide marquée en échec"""
+    try:
+        return page_fn(pdf_path, page, flavor)
+    except Exception as exc:
+        logger.warning("%s page %d: extraction failed (%s)", pdf_path, page, exc)
+        return PageResult(page, pd.DataFrame(), None, failed=True)
+
+
+def _extract(page_fn: Callable[[str, int, str], PageResult], pdf_path: str, pages: List[int],
+             flavor: str, workers: int) -> Iterator[PageResult]:
+    if workers <= 1 or len(pages) <= 1:
+        for p in pages:
+            yield _read_page(page_fn, pdf_path, p, flavor)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(pages))) as pool:
+        # map restitue les résultats dans l'ordre de soumission: fusion déterministe
+        yield from pool.map(_read_page, repeat(page_fn), repeat(pdf_path), pages, repeat(flavor))
+
+
+def iter_pages(page_fn: Callable[[str, int, str], PageResult], pdf_path: str, pages: Iterable[int],
+               flavor: str = "stream", workers: int = 1, cache=None,
+               parser_version: Optional[str] = None) -> Iterator[PageResult]:
+    """
+    Résultats par page, dans l'ordre des pages
+
+    Args:
+        page_fn: fonction de niveau module (sérialisable) du parser
+        workers: 1 = séquentiel dans le processus courant, sinon pool de processus
+        cache: PageCache optionnel (requiert parser_version)
+    """
+    pages = [int(p) for p in pages]
+    if cache is None:
+        yield from _extract(page_fn, pdf_path, pages, flavor, workers)
+        return
+
+    from tariff_engine.parsers.page_cache import file_sha256
+
+    digest = file_sha256(pdf_path)
+    cached = {p: cache.get(pdf_path, digest, p, parser_version, flavor) for p in pages}
+    fresh = _extract(page_fn, pdf_path, [p for p in pages if cached[p] is None], flavor, workers)
+    for p in pages:
+        result = cached[p]
+        if result is None:
+            result = next(fresh)
+            if not result.failed:
+                cache.put(digest, parser_version, flavor, result)
+        yield result
+
+
+def merge_pages(results: Iterable[PageResult]) -> pd.DataFrame:
+    """Concaténer les pages au fil de l'eau en propageant heading_ctx d'une page à l'autre"""
+    frames, _ = chain_headings((r.rows, r.last_heading) for r in results)
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    out = pd.concat(frames, ignore_index=True)
+    out["heading_ctx"] = out["heading_ctx"].astype(object).where(out["heading_ctx"].notna(), None)
+    return out
@@ -0,0 +1,343 @@
+"""
+Ordonnanceur d'ingestion multi-blocs piloté par le registre
+
+Lit registry.csv (racine, séparateur ",") ou tariff_engine/registry.csv
+(séparateur ";", en-têtes répétés tolérés); une ligne par bloc, la dernière
+l'emporte en cas de doublon. Colonnes reconnues:
+    bloc, country, hs_version, parser,
+    pdf_url et/ou local_path (source), pages ("14-80", vide = tout le PDF),
+    depends_on (blocs séparés par "|")
+
+Plan: un bloc est ignoré si son manifeste indique la même empreinte SHA-256
+de source, la même version de parser et une sortie toujours présente, et
+si aucune de ses dépendances n'est ré-ingérée. Les blocs à traiter tournent
+en parallèle (pool borné), chacun dès que ses dépendances sont terminées.
+Chaque bloc écrit un manifeste JSON (tariff_engine/manifests/<BLOC>.json)
+avec les durées par étape.
+
+Usage (depuis la racine du dépôt):
+    python -m tariff_engine.scheduler --registry registry.csv --workers 2
+"""
+import argparse
+import importlib
+import io
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+import pandas as pd
+
+from tariff_engine.parsers.page_cache import PageCache, file_sha256
+
+BASE = Path("tariff_engine")
+PDF_DIR = BASE / "pdf_sources"
+NORM_DIR = BASE / "normalized"
+RAW_DIR = BASE / "raw_tables"
+MANIFEST_DIR = BASE / "manifests"
+
+# Blocs ingérés en parallèle
+BLOC_WORKERS = int(os.getenv("TARIFF_BLOC_WORKERS", "2"))
+# Extraction PDF répartie sur N processus par bloc (1 = séquentiel)
+PARSE_WORKERS = int(os.getenv("TARIFF_PARSE_WORKERS", os.cpu_count() or 1))
+
+# nom dans le registre -> module du parser
+PARSERS = {
+    "eac": "tariff_engine.parsers.eac_parser_v1_2",
+    "eac_parser_v1_2": "tariff_engine.parsers.eac_parser_v1_2",
+    "eac_parser_v1_1": "tariff_engine.parsers.eac_parser_v1_1",
+    "eac_parser": "tariff_engine.parsers.eac_parser",
+}
+
+COLUMNS = ("bloc", "country", "hs_version", "parser", "pdf_url", "local_path", "pages", "depends_on")
+
+
+class BlocSpec(NamedTuple):
+    bloc: str
+    country: str
+    hs_version: str
+    parser: str
+    pdf_url: str
+    local_path: str
+    pages: str
+    depends_on: tuple
+
+
+class PlanItem(NamedTuple):
+    spec: BlocSpec
+    action: str  # "ingest" | "skip"
+    reason: str
+
+
+def load_registry(path) -> List[BlocSpec]:
+    """Lignes du registre, quel que soit le séparateur"""
+    text = Path(path).read_text(encoding="utf-8")
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return []
+    header = lines[0]
+    sep = ";" if header.count(";") > header.count(",") else ","
+    # en-têtes répétés (fichiers concaténés)
+    body = [header] + [line for line in lines[1:] if line != header]
+    df = pd.read_csv(io.StringIO("\n".join(body)), sep=sep, dtype=str).fillna("")
+    df.columns = [c.strip() for c in df.columns]
+
+    specs: Dict[str, BlocSpec] = {}
+    for row in df.to_dict("records"):
+        if str(row.get("bloc", "")).strip():
+            spec = spec_from_row(row)
+            specs[spec.bloc] = spec
+    return list(specs.values())
+
+
+def spec_from_row(row: Dict) -> BlocSpec:
+    """BlocSpec d'une ligne du registre (colonnes absentes = vides)"""
+    values = {c: str(row.get(c, "") or "").strip() for c in COLUMNS}
+    bloc = values["bloc"].upper()
+    return BlocSpec(
+        bloc=bloc,
+        country=values["country"],
+        hs_version=values["hs_version"],
+        parser=values["parser"],
+        pdf_url=values["pdf_url"],
+        local_path=values["local_path"] or str(PDF_DIR / bloc / f"{bloc}.pdf"),
+        pages=values["pages"],
+        depends_on=tuple(d.strip().upper() for d in values["depends_on"].split("|") if d.strip()),
+    )
+
+
+def page_list(spec: str, pdf_path: str) -> List[int]:
+    if not spec:
+        from tariff_engine.parsers.pages import page_count
+        return list(range(1, page_count(pdf_path) + 1))
+    pages = []
+    for part in spec.split(","):
+        first, _, last = part.strip().partition("-")
+        pages.extend(range(int(first), int(last or first) + 1))
+    return pages
+
+
+def parser_module(name: str):
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser: {name}")
+    return importlib.import_module(PARSERS[name])
+
+
+class IngestionScheduler:
+    """
+    Plans and runs the ingestion of every bloc of a registry
+    """
+
+    def __init__(self, registry_path="registry.csv", workers: int = BLOC_WORKERS,
+                 parse_workers: int = PARSE_WORKERS, manifest_dir: Path = MANIFEST_DIR,
+                 cache: Optional[PageCache] = None, specs: Optional[List[BlocSpec]] = None):
+        self.specs = specs if specs is not None else load_registry(registry_path)
+        self.workers = max(1, workers)
+        self.parse_workers = parse_workers
+        self.manifest_dir = Path(manifest_dir)
+        self.cache = cache if cache is not None else PageCache()
+
+    # ------------------------------------------------------------------
+    # Plan
+    # ------------------------------------------------------------------
+
+    def manifest_path(self, bloc: str) -> Path:
+        return self.manifest_dir / f"{bloc}.json"
+
+    def read_manifest(self, bloc: str) -> Optional[Dict]:
+        path = self.manifest_path(bloc)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _ordered(self) -> List[BlocSpec]:
+        """Blocs triés de sorte que chaque dépendance précède ses dépendants"""
+        by_bloc = {s.bloc: s for s in self.specs}
+        ordered, state = [], {}
+
+        def visit(bloc: str, chain: tuple):
+            if state.get(bloc) == "done":
+                return
+            if bloc in chain:
+                raise ValueError(f"Dependency cycle: {' -> '.join(chain + (bloc,))}")
+            spec = by_bloc.get(bloc)
+            if spec is None:
+                raise ValueError(f"Unknown dependency: {bloc} (required by {chain[-1]})")
+            for dep in spec.depends_on:
+                visit(dep, chain + (bloc,))
+            state[bloc] = "done"
+            ordered.append(spec)
+
+        for spec in self.specs:
+            visit(spec.bloc, ())
+        return ordered
+
+    def _freshness(self, spec: BlocSpec) -> Optional[str]:
+        """Raison de ré-ingérer le bloc, None s'il est à jour"""
+        manifest = self.read_manifest(spec.bloc)
+        if manifest is None or manifest.get("status") != "ok":
+            return "no successful run"
+        if spec.parser not in PARSERS:
+            return f"unknown parser {spec.parser}"
+        if not Path(spec.local_path).exists():
+            return "source not downloaded"
+        if manifest.get("parser") != spec.parser or \
+                manifest.get("parser_version") != parser_module(spec.parser).PARSER_VERSION:
+            return "parser changed"
+        if manifest.get("pages") != spec.pages:
+            return "pages changed"
+        if not Path(manifest.get("output", "")).exists():
+            return "output missing"
+        if manifest.get("source_sha256") != file_sha256(spec.local_path):
+            return "source changed"
+        return None
+
+    def plan(self, force: bool = False) -> List[PlanItem]:
+        items, rerun = [], set()
+        for spec in self._ordered():
+            changed_deps = [d for d in spec.depends_on if d in rerun]
+            if force:
+                reason = "forced"
+            elif changed_deps:
+                reason = f"dependency re-ingested: {', '.join(changed_deps)}"
+            else:
+                reason = self._freshness(spec)
+            if reason is None:
+                items.append(PlanItem(spec, "skip", "up to date"))
+            else:
+                rerun.add(spec.bloc)
+                items.append(PlanItem(spec, "ingest", reason))
+        return items
+
+    # ------------------------------------------------------------------
+    # Exécution
+    # ------------------------------------------------------------------
+
+    def ingest(self, spec: BlocSpec, reason: str = "") -> Dict:
+        """Télécharger (si besoin), extraire et écrire le manifeste d'un bloc"""
+        timings = {}
+        started_at = datetime.now(timezone.utc).isoformat()
+        start = time.perf_counter()
+        manifest = {"bloc": spec.bloc, "parser": spec.parser, "pages": spec.pages,
+                    "reason": reason, "started_at": started_at}
+        hits, misses = self.cache.hits, self.cache.misses
+        try:
+            module = parser_module(spec.parser)
+            pdf_path = Path(spec.local_path)
+
+            step = time.perf_counter()
+            if spec.pdf_url:
+                from tariff_engine.ingest import download
+                pdf_path.parent.mkdir(exist_ok=True, parents=True)
+                download(spec.pdf_url, pdf_path)
+            elif not pdf_path.exists():
+                raise FileNotFoundError(f"Missing source PDF: {pdf_path}")
+            timings["download_s"] = time.perf_counter() - step
+
+            step = time.perf_counter()
+            digest = file_sha256(str(pdf_path))
+            timings["hash_s"] = time.perf_counter() - step
+
+            step = time.perf_counter()
+            output, rows = self._parse(module, spec, str(pdf_path))
+            timings["parse_s"] = time.perf_counter() - step
+
+            manifest.update({
+                "status": "ok",
+                "parser_version": module.PARSER_VERSION,
+                "source_path": str(pdf_path),
+                "source_sha256": digest,
+                "output": str(output),
+                "rows": rows,
+            })
+        except Exception as e:
+            manifest.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+        timings["total_s"] = time.perf_counter() - start
+        manifest["timings"] = {k: round(v, 3) for k, v in timings.items()}
+        # compteurs partagés entre blocs concurrents: valeurs indicatives
+        manifest["page_cache"] = {"hits": self.cache.hits - hits, "misses": self.cache.misses - misses}
+        manifest["finished_at"] = datetime.now(timezone.utc).isoformat()
+
+        self.manifest_dir.mkdir(exist_ok=True, parents=True)
+        self.manifest_path(spec.bloc).write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+        return manifest
+
+    def _parse(self, module, spec: BlocSpec, pdf_path: str):
+        if spec.parser == "eac_parser":
+            # tables brutes puis normalisation (codes HS uniquement)
+            from tariff_engine.normalizer.normalize_eac import normalize
+            RAW_DIR.mkdir(exist_ok=True, parents=True)
+            raw_out = RAW_DIR / f"{spec.bloc}_raw.csv"
+            module.parse(pdf_path, str(raw_out), workers=self.parse_workers, cache=self.cache)
+            norm = normalize(str(raw_out), spec.bloc, spec.country, spec.hs_version)
+            output = NORM_DIR / f"{spec.bloc}_norm.csv"
+            norm.to_csv(output, index=False)
+            return output, len(norm)
+
+        output = NORM_DIR / f"{spec.bloc}_MASTER.csv"
+        pages = page_list(spec.pages, pdf_path)
+        if hasattr(module, "parse_pages"):
+            df = module.parse_pages(pdf_path, pages, workers=self.parse_workers, cache=self.cache)
+        else:
+            df = module.parse_range(pdf_path, min(pages), max(pages), workers=self.parse_workers, cache=self.cache)
+        df.to_csv(output, index=False)
+        return output, len(df)
+
+    def run(self, force: bool = False) -> List[Dict]:
+        """
+        Exécuter le plan: blocs indépendants en parallèle, dépendants après
+        leurs dépendances
+
+        Returns:
+            manifestes des blocs ingérés (dans l'ordre du plan)
+        """
+        NORM_DIR.mkdir(exist_ok=True, parents=True)
+        plan = self.plan(force)
+        for item in plan:
+            print(f"[{item.action.upper()}] {item.spec.bloc}: {item.reason}")
+
+        todo = {item.spec.bloc: item for item in plan if item.action == "ingest"}
+        done: Dict[str, Dict] = {}
+        failed = set()
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while todo or running:
+                for bloc, item in list(todo.items()):
+                    deps = [d for d in item.spec.depends_on if d in todo or d in running]
+                    if any(d in failed for d in item.spec.depends_on):
+                        del todo[bloc]
+                        failed.add(bloc)
+                        done[bloc] = {"bloc": bloc, "status": "skipped", "reason": "dependency failed"}
+                    elif not deps:
+                        del todo[bloc]
+                        running[bloc] = pool.submit(self.ingest, item.spec, item.reason)
+                if not running:
+                    break
+                finished, _ = wait(running.values(), return_when=FIRST_COMPLETED)
+                for bloc in [b for b, f in running.items() if f in finished]:
+                    manifest = done[bloc] = running.pop(bloc).result()
+                    if manifest["status"] != "ok":
+                        failed.add(bloc)
+                    print(f"[{manifest['status'].upper()}] {bloc}: {manifest.get('rows', manifest.get('error'))} "
+                          f"in {manifest['timings']['total_s']:.1f}s")
+
+        print(self.cache.summary())
+        return [done[item.spec.bloc] for item in plan if item.spec.bloc in done]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--registry", default="registry.csv")
+    parser.add_argument("--workers", type=int, default=BLOC_WORKERS)
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--plan", action="store_true", help="afficher le plan sans l'exécuter")
+    args = parser.parse_args()
+    scheduler = IngestionScheduler(args.registry, workers=args.workers)
+    if args.plan:
+        for item in scheduler.plan(args.force):
+            print(f"[{item.action.upper()}] {item.spec.bloc}: {item.reason}")
+    else:
+        scheduler.run(args.force)
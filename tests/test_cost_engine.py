@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests du calcul de coût de revient (cost_engine.py): simulate_many == simulate
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cost_engine import RESULT_KEYS, simulate, simulate_lines, simulate_many, what_if
+
+
+def random_line(rng: random.Random):
+    """Ligne aléatoire: montants, taux et options dans des plages réalistes ou extrêmes"""
+    amount = lambda: rng.choice([0, 0.1, 1e-9, 1e12, rng.uniform(0, 1e6), rng.randint(0, 10 ** 7)])
+    rate = lambda: rng.choice([0, 2.5, 5, 0.1, rng.uniform(0, 100), rng.randint(0, 200)])
+    payload = {"cif_value": amount(), "quantity": rng.choice([0, 1, 3.7, amount()])}
+    if rng.random() < 0.6:
+        payload["origin_certificate"] = rng.random() < 0.5
+    tariff = {"SPECIFIC": [{"amount": rng.uniform(0, 50)} for _ in range(rng.randint(0, 4))]}
+    for key in ("DD", "PRCT", "TCS"):
+        if rng.random() < 0.8:
+            tariff[key] = rate()
+    rules = {"vat_rate": rate()}
+    if rng.random() < 0.7:
+        rules["vat_on_duty"] = rng.random() < 0.5
+    preference = {"DD": rate()} if rng.random() < 0.5 else {}
+    return payload, tariff, rules, preference
+
+
+class TestSimulateMany:
+    """Propriété: pour toute ligne, simulate_many reproduit simulate à l'identique"""
+
+    def test_equivalence_on_random_lines(self):
+        rng = random.Random(2024)
+        for _ in range(20):
+            lines = [random_line(rng) for _ in range(rng.randint(1, 300))]
+            many = simulate_lines(*zip(*lines))
+            for i, line in enumerate(lines):
+                expected = simulate(*line)
+                assert {k: float(many[k][i]) for k in RESULT_KEYS} == expected
+
+    def test_scalar_broadcast(self):
+        out = simulate_many(cif_value=[1000.0, 2000.0], quantity=10, dd=20, vat_rate=18,
+                            specific_amounts=[1.5, 0.0])
+        expected = simulate({"cif_value": 2000.0, "quantity": 10}, {"DD": 20, "SPECIFIC": [{"amount": 0.0}]},
+                            {"vat_rate": 18}, {})
+        assert out["total_landed_cost"].shape == (2,)
+        assert {k: float(out[k][1]) for k in RESULT_KEYS} == expected
+
+    def test_what_if_grid(self):
+        lines = dict(cif_value=np.array([1000.0, 5000.0]), quantity=np.array([1.0, 2.0]),
+                     dd=np.array([35.0, 10.0]), vat_rate=np.array([18.0, 16.0]),
+                     specific_amounts=np.array([[2.0], [0.0]]))
+        grid = what_if([np.nan, 0.0, 5.0], [False, True], **lines)
+        assert grid["duty"].shape == (3, 2, 2)
+        for p, pref in enumerate([None, 0.0, 5.0]):
+            for c, cert in enumerate([False, True]):
+                for i in range(2):
+                    expected = simulate(
+                        {"cif_value": lines["cif_value"][i], "quantity": lines["quantity"][i], "origin_certificate": cert},
+                        {"DD": lines["dd"][i], "SPECIFIC": [{"amount": lines["specific_amounts"][i, 0]}]},
+                        {"vat_rate": lines["vat_rate"][i]},
+                        {"DD": pref},
+                    )
+                    assert grid["total_landed_cost"][p, c, i] == expected["total_landed_cost"]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests du moteur de comparaison de tarifs (delta_engine.py)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import delta_engine
+from delta_engine import FIELDS, compare, compare_chunked
+
+
+def reference_compare(old_csv, new_csv):
+    """Ancienne boucle ligne à ligne (implémentation de référence)"""
+    old = pd.read_csv(old_csv).set_index("national_code")
+    new = pd.read_csv(new_csv).set_index("national_code")
+    deltas = [{"national_code": c, "change_type": "NEW"} for c in new.index.difference(old.index)]
+    deltas += [{"national_code": c, "change_type": "REMOVED"} for c in old.index.difference(new.index)]
+    for c in old.index.intersection(new.index):
+        for f in FIELDS:
+            ov = str(old.loc[c, f]) if f in old.columns else ""
+            nv = str(new.loc[c, f]) if f in new.columns else ""
+            if ov != nv:
+                deltas.append({"national_code": c, "change_type": "MODIFIED", "field_changed": f,
+                               "old_value": ov, "new_value": nv})
+    return deltas
+
+
+DD5 = '[{"code":"DD","rate":5}]'
+DD10 = '[{"code":"DD","rate":10}]'
+
+
+@pytest.fixture
+def schedules(tmp_path):
+    old = pd.DataFrame({
+        "national_code": [1517100000, 1517900000, 1601000000, 101210000],
+        "advalorem_json": [DD5, DD5, None, DD10],
+        "specific_json": ["[]", "[]", "[]", "[]"],
+        "advantages_json": [None, None, None, None],
+        "formalities_json": ["[]", '["certificat"]', "[]", "[]"],
+    })
+    new = pd.DataFrame({
+        "national_code": [101210000, 1601000000, 1517900000, 2203000000],
+        "advalorem_json": [DD5, DD10, DD5, DD5],
+        "advantages_json": [None, None, "[]", None],
+        "formalities_json": ["[]", "[]", "[]", "[]"],
+    })
+    old_csv, new_csv = tmp_path / "old.csv", tmp_path / "new.csv"
+    old.to_csv(old_csv, index=False)
+    new.to_csv(new_csv, index=False)
+    return str(old_csv), str(new_csv)
+
+
+def canonical(deltas):
+    return sorted(json.dumps(dict(d, national_code=str(d["national_code"])), sort_keys=True) for d in deltas)
+
+
+class TestCompare:
+    """La comparaison vectorisée reproduit l'ancienne boucle"""
+
+    def test_matches_row_loop(self, schedules):
+        deltas = compare(*schedules)
+        assert deltas == reference_compare(*schedules)
+        assert json.dumps(deltas)
+        assert [d["change_type"] for d in deltas[:2]] == ["NEW", "REMOVED"]
+        # colonne absente de la nouvelle version: comparée à ""
+        assert {"national_code": 1517900000, "change_type": "MODIFIED", "field_changed": "specific_json",
+                "old_value": "[]", "new_value": ""} in deltas
+
+    def test_identical_files(self, schedules):
+        assert compare(schedules[0], schedules[0]) == []
+
+
+class TestStreamedOutput:
+    """Sortie JSONL / Parquet et lecture par blocs"""
+
+    def test_chunked_jsonl_matches_in_memory(self, schedules, tmp_path):
+        out = tmp_path / "deltas.jsonl"
+        count = compare_chunked(*schedules, str(out), chunksize=1, partitions=3)
+        lines = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        assert count == len(lines)
+        assert canonical(lines) == canonical(compare(*schedules))
+
+    def test_chunked_records_identical_to_in_memory(self, tmp_path):
+        # taux numériques: 3 devient 3.0 dès qu'une valeur manque dans le fichier
+        old = pd.DataFrame({"national_code": [101, 102, 103, 104], "advalorem_json": [3, 5, None, 7],
+                            "specific_json": [1, 1, 1, 1], "advantages_json": [True, False, True, False]})
+        new = pd.DataFrame({"national_code": [101, 102, 103, 105], "advalorem_json": [3, 6, 4, 7],
+                            "specific_json": [1, 2, 1, 1], "advantages_json": [True, True, True, False]})
+        old_csv, new_csv = tmp_path / "old.csv", tmp_path / "new.csv"
+        old.to_csv(old_csv, index=False)
+        new.to_csv(new_csv, index=False)
+        out = tmp_path / "deltas.jsonl"
+
+        compare_chunked(str(old_csv), str(new_csv), str(out), chunksize=1, partitions=3)
+        lines = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        expected = compare(str(old_csv), str(new_csv))
+        assert {"national_code": 102, "change_type": "MODIFIED", "field_changed": "advalorem_json",
+                "old_value": "5.0", "new_value": "6"} in expected
+        assert sorted(map(json.dumps, lines)) == sorted(map(json.dumps, expected))
+
+    def test_chunked_parquet(self, schedules, tmp_path):
+        out = tmp_path / "deltas.parquet"
+        count = compare_chunked(*schedules, str(out), chunksize=2)
+        df = pd.read_parquet(out)
+        assert list(df.columns) == delta_engine.DELTA_COLUMNS
+        assert len(df) == count == len(compare(*schedules))
+        assert df.loc[df["change_type"] == "NEW", "national_code"].tolist() == ["2203000000"]
+        assert df.loc[df["change_type"] == "NEW", "old_value"].isna().all()
+
+    def test_cli_writes_parquet(self, schedules, tmp_path):
+        out = tmp_path / "deltas.parquet"
+        delta_engine.main([*schedules, "--out", str(out)])
+        assert len(pd.read_parquet(out)) == len(compare(*schedules))
+
+    def test_empty_output(self, schedules, tmp_path):
+        out = tmp_path / "deltas.parquet"
+        assert compare_chunked(schedules[0], schedules[0], str(out)) == 0
+        assert pd.read_parquet(out).empty
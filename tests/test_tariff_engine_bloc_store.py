@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests de l'index binaire des blocs normalisés (tariff_engine/bloc_store.py)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from routers import tariff_engine_router
+from tariff_engine import api_multi
+from tariff_engine import bloc_store
+from tariff_engine.bloc_store import BlocStore, open_index
+
+
+BLOC = {
+    "15171000": {"hs_code": "15171000", "description": "Margarine", "unit": "kg",
+                 "duty_rate_pct": 25.0, "heading_ctx": 15.17, "page": 14, "source_pdf": "eac.pdf"},
+    "01012100": {"hs_code": "01012100", "description": "Chevaux reproducteurs", "unit": "",
+                 "duty_rate_pct": None, "heading_ctx": "", "page": 14, "source_pdf": "eac.pdf"},
+    "0101290010": {"hs_code": "0101290010", "description": "Ânes", "unit": None,
+                   "duty_rate_pct": 0.0, "heading_ctx": "01.01", "page": 15, "source_pdf": "eac.pdf"},
+    "16010000": {"hs_code": "16010000", "description": "Saucisses", "duty_rate_pct": 35},
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "EAC_MASTER_indexed.json"
+    path.write_text(json.dumps(BLOC, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class TestBlocIndex:
+    """L'index restitue exactement le JSON d'origine"""
+
+    def test_records_match_json(self, source):
+        index = open_index(source)
+        assert list(index) == list(BLOC)
+        for key, record in BLOC.items():
+            assert index[key] == record
+            assert list(index[key]) == list(record)
+            assert all(type(index[key][f]) is type(record[f]) for f in record)
+        # champs absents de l'enregistrement non ajoutés
+        assert "unit" not in index["16010000"]
+
+    def test_missing_keys(self, source):
+        index = open_index(source)
+        for key in ("", "1517", "151710001", "9" * 20, "zzz"):
+            assert key not in index
+            assert index.get(key) is None
+        with pytest.raises(KeyError):
+            index["1517"]
+
+    def test_records_are_fresh_copies(self, source):
+        index = open_index(source)
+        index["15171000"]["_bloc"] = "EAC"
+        assert "_bloc" not in index["15171000"]
+
+    def test_stats(self, source):
+        assert open_index(source).stats() == {
+            "keys": 4, "rate_non_null": 3, "unit_non_empty": 2,
+            "sample_keys": ["15171000", "01012100", "0101290010", "16010000"],
+        }
+
+    def test_prefix_and_range_scans(self, source):
+        index = open_index(source)
+        assert [k for k, _ in index.scan("0101")] == ["01012100", "0101290010"]
+        assert [k for k, _ in index.scan("010129")] == ["0101290010"]
+        assert [k for k, _ in index.scan("15", "16")] == ["15171000", "16010000"]
+        assert [k for k, _ in index.scan("01", "99", limit=3)] == ["01012100", "0101290010", "15171000"]
+        assert list(index.scan("02")) == [] and index.count("16", "15") == 0
+        assert dict(index.scan("1517")) == {"15171000": BLOC["15171000"]}
+
+    def test_keys_missing_leading_zero(self, tmp_path):
+        # Format des blocs extraits des PDF: '1012100' pour 0101.21.00, '30291' pour 0302.91
+        raw = {"1012100": {"hs_code": "1012100"}, "30291": {"hs_code": "30291"},
+               "10011100": {"hs_code": "10011100"}, "1012900": {"hs_code": "1012900"}}
+        path = tmp_path / "EAC_MASTER_indexed.json"
+        path.write_text(json.dumps(raw), encoding="utf-8")
+        index = open_index(path)
+        assert list(index) == ["01012100", "030291", "10011100", "01012900"]
+        assert index["0101.21.00"] == index["1012100"] == raw["1012100"]
+        assert [k for k, _ in index.scan("0101")] == ["01012100", "01012900"]
+        assert [k for k, _ in index.scan("10")] == ["10011100"]
+        assert [k for k, _ in index.scan("101")] == ["01012100", "01012900"]
+        assert [k for k, _ in index.scan("01", "09")] == ["01012100", "01012900", "030291"]
+
+    def test_get_many(self, source):
+        found = open_index(source).get_many(["16010000", "9999", "01012100"])
+        assert found == {"16010000": BLOC["16010000"], "9999": None, "01012100": BLOC["01012100"]}
+
+    def test_built_once_per_dataset_version(self, source, monkeypatch):
+        open_index(source)
+        assert source.with_suffix(".idx").exists()
+
+        builds = []
+        build_index = bloc_store.build_index
+        monkeypatch.setattr(bloc_store, "build_index", lambda *a: builds.append(1) or build_index(*a))
+        open_index(source)
+        assert builds == []
+
+        changed = dict(BLOC, **{"16010000": dict(BLOC["16010000"], duty_rate_pct=10)})
+        source.write_text(json.dumps(changed), encoding="utf-8")
+        assert open_index(source)["16010000"]["duty_rate_pct"] == 10
+        assert builds == [1]
+
+
+class TestBlocStore:
+    """Résolution des fichiers par bloc, partagée par les API"""
+
+    def test_load_candidates(self, source, tmp_path):
+        store = BlocStore(tmp_path)
+        index, src = store.load(" eac")
+        assert src == str(source)
+        assert store.load("EAC")[0] is index
+        with pytest.raises(FileNotFoundError, match="bloc=SADC"):
+            store.load("sadc")
+
+    def test_api_multi_adds_trace_without_touching_index(self, source, tmp_path, monkeypatch):
+        monkeypatch.setattr(api_multi, "BLOC_STORE", BlocStore(tmp_path))
+        row = api_multi.get_tariff("eac", "1517.10.00")
+        assert row["_bloc"] == "EAC" and row["_dataset"] == str(source)
+        assert "_bloc" not in api_multi.load_bloc("EAC")[0]["15171000"]
+
+
+class TestTariffEngineRouter:
+    """Préfixes, plages et recherche groupée sur /api/tariff-engine"""
+
+    @pytest.fixture
+    def client(self, source, tmp_path, monkeypatch):
+        monkeypatch.setattr(tariff_engine_router, "BLOC_STORE", BlocStore(tmp_path))
+        app = FastAPI()
+        app.include_router(tariff_engine_router.router)
+        return TestClient(app)
+
+    def test_prefix(self, client):
+        body = client.get("/api/tariff-engine/eac/prefix", params={"hs": "0101.29"}).json()
+        assert (body["count"], body["total"], body["truncated"]) == (1, 1, False)
+        assert body["results"][0]["hs_key"] == "0101290010"
+
+        body = client.get("/api/tariff-engine/eac/range", params={"start": "01", "end": "15", "limit": 1}).json()
+        assert (body["count"], body["total"], body["truncated"]) == (1, 3, True)
+
+    def test_bulk_and_meta(self, client):
+        body = client.post("/api/tariff-engine/eac/bulk", json={"hs_codes": ["1517.10.00", "0000"]}).json()
+        assert body["found"] == 1 and body["missing"] == ["0000"]
+        assert body["results"]["15171000"]["duty_rate_pct"] == 25.0
+
+        meta = client.get("/api/tariff-engine/eac/meta").json()
+        assert meta["keys"] == 4 and meta["rate_non_null"] == 3
+        assert client.get("/api/tariff-engine/sadc/meta").status_code == 404
+
+
+class TestShippedBloc:
+    """Blocs livrés dans tariff_engine/normalized (clés sans zéro initial)"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        shipped = Path(__file__).parent.parent / "tariff_engine" / "normalized" / "EAC_MASTER_indexed.json"
+        (tmp_path / shipped.name).write_bytes(shipped.read_bytes())
+        monkeypatch.setattr(tariff_engine_router, "BLOC_STORE", BlocStore(tmp_path))
+        app = FastAPI()
+        app.include_router(tariff_engine_router.router)
+        return TestClient(app), json.loads(shipped.read_text(encoding="utf-8"))
+
+    def test_prefix_and_range(self, client):
+        client, raw = client
+        chapter_01 = {k for k in raw if len(k) % 2 and k.startswith("1")}
+        chapter_10 = {k for k in raw if len(k) % 2 == 0 and k.startswith("10")}
+        assert chapter_01 and chapter_10
+
+        body = client.get("/api/tariff-engine/eac/prefix", params={"hs": "01", "limit": 5000}).json()
+        assert {r["hs_code"] for r in body["results"]} == chapter_01
+        body = client.get("/api/tariff-engine/eac/prefix", params={"hs": "10", "limit": 5000}).json()
+        assert {r["hs_code"] for r in body["results"]} == chapter_10
+        assert client.get("/api/tariff-engine/eac/prefix", params={"hs": "0101"}).json()["total"] > 0
+
+        body = client.get("/api/tariff-engine/eac/range", params={"start": "01", "end": "09", "limit": 5000}).json()
+        assert body["total"] == sum(1 for k in raw if len(k) % 2)
+        assert client.get("/api/tariff-engine/eac", params={"hs": "0101.21.00"}).json()["hs_code"] == "1012100"
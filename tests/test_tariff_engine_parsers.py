@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Tests des parsers PDF du tariff_engine (classement vectorisé, extraction par page)
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tariff_engine.parsers import pages as pf
+from tariff_engine.parsers import eac_parser_v1_1 as v1_1
+from tariff_engine.parsers import eac_parser_v1_2 as v1_2
+from tariff_engine.parsers.page_cache import PageCache, file_sha256
+
+
+TABLE_V1_2 = [
+    ["15.17", "", "Margarine", "", "", ""],
+    ["", "1517.10.00", "Margarine", "excl. liquid", "kg", "25%"],
+    ["1517.90.00", "", "Other", "", "KG.", ""],
+    ["", "1517.90.10", "Edible", "mixtures", "u", "10 %"],
+    ["", "abc", "Header", "", "", ""],
+    ["16.01", "", "Sausages", "", "", ""],
+    ["", "1601.00.00", "Sausages", "", "pcs", "35%"],
+]
+
+TABLE_V1_1 = [
+    ["15.17", "", "Margarine", "", "", "", ""],
+    ["", "1517.10.00", "Margarine", "", "kg", "", "25%"],
+    ["", "1517.90.00", "", "Other", "", "L", "0%"],
+    ["", "1517.90.10", "Edible", "mixtures", "1234", "10%", ""],
+    ["1601.00.00", "", "Sausages", "", "kgs123", "u", "35 %"],
+]
+
+
+def reference_v1_2(rows, page, pdf_path, heading=None):
+    """Ancienne boucle iterrows de eac_parser_v1_2 (implémentation de référence)"""
+    out = []
+    for cells in rows:
+        c0, c1, c2, c3 = cells[:4]
+        if re.fullmatch(r"\d{1,2}\.\d{2}", c0) and c1 == "":
+            heading = c0
+        hs = v1_2_to_hs(c1) or v1_2_to_hs(c0)
+        if not hs or len(hs) < 6:
+            continue
+        duty = next((float(m.group(1)) for m in map(v1_2.PCT_RE.search, cells) if m), None)
+        unit = next((u for u in (c.lower().replace(".", "") for c in cells) if u in v1_2.UNIT_OK), "")
+        out.append({"hs_code": hs, "heading_ctx": heading, "description": " ".join([c2, c3]).strip(),
+                    "unit": unit, "duty_rate_pct": duty, "page": page, "source_pdf": pdf_path})
+    return out, heading
+
+
+def v1_2_to_hs(code):
+    c = code.replace(".", "")
+    return c if c.isdigit() else ""
+
+
+def records(df):
+    return [
+        {k: (None if isinstance(v, float) and pd.isna(v) else v) for k, v in row.items()}
+        for row in df.to_dict("records")
+    ]
+
+
+def fake_page(pdf_path, page, flavor="stream"):
+    """Page synthétique: la position 15.17 n'apparaît que sur la première page"""
+    rows = TABLE_V1_2 if page == 1 else TABLE_V1_2[1:5] + TABLE_V1_2[6:]
+    table = pd.DataFrame(rows)
+    return pf.page_result(page, [v1_2.classify_table(table, page, pdf_path)])
+
+
+class TestVectorizedClassifier:
+    """Le classement vectorisé reproduit l'ancienne boucle ligne à ligne"""
+
+    def test_v1_2_matches_row_loop(self):
+        rows, last_heading = v1_2.classify_table(pd.DataFrame(TABLE_V1_2), 3, "eac.pdf")
+        expected, heading = reference_v1_2(TABLE_V1_2, 3, "eac.pdf")
+        assert records(rows) == expected
+        assert last_heading == heading == "16.01"
+
+    def test_v1_2_skips_small_tables(self):
+        rows, last_heading = v1_2.classify_table(pd.DataFrame(TABLE_V1_2[:4]), 1, "eac.pdf")
+        assert rows.empty and last_heading is None
+
+    def test_v1_1_units_and_rates(self):
+        rows, _ = v1_1.classify_table(pd.DataFrame(TABLE_V1_1), 75, "eac.pdf")
+        assert list(rows["hs_code"]) == ["15171000", "15179000", "15179010", "16010000"]
+        assert list(rows["unit"]) == ["kg", "l", "", "u"]
+        # un taux nul en c6 se replie sur c5 (comme `_rate_pct(c6) or _rate_pct(c5)`)
+        assert records(rows)[1]["duty_rate_pct"] is None
+        assert list(rows["duty_rate_pct"])[2:] == [10.0, 35.0]
+        assert list(rows["description"])[:2] == ["Margarine", "Other"]
+        assert set(rows["heading_ctx"]) == {"15.17"}
+
+    def test_clean_frame(self):
+        df = pf.clean_frame(pd.DataFrame([[" 15.17\n", 3, "a\rb "]]))
+        assert df.iloc[0].tolist() == ["15.17", "3", "a b"]
+
+
+class TestPageExtraction:
+    """Fusion des pages dans l'ordre, en série ou en parallèle"""
+
+    def test_heading_carried_across_pages(self):
+        merged = pf.merge_pages(pf.iter_pages(fake_page, "eac.pdf", [1, 2]))
+        page2 = merged[merged["page"] == 2]
+        assert len(page2) == 4
+        # la page 2 commence sans position: la dernière position de la page 1 s'applique
+        assert set(page2["heading_ctx"]) == {"16.01"}
+
+    def test_parallel_matches_serial(self):
+        pages = [1, 2, 3, 4]
+        serial = pf.merge_pages(pf.iter_pages(fake_page, "eac.pdf", pages, workers=1))
+        parallel = pf.merge_pages(pf.iter_pages(fake_page, "eac.pdf", pages, workers=2))
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_parse_pages_dedup(self, monkeypatch):
+        monkeypatch.setattr(pf, "read_tables", lambda pdf_path, page, flavor: [pd.DataFrame(TABLE_V1_2)])
+        df = v1_2.parse_pages("eac.pdf", [14, 15])
+        assert df["hs_code"].is_unique
+        assert set(df["page"]) == {15}
+
+    def test_no_tables(self, monkeypatch):
+        monkeypatch.setattr(pf, "read_tables", lambda pdf_path, page, flavor: [])
+        assert v1_1.parse_range("eac.pdf", 14, 16).empty
+
+
+class TestPageCache:
+    """Cache disque des pages, adressé par le contenu du PDF"""
+
+    @pytest.fixture
+    def pdf(self, tmp_path):
+        path = tmp_path / "eac.pdf"
+        path.write_bytes(b"%PDF-1.4 bulletin")
+        return path
+
+    def run(self, pdf, cache, calls, parser_version="eac_parser_v1_2@2"):
+        def page_fn(pdf_path, page, flavor):
+            calls.append(page)
+            return fake_page(pdf_path, page, flavor)
+
+        return pf.merge_pages(pf.iter_pages(page_fn, str(pdf), [1, 2, 3], "stream", 1, cache, parser_version))
+
+    def test_unchanged_pdf_is_served_from_cache(self, pdf, tmp_path):
+        calls = []
+        first = self.run(pdf, PageCache(tmp_path / "cache"), calls)
+        cache = PageCache(tmp_path / "cache")
+        second = self.run(pdf, cache, calls)
+        assert calls == [1, 2, 3]
+        assert (cache.hits, cache.misses) == (3, 0)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_parser_version_and_content_change_the_key(self, pdf, tmp_path):
+        calls = []
+        self.run(pdf, PageCache(tmp_path / "cache"), calls)
+        self.run(pdf, PageCache(tmp_path / "cache"), calls, parser_version="eac_parser_v1_2@3")
+        pdf.write_bytes(b"%PDF-1.4 bulletin modifie")
+        cache = PageCache(tmp_path / "cache")
+        self.run(pdf, cache, calls)
+        assert calls == [1, 2, 3] * 3
+        assert cache.misses == 3
+
+    def test_failed_page_is_not_cached(self, pdf, tmp_path):
+        calls = []
+
+        def flaky(pdf_path, page, flavor):
+            calls.append(page)
+            if page == 2 and calls.count(2) == 1:
+                raise OSError("camelot: ghostscript not found")
+            return fake_page(pdf_path, page, flavor)
+
+        first = pf.merge_pages(pf.iter_pages(flaky, str(pdf), [1, 2, 3], "stream", 1,
+                                             PageCache(tmp_path / "cache"), "eac_parser_v1_2@2"))
+        assert 2 not in set(first["page"])
+        cache = PageCache(tmp_path / "cache")
+        second = pf.merge_pages(pf.iter_pages(flaky, str(pdf), [1, 2, 3], "stream", 1, cache, "eac_parser_v1_2@2"))
+        assert calls == [1, 2, 3, 2]
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert 2 in set(second["page"])
+
+    def test_partial_cache_and_raw_tables(self, pdf, tmp_path):
+        cache = PageCache(tmp_path / "cache")
+        digest = file_sha256(str(pdf))
+        raw = pd.DataFrame([["1517.10.00", "Margarine"], ["", "25%"]])
+        cache.put(digest, "eac_parser@1", "stream", pf.PageResult(2, raw, None))
+
+        result = cache.get(str(pdf), digest, 2, "eac_parser@1", "stream")
+        assert list(result.rows.columns) == [0, 1]
+        pd.testing.assert_frame_equal(result.rows, raw)
+        assert cache.get(str(pdf), digest, 3, "eac_parser@1", "stream") is None
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests de l'ordonnanceur d'ingestion multi-blocs (tariff_engine/scheduler.py)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tariff_engine import scheduler as sched
+from tariff_engine.parsers.page_cache import PageCache
+
+
+FAKE_PARSER = '''
+import pandas as pd
+PARSER_VERSION = "fake@1"
+CALLS = []
+
+def parse_pages(pdf_path, pages, workers=1, cache=None):
+    CALLS.append(pdf_path)
+    if b"broken" in open(pdf_path, "rb").read():
+        raise ValueError("unreadable PDF")
+    return pd.DataFrame({"hs_code": ["151710", "151790"], "page": [pages[0], pages[-1]]})
+'''
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    (tmp_path / "fake_tariff_parser.py").write_text(FAKE_PARSER)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "fake_tariff_parser", raising=False)
+    monkeypatch.setitem(sched.PARSERS, "fake", "fake_tariff_parser")
+    monkeypatch.setattr(sched, "NORM_DIR", tmp_path / "normalized")
+    for bloc in ("EAC", "CEMAC", "SACU"):
+        (tmp_path / f"{bloc}.pdf").write_bytes(f"%PDF {bloc}".encode())
+    registry = tmp_path / "registry.csv"
+    registry.write_text(
+        "bloc;country;hs_version;local_path;parser;pages;depends_on\n"
+        f"EAC;EAC;2022;{tmp_path}/EAC.pdf;fake;14-16;\n"
+        "bloc;country;hs_version;local_path;parser;pages;depends_on\n"
+        f"CEMAC;CEMAC;2022;{tmp_path}/CEMAC.pdf;fake;1;\n"
+        f"SACU;SACU;2022;{tmp_path}/SACU.pdf;fake;1-2;EAC|CEMAC\n"
+    )
+
+    def make():
+        return sched.IngestionScheduler(registry, workers=2, parse_workers=1,
+                                        manifest_dir=tmp_path / "manifests", cache=PageCache(tmp_path / "cache"))
+    return tmp_path, make
+
+
+class TestRegistry:
+    """Lecture des deux formats de registre"""
+
+    def test_semicolon_registry_with_repeated_headers(self, env):
+        tmp_path, make = env
+        specs = {s.bloc: s for s in make().specs}
+        assert set(specs) == {"EAC", "CEMAC", "SACU"}
+        assert specs["SACU"].depends_on == ("EAC", "CEMAC")
+
+    def test_comma_registry_defaults(self, tmp_path):
+        registry = tmp_path / "registry.csv"
+        registry.write_text("bloc,country,hs_version,pdf_url,parser,prefix\n"
+                            "eac,MULTI,HS2022,https://example.org/eac.pdf,eac,EA\n")
+        (spec,) = sched.load_registry(registry)
+        assert spec.bloc == "EAC" and spec.pdf_url.endswith("eac.pdf")
+        assert spec.local_path == str(sched.PDF_DIR / "EAC" / "EAC.pdf")
+        assert spec.pages == "" and spec.depends_on == ()
+
+    def test_page_list(self):
+        assert sched.page_list("14-16,20", "unused.pdf") == [14, 15, 16, 20]
+
+
+class TestPlanAndRun:
+    """Plan incrémental et manifestes par bloc"""
+
+    def test_dependencies_run_first(self, env):
+        tmp_path, make = env
+        plan = make().plan()
+        assert [item.spec.bloc for item in plan] == ["EAC", "CEMAC", "SACU"]
+        assert {item.action for item in plan} == {"ingest"}
+
+    def test_run_writes_manifests_then_skips(self, env):
+        tmp_path, make = env
+        manifests = make().run()
+        assert [m["status"] for m in manifests] == ["ok", "ok", "ok"]
+        manifest = json.loads((tmp_path / "manifests" / "EAC.json").read_text())
+        assert manifest["rows"] == 2 and manifest["parser_version"] == "fake@1"
+        assert set(manifest["timings"]) == {"download_s", "hash_s", "parse_s", "total_s"}
+        assert Path(manifest["output"]).exists()
+
+        assert {item.action for item in make().plan()} == {"skip"}
+        assert make().run() == []
+
+    def test_changed_source_reruns_dependents(self, env):
+        tmp_path, make = env
+        make().run()
+        (tmp_path / "CEMAC.pdf").write_bytes(b"%PDF CEMAC 2024")
+        plan = {item.spec.bloc: item for item in make().plan()}
+        assert plan["EAC"].action == "skip"
+        assert plan["CEMAC"].reason == "source changed"
+        assert plan["SACU"].reason == "dependency re-ingested: CEMAC"
+
+    def test_failed_dependency_skips_dependents(self, env):
+        tmp_path, make = env
+        (tmp_path / "EAC.pdf").write_bytes(b"%PDF broken")
+        manifests = {m["bloc"]: m for m in make().run()}
+        assert manifests["EAC"]["status"] == "error"
+        assert "unreadable PDF" in manifests["EAC"]["error"]
+        assert manifests["CEMAC"]["status"] == "ok"
+        assert manifests["SACU"]["status"] == "skipped"
+
+    def test_cycle_is_rejected(self, env):
+        tmp_path, make = env
+        scheduler = make()
+        scheduler.specs[0] = scheduler.specs[0]._replace(depends_on=("SACU",))
+        with pytest.raises(ValueError):
+            scheduler.plan()